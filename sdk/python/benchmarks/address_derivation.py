@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+
+#
+# Measures derivation of 100000 Symbol addresses from public keys.
+# Bulk derivation creates hashers once and copies them for every public key,
+# so it should be cheaper than deriving every address separately.
+# Process pool mode only pays off on multi-core machines, where it splits keys across worker processes.
+#
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.benchmark_utils import measure, print_speedup
+from symbolchain.CryptoTypes import PublicKey
+from symbolchain.symbol.Network import Network
+
+NUM_PUBLIC_KEYS = 100000
+
+
+def main():
+	public_keys = [PublicKey(index.to_bytes(PublicKey.SIZE, byteorder='little')) for index in range(NUM_PUBLIC_KEYS)]
+	network = Network.TESTNET
+
+	print(f'deriving {NUM_PUBLIC_KEYS} addresses')
+	baseline_time = measure(
+		'Network.public_key_to_address (sequential)',
+		lambda: [network.public_key_to_address(public_key) for public_key in public_keys],
+		number=1)
+	optimized_time = measure('Network.public_keys_to_addresses', lambda: network.public_keys_to_addresses(public_keys), number=1)
+	print_speedup('bulk speedup', baseline_time, optimized_time)
+
+	with ProcessPoolExecutor() as executor:
+		process_pool_time = measure(
+			f'Network.public_keys_to_addresses ({os.cpu_count()} processes)',
+			lambda: network.public_keys_to_addresses(public_keys, executor),
+			number=1)
+		print_speedup('process pool speedup', baseline_time, process_pool_time)
+
+
+if '__main__' == __name__:
+	main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+
+#
+# Measures serialization of AggregateBondedTransactionV2 containing 100 embedded transfers.
+# Serialization computes (nested) sizes once per pass, so serialize should cost about one size plus one serialize_into call.
+#
+
+from benchmarks.benchmark_utils import measure
+from symbolchain.CryptoTypes import PublicKey
+from symbolchain.facade.SymbolFacade import SymbolFacade
+
+NUM_EMBEDDED_TRANSACTIONS = 100
+
+
+def create_aggregate(facade):
+	signer_public_key = PublicKey(bytes(range(PublicKey.SIZE)))
+	recipient_address = facade.network.public_key_to_address(signer_public_key)
+	embedded_transactions = [
+		facade.transaction_factory.create_embedded({
+			'type': 'transfer_transaction_v1',
+			'signer_public_key': signer_public_key,
+			'recipient_address': recipient_address,
+			'mosaics': [{'mosaic_id': 0x72C0212E67A08BCE, 'amount': index + 1}],
+			'message': f'embedded transaction #{index}'
+		})
+		for index in range(NUM_EMBEDDED_TRANSACTIONS)
+	]
+
+	return facade.transaction_factory.create({
+		'type': 'aggregate_bonded_transaction_v2',
+		'signer_public_key': signer_public_key,
+		'fee': 1000000,
+		'deadline': 1,
+		'transactions_hash': facade.hash_embedded_transactions(embedded_transactions),
+		'transactions': embedded_transactions
+	})
+
+
+def main():
+	facade = SymbolFacade('testnet')
+	aggregate = create_aggregate(facade)
+
+	print(f'aggregate with {NUM_EMBEDDED_TRANSACTIONS} embedded transactions, size {aggregate.size} bytes')
+	measure('size', lambda: aggregate.size)
+	measure('serialize', aggregate.serialize)
+
+	buffer = bytearray(aggregate.size)
+	measure('serialize_into (preallocated buffer)', lambda: aggregate.serialize_into(buffer, 0))
+
+
+if '__main__' == __name__:
+	main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+#
+# Measures hashing of 10000 Symbol and NEM transfers, as needed when indexing transactions of blocks.
+# Baseline calls hash_transaction for every transaction.
+# Optimized hash_transactions (for Symbol) hashes signature, signer and data directly from serialized transactions
+# (e.g. as read by BlockReader), optionally splitting them across (process pool) executor.
+#
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.benchmark_utils import measure, print_speedup
+from symbolchain.CryptoTypes import PrivateKey, PublicKey
+from symbolchain.facade.NemFacade import NemFacade
+from symbolchain.facade.SymbolFacade import SymbolFacade
+
+NUM_TRANSACTIONS = 10000
+
+
+def create_transfers(facade, descriptor_factory):
+	signer_public_key = facade.KeyPair(PrivateKey.random()).public_key
+	return [
+		facade.transaction_factory.create({
+			**descriptor_factory(index),
+			'type': 'transfer_transaction_v1',
+			'signer_public_key': signer_public_key,
+			'recipient_address': facade.network.public_key_to_address(PublicKey(index.to_bytes(PublicKey.SIZE, byteorder='little'))),
+			'deadline': 1
+		})
+		for index in range(NUM_TRANSACTIONS)
+	]
+
+
+def main():
+	symbol_facade = SymbolFacade('testnet')
+	symbol_transactions = create_transfers(symbol_facade, lambda index: {
+		'mosaics': [{'mosaic_id': 0x72C0212E67A08BCE, 'amount': 1000000 + index}]
+	})
+	symbol_payloads = [bytes(transaction.serialize()) for transaction in symbol_transactions]
+
+	print(f'hashing {NUM_TRANSACTIONS} Symbol transactions')
+	baseline_time = measure(
+		'SymbolFacade.hash_transaction',
+		lambda: [symbol_facade.hash_transaction(transaction) for transaction in symbol_transactions],
+		number=3)
+
+	transactions_time = measure(
+		'SymbolFacade.hash_transactions (transactions)',
+		lambda: symbol_facade.hash_transactions(symbol_transactions),
+		number=3)
+	print_speedup('transactions speedup', baseline_time, transactions_time)
+
+	payloads_time = measure('SymbolFacade.hash_transactions (payloads)', lambda: symbol_facade.hash_transactions(symbol_payloads), number=3)
+	print_speedup('payloads speedup', baseline_time, payloads_time)
+
+	with ProcessPoolExecutor() as executor:
+		process_pool_time = measure(
+			f'SymbolFacade.hash_transactions (payloads, {os.cpu_count()} processes)',
+			lambda: symbol_facade.hash_transactions(symbol_payloads, executor),
+			number=3)
+		print_speedup('process pool speedup', baseline_time, process_pool_time)
+
+	nem_facade = NemFacade('testnet')
+	nem_transactions = create_transfers(nem_facade, lambda index: {'amount': 1000000 + index})
+
+	print(f'hashing {NUM_TRANSACTIONS} NEM transactions')
+	baseline_time = measure(
+		'NemFacade.hash_transaction',
+		lambda: [nem_facade.hash_transaction(transaction) for transaction in nem_transactions],
+		number=3)
+	transactions_time = measure('NemFacade.hash_transactions', lambda: nem_facade.hash_transactions(nem_transactions), number=3)
+	print_speedup('transactions speedup', baseline_time, transactions_time)
+
+
+if '__main__' == __name__:
+	main()
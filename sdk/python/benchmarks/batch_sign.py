@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+#
+# Measures signing of 1000 Symbol transfers from a single signer with BatchOperations.sign_all.
+# Baseline loads (and decrypts) signer private key for every transaction and saves every signature as a QR code.
+# Optimized sign_all loads every signer private key once and saves signatures with a lightweight storage.
+# Process pool mode only pays off on multi-core machines, where it splits transactions across worker processes.
+#
+
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.benchmark_utils import measure, print_speedup
+from symbolchain.AccountDescriptorRepository import AccountDescriptorRepository
+from symbolchain.CryptoTypes import PrivateKey, PublicKey
+from symbolchain.facade.BatchOperations import BatchOperations
+from symbolchain.facade.SymbolFacade import SymbolFacade
+from symbolchain.PrivateKeyStorage import PrivateKeyStorage
+from symbolchain.QrStorage import QrStorage
+from symbolchain.SignatureStorage import BinarySignatureStorage, JsonLinesSignatureStorage
+
+NUM_TRANSACTIONS = 1000
+
+
+def sign_all_baseline(facade, transactions, private_key_storage, qr_storage):
+	for i, transaction in enumerate(transactions):
+		signer_public_key = PublicKey(transaction.signer_public_key.bytes)
+		signer_account_name = facade.account_descriptor_repository.find_by_public_key(signer_public_key).name
+		signer_private_key = private_key_storage.load(signer_account_name)
+
+		signature = facade.sign_transaction(facade.KeyPair(signer_private_key), transaction)
+		transaction_hash = facade.hash_transaction(transaction)
+		qr_storage.save(f'sig_{i}', transaction_hash.bytes + signature.bytes)
+
+
+def main():
+	private_key = PrivateKey.random()
+	public_key = SymbolFacade.KeyPair(private_key).public_key
+	facade = SymbolFacade('testnet', AccountDescriptorRepository(f'- public_key: {public_key}\n  name: PAYROLL\n'))
+	operations = BatchOperations(facade)
+
+	transactions = [
+		facade.transaction_factory.create({
+			'type': 'transfer_transaction_v1',
+			'signer_public_key': 'PAYROLL',
+			'recipient_address': facade.network.public_key_to_address(PublicKey(index.to_bytes(PublicKey.SIZE, byteorder='little'))),
+			'mosaics': [{'mosaic_id': 0x72C0212E67A08BCE, 'amount': 1000000 + index}],
+			'deadline': 1
+		})
+		for index in range(NUM_TRANSACTIONS)
+	]
+
+	with tempfile.TemporaryDirectory() as temp_directory:
+		private_key_storage = PrivateKeyStorage(temp_directory, 'password')
+		private_key_storage.save('PAYROLL', private_key)
+
+		print(f'signing {NUM_TRANSACTIONS} transactions')
+		baseline_time = measure(
+			'sign, hash and save QR code one by one',
+			lambda: sign_all_baseline(facade, transactions, private_key_storage, QrStorage(temp_directory)),
+			number=1,
+			repeat=1)
+
+		binary_storage = BinarySignatureStorage(temp_directory)
+		binary_time = measure(
+			'BatchOperations.sign_all (BinarySignatureStorage)',
+			lambda: operations.sign_all(transactions, private_key_storage, binary_storage),
+			number=1)
+		print_speedup('binary storage speedup', baseline_time, binary_time)
+
+		json_lines_storage_path = os.path.join(temp_directory, 'signatures.jsonl')
+		json_lines_time = measure(
+			'BatchOperations.sign_all (JsonLinesSignatureStorage)',
+			lambda: operations.sign_all(transactions, private_key_storage, JsonLinesSignatureStorage(json_lines_storage_path)),
+			number=1)
+		print_speedup('json lines storage speedup', baseline_time, json_lines_time)
+
+		with ProcessPoolExecutor() as executor:
+			process_pool_time = measure(
+				f'BatchOperations.sign_all ({os.cpu_count()} processes)',
+				lambda: operations.sign_all(transactions, private_key_storage, binary_storage, executor),
+				number=1)
+			print_speedup('process pool speedup', baseline_time, process_pool_time)
+
+
+if '__main__' == __name__:
+	main()
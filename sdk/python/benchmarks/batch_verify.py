@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+
+#
+# Measures verification of 1000 signatures signed by 10 key pairs.
+# Batch verifier reuses verifiers of the same signer and verifies chunks of signatures in parallel threads,
+# so it should be cheaper than creating verifier for, and verifying, every signature sequentially.
+#
+
+from benchmarks.benchmark_utils import measure, print_speedup
+from symbolchain.CryptoTypes import PrivateKey
+from symbolchain.symbol.KeyPair import BatchVerifier, KeyPair, Verifier
+
+NUM_SIGNATURES = 1000
+NUM_KEY_PAIRS = 10
+
+
+def create_items():
+	key_pairs = [KeyPair(PrivateKey.random()) for _ in range(NUM_KEY_PAIRS)]
+	items = []
+	for index in range(NUM_SIGNATURES):
+		key_pair = key_pairs[index % NUM_KEY_PAIRS]
+		message = index.to_bytes(4, byteorder='little') * 50
+		items.append((key_pair.public_key, message, key_pair.sign(message)))
+
+	return items
+
+
+def verify_sequentially(items):
+	return [Verifier(public_key).verify(message, signature) for (public_key, message, signature) in items]
+
+
+def main():
+	items = create_items()
+
+	print(f'verifying {NUM_SIGNATURES} signatures signed by {NUM_KEY_PAIRS} key pairs')
+	baseline_time = measure('Verifier.verify (sequential)', lambda: verify_sequentially(items), number=5)
+	batch_verifier = BatchVerifier()
+	optimized_time = measure('BatchVerifier.verify', lambda: batch_verifier.verify(items), number=5)
+	print_speedup('batch speedup', baseline_time, optimized_time)
+
+
+if '__main__' == __name__:
+	main()
@@ -0,0 +1,13 @@
+import timeit
+
+
+def measure(name, func, number=100, repeat=5):
+	"""Runs func number times (repeat times) and prints best average time per call."""
+	best_time = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+	print(f'{name:<60} {best_time * 1_000_000:12.2f} us/call')
+	return best_time
+
+
+def print_speedup(name, baseline_time, optimized_time):
+	"""Prints ratio between baseline and optimized timings."""
+	print(f'{name:<60} {baseline_time / optimized_time:12.2f} x')
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+#
+# Measures hashing, verifying and recomputing transactions hash of a Symbol block with 1000 transfers.
+# Baseline serializes whole block to extract its header and hashes transactions one by one with hash_transaction.
+# Optimized SymbolFacade block helpers serialize only block header and hash (once serialized) transactions in bulk.
+#
+
+import hashlib
+
+from benchmarks.benchmark_utils import measure, print_speedup
+from symbolchain import sc
+from symbolchain.CryptoTypes import Hash256, PrivateKey, PublicKey
+from symbolchain.facade.SymbolFacade import SymbolFacade
+from symbolchain.symbol.KeyPair import Verifier
+from symbolchain.symbol.Merkle import MerkleHashBuilder
+
+NUM_TRANSACTIONS = 1000
+
+# signature and signer public key followed by normal block header without footer padding
+BLOCK_SIGNATURE_OFFSET = 8
+BLOCK_HEADER_DATA_OFFSET = 108
+NORMAL_BLOCK_HEADER_DATA_END = sc.NormalBlockV1().size - 4
+
+
+def hash_block_baseline(block):
+	block_buffer = block.serialize()
+	return Hash256(hashlib.sha3_256(
+		block_buffer[BLOCK_SIGNATURE_OFFSET:BLOCK_HEADER_DATA_OFFSET - 4] + block_buffer[BLOCK_HEADER_DATA_OFFSET:NORMAL_BLOCK_HEADER_DATA_END]
+	).digest())
+
+
+def verify_block_baseline(block):
+	block_buffer = block.serialize()
+	return Verifier(block.signer_public_key).verify(block_buffer[BLOCK_HEADER_DATA_OFFSET:NORMAL_BLOCK_HEADER_DATA_END], block.signature)
+
+
+def transactions_hash_baseline(facade, block):
+	hash_builder = MerkleHashBuilder()
+	for transaction in block.transactions:
+		hash_builder.update(facade.hash_transaction(transaction))
+
+	return hash_builder.final()
+
+
+def main():
+	facade = SymbolFacade('testnet')
+	key_pair = SymbolFacade.KeyPair(PrivateKey.random())
+
+	block = sc.NormalBlockV1()
+	block.network = sc.NetworkType.TESTNET
+	block.signer_public_key = sc.PublicKey(key_pair.public_key.bytes)
+	block.transactions = [
+		facade.transaction_factory.create({
+			'type': 'transfer_transaction_v1',
+			'signer_public_key': key_pair.public_key,
+			'recipient_address': facade.network.public_key_to_address(PublicKey(index.to_bytes(PublicKey.SIZE, byteorder='little'))),
+			'mosaics': [{'mosaic_id': 0x72C0212E67A08BCE, 'amount': 1000000 + index}],
+			'deadline': 1
+		})
+		for index in range(NUM_TRANSACTIONS)
+	]
+	block.transactions_hash = sc.Hash256(facade.compute_block_transactions_hash(block).bytes)
+	block.signature = sc.Signature(SymbolFacade.sign_block(key_pair, block).bytes)
+
+	print(f'processing block with {NUM_TRANSACTIONS} transactions')
+	baseline_time = measure('hash block (serialize whole block)', lambda: hash_block_baseline(block), number=5)
+	optimized_time = measure('SymbolFacade.hash_block', lambda: SymbolFacade.hash_block(block), number=5)
+	print_speedup('hash_block speedup', baseline_time, optimized_time)
+
+	baseline_time = measure('verify block (serialize whole block)', lambda: verify_block_baseline(block), number=5)
+	optimized_time = measure('SymbolFacade.verify_block', lambda: SymbolFacade.verify_block(block), number=5)
+	print_speedup('verify_block speedup', baseline_time, optimized_time)
+
+	baseline_time = measure(
+		'transactions hash (hash_transaction one by one)',
+		lambda: transactions_hash_baseline(facade, block),
+		number=5)
+	optimized_time = measure(
+		'SymbolFacade.compute_block_transactions_hash',
+		lambda: facade.compute_block_transactions_hash(block),
+		number=5)
+	print_speedup('compute_block_transactions_hash speedup', baseline_time, optimized_time)
+
+
+if '__main__' == __name__:
+	main()
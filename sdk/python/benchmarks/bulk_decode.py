@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+
+#
+# Measures decoding of 2000 messages exchanged with 20 counterparties.
+# Bulk decoding derives shared key of every counterparty once and decrypts chunks of messages in parallel threads,
+# so it should be cheaper than deriving shared key for, and decrypting, every message sequentially.
+#
+
+from benchmarks.benchmark_utils import measure, print_speedup
+from symbolchain.CryptoTypes import PrivateKey
+from symbolchain.symbol.KeyPair import KeyPair
+from symbolchain.symbol.MessageEncoder import MessageEncoder
+
+NUM_MESSAGES = 2000
+NUM_COUNTERPARTIES = 20
+
+
+def create_pairs(encoder):
+	counterparty_public_keys = [KeyPair(PrivateKey.random()).public_key for _ in range(NUM_COUNTERPARTIES)]
+	pairs = []
+	for index in range(NUM_MESSAGES):
+		counterparty_public_key = counterparty_public_keys[index % NUM_COUNTERPARTIES]
+		pairs.append((counterparty_public_key, encoder.encode(counterparty_public_key, index.to_bytes(4, byteorder='little') * 64)))
+
+	return pairs
+
+
+def decode_sequentially(encoder, pairs):
+	return [encoder.try_decode(public_key, encoded_message) for (public_key, encoded_message) in pairs]
+
+
+def main():
+	encoder = MessageEncoder(KeyPair(PrivateKey.random()))
+	pairs = create_pairs(encoder)
+
+	print(f'decoding {NUM_MESSAGES} messages exchanged with {NUM_COUNTERPARTIES} counterparties')
+	baseline_time = measure('MessageEncoder.try_decode (sequential)', lambda: decode_sequentially(encoder, pairs), number=3)
+	optimized_time = measure('MessageEncoder.try_decode_many', lambda: encoder.try_decode_many(pairs), number=3)
+	print_speedup('bulk speedup', baseline_time, optimized_time)
+
+
+if '__main__' == __name__:
+	main()
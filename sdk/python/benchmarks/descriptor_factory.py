@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+#
+# Measures creation of Symbol transactions from all tests/vectors/symbol/models/transactions.json descriptors.
+# Baseline clears copy plans before every transaction, so type hints and attributes are looked up for every transaction.
+# Optimized creation reuses copy plans compiled for every (entity class, descriptor keys) combination.
+#
+
+import json
+import os
+import re
+from binascii import unhexlify
+from pathlib import Path
+
+from benchmarks.benchmark_utils import measure, print_speedup
+from symbolchain import sc
+from symbolchain.facade.SymbolFacade import SymbolFacade
+
+SCHEMAS_PATH = Path(os.environ.get('SCHEMAS_PATH', Path(__file__).resolve().parents[3] / 'tests' / 'vectors'))
+HEX_STRING_PATTERN = re.compile('^[0-9A-F]+$')
+
+
+def fixup_descriptor(descriptor, facade):
+	for key, value in descriptor.items():
+		# skip false positive due to ABC123 value that should be treated as plain string
+		if 'value' == key and 'namespace_metadata_transaction_v1' == descriptor.get('type'):
+			continue
+
+		if isinstance(value, str) and HEX_STRING_PATTERN.match(value):
+			descriptor[key] = unhexlify(value)
+		elif isinstance(value, list):
+			for value_item in value:
+				if isinstance(value_item, dict):
+					fixup_descriptor(value_item, facade)
+		elif isinstance(value, dict):
+			fixup_descriptor(value, facade)
+
+
+def create_cosignature(descriptor):
+	cosignature = sc.Cosignature()
+	cosignature.signature = sc.Signature(descriptor['signature'])
+	cosignature.signer_public_key = sc.PublicKey(descriptor['signer_public_key'])
+	return cosignature
+
+
+def load_descriptors(facade):
+	with open(SCHEMAS_PATH / 'symbol' / 'models' / 'transactions.json', 'rt', encoding='utf8') as infile:
+		items = json.load(infile)
+
+	descriptors = []
+	for item in items:
+		descriptor = item['descriptor']
+		descriptor['signature'] = sc.Signature(descriptor['signature'])
+		fixup_descriptor(descriptor, facade)
+
+		if 'transactions' in descriptor:
+			descriptor['transactions'] = [facade.transaction_factory.create_embedded(child) for child in descriptor['transactions']]
+
+		if 'cosignatures' in descriptor:
+			descriptor['cosignatures'] = [create_cosignature(cosignature) for cosignature in descriptor['cosignatures']]
+
+		descriptors.append(descriptor)
+
+	return descriptors
+
+
+def main():
+	facade = SymbolFacade('testnet')
+	descriptors = load_descriptors(facade)
+	rule_based_factory = facade.transaction_factory.factory
+
+	def create_all_without_plans():
+		for descriptor in descriptors:
+			rule_based_factory._copy_plans.clear()  # pylint: disable=protected-access
+			facade.transaction_factory.create(descriptor)
+
+	def create_all():
+		for descriptor in descriptors:
+			facade.transaction_factory.create(descriptor)
+
+	print(f'creating {len(descriptors)} transactions')
+	baseline_time = measure('TransactionFactory.create (plans cleared)', create_all_without_plans, number=20)
+	optimized_time = measure('TransactionFactory.create (plans cached)', create_all, number=20)
+	print_speedup('copy plan speedup', baseline_time, optimized_time)
+	print(f'{"transactions per second (plans cached)":<60} {len(descriptors) / optimized_time:12.0f}')
+
+
+if '__main__' == __name__:
+	main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+#
+# Measures loading of 10000 transfer descriptors (without creating transactions).
+# Baseline parses whole YAML document with pure python SafeLoader.
+# Optimized readers use libyaml based CSafeLoader (when available) or JSON lines and yield descriptors one at a time.
+#
+
+import io
+import json
+
+import yaml
+
+from benchmarks.benchmark_utils import measure, print_speedup
+from symbolchain.DescriptorReader import YamlLoader, read_json_lines_descriptors, read_yaml_descriptors
+
+NUM_DESCRIPTORS = 10000
+
+
+def main():
+	descriptors = [
+		{
+			'type': 'transfer_transaction_v1',
+			'signer_public_key': 'PAYROLL',
+			'recipient_address': f'EMPLOYEE_{index}',
+			'mosaics': [{'mosaic_id': 0x72C0212E67A08BCE, 'amount': 1000000 + index}],
+			'message': {'message_type': 'plain', 'message': f'salary {index}'}
+		}
+		for index in range(NUM_DESCRIPTORS)
+	]
+	yaml_input = yaml.dump(descriptors)
+	multi_document_yaml_input = yaml.dump_all(descriptors)
+	json_lines_input = '\n'.join(json.dumps(descriptor) for descriptor in descriptors)
+
+	print(f'loading {NUM_DESCRIPTORS} descriptors ({YamlLoader.__name__})')
+	baseline_time = measure('yaml.load (SafeLoader)', lambda: yaml.load(yaml_input, Loader=yaml.SafeLoader), number=1, repeat=3)
+
+	yaml_time = measure(
+		'read_yaml_descriptors (multi-document)',
+		lambda: sum(1 for _ in read_yaml_descriptors(io.StringIO(multi_document_yaml_input))),
+		number=1,
+		repeat=3)
+	print_speedup('yaml speedup', baseline_time, yaml_time)
+
+	json_lines_time = measure(
+		'read_json_lines_descriptors',
+		lambda: sum(1 for _ in read_json_lines_descriptors(io.StringIO(json_lines_input))),
+		number=1,
+		repeat=3)
+	print_speedup('json lines speedup', baseline_time, json_lines_time)
+
+
+if '__main__' == __name__:
+	main()
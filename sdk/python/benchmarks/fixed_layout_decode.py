@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+#
+# Measures decoding of arrays of fixed layout structs (cosignatures of aggregate and mosaics of transfer).
+# Fixed layout structs are unpacked in bulk with precompiled codecs, which should be significantly cheaper than
+# deserializing every element (and every pod inside it) separately.
+#
+
+from benchmarks.benchmark_utils import measure, print_speedup
+from symbolchain.ArrayHelpers import ArrayHelpers
+from symbolchain.sc import (
+	_COSIGNATURE_CODEC,
+	_UNRESOLVED_MOSAIC_CODEC,
+	Amount,
+	Cosignature,
+	PublicKey,
+	UnresolvedMosaic,
+	UnresolvedMosaicId
+)
+
+NUM_ELEMENTS = 100
+
+
+def create_cosignatures_buffer():
+	buffer = bytearray()
+	for index in range(NUM_ELEMENTS):
+		cosignature = Cosignature()
+		cosignature.signer_public_key = PublicKey(bytes([index]) * PublicKey.SIZE)
+		buffer += cosignature.serialize()
+
+	return buffer
+
+
+def create_mosaics_buffer():
+	buffer = bytearray()
+	for index in range(NUM_ELEMENTS):
+		mosaic = UnresolvedMosaic()
+		mosaic.mosaic_id = UnresolvedMosaicId(index + 1)
+		mosaic.amount = Amount(1000 * index)
+		buffer += mosaic.serialize()
+
+	return buffer
+
+
+def measure_array(name, buffer, element_type, codec):
+	view = memoryview(buffer)
+	baseline_time = measure(f'{name}: read_array', lambda: ArrayHelpers.read_array(view, element_type))
+	optimized_time = measure(f'{name}: read_fixed_size_array', lambda: ArrayHelpers.read_fixed_size_array(view, element_type, codec))
+	print_speedup(f'{name} speedup', baseline_time, optimized_time)
+
+
+def main():
+	print(f'decoding arrays of {NUM_ELEMENTS} elements')
+	measure_array('cosignatures', create_cosignatures_buffer(), Cosignature, _COSIGNATURE_CODEC)
+	measure_array('mosaics', create_mosaics_buffer(), UnresolvedMosaic, _UNRESOLVED_MOSAIC_CODEC)
+
+
+if '__main__' == __name__:
+	main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+#
+# Measures memory used by and time needed to deserialize 10000 Symbol transfers, each with 3 mosaics.
+# Baseline emulates previous layout by deserializing into dict backed subclasses of generated models.
+# Optimized (generated) models use __slots__ and create decoded pods and byte arrays without validating them again.
+#
+
+import tracemalloc
+
+from benchmarks.benchmark_utils import measure, print_speedup
+from symbolchain import sc
+from symbolchain.CryptoTypes import PublicKey
+from symbolchain.facade.SymbolFacade import SymbolFacade
+
+NUM_TRANSACTIONS = 10000
+
+
+class DictBackedAmount(sc.Amount):
+	pass
+
+
+class DictBackedUnresolvedMosaicId(sc.UnresolvedMosaicId):
+	pass
+
+
+class DictBackedUnresolvedMosaic(sc.UnresolvedMosaic):
+	pass
+
+
+def to_dict_backed_mosaic(mosaic):
+	dict_backed_mosaic = DictBackedUnresolvedMosaic()
+	dict_backed_mosaic.mosaic_id = DictBackedUnresolvedMosaicId(mosaic.mosaic_id.value)
+	dict_backed_mosaic.amount = DictBackedAmount(mosaic.amount.value)
+	return dict_backed_mosaic
+
+
+def measure_memory(name, create):
+	tracemalloc.start()
+	objects = create()
+	(current_size, _) = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+
+	print(f'{name:<60} {current_size / len(objects):12.0f} bytes/object')
+	return (objects, current_size)
+
+
+def main():
+	facade = SymbolFacade('testnet')
+	payloads = [
+		facade.transaction_factory.create({
+			'type': 'transfer_transaction_v1',
+			'signer_public_key': PublicKey(bytes(PublicKey.SIZE)),
+			'recipient_address': facade.network.public_key_to_address(PublicKey(index.to_bytes(PublicKey.SIZE, byteorder='little'))),
+			'mosaics': [{'mosaic_id': mosaic_id, 'amount': 1000000 + index} for mosaic_id in range(1, 4)],
+			'deadline': 1
+		}).serialize()
+		for index in range(NUM_TRANSACTIONS)
+	]
+
+	def deserialize_all():
+		return [sc.TransferTransactionV1.deserialize(payload) for payload in payloads]
+
+	def deserialize_all_dict_backed():
+		transactions = deserialize_all()
+		for transaction in transactions:
+			transaction.mosaics = [to_dict_backed_mosaic(mosaic) for mosaic in transaction.mosaics]
+
+		return transactions
+
+	print(f'deserializing {NUM_TRANSACTIONS} transactions')
+	(_, baseline_mosaics_size) = measure_memory(
+		'mosaics (dict backed)',
+		lambda: [to_dict_backed_mosaic(mosaic) for transaction in deserialize_all() for mosaic in transaction.mosaics])
+	(_, optimized_mosaics_size) = measure_memory(
+		'mosaics (slots)',
+		lambda: [mosaic for transaction in deserialize_all() for mosaic in transaction.mosaics])
+	print(f'{"mosaics memory reduction":<60} {baseline_mosaics_size / optimized_mosaics_size:12.2f} x')
+
+	(_, baseline_size) = measure_memory('transfers (dict backed mosaics)', deserialize_all_dict_backed)
+	(_, optimized_size) = measure_memory('transfers (slots)', deserialize_all)
+	print(f'{"transfers memory reduction":<60} {baseline_size / optimized_size:12.2f} x')
+
+	def deserialize_all_validated():
+		# emulates previous deserialization, which validated every decoded pod again
+		for payload in payloads:
+			transaction = sc.TransferTransactionV1.deserialize(payload)
+			for mosaic in transaction.mosaics:
+				sc.UnresolvedMosaicId(mosaic.mosaic_id.value)
+				sc.Amount(mosaic.amount.value)
+
+	baseline_time = measure('deserialize (revalidated mosaics)', deserialize_all_validated, number=1)
+	optimized_time = measure('deserialize', deserialize_all, number=1)
+	print_speedup('deserialize speedup', baseline_time, optimized_time)
+
+
+if '__main__' == __name__:
+	main()
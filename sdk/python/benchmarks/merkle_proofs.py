@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+
+#
+# Measures proving inclusion of all 1000 hashes of a merkle tree.
+# Batch proving hashes every internal node shared by multiple paths once and works on raw bytes,
+# so it should be cheaper than proving every path separately.
+#
+
+from benchmarks.benchmark_utils import measure, print_speedup
+from symbolchain.CryptoTypes import Hash256
+from symbolchain.symbol.Merkle import MerkleHashBuilder, prove_merkle, prove_merkle_many
+
+NUM_HASHES = 1000
+
+
+def create_leaf_hashes_and_paths():
+	builder = MerkleHashBuilder()
+	leaf_hashes = [Hash256(index.to_bytes(32, byteorder='little')) for index in range(NUM_HASHES)]
+	for leaf_hash in leaf_hashes:
+		builder.update(leaf_hash)
+
+	return [(leaf_hash, builder.merkle_path(index)) for (index, leaf_hash) in enumerate(leaf_hashes)], builder.final()
+
+
+def prove_sequentially(leaf_hashes_and_paths, root_hash):
+	return [prove_merkle(leaf_hash, merkle_path, root_hash) for (leaf_hash, merkle_path) in leaf_hashes_and_paths]
+
+
+def main():
+	leaf_hashes_and_paths, root_hash = create_leaf_hashes_and_paths()
+
+	print(f'proving {NUM_HASHES} merkle paths')
+	baseline_time = measure('prove_merkle (sequential)', lambda: prove_sequentially(leaf_hashes_and_paths, root_hash), number=10)
+	optimized_time = measure('prove_merkle_many', lambda: prove_merkle_many(leaf_hashes_and_paths, root_hash), number=10)
+	print_speedup('batch speedup', baseline_time, optimized_time)
+
+
+if '__main__' == __name__:
+	main()
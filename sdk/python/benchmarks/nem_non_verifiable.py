@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+#
+# Measures serialization of non-verifiable portion of NEM transfer and multisig transactions, as needed for hashing and signing.
+# Baseline copies every (settable) property of transaction into new NonVerifiable* transaction via reflection and serializes it.
+# Optimized generated serialize_non_verifiable writes non-verifiable fields directly from (verifiable) transaction.
+#
+
+from benchmarks.benchmark_utils import measure, print_speedup
+from symbolchain.CryptoTypes import PrivateKey, PublicKey
+from symbolchain.facade.NemFacade import NemFacade
+from symbolchain.nem.TransactionFactory import TransactionFactory
+
+NUM_TRANSACTIONS = 1000
+
+
+def main():
+	facade = NemFacade('testnet')
+	signer_public_key = NemFacade.KeyPair(PrivateKey.random()).public_key
+
+	def create_transfer(index):
+		return facade.transaction_factory.create({
+			'type': 'transfer_transaction_v2',
+			'signer_public_key': signer_public_key,
+			'recipient_address': facade.network.public_key_to_address(PublicKey(index.to_bytes(PublicKey.SIZE, byteorder='little'))),
+			'amount': 1000000 + index,
+			'message': {'message_type': 'plain', 'message': f'salary {index}'},
+			'deadline': 1
+		})
+
+	transfers = [create_transfer(index) for index in range(NUM_TRANSACTIONS)]
+	multisigs = [
+		facade.transaction_factory.create({
+			'type': 'multisig_transaction_v1',
+			'signer_public_key': signer_public_key,
+			'inner_transaction': TransactionFactory.to_non_verifiable_transaction(transfer),
+			'deadline': 1
+		})
+		for transfer in transfers
+	]
+
+	for (name, transactions) in [('transfer', transfers), ('multisig', multisigs)]:
+		print(f'serializing non-verifiable portion of {NUM_TRANSACTIONS} {name} transactions')
+		baseline_time = measure(
+			'reflection copy + serialize',
+			lambda transactions=transactions: [
+				TransactionFactory._copy_to_non_verifiable_transaction(transaction).serialize()  # pylint: disable=protected-access
+				for transaction in transactions
+			],
+			number=5)
+		optimized_time = measure(
+			'serialize_non_verifiable_transaction',
+			lambda transactions=transactions: [
+				TransactionFactory.serialize_non_verifiable_transaction(transaction) for transaction in transactions
+			],
+			number=5)
+		print_speedup(f'{name} speedup', baseline_time, optimized_time)
+
+
+if '__main__' == __name__:
+	main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+#
+# Measures signing of 1000 NEM transfer (non-verifiable) payloads by a single key pair.
+# Baseline emulates previous KeyPair.sign, which hashed private key twice (once for nonce, once for scalar) per signature.
+# Optimized KeyPair precomputes clamped scalar and nonce prefix once and sign_many shares them across all signatures.
+#
+
+import sha3
+from nacl.bindings import (
+	crypto_core_ed25519_scalar_add,
+	crypto_core_ed25519_scalar_mul,
+	crypto_core_ed25519_scalar_reduce,
+	crypto_scalarmult_ed25519_base_noclamp
+)
+
+from benchmarks.benchmark_utils import measure, print_speedup
+from symbolchain.CryptoTypes import PrivateKey, PublicKey, Signature
+from symbolchain.facade.NemFacade import NemFacade
+from symbolchain.nem.TransactionFactory import TransactionFactory
+
+NUM_TRANSACTIONS = 1000
+
+
+def sign_baseline(private_key, public_key, message):
+	# pylint: disable=invalid-name
+	sk = private_key.bytes[::-1]
+
+	hashobj = sha3.keccak_512(sha3.keccak_512(sk).digest()[32:])
+	hashobj.update(message)
+	r = crypto_core_ed25519_scalar_reduce(hashobj.digest())
+	R = crypto_scalarmult_ed25519_base_noclamp(r)
+
+	hashobj = sha3.keccak_512(R)
+	hashobj.update(public_key.bytes)
+	hashobj.update(message)
+	h = crypto_core_ed25519_scalar_reduce(hashobj.digest())
+
+	a = bytearray(sha3.keccak_512(sk).digest()[:32])
+	a[0] &= 0xF8
+	a[31] &= 0x7F
+	a[31] |= 0x40
+
+	S = crypto_core_ed25519_scalar_add(r, crypto_core_ed25519_scalar_mul(bytes(a), h))
+	return Signature(R + S)
+
+
+def main():
+	facade = NemFacade('testnet')
+	key_pair = NemFacade.KeyPair(PrivateKey.random())
+	payloads = [
+		TransactionFactory.serialize_non_verifiable_transaction(facade.transaction_factory.create({
+			'type': 'transfer_transaction_v2',
+			'signer_public_key': key_pair.public_key,
+			'recipient_address': facade.network.public_key_to_address(PublicKey(index.to_bytes(PublicKey.SIZE, byteorder='little'))),
+			'amount': 1000000 + index,
+			'deadline': 1
+		}))
+		for index in range(NUM_TRANSACTIONS)
+	]
+
+	assert key_pair.sign_many(payloads) == [sign_baseline(key_pair.private_key, key_pair.public_key, payload) for payload in payloads]
+
+	print(f'signing {NUM_TRANSACTIONS} NEM transactions')
+	baseline_time = measure(
+		'sign (hash private key per signature)',
+		lambda: [sign_baseline(key_pair.private_key, key_pair.public_key, payload) for payload in payloads],
+		number=5)
+	sign_time = measure('KeyPair.sign', lambda: [key_pair.sign(payload) for payload in payloads], number=5)
+	print_speedup('sign speedup', baseline_time, sign_time)
+
+	sign_many_time = measure('KeyPair.sign_many', lambda: key_pair.sign_many(payloads), number=5)
+	print_speedup('sign_many speedup', baseline_time, sign_many_time)
+
+
+if '__main__' == __name__:
+	main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+#
+# Measures signing, hashing and cosigning (by 5 cosigners) of a Symbol aggregate with 100 embedded transfers.
+# Baseline calls SymbolFacade sign_transaction, hash_transaction and cosign_transaction, which serialize aggregate every time.
+# Optimized SigningContext serializes aggregate once and hashes it once per signature.
+#
+
+from benchmarks.benchmark_utils import measure, print_speedup
+from symbolchain.CryptoTypes import PrivateKey, PublicKey
+from symbolchain.facade.SymbolFacade import SymbolFacade
+
+NUM_EMBEDDED_TRANSACTIONS = 100
+NUM_COSIGNERS = 5
+
+
+def main():
+	facade = SymbolFacade('testnet')
+	signer_key_pair = SymbolFacade.KeyPair(PrivateKey.random())
+	cosigner_key_pairs = [SymbolFacade.KeyPair(PrivateKey.random()) for _ in range(NUM_COSIGNERS)]
+
+	embedded_transactions = [
+		facade.transaction_factory.create_embedded({
+			'type': 'transfer_transaction_v1',
+			'signer_public_key': signer_key_pair.public_key,
+			'recipient_address': facade.network.public_key_to_address(PublicKey(index.to_bytes(PublicKey.SIZE, byteorder='little'))),
+			'mosaics': [{'mosaic_id': 0x72C0212E67A08BCE, 'amount': 1000000 + index}],
+			'message': bytes(100)
+		})
+		for index in range(NUM_EMBEDDED_TRANSACTIONS)
+	]
+	transaction = facade.transaction_factory.create({
+		'type': 'aggregate_complete_transaction_v2',
+		'signer_public_key': signer_key_pair.public_key,
+		'deadline': 1,
+		'transactions_hash': facade.hash_embedded_transactions(embedded_transactions),
+		'transactions': embedded_transactions
+	})
+
+	def sign_and_cosign_with_facade():
+		signature = facade.sign_transaction(signer_key_pair, transaction)
+		facade.transaction_factory.attach_signature(transaction, signature)
+		facade.hash_transaction(transaction)
+		for key_pair in cosigner_key_pairs:
+			facade.cosign_transaction(key_pair, transaction)
+
+	def sign_and_cosign_with_context():
+		context = facade.create_signing_context(transaction)
+		signature = context.sign(signer_key_pair)
+		facade.transaction_factory.attach_signature(transaction, signature)
+		context.hash()
+		for key_pair in cosigner_key_pairs:
+			context.cosign(key_pair)
+
+	print(f'signing, hashing and cosigning aggregate with {NUM_EMBEDDED_TRANSACTIONS} transactions by {NUM_COSIGNERS} cosigners')
+	baseline_time = measure('SymbolFacade sign/hash/cosign', sign_and_cosign_with_facade, number=20)
+	optimized_time = measure('SigningContext sign/hash/cosign', sign_and_cosign_with_context, number=20)
+	print_speedup('signing context speedup', baseline_time, optimized_time)
+
+
+if '__main__' == __name__:
+	main()
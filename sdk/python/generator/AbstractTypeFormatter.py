@@ -42,10 +42,22 @@ class AbstractTypeFormatter(ABC):
 	def get_serialize_descriptor(self) -> MethodDescriptor:
 		pass
 
+	def get_from_unpacked_descriptor(self) -> MethodDescriptor:
+		# pylint: disable=no-self-use
+		return None
+
+	def get_serialize_into_descriptor(self) -> MethodDescriptor:
+		# pylint: disable=no-self-use
+		return None
+
 	def get_serialize_protected_descriptor(self) -> MethodDescriptor:
 		# pylint: disable=no-self-use
 		return None
 
+	def get_non_verifiable_descriptor(self) -> MethodDescriptor:
+		# pylint: disable=no-self-use
+		return None
+
 	@abstractmethod
 	def get_size_descriptor(self) -> MethodDescriptor:
 		pass
@@ -65,3 +77,7 @@ class AbstractTypeFormatter(ABC):
 	def get_fields(self):
 		# pylint: disable=no-self-use
 		return []
+
+	def get_module_fields(self):
+		# pylint: disable=no-self-use
+		return []
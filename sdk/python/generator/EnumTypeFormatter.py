@@ -40,6 +40,11 @@ class EnumTypeFormatter(AbstractTypeFormatter):
 		body += 'return buffer'
 		return MethodDescriptor(body=body)
 
+	def get_serialize_into_descriptor(self):
+		body = f'buffer[offset:offset + {self.enum_type.size}] = {self.int_printer.store("self.value")}\n'
+		body += f'return offset + {self.enum_type.size}'
+		return MethodDescriptor(body=body)
+
 	def get_size_descriptor(self):
 		body = f'return {self.enum_type.size}\n'
 		return MethodDescriptor(body=body)
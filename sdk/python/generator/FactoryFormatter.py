@@ -1,7 +1,9 @@
+from catparser.DisplayType import DisplayType
+
 from .AbstractTypeFormatter import AbstractTypeFormatter, MethodDescriptor
 from .format import indent
-from .name_formatting import fix_name, underline_name
-from .printers import BuiltinPrinter
+from .name_formatting import underline_name
+from .printers import BuiltinPrinter, IntPrinter
 from .TypeFormatter import ClassFormatter
 
 
@@ -17,7 +19,7 @@ class FactoryClassFormatter(ClassFormatter):
 	def generate_deserializer(self):
 		method_descriptor = self.provider.get_deserialize_descriptor()
 		method_descriptor.method_name = 'deserialize'
-		method_descriptor.arguments = ['payload: bytes']
+		method_descriptor.arguments = ['payload: bytes | bytearray | memoryview']
 		method_descriptor.annotations = ['@classmethod']
 		return self.generate_method(method_descriptor)
 
@@ -53,17 +55,60 @@ class FactoryFormatter(AbstractTypeFormatter):
 	def typename(self):
 		return f'{self.abstract.name}Factory'
 
+	def _discriminator_fields(self):
+		discriminators = [] if not self.factory_descriptor else self.factory_descriptor.discriminator_names
+		return [next(field for field in self.abstract.fields if discriminator == field.name) for discriminator in discriminators]
+
+	def _field_offset(self, discriminator_field):
+		offset = 0
+		for field in self.abstract.fields:
+			if field.is_const:
+				continue
+
+			if discriminator_field == field:
+				return offset
+
+			field_size = field.extensions.type_model.size
+			if not isinstance(field_size, int):
+				raise RuntimeError(f'discriminator {discriminator_field.name} is not at fixed offset in {self.abstract.name}')
+
+			offset += field_size
+
+		raise RuntimeError(f'discriminator {discriminator_field.name} not found in {self.abstract.name}')
+
+	def _header_size(self):
+		# size of leading fixed size fields, which are all required to be present in any valid payload
+		size = 0
+		for field in self.abstract.fields:
+			if field.is_const:
+				continue
+
+			field_size = field.extensions.type_model.size
+			if not isinstance(field_size, int):
+				break
+
+			size += field_size
+
+		return size
+
 	def create_discriminator(self, name):
-		field_names = self.factory_descriptor.discriminator_values
-		values = ', '.join(map(lambda value: f'{name}.{value}', field_names))
-		return f'({values}): {name}'
+		values = []
+		for (field, value) in zip(self._discriminator_fields(), self.factory_descriptor.discriminator_values):
+			# enum discriminators are peeked as raw integers, so compare against underlying value
+			postfix = '.value' if DisplayType.ENUM == field.extensions.type_model.display_type else ''
+			values.append(f'{name}.{value}{postfix}')
 
-	def get_deserialize_descriptor(self):
-		body = f'{self.printer.name} = {self.printer.get_default_value()}\n'
-		body += 'buffer = bytes(payload)\n'
-		body += f'{self.printer.get_type()}._deserialize(buffer, {self.printer.name})  # pylint: disable=protected-access\n'
-		body += '\n'
-		body += 'mapping = {\n'
+		return f'({", ".join(values)}): {name}'
+
+	def create_discriminator_load(self, field):
+		offset = self._field_offset(field)
+		type_model = field.extensions.type_model
+		printer = field.extensions.printer
+		is_unsigned = printer.descriptor.is_unsigned if isinstance(printer, IntPrinter) else type_model.is_unsigned
+		return f'int.from_bytes(buffer[{offset}:{offset + type_model.size}], byteorder=\'little\', signed={not is_unsigned})'
+
+	def get_fields(self):
+		body = 'MAPPING = {\n'
 
 		if self.factory_descriptor:
 			names = [f'{concrete.name}' for concrete in self.factory_descriptor.children]
@@ -72,11 +117,20 @@ class FactoryFormatter(AbstractTypeFormatter):
 			)
 
 		body += '}\n'
+		return [body]
 
-		discriminators = [] if not self.factory_descriptor else self.factory_descriptor.discriminator_names
-		values = ', '.join(map(lambda discriminator: f'{self.printer.name}.{fix_name(discriminator)}', discriminators))
+	def get_deserialize_descriptor(self):
+		# peek discriminator(s) directly from fixed offsets within header without (fully) deserializing it
+		header_size = self._header_size()
+		body = 'buffer = memoryview(payload)\n'
+		body += f'if len(buffer) < {header_size}:\n'
+		body += f'\traise ValueError(f\'payload size {{len(buffer)}} is smaller than {self.abstract.name} header size {header_size}\')\n\n'
+
+		values = ', '.join(map(self.create_discriminator_load, self._discriminator_fields()))
 		body += f'discriminator = ({values})\n'
-		body += 'factory_class = mapping[discriminator]\n'
+		body += 'factory_class = cls.MAPPING.get(discriminator)\n'
+		body += 'if factory_class is None:\n'
+		body += f'\traise ValueError(f\'unknown discriminator {{discriminator}} for {self.abstract.name}\')\n\n'
 		body += 'return factory_class.deserialize(buffer)'
 
 		return MethodDescriptor(body=body, result=self.abstract.name)
@@ -7,9 +7,11 @@ from catparser.generators.util import build_factory_map, extend_models
 
 from .EnumTypeFormatter import EnumTypeFormatter
 from .FactoryFormatter import FactoryClassFormatter, FactoryFormatter
+from .fixed_layout import create_fixed_layout
 from .PodTypeFormatter import PodTypeFormatter
-from .printers import BuiltinPrinter, create_pod_printer
+from .printers import BuiltinPrinter, TypedArrayPrinter, create_pod_printer
 from .StructTypeFormatter import StructFormatter
+from .StructViewFormatter import StructViewClassFormatter, StructViewFormatter
 from .TypeFormatter import TypeFormatter
 
 
@@ -17,11 +19,42 @@ def create_printer(descriptor, name, is_pod):
 	return (create_pod_printer if is_pod else BuiltinPrinter)(descriptor, name)
 
 
+def set_array_element_codecs(ast_models):
+	fixed_layouts = {ast_model.name: create_fixed_layout(ast_model) for ast_model in ast_models}
+	for ast_model in ast_models:
+		if DisplayType.STRUCT != ast_model.display_type:
+			continue
+
+		for field in ast_model.fields:
+			printer = field.extensions.printer
+			if not isinstance(printer, TypedArrayPrinter) or printer.is_variable_size:
+				continue
+
+			fixed_layout = fixed_layouts.get(field.field_type.element_type)
+			if fixed_layout:
+				printer.element_codec_name = fixed_layout.codec_name
+
+
+def find_factory_ast_model(ast_model, ast_models):
+	return next(factory_ast_model for factory_ast_model in ast_models if ast_model.factory_type == factory_ast_model.name)
+
+
+def create_non_verifiable_formatter(ast_model, ast_models):
+	# verifiable structs (e.g. NEM transactions) with NonVerifiable counterparts can directly serialize their non-verifiable portion
+	non_verifiable_name = f'NonVerifiable{ast_model.name}'
+	non_verifiable_ast_model = next((candidate for candidate in ast_models if non_verifiable_name == candidate.name), None)
+	if not non_verifiable_ast_model or non_verifiable_ast_model.is_abstract:
+		return None
+
+	return StructFormatter(non_verifiable_ast_model, find_factory_ast_model(non_verifiable_ast_model, ast_models))
+
+
 def to_type_formatter_instance(ast_model, ast_models):
 	if DisplayType.STRUCT == ast_model.display_type and ast_model.factory_type:
 		return StructFormatter(
 			ast_model,
-			next(factory_ast_model for factory_ast_model in ast_models if ast_model.factory_type == factory_ast_model.name))
+			find_factory_ast_model(ast_model, ast_models),
+			create_non_verifiable_formatter(ast_model, ast_models))
 
 	type_formatter_class = {
 		DisplayType.STRUCT: StructFormatter,
@@ -36,6 +69,7 @@ def to_type_formatter_instance(ast_model, ast_models):
 def generate_files(ast_models, output_directory: Path):
 	factory_map = build_factory_map(ast_models)
 	extend_models(ast_models, create_printer)
+	set_array_element_codecs(ast_models)
 
 	output_directory.mkdir(exist_ok=True)
 
@@ -53,6 +87,7 @@ from __future__ import annotations
 
 from binascii import hexlify
 from enum import Enum, Flag
+from struct import Struct
 from typing import List, TypeVar
 
 from ..ArrayHelpers import ArrayHelpers
@@ -66,10 +101,16 @@ StrBytes = TypeVar('StrBytes', str, bytes)
 '''
 		)
 		for ast_model in ast_models:
-			generator = TypeFormatter(to_type_formatter_instance(ast_model, ast_models))
+			type_formatter = to_type_formatter_instance(ast_model, ast_models)
+			generator = TypeFormatter(type_formatter)
 			output_file.write(str(generator))
 			output_file.write('\n\n')
 
+			if DisplayType.STRUCT == ast_model.display_type:
+				view_generator = StructViewClassFormatter(StructViewFormatter(type_formatter, ast_models))
+				output_file.write(str(view_generator))
+				output_file.write('\n\n')
+
 		factories = []
 		for ast_model in ast_models:
 			if DisplayType.STRUCT == ast_model.display_type and ast_model.is_abstract:
@@ -1,4 +1,5 @@
 from .AbstractTypeFormatter import AbstractTypeFormatter, MethodDescriptor
+from .fixed_layout import INTEGER_FORMAT_CHARACTERS, codec_name, create_unpack_statements, integer_format
 from .printers import create_pod_printer
 
 
@@ -22,8 +23,19 @@ class PodTypeFormatter(AbstractTypeFormatter):
 	def _is_array(self):
 		return self.pod.display_type.is_array
 
+	@property
+	def _codec_name(self):
+		# integer pods are (un)packed with precompiled codec
+		return None if self._is_array or self.pod.size not in INTEGER_FORMAT_CHARACTERS else codec_name(self.pod.name)
+
 	def get_fields(self):
-		return [f'SIZE = {self.pod.size}']
+		return ['__slots__ = ()', f'SIZE = {self.pod.size}']
+
+	def get_module_fields(self):
+		if not self._codec_name:
+			return []
+
+		return [f'{self._codec_name} = Struct(\'<{integer_format(self.pod.size, self.pod.is_unsigned)}\')']
 
 	def get_base_class(self):
 		return '(ByteArray)' if self._is_array else '(BaseValue)'
@@ -39,16 +51,38 @@ class PodTypeFormatter(AbstractTypeFormatter):
 		return MethodDescriptor(body=body, arguments=arguments)
 
 	def get_deserialize_descriptor(self):
+		# decoded values always fit pod, so they are not validated again
+		if self._codec_name:
+			return MethodDescriptor(body=create_unpack_statements(
+				self._codec_name,
+				self.pod.size,
+				self.typename,
+				lambda unpacked: f'{self.typename}.from_trusted({unpacked}[0])'))
+
 		body = 'buffer = memoryview(payload)\n'
-		body += f'return {self.typename}({self.printer.load()})'
+		body += f'return {self.typename}.from_trusted({self.printer.load()})'
 		return MethodDescriptor(body=body)
 
 	def get_serialize_descriptor(self):
 		if self._is_array:
 			return MethodDescriptor(body='return self.bytes')
 
+		if self._codec_name:
+			return MethodDescriptor(body=f'return {self._codec_name}.pack(self.value)')
+
 		return MethodDescriptor(body=f'return {self.printer.store("self.value")}')
 
+	def get_serialize_into_descriptor(self):
+		if self._codec_name:
+			body = f'{self._codec_name}.pack_into(buffer, offset, self.value)\n'
+			body += f'return offset + {self.pod.size}'
+			return MethodDescriptor(body=body)
+
+		value = 'self.bytes' if self._is_array else self.printer.store('self.value')
+		body = f'buffer[offset:offset + {self.pod.size}] = {value}\n'
+		body += f'return offset + {self.pod.size}'
+		return MethodDescriptor(body=body)
+
 	def get_size_descriptor(self):
 		if not self._is_array:
 			return None
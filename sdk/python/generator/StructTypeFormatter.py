@@ -3,9 +3,13 @@ from itertools import filterfalse
 from catparser.DisplayType import DisplayType
 
 from .AbstractTypeFormatter import AbstractTypeFormatter, MethodDescriptor
+from .fixed_layout import create_fixed_layout, create_unpack_statements
 from .format import indent
 from .name_formatting import fix_size_name
 
+# generated slot tuples longer than this are wrapped, so that generated code stays within line length limits
+MAX_SLOTS_LINE_LENGTH = 140
+
 
 def is_reserved(field):
 	return 'reserved' == field.disposition
@@ -23,6 +27,18 @@ def is_computed(field):
 	return hasattr(field.field_type, 'sizeref') and field.field_type.sizeref
 
 
+def is_deferred_size(field):
+	# deferred size fields are written as placeholders and patched after bound field is serialized
+	if not is_bound_size(field):
+		return False
+
+	bound_field = field.extensions.bound_field
+	if bound_field.display_type.is_array:
+		return not field.name.endswith('_count') and bound_field.field_type.is_byte_constrained
+
+	return field.is_size_reference
+
+
 def create_temporary_buffer_name(name):
 	return f'{name}_condition'
 
@@ -44,11 +60,13 @@ def filter_size_if_first(fields_iter):
 class StructFormatter(AbstractTypeFormatter):
 	# pylint: disable=too-many-public-methods
 
-	def __init__(self, ast_model, factory_ast_model=None):
+	def __init__(self, ast_model, factory_ast_model=None, non_verifiable_formatter=None):
 		super().__init__()
 
 		self.struct = ast_model
 		self.base_struct = factory_ast_model
+		self.fixed_layout = create_fixed_layout(ast_model)
+		self.non_verifiable_formatter = non_verifiable_formatter
 
 	def non_const_fields(self, include_inherited=True):
 		fields = filterfalse(is_const, self.struct.fields)
@@ -126,8 +144,22 @@ class StructFormatter(AbstractTypeFormatter):
 		body += '}\n'
 		return body
 
+	def generate_slots(self):
+		# only fields introduced by this struct need slots, inherited fields are stored in base struct slots
+		own_fields = list(self.non_reserved_fields(include_inherited=False)) + list(self.reserved_fields(include_inherited=False))
+		slot_names = [f'\'{self.field_name(field, "")[1:]}\'' for field in own_fields]
+		slots = f'__slots__ = ({", ".join(slot_names)}{"," if 1 == len(slot_names) else ""})\n'
+		if len(slots) <= MAX_SLOTS_LINE_LENGTH:
+			return slots
+
+		# wrap long slot tuples one name per line, like type hints
+		return '__slots__ = (\n' + indent(',\n'.join(slot_names)) + ')\n'
+
 	def get_fields(self):
-		return list(map(self.generate_class_field, self.const_fields())) + [self.generate_type_hints()]
+		return [self.generate_slots()] + list(map(self.generate_class_field, self.const_fields())) + [self.generate_type_hints()]
+
+	def get_module_fields(self):
+		return [self.fixed_layout.get_codec_definition()] if self.fixed_layout else []
 
 	def get_paired_const_field(self, field):
 		for const_field in self.const_fields():
@@ -286,6 +318,13 @@ class StructFormatter(AbstractTypeFormatter):
 		return indent_if_conditional(condition, deserialize_field)
 
 	def get_deserialize_descriptor(self):
+		if self.fixed_layout:
+			return MethodDescriptor(body=create_unpack_statements(
+				self.fixed_layout.codec_name,
+				self.fixed_layout.size,
+				self.typename,
+				lambda unpacked: f'{self.typename}.from_unpacked({unpacked})'))
+
 		body = ''
 		if not self.is_type_abstract:
 			body = 'buffer = memoryview(payload)\n'
@@ -349,6 +388,36 @@ class StructFormatter(AbstractTypeFormatter):
 
 		return MethodDescriptor(body=body)
 
+	def get_from_unpacked_descriptor(self):
+		if not self.fixed_layout:
+			return None
+
+		names = [field.name for field in self.fixed_layout.fields]
+		body = f'({", ".join(names)}{"," if 1 == len(names) else ""}) = values\n'
+
+		for field in self.fixed_layout.fields:
+			if is_reserved(field.field):
+				assert_message = f'f\'Invalid value of reserved field ({{{field.name}}})\''
+				body += f'assert {field.name} == {field.field.value}, {assert_message}\n'
+
+		body += f'instance = {self.typename}()\n'
+		body += '\n'
+		body += '# pylint: disable=protected-access\n'
+
+		exposed_names = set(field.name for field in self.non_reserved_fields(include_inherited=False))
+		for field in self.fixed_layout.fields:
+			if field.field.name in exposed_names:
+				body += f'{self.field_name(field.field, "instance")} = {field.to_field_value(field.name)}\n'
+
+		body += 'return instance'
+		return MethodDescriptor(body=body)
+
+	def _find_deferred_size_field(self, field):
+		return next((
+			size_field for size_field in self.non_const_fields(include_inherited=False)
+			if is_deferred_size(size_field) and field.name == size_field.extensions.bound_field.name
+		), None)
+
 	def generate_serialize_field(self, field):
 		condition = self.generate_condition(field, True)
 
@@ -357,41 +426,55 @@ class StructFormatter(AbstractTypeFormatter):
 
 		# bound fields are the size / count / sizeof fields that are bound to either object or array
 		bound_field = field.extensions.bound_field
+		if is_deferred_size(field):
+			# size is known only after bound field is written, so reserve space for it and patch it afterwards
+			size_offset = f'{field.extensions.printer.name}_offset'
+			serialize_field = f'{size_offset} = offset\noffset += {field.size}  # {field.name}\n'
+			return indent_if_conditional(condition, serialize_field)
+
 		if is_bound_size(field):
 			bound_field_name = self.field_name(bound_field)
 			field_comment = f'  # {field.name}'
 
 			if bound_field.display_type.is_array:
-				if field.name.endswith('_count') or not bound_field.field_type.is_byte_constrained:
-					field_value = f'len({bound_field_name})'
-
-					bound_condition = self.generate_condition(bound_field, True)
-					if condition and bound_condition:
-						raise RuntimeError('do not know yet how to generate both conditions')
-
-					# HACK: create inline if condition (for NEM namespace purposes)
-					if bound_condition:
-						condition_value = bound_field.value.value
-						field_value = f'({field_value} if {bound_field_name} is not None else {condition_value})'
-				else:
-					field_value = bound_field.extensions.printer.get_size()
-			elif field.is_size_reference:
-				field_value = bound_field.extensions.printer.get_size()
+				field_value = f'len({bound_field_name})'
+
+				bound_condition = self.generate_condition(bound_field, True)
+				if condition and bound_condition:
+					raise RuntimeError('do not know yet how to generate both conditions')
+
+				# HACK: create inline if condition (for NEM namespace purposes)
+				if bound_condition:
+					condition_value = bound_field.value.value
+					field_value = f'({field_value} if {bound_field_name} is not None else {condition_value})'
 		else:
 			field_value = self.field_name(field)
 
-		serialize_field = field.extensions.printer.store(field_value) + field_comment
+		# attach comment to first statement
+		serialize_field = field.extensions.printer.store_into(field_value).replace('\n', f'{field_comment}\n', 1)
+		if '\n' not in serialize_field:
+			serialize_field += field_comment
+
+		serialize_field += '\n'
+
+		size_field = self._find_deferred_size_field(field)
+		if size_field:
+			size_offset = f'{size_field.extensions.printer.name}_offset'
+			field_offset = f'{field.extensions.printer.name}_offset'
+			serialize_field = f'{field_offset} = offset\n{serialize_field}'
+			serialize_field += f'buffer[{size_offset}:{size_offset} + {size_field.size}] = '
+			serialize_field += f'{size_field.extensions.printer.store(f"(offset - {field_offset})")}\n'
 
-		return indent_if_conditional(condition, f'buffer += {serialize_field}\n')
+		return indent_if_conditional(condition, serialize_field)
 
 	def generate_serialize_fields(self):
 		body = ''
 
-		# if first field is size replace serializer with custom one (to access builder .size() instead)
+		# if first field is size, skip over it, it is patched once whole struct is serialized (see serialize_into)
 		fields_iter = self.non_const_fields(include_inherited=False)
 		first_field = next(fields_iter)
 		if self.struct.size == first_field.extensions.printer.name:
-			body += f'buffer += self.size.to_bytes({first_field.size}, byteorder=\'little\', signed=False)\n'
+			body += f'offset += {first_field.size}  # size\n'
 		else:
 			body += self.generate_serialize_field(first_field)
 
@@ -400,18 +483,45 @@ class StructFormatter(AbstractTypeFormatter):
 
 		return body
 
+	def _size_field(self):
+		for struct in filter(None, [self.base_struct, self.struct]):
+			first_field = next(filterfalse(is_const, struct.fields))
+			if struct.size == first_field.extensions.printer.name:
+				return first_field
+
+		return None
+
 	def get_serialize_descriptor(self):
-		body = 'buffer = bytearray()\n'
+		body = 'buffer = bytearray(self.size)\n'
+		body += 'self.serialize_into(buffer, 0)\n'
+		body += 'return buffer'
+		return MethodDescriptor(body=body)
+
+	def get_serialize_into_descriptor(self):
+		if self.fixed_layout:
+			values = ', '.join(field.to_packed_value(self.field_name(field.field)) for field in self.fixed_layout.fields)
+			body = f'{self.fixed_layout.codec_name}.pack_into(buffer, offset, {values})\n'
+			body += f'return offset + {self.fixed_layout.size}'
+			return MethodDescriptor(body=body)
+
+		size_field = self._size_field()
+
+		body = ''
+		if size_field:
+			body += 'size_offset = offset\n'
 
 		if self.base_struct:
-			body += 'super()._serialize(buffer)\n'
+			body += 'offset = super()._serialize_into(buffer, offset)\n'
 
 		if self.is_type_abstract:
-			body += 'self._serialize(buffer)\n'
+			body += 'offset = self._serialize_into(buffer, offset)\n'
 		else:
 			body += self.generate_serialize_fields()
 
-		body += 'return buffer'
+		if size_field:
+			body += f'buffer[size_offset:size_offset + {size_field.size}] = {size_field.extensions.printer.store("(offset - size_offset)")}\n'
+
+		body += 'return offset'
 		return MethodDescriptor(body=body)
 
 	def get_serialize_protected_descriptor(self):
@@ -419,6 +529,22 @@ class StructFormatter(AbstractTypeFormatter):
 			return None
 
 		body = self.generate_serialize_fields()
+		body += 'return offset'
+		return MethodDescriptor(body=body)
+
+	def get_non_verifiable_descriptor(self):
+		if not self.non_verifiable_formatter:
+			return None
+
+		# non-verifiable struct fields are subset of (verifiable) struct fields with same names,
+		# so they can be written directly from self without creating non-verifiable struct
+		fields = list(self.non_verifiable_formatter.non_const_fields())
+		body = 'size = 0\n'
+		body += ''.join(map(self.non_verifiable_formatter.generate_size_field, fields))
+		body += 'buffer = bytearray(size)\n'
+		body += 'offset = 0\n'
+		body += ''.join(map(self.non_verifiable_formatter.generate_serialize_field, fields))
+		body += 'return buffer'
 		return MethodDescriptor(body=body)
 
 	def generate_size_field(self, field):
@@ -428,6 +554,9 @@ class StructFormatter(AbstractTypeFormatter):
 		return indent_if_conditional(condition, f'size += {size_field}\n')
 
 	def get_size_descriptor(self):
+		if self.fixed_layout:
+			return MethodDescriptor(body=f'return {self.fixed_layout.size}')
+
 		body = 'size = 0\n'
 		if self.base_struct:
 			body += 'size += super().size\n'
@@ -0,0 +1,307 @@
+from catparser.DisplayType import DisplayType
+
+from .AbstractTypeFormatter import AbstractTypeFormatter, MethodDescriptor
+from .format import indent
+from .name_formatting import fix_size_name
+from .printers import ArrayPrinter, IntPrinter, TypedArrayPrinter
+from .StructTypeFormatter import create_temporary_buffer_name, indent_if_conditional, is_bound_size, is_computed, is_reserved
+from .TypeFormatter import ClassFormatter
+
+
+def view_name(name):
+	return f'{name}View'
+
+
+def load_int(printer):
+	data_size = printer.get_size()
+	return f'int.from_bytes(buffer[offset:offset + {data_size}], byteorder=\'little\', signed={not printer.descriptor.is_unsigned})'
+
+
+class StructViewClassFormatter(ClassFormatter):
+	def generate_ctor(self):
+		method_descriptor = self.provider.get_ctor_descriptor()
+		method_descriptor.method_name = '__init__'
+		method_descriptor.arguments = ['payload: bytes | bytearray | memoryview']
+		return self.generate_method(method_descriptor)
+
+	def generate_methods(self):
+		methods = [self.generate_ctor()]
+
+		# size is only generated by root views, derived views inherit it
+		size_descriptor = self.provider.get_size_descriptor()
+		if size_descriptor:
+			size_descriptor.method_name = 'size'
+			size_descriptor.result = 'int'
+			size_descriptor.annotations = ['@property']
+			methods.append(self.generate_method(size_descriptor))
+
+		methods.extend(map(self.generate_method, self.provider.get_getter_descriptors()))
+		return methods
+
+
+class StructViewFormatter(AbstractTypeFormatter):
+	"""Generates lazy, zero-copy view over serialized struct.
+
+	View constructor only scans the buffer and records field offsets (reading only sizes, counts and conditions),
+	while every field is decoded into regular (eager) model type on first access.
+	"""
+
+	def __init__(self, struct_formatter, ast_models):
+		super().__init__()
+
+		self.struct_formatter = struct_formatter
+		self.struct = struct_formatter.struct
+		self.base_struct = struct_formatter.base_struct
+		self.ast_models = {ast_model.name: ast_model for ast_model in ast_models}
+
+	@property
+	def typename(self):
+		return view_name(self.struct.name)
+
+	def get_base_class(self):
+		return '' if not self.base_struct else f'({view_name(self.base_struct.name)})'
+
+	def _static_struct_size(self, ast_model):
+		if DisplayType.STRUCT != ast_model.display_type:
+			return ast_model.size if isinstance(ast_model.size, int) else None
+
+		if ast_model.is_abstract or ast_model.factory_type:
+			return None
+
+		size = 0
+		for field in ast_model.fields:
+			if field.is_const:
+				continue
+
+			field_size = self._static_field_size(field)
+			if field_size is None:
+				return None
+
+			size += field_size
+
+		return size
+
+	def _static_field_size(self, field):
+		if field.is_conditional:
+			return None
+
+		printer = field.extensions.printer
+		if isinstance(printer, (IntPrinter, ArrayPrinter)):
+			size = printer.descriptor.size
+			return size if isinstance(size, int) else None
+
+		if isinstance(printer, TypedArrayPrinter):
+			return None
+
+		return self._static_struct_size(field.extensions.type_model)
+
+	def _static_prefix_size(self):
+		# size of leading fixed size fields, which can be checked before any of them is read
+		size = 0
+		fields = list(self.struct_formatter.non_const_fields(include_inherited=False))
+		for field in fields:
+			field_size = self._static_field_size(field)
+			if field_size is None:
+				return (size, False)
+
+			size += field_size
+
+		return (size, True)
+
+	def _needed_field_names(self):
+		names = set()
+		for field in self.struct_formatter.non_const_fields(include_inherited=False):
+			if field.is_conditional:
+				names.add(field.value.linked_field_name)
+
+			if is_bound_size(field) or is_computed(field) or is_reserved(field) or self.struct.size == field.extensions.printer.name:
+				names.add(field.name)
+
+			for size_field in field.extensions.size_fields:
+				names.add(size_field.name)
+
+		return names
+
+	@staticmethod
+	def _referenced_size_names(field):
+		names = [size_field.name for size_field in field.extensions.size_fields]
+
+		printer = field.extensions.printer
+		if isinstance(printer, (ArrayPrinter, TypedArrayPrinter)) and isinstance(printer.descriptor.size, str):
+			names.append(printer.descriptor.size)
+
+		return [fix_size_name(name) for name in names]
+
+	def _exposed_field_names(self):
+		return set(field.name for field in self.struct_formatter.non_reserved_fields(include_inherited=False))
+
+	def _generate_advancement(self, field):
+		printer = field.extensions.printer
+		if field.extensions.size_fields:
+			return f'offset += {field.extensions.size_fields[0].name}\n'
+
+		if isinstance(printer, ArrayPrinter):
+			return f'offset += {printer.advancement_size()}\n'
+
+		if isinstance(printer, TypedArrayPrinter):
+			return self._generate_array_advancement(field)
+
+		# conditional fields are only advanced over when present, so size of field type is sufficient
+		field_size = self._static_struct_size(field.extensions.type_model)
+		if field_size is not None:
+			return f'offset += {field_size}\n'
+
+		return f'offset += {view_name(field.extensions.type_model.name)}(buffer[offset:]).size\n'
+
+	def _generate_array_advancement(self, field):
+		printer = field.extensions.printer
+		field_type = field.field_type
+		if field_type.is_byte_constrained:
+			return f'offset += {fix_size_name(printer.descriptor.size)}\n'
+
+		if field_type.is_expandable:
+			return 'offset = len(buffer)\n'
+
+		if field_type.alignment:
+			raise RuntimeError(f'do not know yet how to generate view for aligned array {field.name}')
+
+		element_model = self.ast_models[field_type.element_type]
+		element_size = self._static_struct_size(element_model)
+		if element_size is not None:
+			return f'offset += {printer.descriptor.size} * {element_size}\n'
+
+		return f'for _ in range({printer.descriptor.size}):\n\toffset += {view_name(element_model.name)}(buffer[offset:]).size\n'
+
+	def _generate_scan_field(self, field, needed_names, exposed_names):
+		printer = field.extensions.printer
+		local_name = fix_size_name(printer.name)
+
+		body = ''
+		if field.name in exposed_names:
+			body += f'self._{printer.name}_offset = offset\n'
+
+		if field.name in needed_names:
+			load = load_int(printer) if isinstance(printer, IntPrinter) else printer.load('buffer[offset:]')
+			body += f'{local_name} = {load}\n'
+
+		if self.struct.size == printer.name:
+			body += f'if {local_name} > len(buffer):\n'
+			body += f'\traise ValueError(f\'size should not exceed {{len(buffer)}}. The value of size was: {{{local_name}}}.\')\n\n'
+			body += f'buffer = buffer[:{local_name}]\n'
+
+		body += self._generate_advancement(field)
+
+		if is_reserved(field):
+			assert_message = f'f\'Invalid value of reserved field ({{{printer.name}}})\''
+			body += f'assert {printer.name} == {field.value}, {assert_message}\n'
+
+		condition = self.struct_formatter.generate_condition(field)
+		if condition:
+			condition = f'self._{printer.name}_offset = None\n' + condition
+
+		return indent_if_conditional(condition, body)
+
+	def _generate_queued_field(self, field):
+		temporary_offset = f'{create_temporary_buffer_name(field.value.linked_field_name)}_offset'
+		condition = self.struct_formatter.generate_condition(field)
+		body = f'self._{field.extensions.printer.name}_offset = None\n'
+		body += condition + indent(f'self._{field.extensions.printer.name}_offset = {temporary_offset}\n')
+		return body
+
+	def get_ctor_descriptor(self):
+		if self.base_struct:
+			body = 'super().__init__(payload)\n'
+			body += 'buffer = self._buffer\n'
+			body += 'offset = self._end_offset\n'
+		else:
+			body = 'buffer = memoryview(payload)\n'
+			body += 'offset = 0\n'
+			body += 'self._cache = {}\n'
+
+		# reject (truncated) buffers up front like deserialize instead of failing when field is accessed
+		(prefix_size, is_static) = self._static_prefix_size()
+		if prefix_size:
+			body += f'if len(buffer) < offset + {prefix_size}:\n'
+			body += f'\traise ValueError(f\'payload size {{len(buffer)}} is smaller than {self.struct.name} size {{offset + {prefix_size}}}\')\n\n'
+
+		needed_names = self._needed_field_names()
+		exposed_names = self._exposed_field_names()
+
+		# special treatment for condition-guarded fields, where condition is behind the fields (see deserialize)
+		processed_fields = set()
+		queued_fields = {}
+		size_names = set()
+		for field in self.struct_formatter.non_const_fields(include_inherited=False):
+			if field.name in exposed_names:
+				size_names.update(self._referenced_size_names(field))
+
+			if field.is_conditional:
+				condition_field_name = field.value.linked_field_name
+				if condition_field_name not in processed_fields:
+					if condition_field_name not in queued_fields:
+						queued_fields[condition_field_name] = []
+
+						# assume same size and skip over all alternatives at once
+						temporary_offset = f'{create_temporary_buffer_name(condition_field_name)}_offset'
+						body += f'{temporary_offset} = offset\n'
+						body += self._generate_advancement(field)
+
+					queued_fields[condition_field_name].append(field)
+					continue
+
+			body += self._generate_scan_field(field, needed_names, exposed_names)
+			processed_fields.add(field.name)
+
+			for conditioned_field in queued_fields.get(field.name, []):
+				body += self._generate_queued_field(conditioned_field)
+
+		body += '\n'
+		if not is_static:
+			# variable size fields (and windowing by size field) can only be checked after scanning
+			body += 'if offset > len(buffer):\n'
+			body += f'\traise ValueError(f\'payload size {{len(buffer)}} is smaller than {self.struct.name} size {{offset}}\')\n\n'
+
+		body += ''.join(f'self._{name} = {name}\n' for name in sorted(size_names))
+		body += 'self._buffer = buffer\n'
+		body += 'self._end_offset = offset'
+		return MethodDescriptor(body=body)
+
+	def get_size_descriptor(self):
+		if self.base_struct:
+			return None
+
+		# size prefixed views are windowed to their size, so whole buffer belongs to view
+		is_size_prefixed = any(self.struct.size == field.extensions.printer.name for field in self.struct.fields)
+		return MethodDescriptor(body='return len(self._buffer)' if is_size_prefixed else 'return self._end_offset')
+
+	def create_getter_descriptor(self, field):
+		printer = field.extensions.printer
+
+		body = ''
+		if field.is_conditional:
+			body += f'if self._{printer.name}_offset is None:\n\treturn None\n\n'
+
+		body += f'if \'{printer.name}\' in self._cache:\n'
+		body += f'\treturn self._cache[\'{printer.name}\']\n\n'
+
+		body += f'buffer = self._buffer[self._{printer.name}_offset:]\n'
+		body += ''.join(f'{name} = self._{name}\n' for name in self._referenced_size_names(field))
+
+		size_fields = field.extensions.size_fields
+		load = printer.load(f'buffer[:{size_fields[0].name}]') if size_fields else printer.load()
+		body += f'{printer.name} = {load}\n'
+		body += f'self._cache[\'{printer.name}\'] = {printer.name}\n'
+		body += f'return {printer.name}'
+
+		method_descriptor = MethodDescriptor(method_name=printer.name, body=body, result=printer.get_type())
+		method_descriptor.annotations = ['@property']
+		return method_descriptor
+
+	def get_getter_descriptors(self):
+		return list(map(self.create_getter_descriptor, self.struct_formatter.non_reserved_fields(include_inherited=False)))
+
+	def get_deserialize_descriptor(self):
+		raise RuntimeError('not required')
+
+	def get_serialize_descriptor(self):
+		raise RuntimeError('not required')
@@ -47,6 +47,12 @@ class ClassFormatter(ABC):
 
 	def generate_output(self):
 		output = self.generate_class()
+
+		# module fields (like precompiled codecs) are emitted in front of class using them
+		module_fields = self.provider.get_module_fields()
+		if module_fields:
+			output = '\n'.join(module_fields) + '\n\n\n' + output
+
 		return output
 
 	def __str__(self):
@@ -105,19 +111,50 @@ class TypeFormatter(ClassFormatter):
 		method_descriptor.annotations = ['@classmethod']
 		return self.generate_method(method_descriptor)
 
+	def generate_from_unpacked(self):
+		method_descriptor = self.provider.get_from_unpacked_descriptor()
+		if not method_descriptor:
+			return None
+
+		method_descriptor.method_name = 'from_unpacked'
+		method_descriptor.arguments = ['values: tuple']
+		method_descriptor.result = self.provider.typename
+		method_descriptor.annotations = ['@classmethod']
+		return self.generate_method(method_descriptor)
+
 	def generate_serializer(self):
 		method_descriptor = self.provider.get_serialize_descriptor()
 		method_descriptor.method_name = 'serialize'
 		method_descriptor.result = 'bytes'
 		return self.generate_method(method_descriptor)
 
+	def generate_serializer_into(self):
+		method_descriptor = self.provider.get_serialize_into_descriptor()
+		if not method_descriptor:
+			return None
+
+		method_descriptor.method_name = 'serialize_into'
+		method_descriptor.arguments = ['buffer: bytearray | memoryview', 'offset: int']
+		method_descriptor.result = 'int'
+		return self.generate_method(method_descriptor)
+
 	def generate_serializer_protected(self):
 		method_descriptor = self.provider.get_serialize_protected_descriptor()
 		if not method_descriptor:
 			return None
 
-		method_descriptor.method_name = '_serialize'
-		method_descriptor.arguments = ['buffer: memoryview']
+		method_descriptor.method_name = '_serialize_into'
+		method_descriptor.arguments = ['buffer: bytearray | memoryview', 'offset: int']
+		method_descriptor.result = 'int'
+		return self.generate_method(method_descriptor)
+
+	def generate_serializer_non_verifiable(self):
+		method_descriptor = self.provider.get_non_verifiable_descriptor()
+		if not method_descriptor:
+			return None
+
+		method_descriptor.method_name = 'serialize_non_verifiable'
+		method_descriptor.result = 'bytes'
 		return self.generate_method(method_descriptor)
 
 	def generate_size(self):
@@ -161,8 +198,11 @@ class TypeFormatter(ClassFormatter):
 		_append_if_not_none(methods, self.generate_size())
 
 		methods.append(self.generate_deserializer())
+		_append_if_not_none(methods, self.generate_from_unpacked())
 		methods.append(self.generate_serializer())
+		_append_if_not_none(methods, self.generate_serializer_into())
 		_append_if_not_none(methods, self.generate_serializer_protected())
+		_append_if_not_none(methods, self.generate_serializer_non_verifiable())
 
 		_append_if_not_none(methods, self.generate_representation())
 
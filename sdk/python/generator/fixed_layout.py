@@ -0,0 +1,119 @@
+from struct import Struct
+
+from catparser.DisplayType import DisplayType
+
+from .name_formatting import underline_name
+from .printers import BuiltinPrinter, IntPrinter
+
+INTEGER_FORMAT_CHARACTERS = {1: 'b', 2: 'h', 4: 'i', 8: 'q'}
+
+
+def codec_name(name):
+	return f'_{underline_name(name).upper()}_CODEC'
+
+
+def integer_format(size, is_unsigned):
+	character = INTEGER_FORMAT_CHARACTERS[size]
+	return character.upper() if is_unsigned else character
+
+
+def create_unpack_statements(codec, size, type_name, unpacked_factory):
+	"""Creates statements unpacking payload with codec, which reject (too) short payloads like all other deserializers."""
+	body = f'if len(payload) < {size}:\n'
+	body += f'\traise ValueError(f\'payload size {{len(payload)}} is smaller than {type_name} size {size}\')\n\n'
+	body += f'return {unpacked_factory(f"{codec}.unpack_from(payload)")}'
+	return body
+
+
+class FixedLayoutField:
+	"""Field of fixed layout struct with conversions between unpacked value and field value."""
+
+	def __init__(self, field, value_format, kind):
+		self.field = field
+		self.format = value_format
+		self.kind = kind
+
+	@property
+	def name(self):
+		return self.field.extensions.printer.name
+
+	def to_field_value(self, unpacked_value):
+		if 'int' == self.kind:
+			return unpacked_value
+
+		if 'enum' == self.kind:
+			return f'{self.field.extensions.type_model.name}({unpacked_value})'
+
+		# unpacked pods always fit, so they are not validated again
+		return f'{self.field.extensions.type_model.name}.from_trusted({unpacked_value})'
+
+	def to_packed_value(self, field_value):
+		return {'int': field_value, 'pod': f'{field_value}.value', 'enum': f'{field_value}.value', 'bytes': f'{field_value}.bytes'}[self.kind]
+
+
+class FixedLayout:
+	"""Layout of struct composed only of fixed size integers, pods and enums that can be (un)packed by single struct.Struct."""
+
+	def __init__(self, name, fields):
+		self.name = name
+		self.fields = fields
+
+	@property
+	def codec_name(self):
+		return codec_name(self.name)
+
+	@property
+	def format(self):
+		return '<' + ''.join(field.format for field in self.fields)
+
+	@property
+	def size(self):
+		return Struct(self.format).size
+
+	def get_codec_definition(self):
+		return f'{self.codec_name} = Struct(\'{self.format}\')'
+
+
+def _create_fixed_layout_field(field):
+	is_computed = hasattr(field.field_type, 'sizeref') and field.field_type.sizeref
+	if field.is_conditional or is_computed or field.extensions.bound_field is not None or field.extensions.size_fields:
+		return None
+
+	printer = field.extensions.printer
+	if isinstance(printer, IntPrinter):
+		(descriptor, kind) = (printer.descriptor, 'int')
+	elif isinstance(printer, BuiltinPrinter):
+		descriptor = field.extensions.type_model
+		kind = {DisplayType.ENUM: 'enum', DisplayType.INTEGER: 'pod', DisplayType.BYTE_ARRAY: 'bytes'}.get(descriptor.display_type)
+	else:
+		return None
+
+	if not kind or not isinstance(descriptor.size, int):
+		return None
+
+	if 'bytes' == kind:
+		return FixedLayoutField(field, f'{descriptor.size}s', kind)
+
+	if descriptor.size not in INTEGER_FORMAT_CHARACTERS:
+		return None
+
+	return FixedLayoutField(field, integer_format(descriptor.size, descriptor.is_unsigned), kind)
+
+
+def create_fixed_layout(ast_model):
+	"""Creates fixed layout for struct if all its fields have fixed size and can be (un)packed by single struct.Struct."""
+	if DisplayType.STRUCT != ast_model.display_type or ast_model.is_abstract or ast_model.factory_type:
+		return None
+
+	fields = []
+	for field in ast_model.fields:
+		if field.is_const:
+			continue
+
+		fixed_layout_field = _create_fixed_layout_field(field)
+		if not fixed_layout_field:
+			return None
+
+		fields.append(fixed_layout_field)
+
+	return FixedLayout(ast_model.name, fields) if fields else None
@@ -39,6 +39,10 @@ class IntPrinter(Printer):
 	def store(self, field_name):
 		return f'{field_name}.to_bytes({self.get_size()}, byteorder=\'little\', signed={not self.descriptor.is_unsigned})'
 
+	def store_into(self, field_name):
+		data_size = self.get_size()
+		return f'buffer[offset:offset + {data_size}] = {self.store(field_name)}\noffset += {data_size}'
+
 	@staticmethod
 	def assign(value):
 		return str(value)
@@ -53,6 +57,9 @@ class TypedArrayPrinter(Printer):
 		super().__init__(descriptor, name)
 		self.type_hint = f'array[{self.descriptor.field_type.element_type}]'
 
+		# name of precompiled codec of fixed layout elements (see fixed_layout), when set elements are unpacked in bulk
+		self.element_codec_name = None
+
 	def get_type(self):
 		return f'List[{self.descriptor.field_type.element_type}]'
 
@@ -95,6 +102,9 @@ class TypedArrayPrinter(Printer):
 			skip_last_element_padding = f'skip_last_element_padding={not self.descriptor.field_type.is_last_element_padded}'
 			return f'ArrayHelpers.read_variable_size_elements({buffer}, {element_type}, {alignment}, {skip_last_element_padding})'
 
+		if self.element_codec_name:
+			return self._load_fixed_size_elements(element_type)
+
 		if self.descriptor.field_type.is_expandable:
 			return f'ArrayHelpers.read_array(buffer, {element_type})'
 
@@ -109,6 +119,17 @@ class TypedArrayPrinter(Printer):
 		args_str = ', '.join(args)
 		return f'ArrayHelpers.read_array_count({args_str})'
 
+	def _load_fixed_size_elements(self, element_type):
+		args = ['buffer', element_type, self.element_codec_name]
+		if not self.descriptor.field_type.is_expandable:
+			args.append(str(self.descriptor.size))
+
+			if self.descriptor.field_type.sort_key:
+				args.append(self._get_sort_accessor())
+
+		args_str = ', '.join(args)
+		return f'ArrayHelpers.read_fixed_size_array({args_str})'
+
 	def advancement_size(self):
 		if self.descriptor.field_type.is_byte_constrained:
 			return str(self.descriptor.size)
@@ -119,14 +140,15 @@ class TypedArrayPrinter(Printer):
 
 		return f'ArrayHelpers.size({self.name})'
 
-	def store(self, field_name):
+	def store_into(self, field_name):
 		if self.is_variable_size:
 			alignment = self.descriptor.field_type.alignment
 			skip_last_element_padding = not self.descriptor.field_type.is_last_element_padded
-			return f'ArrayHelpers.write_variable_size_elements({field_name}, {alignment}, skip_last_element_padding={skip_last_element_padding})'
+			args_str = f'{field_name}, {alignment}, skip_last_element_padding={skip_last_element_padding}'
+			return f'offset = ArrayHelpers.write_variable_size_elements_into(buffer, offset, {args_str})'
 
 		if self.descriptor.field_type.is_expandable:
-			return f'ArrayHelpers.write_array({field_name})'
+			return f'offset = ArrayHelpers.write_array_into(buffer, offset, {field_name})'
 
 		args = [field_name]
 		size = self.descriptor.size
@@ -138,9 +160,9 @@ class TypedArrayPrinter(Printer):
 
 		args_str = ', '.join(args)
 		if isinstance(size, str):
-			return f'ArrayHelpers.write_array({args_str})'
+			return f'offset = ArrayHelpers.write_array_into(buffer, offset, {args_str})'
 
-		return f'ArrayHelpers.write_array_count({args_str})'
+		return f'offset = ArrayHelpers.write_array_count_into(buffer, offset, {args_str})'
 
 	def sort(self, field_name):
 		if not self.descriptor.field_type.sort_key:
@@ -184,8 +206,8 @@ class ArrayPrinter(Printer):
 		return fix_size_name(self.descriptor.size)
 
 	@staticmethod
-	def store(field_name):
-		return field_name
+	def store_into(field_name):
+		return f'buffer[offset:offset + len({field_name})] = {field_name}\noffset += len({field_name})'
 
 	@staticmethod
 	def to_string(field_name):
@@ -231,8 +253,8 @@ class BuiltinPrinter(Printer):
 		return f'{self.name}.size'
 
 	@staticmethod
-	def store(field_name):
-		return f'{field_name}.serialize()'
+	def store_into(field_name):
+		return f'offset = {field_name}.serialize_into(buffer, offset)'
 
 	def sort(self, field_name):
 		return f'{field_name}.sort()' if DisplayType.STRUCT == self.descriptor.display_type else None
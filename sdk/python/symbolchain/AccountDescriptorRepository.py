@@ -1,6 +1,5 @@
-import yaml
-
 from .CryptoTypes import PublicKey
+from .DescriptorReader import load_yaml
 
 
 class AccountDescriptor:
@@ -17,29 +16,72 @@ class AccountDescriptor:
 		self.roles = descriptor_yaml.get('roles') or []
 
 
+def _add_to_index(index, key, descriptor):
+	if key:
+		index.setdefault(key, []).append(descriptor)
+
+
+def _remove_from_index(index, key, descriptor):
+	if key:
+		descriptors = index[key]
+		descriptors.remove(descriptor)
+		if not descriptors:
+			del index[key]
+
+
 class AccountDescriptorRepository:
-	"""Loads read-only account descriptors from YAML."""
+	"""Loads account descriptors from YAML and indexes them by name, public key, address and role."""
 
 	def __init__(self, yaml_input):
 		"""Loads account descriptors from the specified input."""
-		descriptors_yaml = yaml_input if isinstance(yaml_input, list) else yaml.load(yaml_input, Loader=yaml.SafeLoader)
-		self.descriptors = [AccountDescriptor(descriptor_yaml) for descriptor_yaml in descriptors_yaml]
+		descriptors_yaml = yaml_input if isinstance(yaml_input, list) else load_yaml(yaml_input)
+		self.descriptors = []
+
+		# every index maps a key to all descriptors with that key (in repository order), so first match is found like in a scan
+		self._name_index = {}
+		self._public_key_index = {}
+		self._address_index = {}
+		self._role_index = {}
+
+		for descriptor_yaml in descriptors_yaml:
+			self.add(AccountDescriptor(descriptor_yaml))
+
+	def add(self, descriptor):
+		"""Adds an account descriptor, which must not be modified while it is in the repository."""
+		self.descriptors.append(descriptor)
+		self._update_indexes(_add_to_index, descriptor)
+
+	def remove(self, descriptor):
+		"""Removes an account descriptor."""
+		self.descriptors.remove(descriptor)
+		self._update_indexes(_remove_from_index, descriptor)
+
+	def _update_indexes(self, update_index, descriptor):
+		update_index(self._name_index, descriptor.name, descriptor)
+		update_index(self._public_key_index, descriptor.public_key, descriptor)
+		update_index(self._address_index, descriptor.address, descriptor)
+		for role in dict.fromkeys(descriptor.roles):
+			update_index(self._role_index, role, descriptor)
 
 	def try_find_by_name(self, name):
 		"""Finds the account descriptor with a matching name or None if no matching descriptors are found."""
-		return next((descriptor for descriptor in self.descriptors if name == descriptor.name), None)
+		descriptors = self._name_index.get(name)
+		return descriptors[0] if descriptors else None
 
 	def find_by_public_key(self, public_key):
-		"""Finds the account descriptor with a matching public key."""
-		return next(descriptor for descriptor in self.descriptors if descriptor.public_key and public_key == descriptor.public_key)
+		"""Finds the account descriptor with a matching public key (raises StopIteration when no descriptors match, like next)."""
+		return next(iter(self._public_key_index.get(public_key, ())))
 
 	def find_by_address(self, address):
-		"""Finds the account descriptor with a matching address."""
-		return next(descriptor for descriptor in self.descriptors if descriptor.address and str(address) == descriptor.address)
+		"""Finds the account descriptor with a matching address (raises StopIteration when no descriptors match, like next)."""
+		return next(iter(self._address_index.get(str(address), ())))
 
 	def find_all_by_role(self, role):
 		"""Finds all account descriptors with a matching role."""
-		return [descriptor for descriptor in self.descriptors if not role or role in descriptor.roles]
+		if not role:
+			return list(self.descriptors)
+
+		return list(self._role_index.get(role, []))
 
 	def _lookup_account_descriptor_field(self, value, property_name, target_class):
 		account_descriptor = self.try_find_by_name(value)
@@ -21,18 +21,33 @@ def read_array_impl(view, factory_class, accessor, should_continue):
 	return elements
 
 
-def write_array_impl(elements, count, accessor):
-	output_buffer = bytes()
-	for i in range(0, count):
-		element = elements[i]
-		if accessor and i > 0 and accessor(elements[i - 1]) >= accessor(element):
+def check_array_sorted(elements, count, accessor):
+	for i in range(1, count):
+		if accessor(elements[i - 1]) >= accessor(elements[i]):
 			raise ValueError('array passed to write array is not sorted')
 
-		output_buffer += element.serialize()
+
+def write_array_impl(elements, count, accessor):
+	if accessor:
+		check_array_sorted(elements, count, accessor)
+
+	output_buffer = bytearray()
+	for i in range(0, count):
+		output_buffer += elements[i].serialize()
 
 	return output_buffer
 
 
+def write_array_into_impl(buffer, offset, elements, count, accessor):
+	if accessor:
+		check_array_sorted(elements, count, accessor)
+
+	for i in range(0, count):
+		offset = elements[i].serialize_into(buffer, offset)
+
+	return offset
+
+
 class ArrayHelpers:
 	@staticmethod
 	def get_bytes(view, size):
@@ -68,28 +83,54 @@ class ArrayHelpers:
 		"""Reads array of deterministic number of objects."""
 		return read_array_impl(view, factory_class, accessor, lambda index, _: count > index)
 
+	@staticmethod
+	def read_fixed_size_array(view, factory_class, codec, count=None, accessor=None):
+		"""Reads array of fixed size objects by unpacking all of them with precompiled codec (whole view when count is None)."""
+		if count is None:
+			if len(view) % codec.size:
+				raise ValueError('unexpected buffer length')
+
+			count = len(view) // codec.size
+
+		size = count * codec.size
+		if size > len(view):
+			raise ValueError(f'size should not exceed {len(view)}. The value of size was: {size}.')
+
+		elements = [factory_class.from_unpacked(values) for values in codec.iter_unpack(view[:size])]
+
+		if accessor:
+			for i in range(1, count):
+				if accessor(elements[i - 1]) >= accessor(elements[i]):
+					raise ValueError('elements in array are not sorted')
+
+		return elements
+
 	@staticmethod
 	def read_variable_size_elements(view, factory_class, alignment, skip_last_element_padding=False):
 		"""Reads array of variable size objects."""
-		elements = []
-		while len(view) > 0:
-			element = factory_class.deserialize(view)
+		return list(ArrayHelpers.iter_variable_size_elements(view, factory_class, alignment, skip_last_element_padding))
+
+	@staticmethod
+	def iter_variable_size_elements(view, factory_class, alignment, skip_last_element_padding=False):
+		"""Reads array of variable size objects, yielding every object as soon as it is deserialized."""
+		offset = 0
+		while len(view) > offset:
+			element = factory_class.deserialize(view[offset:])
 
 			if element.size <= 0:
 				raise ValueError('element size has invalid size')
 
-			elements.append(element)
+			yield element
 
+			remaining_size = len(view) - offset
 			aligned_size = ArrayHelpers.align_up(element.size, alignment)
-			if skip_last_element_padding and element.size >= len(view):
+			if skip_last_element_padding and element.size >= remaining_size:
 				aligned_size = element.size
 
-			if aligned_size > len(view):
+			if aligned_size > remaining_size:
 				raise ValueError('unexpected buffer length')
 
-			view = view[aligned_size:]
-
-		return elements
+			offset += aligned_size
 
 	@staticmethod
 	def write_array(elements, accessor=None):
@@ -104,7 +145,7 @@ class ArrayHelpers:
 	@staticmethod
 	def write_variable_size_elements(elements, alignment, skip_last_element_padding=False):
 		"""Writes array of variable size objects."""
-		output_buffer = bytes()
+		output_buffer = bytearray()
 		for index, element in enumerate(elements):
 			output_buffer += element.serialize()
 
@@ -114,3 +155,28 @@ class ArrayHelpers:
 					output_buffer += bytes(aligned_size - element.size)
 
 		return output_buffer
+
+	@staticmethod
+	def write_array_into(buffer, offset, elements, accessor=None):
+		"""Writes array of objects into buffer at offset and returns offset following written data."""
+		return write_array_into_impl(buffer, offset, elements, len(elements), accessor)
+
+	@staticmethod
+	def write_array_count_into(buffer, offset, elements, count, accessor=None):
+		"""Writes array of deterministic number of objects into buffer at offset and returns offset following written data."""
+		return write_array_into_impl(buffer, offset, elements, count, accessor)
+
+	@staticmethod
+	def write_variable_size_elements_into(buffer, offset, elements, alignment, skip_last_element_padding=False):
+		"""Writes array of variable size objects into buffer at offset and returns offset following written data."""
+		for index, element in enumerate(elements):
+			element_offset = offset
+			offset = element.serialize_into(buffer, offset)
+
+			if not skip_last_element_padding or len(elements) - 1 != index:
+				# alignment is calculated from written size, so element.size does not need to be recalculated
+				aligned_offset = element_offset + ArrayHelpers.align_up(offset - element_offset, alignment)
+				buffer[offset:aligned_offset] = bytes(aligned_offset - offset)
+				offset = aligned_offset
+
+		return offset
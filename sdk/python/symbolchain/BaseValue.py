@@ -1,9 +1,30 @@
+import functools
+
 from .Ordered import Ordered
 
 
+@functools.lru_cache(maxsize=None)
+def _bounds(size, signed):
+	bit_size = size * 8
+	if signed:
+		upper_bound = (1 << (bit_size - 1)) - 1
+		return (-upper_bound - 1, upper_bound)
+
+	return (0, (1 << bit_size) - 1)
+
+
+@functools.lru_cache(maxsize=None)
+def _trusted_layout(value_class):
+	# default construct a prototype so that size and tag are exactly the ones the subclass passes to BaseValue.__init__
+	prototype = value_class()
+	return (prototype.size, prototype._BaseValue__tag)  # pylint: disable=protected-access
+
+
 class BaseValue(Ordered):
 	"""Represents a base int."""
 
+	__slots__ = ('size', 'value', '__tag')
+
 	def __init__(self, size, value, tag=None, signed=False):
 		"""Creates a base value."""
 		self.size = size
@@ -11,19 +32,26 @@ class BaseValue(Ordered):
 		self.__tag = (tag, signed)
 
 		# check bounds
-		bit_size = self.size * 8
-		if signed:
-			upper_bound = (1 << (bit_size - 1)) - 1
-			lower_bound = -upper_bound - 1
-		else:
-			upper_bound = (1 << bit_size) - 1
-			lower_bound = 0
-
+		(lower_bound, upper_bound) = _bounds(size, signed)
 		if self.value < lower_bound or self.value > upper_bound:
 			signed_description = 'signed' if signed else 'unsigned'
 			value_range_message = f'{value} must be in range [{lower_bound}, {upper_bound}]'
 			raise ValueError(f'{value_range_message} for {self.size} bytes ({signed_description})')
 
+	@classmethod
+	def from_trusted(cls, value):
+		"""
+		Creates a value of a (default constructible) subclass without checking bounds.
+		Size, tag and signedness are taken from a default constructed instance, so they match the ones used by the subclass constructor.
+		This is only safe when value is known to be in bounds, e.g. when it was just decoded from size bytes.
+		"""
+		(size, tag) = _trusted_layout(cls)
+		instance = cls.__new__(cls)
+		instance.size = size
+		instance.value = value
+		instance.__tag = tag  # pylint: disable=unused-private-member
+		return instance
+
 	def _cmp(self, other, operation):
 		if not isinstance(other, BaseValue):
 			return NotImplemented
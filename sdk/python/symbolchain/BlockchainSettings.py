@@ -1,6 +1,5 @@
-import yaml
-
 from .AccountDescriptorRepository import AccountDescriptorRepository
+from .DescriptorReader import load_yaml
 from .NodeDescriptorRepository import NodeDescriptorRepository
 
 
@@ -17,5 +16,5 @@ class BlockchainSettings:
 	@staticmethod
 	def load_from_yaml(yaml_input):
 		"""Loads settings from YAML."""
-		settings_yaml = yaml.load(yaml_input, Loader=yaml.SafeLoader)
+		settings_yaml = load_yaml(yaml_input)
 		return BlockchainSettings(settings_yaml)
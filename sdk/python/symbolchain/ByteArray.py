@@ -6,6 +6,8 @@ from .Ordered import Ordered
 class ByteArray(Ordered):
 	"""Represents a fixed size byte array."""
 
+	__slots__ = ('bytes', '__tag')
+
 	def __init__(self, fixed_size, array_input, tag=None):
 		"""Creates a byte array from bytes or hex string."""
 		raw_bytes = array_input
@@ -18,6 +20,17 @@ class ByteArray(Ordered):
 		self.bytes = raw_bytes
 		self.__tag = tag
 
+	@classmethod
+	def from_trusted(cls, raw_bytes):
+		"""
+		Creates a byte array of a subclass with SIZE that tags byte arrays with itself from bytes without checking size.
+		This is only safe when raw_bytes is known to have SIZE bytes, e.g. when it was just decoded from payload.
+		"""
+		instance = cls.__new__(cls)
+		instance.bytes = raw_bytes
+		instance.__tag = cls  # pylint: disable=unused-private-member
+		return instance
+
 	def _cmp(self, other, operation):
 		if not isinstance(other, ByteArray):
 			return NotImplemented
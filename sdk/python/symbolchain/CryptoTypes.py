@@ -6,6 +6,8 @@ from .ByteArray import ByteArray
 class Hash256(ByteArray):
 	"""Represents a 256-bit hash."""
 
+	__slots__ = ()
+
 	SIZE = 32
 
 	def __init__(self, hash256):
@@ -24,6 +26,8 @@ class Hash256(ByteArray):
 class PrivateKey(ByteArray):
 	"""Represents a private key."""
 
+	__slots__ = ()
+
 	SIZE = 32
 
 	def __init__(self, private_key):
@@ -42,6 +46,8 @@ class PrivateKey(ByteArray):
 class PublicKey(ByteArray):
 	"""Represents a public key."""
 
+	__slots__ = ()
+
 	SIZE = 32
 
 	def __init__(self, public_key):
@@ -55,6 +61,8 @@ class PublicKey(ByteArray):
 class SharedKey256(ByteArray):
 	"""Represents 256-bit symmetric encryption key."""
 
+	__slots__ = ()
+
 	SIZE = 32
 
 	def __init__(self, key):
@@ -68,6 +76,8 @@ class SharedKey256(ByteArray):
 class Signature(ByteArray):
 	"""Represents a signature."""
 
+	__slots__ = ()
+
 	SIZE = 64
 
 	def __init__(self, signature):
@@ -0,0 +1,34 @@
+import json
+
+import yaml
+
+# libyaml based loader is much faster than pure python loader, but it is only available when pyyaml is built against libyaml
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def load_yaml(yaml_input):
+	"""Loads (single document) YAML string or stream with fastest available safe loader."""
+	return yaml.load(yaml_input, Loader=YamlLoader)
+
+
+def read_yaml_descriptors(yaml_input):
+	"""
+	Reads descriptors from a (multi-document) YAML string or stream one document at a time.
+	Every document is either a single descriptor or a list of descriptors, which are yielded one at a time.
+	"""
+	for document in yaml.load_all(yaml_input, Loader=YamlLoader):
+		if document is None:
+			continue
+
+		if isinstance(document, list):
+			yield from document
+		else:
+			yield document
+
+
+def read_json_lines_descriptors(json_lines_input):
+	"""Reads descriptors from a JSON lines string or (text) stream one line at a time."""
+	lines = json_lines_input.splitlines() if isinstance(json_lines_input, str) else json_lines_input
+	for line in lines:
+		if line.strip():
+			yield json.loads(line)
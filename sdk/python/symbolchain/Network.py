@@ -1,10 +1,34 @@
 from abc import abstractmethod
 
-from symbolchain.ripemd160 import ripemd160
+from symbolchain.impl.ChunkHelpers import map_chunks
+from symbolchain.ripemd160 import ripemd160, ripemd160_hasher
 
 BASE32_RFC4648_ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ234567'
 
 
+def _public_keys_to_address_bytes(network, public_keys_bytes):
+	# hashers are created once and copied for every key, which is cheaper than creating (and looking up) new hashers
+	address_hasher = network.address_hasher()
+	ripemd160_prototype = ripemd160_hasher()
+	identifier = bytes([network.identifier])
+	checksum_size = network.address_class.SIZE - 1 - ripemd160_prototype.digest_size
+
+	addresses_bytes = []
+	for public_key_bytes in public_keys_bytes:
+		part_one_hash_builder = address_hasher.copy()
+		part_one_hash_builder.update(public_key_bytes)
+
+		part_two_hash_builder = ripemd160_prototype.copy()
+		part_two_hash_builder.update(part_one_hash_builder.digest())
+		version = identifier + part_two_hash_builder.digest()
+
+		part_three_hash_builder = address_hasher.copy()
+		part_three_hash_builder.update(version)
+		addresses_bytes.append(version + part_three_hash_builder.digest()[:checksum_size])
+
+	return addresses_bytes
+
+
 class Network:
 	"""Represents a network."""
 
@@ -35,6 +59,15 @@ class Network:
 
 		return self.create_address(version, checksum)
 
+	def public_keys_to_addresses(self, public_keys, executor=None):
+		"""
+		Converts public keys to addresses.
+		Very large batches can be split into chunks converted in parallel by executor (e.g. ProcessPoolExecutor).
+		"""
+		public_keys_bytes = [public_key.bytes for public_key in public_keys]
+		addresses_bytes = map_chunks(_public_keys_to_address_bytes, (self,), public_keys_bytes, executor=executor)
+		return list(map(self.address_class, addresses_bytes))
+
 	def is_valid_address_string(self, address_string):
 		"""Checks if an address string is valid and belongs to this network."""
 		if self.address_class.ENCODED_SIZE != len(address_string):
@@ -1,4 +1,4 @@
-import yaml
+from .DescriptorReader import load_yaml
 
 
 class NodeDescriptor:
@@ -15,7 +15,7 @@ class NodeDescriptorRepository:
 
 	def __init__(self, yaml_input):
 		"""Loads node descriptors from the specified input."""
-		descriptors_yaml = yaml_input if isinstance(yaml_input, list) else yaml.load(yaml_input, Loader=yaml.SafeLoader)
+		descriptors_yaml = yaml_input if isinstance(yaml_input, list) else load_yaml(yaml_input)
 		self.descriptors = [NodeDescriptor(descriptor_yaml) for descriptor_yaml in descriptors_yaml]
 
 	def find_all_by_role(self, role):
@@ -3,6 +3,8 @@ from abc import ABC, abstractmethod
 
 
 class Ordered(ABC):
+	__slots__ = ()
+
 	@abstractmethod
 	def _cmp(self, other, operation):
 		pass
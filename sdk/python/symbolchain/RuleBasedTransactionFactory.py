@@ -1,11 +1,11 @@
 import functools
 import inspect
 import operator
+from collections import OrderedDict
 from enum import Enum, Flag
 
 from .BaseValue import BaseValue
 from .ByteArray import ByteArray
-from .TransactionDescriptorProcessor import TransactionDescriptorProcessor
 
 
 def _name_to_enum_value(mapping, enum_type, enum_value_name):
@@ -34,11 +34,19 @@ def _build_type_hints_map(struct_value):
 	return type_hints
 
 
+@functools.lru_cache(maxsize=None)
+def _is_byte_array_type(value_type):
+	# ByteArray derives from ABC, which makes isinstance relatively expensive, so checks are cached by type
+	return issubclass(value_type, ByteArray)
+
+
 def _type_converter_factory(module, custom_type_converter, value):
-	if custom_type_converter and custom_type_converter(value):
-		return custom_type_converter(value)
+	if custom_type_converter:
+		converted_value = custom_type_converter(value)
+		if converted_value:
+			return converted_value
 
-	if isinstance(value, ByteArray):
+	if _is_byte_array_type(type(value)):
 		return getattr(module, type(value).__name__)(value.bytes)
 
 	return value
@@ -47,6 +55,8 @@ def _type_converter_factory(module, custom_type_converter, value):
 class RuleBasedTransactionFactory:
 	"""Rule based transaction factory."""
 
+	MAX_COPY_PLANS = 1024
+
 	def __init__(self, module, type_converter=None, type_rule_overrides=None):
 		"""Creates a rule based transaction factory for use with catbuffer generated code."""
 		self.module = module
@@ -54,6 +64,10 @@ class RuleBasedTransactionFactory:
 		self.type_rule_overrides = type_rule_overrides or {}
 		self.rules = {}
 
+		# plans are keyed by (entity class, descriptor key set), so type hints and attributes are only looked up once per combination
+		# (cache is bounded, because descriptors with many optional field combinations would otherwise keep adding plans)
+		self._copy_plans = OrderedDict()
+
 	def _get_module_class(self, name):
 		return getattr(self.module, name)
 
@@ -65,7 +79,8 @@ class RuleBasedTransactionFactory:
 			self.rules[name] = self.type_rule_overrides[pod_class]
 			return
 
-		self.rules[name] = lambda value: pod_class(value) if not isinstance(value, pod_class) else value
+		# plain ints are most common input, so they skip (relatively expensive) ABC isinstance check
+		self.rules[name] = lambda value: pod_class(value) if int is type(value) or not isinstance(value, pod_class) else value
 
 	def add_flags_parser(self, name):
 		"""Creates flag type parser."""
@@ -106,13 +121,8 @@ class RuleBasedTransactionFactory:
 		struct_class = self._get_module_class(name)
 
 		def parser(struct_descriptor):
-			struct_processor = self._create_processor(struct_descriptor)
 			struct_value = struct_class()
-
-			all_type_hints = _build_type_hints_map(struct_value)
-			struct_processor.set_type_hints(all_type_hints)
-
-			struct_processor.copy_to(struct_value)
+			self._copy_to(struct_value, struct_descriptor)
 			return struct_value
 
 		self.rules[f'struct:{name}'] = parser
@@ -145,22 +155,57 @@ class RuleBasedTransactionFactory:
 
 	def create_from_factory(self, factory, descriptor):
 		"""Creates an entity from a descriptor using a factory."""
-		processor = self._create_processor(descriptor)
-		entity_type = processor.lookup_value('type')
-		entity = factory(entity_type)
+		if 'type' not in descriptor:
+			raise ValueError('transaction descriptor does not have attribute type')
 
-		all_type_hints = _build_type_hints_map(entity)
-		processor.set_type_hints(all_type_hints)
-		processor.copy_to(entity, ['type'])
-
-		self._auto_encode_strings(entity)
+		entity = factory(self.type_converter(descriptor['type']))
+		self._copy_to(entity, descriptor, 'type', True)
 		return entity
 
-	def _create_processor(self, descriptor):
-		return TransactionDescriptorProcessor(descriptor, self.rules, self.type_converter)
+	def _copy_to(self, entity, descriptor, ignore_key=None, auto_encode_strings=False):
+		# key order is irrelevant, so descriptors with same keys in different order share plan
+		plan_key = (type(entity), frozenset(descriptor.keys()), ignore_key)
+		plan = self._copy_plans.get(plan_key)
+		if plan is None:
+			plan = self._compile_copy_plan(entity, descriptor.keys(), ignore_key)
+			self._copy_plans[plan_key] = plan
+			if len(self._copy_plans) > self.MAX_COPY_PLANS:
+				self._copy_plans.popitem(last=False)
+		else:
+			self._copy_plans.move_to_end(plan_key)
+
+		for (key, type_hint) in plan:
+			value = descriptor[key]
+			rule = self.rules.get(type_hint)
+			if rule:
+				value = rule(value)
+
+			if isinstance(value, list):
+				getattr(entity, key).extend([self.type_converter(item) for item in value])
+				continue
+
+			value = self.type_converter(value)
+			if auto_encode_strings and isinstance(value, str):
+				value = value.encode('utf8')
+
+			setattr(entity, key, value)
 
 	@staticmethod
-	def _auto_encode_strings(entity):
-		for key, value in vars(entity).items():
-			if isinstance(value, str):
-				setattr(entity, key, value.encode('utf8'))
+	def _compile_copy_plan(entity, keys, ignore_key):
+		type_hints = _build_type_hints_map(entity)
+
+		plan = []
+		for key in keys:
+			if key == ignore_key:
+				continue
+
+			if key.endswith('_computed'):
+				raise ValueError(f'cannot explicitly set computed field {key}')
+
+			if not hasattr(entity, key):
+				raise ValueError(f'transaction does not have attribute {key}')
+
+			plan.append((key, type_hints.get(key)))
+
+		# plan is shared by all key orders, so fields are always set in same (sorted) order
+		return tuple(sorted(plan, key=operator.itemgetter(0)))
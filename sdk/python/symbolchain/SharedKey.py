@@ -2,15 +2,30 @@ import hashlib
 
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from nacl.bindings import crypto_scalarmult_ed25519
+from nacl.exceptions import RuntimeError as NaclRuntimeError
 
 from .CryptoTypes import SharedKey256
 from .external import ed25519
 
 
+def derive_shared_secret(other_public_key_bytes, private_key_bytes, hashing_algorithm=hashlib.sha512):
+	"""Derives shared secret (shared point) from private key and public key."""
+	hashed_private_key = hashing_algorithm(private_key_bytes).digest()
+
+	try:
+		# libsodium clamps scalar the same way as reference implementation
+		return crypto_scalarmult_ed25519(hashed_private_key[:32], bytes(other_public_key_bytes))
+	except NaclRuntimeError:
+		# libsodium rejects non-canonical, small order and non main subgroup points (and identity result) without details,
+		# so fall back to reference implementation, which raises descriptive errors
+		return ed25519.derive_shared_secret_unsafe(other_public_key_bytes, private_key_bytes, hashing_algorithm)
+
+
 class SharedKey:
 	@staticmethod
 	def _derive_shared_key(other_public_key_bytes, private_key_bytes, info, hashing_algorithm=hashlib.sha512):
-		shared_secret = ed25519.derive_shared_secret_unsafe(other_public_key_bytes, private_key_bytes, hashing_algorithm)
+		shared_secret = derive_shared_secret(other_public_key_bytes, private_key_bytes, hashing_algorithm)
 		salt = bytes(32)
 		hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=salt, info=info)
 		return SharedKey256(hkdf.derive(shared_secret))
@@ -0,0 +1,51 @@
+import threading
+from collections import OrderedDict
+
+
+class SharedKeyCache:
+	"""Bounded LRU cache of derived shared keys keyed by (own public key, counterparty public key)."""
+
+	def __init__(self, max_size=1024):
+		"""Creates a cache holding at most max_size shared keys."""
+		if max_size <= 0:
+			raise ValueError('max_size must be positive')
+
+		self.max_size = max_size
+		self.hits = 0
+		self.misses = 0
+
+		self._shared_keys = OrderedDict()
+		self._lock = threading.Lock()
+
+	def __len__(self):
+		return len(self._shared_keys)
+
+	def derive_shared_key(self, shared_key_class, key_pair, other_public_key):
+		"""Returns cached shared key or derives it with shared_key_class and caches it."""
+		# shared keys of different blockchains are not interchangeable, so shared key class is part of cache key
+		cache_key = (shared_key_class, key_pair.public_key.bytes, other_public_key.bytes)
+		with self._lock:
+			shared_key = self._shared_keys.get(cache_key)
+			if shared_key is not None:
+				self._shared_keys.move_to_end(cache_key)
+				self.hits += 1
+				return shared_key
+
+			self.misses += 1
+
+		# derive outside of lock, so derivations of different shared keys do not block each other
+		shared_key = shared_key_class.derive_shared_key(key_pair, other_public_key)
+		with self._lock:
+			self._shared_keys[cache_key] = shared_key
+			self._shared_keys.move_to_end(cache_key)
+			if len(self._shared_keys) > self.max_size:
+				self._shared_keys.popitem(last=False)
+
+		return shared_key
+
+	def clear(self):
+		"""Wipes all cached shared keys and resets counters."""
+		with self._lock:
+			self._shared_keys.clear()
+			self.hits = 0
+			self.misses = 0
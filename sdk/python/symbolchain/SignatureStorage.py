@@ -0,0 +1,114 @@
+import json
+import os
+from abc import ABC, abstractmethod
+
+from .CryptoTypes import Hash256, Signature
+
+
+class SignatureStorage(ABC):
+	"""Loads and saves transaction hashes along with attesting signatures by name."""
+
+	@abstractmethod
+	def save(self, name, transaction_hash, signatures):
+		"""Saves a transaction hash along with attesting signatures."""
+
+	@abstractmethod
+	def load(self, name):
+		"""Loads a transaction hash along with attesting signatures."""
+
+	def save_all(self, entries):
+		"""Saves multiple (name, transaction hash, signatures) tuples."""
+		for (name, transaction_hash, signatures) in entries:
+			self.save(name, transaction_hash, signatures)
+
+	def load_all(self, names):
+		"""Loads transaction hashes along with attesting signatures for multiple names."""
+		return [self.load(name) for name in names]
+
+	@staticmethod
+	def _to_buffer(transaction_hash, signatures):
+		return transaction_hash.bytes + b''.join(signature.bytes for signature in signatures)
+
+	@staticmethod
+	def _from_buffer(buffer):
+		buffer_size = len(buffer)
+		if buffer_size < Hash256.SIZE or 0 != (buffer_size - Hash256.SIZE) % Signature.SIZE:
+			raise ValueError(f'buffer has unexpected size {buffer_size}')
+
+		transaction_hash = Hash256(buffer[0:Hash256.SIZE])
+
+		signatures = []
+		for i in range(0, (buffer_size - Hash256.SIZE) // Signature.SIZE):
+			signature_start = Hash256.SIZE + i * Signature.SIZE
+			signatures.append(Signature(buffer[signature_start:signature_start + Signature.SIZE]))
+
+		return (transaction_hash, signatures)
+
+
+class BinarySignatureStorage(SignatureStorage):
+	"""Loads and saves signatures as raw binary files in a directory."""
+
+	def __init__(self, directory):
+		"""Creates storage for a directory."""
+		self.directory = directory
+
+	def save(self, name, transaction_hash, signatures):
+		"""Saves a transaction hash along with attesting signatures."""
+		with open(self._get_file_path(name), 'wb') as outfile:
+			outfile.write(self._to_buffer(transaction_hash, signatures))
+
+	def load(self, name):
+		"""Loads a transaction hash along with attesting signatures."""
+		with open(self._get_file_path(name), 'rb') as infile:
+			return self._from_buffer(infile.read())
+
+	def _get_file_path(self, name):
+		return os.path.join(self.directory, f'{name}.bin')
+
+
+class JsonLinesSignatureStorage(SignatureStorage):
+	"""Loads and saves signatures as lines of a single JSON lines file, where later lines override earlier lines with same name."""
+
+	def __init__(self, file_path):
+		"""Creates storage for a file."""
+		self.file_path = file_path
+
+	def save(self, name, transaction_hash, signatures):
+		"""Saves a transaction hash along with attesting signatures."""
+		self.save_all([(name, transaction_hash, signatures)])
+
+	def load(self, name):
+		"""Loads a transaction hash along with attesting signatures."""
+		return self.load_all([name])[0]
+
+	def save_all(self, entries):
+		"""Saves multiple (name, transaction hash, signatures) tuples by appending them to file at once."""
+		with open(self.file_path, 'at', encoding='utf8') as outfile:
+			for (name, transaction_hash, signatures) in entries:
+				outfile.write(json.dumps({
+					'name': name,
+					'transaction_hash': str(transaction_hash),
+					'signatures': [str(signature) for signature in signatures]
+				}))
+				outfile.write('\n')
+
+	def load_all(self, names):
+		"""Loads transaction hashes along with attesting signatures for multiple names by reading file once."""
+		signature_groups = {}
+		with open(self.file_path, 'rt', encoding='utf8') as infile:
+			for line in infile:
+				if not line.strip():
+					continue
+
+				entry = json.loads(line)
+				signature_groups[entry['name']] = (entry['transaction_hash'], entry['signatures'])
+
+		groups = []
+		for name in names:
+			if name not in signature_groups:
+				raise KeyError(f'no signatures are stored with name {name}')
+
+			(transaction_hash_hex, signatures_hex) = signature_groups[name]
+			groups.append((Hash256(transaction_hash_hex), [Signature(signature_hex) for signature_hex in signatures_hex]))
+
+		return groups
@@ -0,0 +1,97 @@
+class StreamReader:
+	"""Reads data sequentially from an in memory or memory-mapped buffer or from a readinto-capable stream."""
+
+	def __init__(self, source):
+		"""Creates a reader around a buffer (bytes, bytearray, mmap) or a binary stream supporting readinto."""
+		# buffers are read without copying, so returned views reference source
+		self.offset = 0
+
+		self._view = None
+		self._stream = None
+		try:
+			self._view = memoryview(source)
+		except TypeError:
+			if not hasattr(source, 'readinto'):
+				raise
+
+			self._stream = source
+
+	def read(self, count):
+		"""Reads exactly count bytes and returns them as a memoryview."""
+		view = self._read_available(count)
+		if count != len(view):
+			raise ValueError(f'unexpected end of data, needed {count} bytes but only {len(view)} are available')
+
+		return view
+
+	def read_or_none(self, count):
+		"""Reads exactly count bytes or returns None when no data is left."""
+		view = self._read_available(count)
+		if not view:
+			return None
+
+		if count != len(view):
+			raise ValueError(f'unexpected end of data, needed {count} bytes but only {len(view)} are available')
+
+		return view
+
+	def read_size_prefixed(self, size_prefix_size=4):
+		"""Reads a size prefixed entity (including its size prefix) or returns None when no data is left."""
+		size_prefix = self.read_or_none(size_prefix_size)
+		if size_prefix is None:
+			return None
+
+		size = int.from_bytes(size_prefix, byteorder='little', signed=False)
+		if size < size_prefix_size:
+			raise ValueError(f'size prefixed entity has invalid size {size}')
+
+		if self._view is not None:
+			# size prefix is part of source view, so extend it instead of copying
+			self.read(size - size_prefix_size)
+			return self._view[self.offset - size:self.offset]
+
+		buffer = bytearray(size)
+		buffer[:size_prefix_size] = size_prefix
+		self._read_stream_into(memoryview(buffer)[size_prefix_size:], size - size_prefix_size)
+		return memoryview(buffer)
+
+	def skip(self, count):
+		"""Skips exactly count bytes."""
+		if self._view is not None:
+			self.read(count)
+			return
+
+		# read in chunks to avoid allocating buffer for (potentially) large skipped area
+		chunk = bytearray(min(count, 0x10000))
+		while count:
+			chunk_size = min(count, len(chunk))
+			self._read_stream_into(memoryview(chunk)[:chunk_size], chunk_size)
+			count -= chunk_size
+
+	def _read_available(self, count):
+		if self._view is not None:
+			view = self._view[self.offset:self.offset + count]
+			self.offset += len(view)
+			return view
+
+		buffer = bytearray(count)
+		read_count = self._read_stream_into_available(memoryview(buffer))
+		return memoryview(buffer)[:read_count]
+
+	def _read_stream_into(self, view, count):
+		read_count = self._read_stream_into_available(view)
+		if count != read_count:
+			raise ValueError(f'unexpected end of data, needed {count} bytes but only {read_count} are available')
+
+	def _read_stream_into_available(self, view):
+		# readinto is allowed to return fewer bytes than requested, so keep reading until view is full or stream is exhausted
+		read_count = 0
+		while len(view) > read_count:
+			chunk_size = self._stream.readinto(view[read_count:])
+			if not chunk_size:
+				break
+
+			read_count += chunk_size
+
+		self.offset += read_count
+		return read_count
@@ -1,8 +1,47 @@
 import os
 
-import yaml
-
 from ..CryptoTypes import PublicKey
+from ..DescriptorReader import load_yaml, read_json_lines_descriptors, read_yaml_descriptors
+from ..impl.ChunkHelpers import map_chunks
+
+
+class _FacadeReference:
+	"""Reference to facade, which is rebuilt from its class and network when pickled (e.g. into process pool workers)."""
+
+	def __init__(self, facade):
+		self.facade = facade
+
+	def __reduce__(self):
+		return (_rebuild_facade_reference, (type(self.facade), self.facade.network))
+
+
+def _rebuild_facade_reference(facade_class, network):
+	return _FacadeReference(facade_class(network))
+
+
+def _sign_chunk(facade_reference, entries):
+	facade = facade_reference.facade
+
+	# key pair creation derives public key, so key pairs are created once per signer
+	key_pairs = {}
+	results = []
+	for (private_key, transaction) in entries:
+		key_pair = key_pairs.get(private_key.bytes)
+		if key_pair is None:
+			key_pair = key_pairs[private_key.bytes] = facade.KeyPair(private_key)
+
+		signature = facade.sign_transaction(key_pair, transaction)
+		results.append((facade.hash_transaction(transaction), signature))
+
+	return results
+
+
+def _verify_chunk(facade_reference, entries):
+	facade = facade_reference.facade
+	return [
+		(facade.hash_transaction(transaction), facade.verify_transaction(transaction, signature))
+		for (transaction, signature) in entries
+	]
 
 
 class BatchOperations:
@@ -24,43 +63,82 @@ class BatchOperations:
 		"""Loads all transactions from YAML."""
 		return [
 			self.facade.transaction_factory.create(transaction_descriptor)
-			for transaction_descriptor in yaml.load(transactions_yaml_input, Loader=yaml.SafeLoader)
+			for transaction_descriptor in load_yaml(transactions_yaml_input)
 		]
 
-	def _sign_one(self, transaction, private_key_storage, signature_storage, output_filename):
-		# transaction.signer_public_key is of different PublicKey type, wrap it in sdk type
-		signer_public_key = PublicKey(transaction.signer_public_key.bytes)
-		signer_account_name = self.facade.account_descriptor_repository.find_by_public_key(signer_public_key).name
-		signer_private_key = private_key_storage.load(signer_account_name)
-
-		signature = self.facade.sign_transaction(self.facade.KeyPair(signer_private_key), transaction)
-		transaction_hash = self.facade.hash_transaction(transaction)
-		signature_storage.save(output_filename, transaction_hash, [signature])
-
-	def sign_all(self, transactions, private_key_storage, signature_storage):
-		"""Signs multiple transactions and saves the signatures as multiple qrcodes."""
-		for i, transaction in enumerate(transactions):
-			self._sign_one(transaction, private_key_storage, signature_storage, f'sig_{self.output_file_prefix}{i}')
-
-	def prepare_all(self, transactions, signature_storage, output_directory):
-		"""Prepares multiple transactions by attaching signatures to each and producing files that can be sent to the network."""
+	def iter_load_all(self, transactions_yaml_input):
+		"""Loads transactions from a (multi-document) YAML string or stream one at a time."""
+		for transaction_descriptor in read_yaml_descriptors(transactions_yaml_input):
+			yield self.facade.transaction_factory.create(transaction_descriptor)
+
+	def iter_load_all_json_lines(self, transactions_json_lines_input):
+		"""Loads transactions from a JSON lines string or (text) stream one at a time."""
+		for transaction_descriptor in read_json_lines_descriptors(transactions_json_lines_input):
+			yield self.facade.transaction_factory.create(transaction_descriptor)
+
+	def _map_chunks(self, func, entries, executor):
+		# facade is only rebuilt when chunks are mapped by process pool workers
+		return map_chunks(func, (_FacadeReference(self.facade),), entries, executor=executor)
+
+	def sign_all(self, transactions, private_key_storage, signature_storage, executor=None):
+		"""
+		Signs multiple transactions and saves the signatures in signature storage.
+		Transactions can be split into chunks signed in parallel by executor (e.g. ProcessPoolExecutor).
+		"""
+		# private keys are loaded (and decrypted) once per signer
+		private_keys = {}
+		entries = []
+		for transaction in transactions:
+			# transaction.signer_public_key is of different PublicKey type, wrap it in sdk type
+			signer_public_key = PublicKey(transaction.signer_public_key.bytes)
+			signer_account_name = self.facade.account_descriptor_repository.find_by_public_key(signer_public_key).name
+			if signer_account_name not in private_keys:
+				private_keys[signer_account_name] = private_key_storage.load(signer_account_name)
+
+			entries.append((private_keys[signer_account_name], transaction))
+
+		signature_storage.save_all(
+			(f'sig_{self.output_file_prefix}{i}', transaction_hash, [signature])
+			for i, (transaction_hash, signature) in enumerate(self._map_chunks(_sign_chunk, entries, executor)))
+
+	def _verify_all(self, transactions, signature_storage, executor):
 		transaction_count = len(transactions)
-		signature_groups = [signature_storage.load(f'sig_{self.output_file_prefix}{i}') for i in range(0, transaction_count)]
-
-		for i, transaction in enumerate(transactions):
-			(signed_transaction_hash, signatures) = signature_groups[i]
+		signature_groups = signature_storage.load_all([f'sig_{self.output_file_prefix}{i}' for i in range(0, transaction_count)])
 
-			transaction_hash = self.facade.hash_transaction(transaction)
+		entries = [(transaction, signatures[0]) for (transaction, (_, signatures)) in zip(transactions, signature_groups)]
+		verify_results = self._map_chunks(_verify_chunk, entries, executor)
+		for i, (transaction_hash, is_verified) in enumerate(verify_results):
+			(signed_transaction_hash, _) = signature_groups[i]
 			if signed_transaction_hash != transaction_hash:
 				raise self.PrepareError(f'transaction hash at {i} does not match signed transaction hash')
 
-			if not self.facade.verify_transaction(transaction, signatures[0]):
+			if not is_verified:
 				raise self.PrepareError(f'transaction signature at {i} does not verify')
 
-		for i, transaction in enumerate(transactions):
-			(_, signatures) = signature_groups[i]
+		return [signature for (_, signature) in entries]
+
+	def prepare_all(self, transactions, signature_storage, output_directory, executor=None):
+		"""
+		Prepares multiple transactions by attaching signatures to each and producing files that can be sent to the network.
+		Transactions can be split into chunks verified in parallel by executor (e.g. ProcessPoolExecutor).
+		"""
+		signatures = self._verify_all(transactions, signature_storage, executor)
 
-			prepared_transaction_buffer = self.facade.transaction_factory.attach_signature(transaction, signatures[0])
+		for i, transaction in enumerate(transactions):
+			prepared_transaction_buffer = self.facade.transaction_factory.attach_signature(transaction, signatures[i])
 			file_path = os.path.join(output_directory, f'payload_{self.output_file_prefix}{i}.json')
 			with open(file_path, 'wb') as outfile:
 				outfile.write(prepared_transaction_buffer.encode('utf8'))
+
+	def prepare_all_json_lines(self, transactions, signature_storage, outfile, executor=None):
+		"""
+		Prepares multiple transactions by attaching signatures to each and writing them to a (binary) stream as JSON lines,
+		which can be sent to the network.
+		Transactions can be split into chunks verified in parallel by executor (e.g. ProcessPoolExecutor).
+		"""
+		signatures = self._verify_all(transactions, signature_storage, executor)
+
+		for i, transaction in enumerate(transactions):
+			prepared_transaction_buffer = self.facade.transaction_factory.attach_signature(transaction, signatures[i])
+			outfile.write(prepared_transaction_buffer.encode('utf8'))
+			outfile.write(b'\n')
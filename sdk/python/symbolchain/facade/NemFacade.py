@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 import sha3
 
 from ..CryptoTypes import Hash256, PrivateKey, PublicKey
+from ..impl.ChunkHelpers import map_chunks
 from ..nem.KeyPair import KeyPair, Verifier
 from ..nem.Network import Address, Network
 from ..nem.SharedKey import SharedKey
@@ -10,6 +11,10 @@ from ..nem.TransactionFactory import TransactionFactory
 from ..Network import NetworkLocator
 
 
+def _hash_non_verifiable_payloads(payloads):
+	return [sha3.keccak_256(payload).digest() for payload in payloads]
+
+
 class NemFacade:
 	"""Facade used to interact with NEM blockchain."""
 
@@ -49,20 +54,30 @@ class NemFacade:
 	@staticmethod
 	def hash_transaction(transaction):
 		"""Hashes a NEM transaction."""
-		non_verifiable_transaction = TransactionFactory.to_non_verifiable_transaction(transaction)
-		return Hash256(sha3.keccak_256(non_verifiable_transaction.serialize()).digest())
+		non_verifiable_payload = TransactionFactory.serialize_non_verifiable_transaction(transaction)
+		return Hash256(sha3.keccak_256(non_verifiable_payload).digest())
+
+	@staticmethod
+	def hash_transactions(transactions, executor=None):
+		"""
+		Hashes NEM transactions.
+		Very large batches can be split into chunks hashed in parallel by executor (e.g. ProcessPoolExecutor).
+		"""
+		payloads = list(map(TransactionFactory.serialize_non_verifiable_transaction, transactions))
+		transaction_hashes = map_chunks(_hash_non_verifiable_payloads, (), payloads, executor=executor)
+		return list(map(Hash256.from_trusted, transaction_hashes))
 
 	@staticmethod
 	def sign_transaction(key_pair, transaction):
 		"""Signs a NEM transaction."""
-		non_verifiable_transaction = TransactionFactory.to_non_verifiable_transaction(transaction)
-		return key_pair.sign(non_verifiable_transaction.serialize())
+		non_verifiable_payload = TransactionFactory.serialize_non_verifiable_transaction(transaction)
+		return key_pair.sign(non_verifiable_payload)
 
 	@staticmethod
 	def verify_transaction(transaction, signature):
 		"""Verifies a NEM transaction."""
-		non_verifiable_transaction = TransactionFactory.to_non_verifiable_transaction(transaction)
-		return Verifier(transaction.signer_public_key).verify(non_verifiable_transaction.serialize(), signature)
+		non_verifiable_payload = TransactionFactory.serialize_non_verifiable_transaction(transaction)
+		return Verifier(transaction.signer_public_key).verify(non_verifiable_payload, signature)
 
 	def bip32_path(self, account_id):
 		"""Creates a network compatible BIP32 path for the specified account."""
@@ -1,11 +1,13 @@
+import copy
 import hashlib
 from datetime import datetime, timezone
 
 from .. import sc
 from ..CryptoTypes import Hash256, PublicKey, Signature
+from ..impl.ChunkHelpers import map_chunks
 from ..Network import NetworkLocator
-from ..symbol.KeyPair import KeyPair, Verifier
-from ..symbol.Merkle import MerkleHashBuilder
+from ..symbol.KeyPair import BatchVerifier, KeyPair, Verifier
+from ..symbol.Merkle import MerkleHashAccumulator, MerkleHashBuilder
 from ..symbol.Network import Address, Network
 from ..symbol.SharedKey import SharedKey
 from ..symbol.TransactionFactory import TransactionFactory
@@ -25,6 +27,84 @@ AGGREGATE_HASHED_SIZE = sum(field[1] for field in [
 	('transactions_hash', Hash256.SIZE)
 ])
 
+# signature and signer public key are adjacent in transaction header and are hashed together
+TRANSACTION_SIGNATURE_OFFSET = 4 + 4  # skip size and reserved1
+TRANSACTION_SIGNER_PUBLIC_KEY_END = TRANSACTION_SIGNATURE_OFFSET + Signature.SIZE + PublicKey.SIZE
+
+# importance (and nemesis) block footers are signed, but normal block footer only contains padding, which is not signed
+IMPORTANCE_BLOCK_TYPES = (sc.BlockType.NEMESIS, sc.BlockType.IMPORTANCE)
+NORMAL_BLOCK_FOOTER_SIZE = 4
+
+AGGREGATE_TRANSACTION_TYPES = (sc.TransactionType.AGGREGATE_COMPLETE, sc.TransactionType.AGGREGATE_BONDED)
+
+
+def _hash_transaction_payloads(generation_hash_seed, payloads):
+	transaction_hashes = []
+	for payload in payloads:
+		payload_view = memoryview(payload)
+
+		hasher = hashlib.sha3_256()
+		hasher.update(payload_view[TRANSACTION_SIGNATURE_OFFSET:TRANSACTION_SIGNER_PUBLIC_KEY_END])
+		hasher.update(generation_hash_seed)
+		hasher.update(SymbolFacade._transaction_data_buffer(payload_view))  # pylint: disable=protected-access
+		transaction_hashes.append(hasher.digest())
+
+	return transaction_hashes
+
+
+def _create_cosignature(key_pair, transaction_hash, detached):
+	if detached:
+		cosignature = sc.DetachedCosignature()
+		cosignature.parent_hash = sc.Hash256(transaction_hash.bytes)
+	else:
+		cosignature = sc.Cosignature()
+
+	cosignature.version = 0
+	cosignature.signer_public_key = sc.PublicKey(key_pair.public_key.bytes)
+	cosignature.signature = sc.Signature(key_pair.sign(transaction_hash.bytes).bytes)
+	return cosignature
+
+
+class SigningContext:
+	"""
+	Signing payload of a Symbol transaction, which is serialized once and shared by sign, hash, verify and cosign operations.
+	Transaction hash is recalculated only when transaction signature or signer public key changes.
+	Transaction must not be otherwise modified after context is created.
+	"""
+
+	def __init__(self, transaction, generation_hash_seed):
+		"""Creates a signing context around a transaction for the network with the specified generation hash seed."""
+		self.transaction = transaction
+		self.signing_payload = generation_hash_seed.bytes + SymbolFacade._transaction_data_buffer(transaction.serialize())
+		self._hash_key = None
+		self._hash = None
+
+	def sign(self, key_pair):
+		"""Signs transaction."""
+		return key_pair.sign(self.signing_payload)
+
+	def verify(self, signature=None):
+		"""Verifies a transaction signature, which defaults to attached signature."""
+		if signature is None:
+			signature = self.transaction.signature
+
+		return Verifier(self.transaction.signer_public_key).verify(self.signing_payload, signature)
+
+	def hash(self):
+		"""Hashes transaction."""
+		hash_key = self.transaction.signature.bytes + self.transaction.signer_public_key.bytes
+		if hash_key != self._hash_key:
+			hasher = hashlib.sha3_256(hash_key)
+			hasher.update(self.signing_payload)
+			self._hash = Hash256(hasher.digest())
+			self._hash_key = hash_key
+
+		return self._hash
+
+	def cosign(self, key_pair, detached=False):
+		"""Cosigns transaction."""
+		return _create_cosignature(key_pair, self.hash(), detached)
+
 
 class SymbolFacade:
 	"""Facade used to interact with Symbol blockchain."""
@@ -34,6 +114,7 @@ class SymbolFacade:
 	Address = Address  # pylint: disable=duplicate-code
 	KeyPair = KeyPair  # pylint: disable=duplicate-code
 	Verifier = Verifier
+	BatchVerifier = BatchVerifier
 	SharedKey = SharedKey
 
 	def __init__(self, network, account_descriptor_repository=None):
@@ -63,46 +144,129 @@ class SymbolFacade:
 		"""Creates a network timestamp representing the current time."""
 		return self.network.from_datetime(datetime.now(timezone.utc))
 
+	def create_signing_context(self, transaction):
+		"""Creates a signing context, which serializes a Symbol transaction once for any sequence of sign, hash, verify and cosign."""
+		return SigningContext(transaction, self.network.generation_hash_seed)
+
 	def hash_transaction(self, transaction):
 		"""Hashes a Symbol transaction."""
-		hasher = hashlib.sha3_256()
-		hasher.update(transaction.signature.bytes)
-		hasher.update(transaction.signer_public_key.bytes)
-		hasher.update(self.network.generation_hash_seed.bytes)
-		hasher.update(self._transaction_data_buffer(transaction.serialize()))
-		return Hash256(hasher.digest())
+		return self.create_signing_context(transaction).hash()
+
+	def hash_transactions(self, transactions, executor=None):
+		"""
+		Hashes Symbol transactions, which can be either transactions or serialized transactions (e.g. `BlockReader` payloads).
+		Very large batches can be split into chunks hashed in parallel by executor (e.g. ProcessPoolExecutor).
+		"""
+		payloads = [
+			transaction if isinstance(transaction, (bytes, bytearray, memoryview)) else transaction.serialize()
+			for transaction in transactions
+		]
+
+		if executor is not None:
+			# memoryviews cannot be pickled, so they are copied into bytes
+			payloads = list(map(bytes, payloads))
+
+		transaction_hashes = map_chunks(_hash_transaction_payloads, (self.network.generation_hash_seed.bytes,), payloads, executor=executor)
+		return list(map(Hash256.from_trusted, transaction_hashes))
 
 	def sign_transaction(self, key_pair, transaction):
 		"""Signs a Symbol transaction."""
-		sign_buffer = self.network.generation_hash_seed.bytes
-		sign_buffer += self._transaction_data_buffer(transaction.serialize())
-		return key_pair.sign(sign_buffer)
+		return self.create_signing_context(transaction).sign(key_pair)
 
 	def verify_transaction(self, transaction, signature):
 		"""Verifies a Symbol transaction."""
-		verify_buffer = self.network.generation_hash_seed.bytes
-		verify_buffer += self._transaction_data_buffer(transaction.serialize())
-		return Verifier(transaction.signer_public_key).verify(verify_buffer, signature)
+		return self.create_signing_context(transaction).verify(signature)
+
+	def verify_transactions(self, transactions, batch_verifier=None):
+		"""Verifies signatures of Symbol transactions in parallel and returns whether each transaction was verified."""
+		return (batch_verifier or BatchVerifier()).verify(
+			(transaction.signer_public_key, self._verify_buffer(transaction), transaction.signature) for transaction in transactions)
+
+	def verify_cosignatures(self, transaction, batch_verifier=None):
+		"""Verifies cosignatures of a Symbol aggregate transaction in parallel and returns whether each cosignature was verified."""
+		transaction_hash = self.hash_transaction(transaction).bytes
+		return (batch_verifier or BatchVerifier()).verify(
+			(cosignature.signer_public_key, transaction_hash, cosignature.signature) for cosignature in transaction.cosignatures)
+
+	def _verify_buffer(self, transaction):
+		return self.create_signing_context(transaction).signing_payload
 
 	def cosign_transaction(self, key_pair, transaction, detached=False):
 		"""Cosigns a Symbol transaction."""
-		transaction_hash = self.hash_transaction(transaction)
+		return _create_cosignature(key_pair, self.hash_transaction(transaction), detached)
 
-		cosignature = sc.DetachedCosignature() if detached else sc.Cosignature()
-		if detached:
-			cosignature.parent_hash = sc.Hash256(transaction_hash.bytes)
-
-		cosignature.version = 0
-		cosignature.signer_public_key = sc.PublicKey(key_pair.public_key.bytes)
-		cosignature.signature = sc.Signature(key_pair.sign(transaction_hash.bytes).bytes)
-		return cosignature
+	@staticmethod
+	def hash_embedded_transaction(embedded_transaction):
+		"""Hashes an embedded transaction of an aggregate."""
+		return Hash256(hashlib.sha3_256(embedded_transaction.serialize()).digest())
 
 	@staticmethod
 	def hash_embedded_transactions(embedded_transactions):
 		"""Hashes embedded transactions of an aggregate."""
 		hash_builder = MerkleHashBuilder()
 		for embedded_transaction in embedded_transactions:
-			hash_builder.update(Hash256(hashlib.sha3_256(embedded_transaction.serialize()).digest()))
+			hash_builder.update(SymbolFacade.hash_embedded_transaction(embedded_transaction))
+
+		return hash_builder.final()
+
+	@staticmethod
+	def create_transactions_hash_accumulator(embedded_transactions=()):
+		"""Creates an accumulator of aggregate transactions hash, which is updated by appending or replacing embedded transaction hashes."""
+		return MerkleHashAccumulator(map(SymbolFacade.hash_embedded_transaction, embedded_transactions))
+
+	@staticmethod
+	def _block_header_data_buffer(block):
+		# header is serialized from shallow copy of block without transactions, so transactions are never serialized
+		block_header = copy.copy(block)
+		block_header.transactions = []
+		block_header_buffer = block_header.serialize()
+
+		footer_size = 0 if block.type_ in IMPORTANCE_BLOCK_TYPES else NORMAL_BLOCK_FOOTER_SIZE
+		return block_header_buffer[TRANSACTION_HEADER_SIZE:len(block_header_buffer) - footer_size]
+
+	@staticmethod
+	def hash_block(block):
+		"""Hashes a Symbol block."""
+		hasher = hashlib.sha3_256(block.signature.bytes)
+		hasher.update(block.signer_public_key.bytes)
+		hasher.update(SymbolFacade._block_header_data_buffer(block))
+		return Hash256(hasher.digest())
+
+	@staticmethod
+	def sign_block(key_pair, block):
+		"""Signs a Symbol block."""
+		return key_pair.sign(SymbolFacade._block_header_data_buffer(block))
+
+	@staticmethod
+	def verify_block(block, signature=None):
+		"""Verifies a Symbol block signature, which defaults to attached signature."""
+		if signature is None:
+			signature = block.signature
+
+		return Verifier(block.signer_public_key).verify(SymbolFacade._block_header_data_buffer(block), signature)
+
+	@staticmethod
+	def _merkle_component_hash(transaction, transaction_hash):
+		# aggregate cosigners are part of merkle component hash, so that transactions hash changes when cosignatures change
+		if transaction.type_ not in AGGREGATE_TRANSACTION_TYPES or not transaction.cosignatures:
+			return transaction_hash
+
+		hasher = hashlib.sha3_256(transaction_hash.bytes)
+		for cosignature in transaction.cosignatures:
+			hasher.update(cosignature.signer_public_key.bytes)
+
+		return Hash256(hasher.digest())
+
+	def compute_block_transactions_hash(self, block, executor=None):
+		"""
+		Computes transactions hash of a Symbol block from its (top level) transactions, which are each serialized once.
+		Very large blocks can be split into chunks hashed in parallel by executor (e.g. ProcessPoolExecutor).
+		"""
+		transaction_hashes = self.hash_transactions(block.transactions, executor)
+
+		hash_builder = MerkleHashBuilder()
+		for (transaction, transaction_hash) in zip(block.transactions, transaction_hashes):
+			hash_builder.update(self._merkle_component_hash(transaction, transaction_hash))
 
 		return hash_builder.final()
 
@@ -0,0 +1,18 @@
+from itertools import repeat
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def map_chunks(func, fixed_args, items, chunk_size=None, executor=None):
+	"""
+	Calls func(*fixed_args, chunk) for every chunk of (at most) chunk_size (default DEFAULT_CHUNK_SIZE) items and flattens the results.
+	Chunks are mapped by executor, unless there is no executor or all items fit in a single chunk.
+	Process pool executors pickle func and fixed_args, so func must be a module level function and fixed_args must be picklable.
+	"""
+	chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+	if executor is None or len(items) <= chunk_size:
+		return list(func(*fixed_args, items))
+
+	chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+	fixed_arg_iterables = [repeat(fixed_arg) for fixed_arg in fixed_args]
+	return [result for chunk_results in executor.map(func, *fixed_arg_iterables, chunks) for result in chunk_results]
@@ -1,10 +1,14 @@
 import secrets
+from concurrent.futures import ThreadPoolExecutor
 
 from symbolchain.Cipher import AesCbcCipher, AesGcmCipher
+from symbolchain.impl.ChunkHelpers import map_chunks
+from symbolchain.SharedKeyCache import SharedKeyCache
 
 GCM_IV_SIZE = 12
 CBC_IV_SIZE = 16
 SALT_SIZE = 32
+DECODE_CHUNK_SIZE = 64
 
 
 def _decode(tag_or_salt_size, iv_size, encoded_message):
@@ -15,10 +19,17 @@ def _decode(tag_or_salt_size, iv_size, encoded_message):
 	return tag_or_salt, initialization_vector, encoded_message_data
 
 
-def decode_aes_gcm(shared_key_class, key_pair, recipient_public_key, encoded_message):
+def derive_shared_key(shared_key_class, key_pair, recipient_public_key, shared_key_cache=None):
+	if shared_key_cache is not None:
+		return shared_key_cache.derive_shared_key(shared_key_class, key_pair, recipient_public_key)
+
+	return shared_key_class.derive_shared_key(key_pair, recipient_public_key)
+
+
+def decode_aes_gcm(shared_key_class, key_pair, recipient_public_key, encoded_message, shared_key_cache=None):
 	tag, initialization_vector, encoded_message_data = _decode(AesGcmCipher.TAG_SIZE, GCM_IV_SIZE, encoded_message)
 
-	shared_key = shared_key_class.derive_shared_key(key_pair, recipient_public_key)
+	shared_key = derive_shared_key(shared_key_class, key_pair, recipient_public_key, shared_key_cache)
 	cipher = AesGcmCipher(shared_key)
 
 	return cipher.decrypt(encoded_message_data + tag, initialization_vector)
@@ -33,8 +44,8 @@ def decode_aes_cbc(shared_key_class, key_pair, recipient_public_key, encoded_mes
 	return cipher.decrypt(encoded_message_data, initialization_vector)
 
 
-def encode_aes_gcm(shared_key_class, key_pair, recipient_public_key, message):
-	shared_key = shared_key_class.derive_shared_key(key_pair, recipient_public_key)
+def encode_aes_gcm(shared_key_class, key_pair, recipient_public_key, message, shared_key_cache=None):
+	shared_key = derive_shared_key(shared_key_class, key_pair, recipient_public_key, shared_key_cache)
 	cipher = AesGcmCipher(shared_key)
 
 	initialization_vector = secrets.token_bytes(GCM_IV_SIZE)
@@ -55,3 +66,35 @@ def encode_aes_cbc(shared_key_class, key_pair, recipient_public_key, message):
 	cipher_text = cipher.encrypt(message, initialization_vector)
 
 	return salt, initialization_vector, cipher_text
+
+
+def _map_chunks(func, items, executor):
+	if executor is None and len(items) > DECODE_CHUNK_SIZE:
+		with ThreadPoolExecutor() as owned_executor:
+			return map_chunks(func, (), items, DECODE_CHUNK_SIZE, owned_executor)
+
+	return map_chunks(func, (), items, DECODE_CHUNK_SIZE, executor)
+
+
+def try_decode_many(encoder, shared_key_class, pairs, executor=None):
+	pairs = list(pairs)
+
+	# group messages by counterparty, so that every shared key is derived once before messages are decrypted
+	# (a batch cache is used when encoder has no cache or its cache is too small to hold all counterparty shared keys)
+	counterparty_public_keys = list({public_key.bytes: public_key for (public_key, _) in pairs}.values())
+	shared_key_cache = encoder.shared_key_cache
+	if shared_key_cache is None or shared_key_cache.max_size < len(counterparty_public_keys):
+		shared_key_cache = SharedKeyCache(max(1, len(counterparty_public_keys)))
+
+	def derive_shared_keys(public_keys):
+		return [shared_key_cache.derive_shared_key(shared_key_class, encoder.key_pair, public_key) for public_key in public_keys]
+
+	_map_chunks(derive_shared_keys, counterparty_public_keys, executor)
+
+	# cryptography releases GIL while decrypting, so threads decrypt messages concurrently
+	batch_encoder = type(encoder)(encoder.key_pair, shared_key_cache)
+
+	def try_decode_chunk(chunk):
+		return [batch_encoder.try_decode(public_key, encoded_message) for (public_key, encoded_message) in chunk]
+
+	return _map_chunks(try_decode_chunk, pairs, executor)
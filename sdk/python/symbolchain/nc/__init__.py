@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from binascii import hexlify
 from enum import Enum, Flag
+from struct import Struct
 from typing import List, TypeVar
 
 from ..ArrayHelpers import ArrayHelpers
@@ -20,7 +21,11 @@ from ..ByteArray import ByteArray
 StrBytes = TypeVar('StrBytes', str, bytes)
 
 
+_AMOUNT_CODEC = Struct('<Q')
+
+
 class Amount(BaseValue):
+	__slots__ = ()
 	SIZE = 8
 
 	def __init__(self, amount: int = 0):
@@ -28,14 +33,24 @@ class Amount(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Amount:
-		buffer = memoryview(payload)
-		return Amount(int.from_bytes(buffer[:8], byteorder='little', signed=False))
+		if len(payload) < 8:
+			raise ValueError(f'payload size {len(payload)} is smaller than Amount size 8')
+
+		return Amount.from_trusted(_AMOUNT_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(8, byteorder='little', signed=False)
+		return _AMOUNT_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_AMOUNT_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 8
+
+
+_HEIGHT_CODEC = Struct('<Q')
 
 
 class Height(BaseValue):
+	__slots__ = ()
 	SIZE = 8
 
 	def __init__(self, height: int = 0):
@@ -43,14 +58,24 @@ class Height(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Height:
-		buffer = memoryview(payload)
-		return Height(int.from_bytes(buffer[:8], byteorder='little', signed=False))
+		if len(payload) < 8:
+			raise ValueError(f'payload size {len(payload)} is smaller than Height size 8')
+
+		return Height.from_trusted(_HEIGHT_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(8, byteorder='little', signed=False)
+		return _HEIGHT_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_HEIGHT_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 8
+
+
+_TIMESTAMP_CODEC = Struct('<I')
 
 
 class Timestamp(BaseValue):
+	__slots__ = ()
 	SIZE = 4
 
 	def __init__(self, timestamp: int = 0):
@@ -58,14 +83,21 @@ class Timestamp(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Timestamp:
-		buffer = memoryview(payload)
-		return Timestamp(int.from_bytes(buffer[:4], byteorder='little', signed=False))
+		if len(payload) < 4:
+			raise ValueError(f'payload size {len(payload)} is smaller than Timestamp size 4')
+
+		return Timestamp.from_trusted(_TIMESTAMP_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(4, byteorder='little', signed=False)
+		return _TIMESTAMP_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_TIMESTAMP_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 4
 
 
 class Address(ByteArray):
+	__slots__ = ()
 	SIZE = 40
 
 	def __init__(self, address: StrBytes = bytes(40)):
@@ -78,13 +110,18 @@ class Address(ByteArray):
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Address:
 		buffer = memoryview(payload)
-		return Address(ArrayHelpers.get_bytes(buffer, 40))
+		return Address.from_trusted(ArrayHelpers.get_bytes(buffer, 40))
 
 	def serialize(self) -> bytes:
 		return self.bytes
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 40] = self.bytes
+		return offset + 40
+
 
 class Hash256(ByteArray):
+	__slots__ = ()
 	SIZE = 32
 
 	def __init__(self, hash256: StrBytes = bytes(32)):
@@ -97,13 +134,18 @@ class Hash256(ByteArray):
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Hash256:
 		buffer = memoryview(payload)
-		return Hash256(ArrayHelpers.get_bytes(buffer, 32))
+		return Hash256.from_trusted(ArrayHelpers.get_bytes(buffer, 32))
 
 	def serialize(self) -> bytes:
 		return self.bytes
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 32] = self.bytes
+		return offset + 32
+
 
 class PublicKey(ByteArray):
+	__slots__ = ()
 	SIZE = 32
 
 	def __init__(self, public_key: StrBytes = bytes(32)):
@@ -116,13 +158,18 @@ class PublicKey(ByteArray):
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> PublicKey:
 		buffer = memoryview(payload)
-		return PublicKey(ArrayHelpers.get_bytes(buffer, 32))
+		return PublicKey.from_trusted(ArrayHelpers.get_bytes(buffer, 32))
 
 	def serialize(self) -> bytes:
 		return self.bytes
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 32] = self.bytes
+		return offset + 32
+
 
 class Signature(ByteArray):
+	__slots__ = ()
 	SIZE = 64
 
 	def __init__(self, signature: StrBytes = bytes(64)):
@@ -135,11 +182,15 @@ class Signature(ByteArray):
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Signature:
 		buffer = memoryview(payload)
-		return Signature(ArrayHelpers.get_bytes(buffer, 64))
+		return Signature.from_trusted(ArrayHelpers.get_bytes(buffer, 64))
 
 	def serialize(self) -> bytes:
 		return self.bytes
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 64] = self.bytes
+		return offset + 64
+
 
 class NetworkType(Enum):
 	MAINNET = 104
@@ -159,6 +210,10 @@ class NetworkType(Enum):
 		buffer += self.value.to_bytes(1, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 1] = self.value.to_bytes(1, byteorder='little', signed=False)
+		return offset + 1
+
 
 class TransactionType(Enum):
 	TRANSFER = 257
@@ -184,8 +239,25 @@ class TransactionType(Enum):
 		buffer += self.value.to_bytes(4, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 4] = self.value.to_bytes(4, byteorder='little', signed=False)
+		return offset + 4
+
 
 class Transaction:
+	__slots__ = (
+		'_type_',
+		'_version',
+		'_network',
+		'_timestamp',
+		'_signer_public_key',
+		'_signature',
+		'_fee',
+		'_deadline',
+		'_entity_body_reserved_1',
+		'_signer_public_key_size',
+		'_signature_size'
+	)
 	TYPE_HINTS = {
 		'type_': 'enum:TransactionType',
 		'network': 'enum:NetworkType',
@@ -333,22 +405,31 @@ class Transaction:
 		return (size_ - len(buffer), size_)
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		self._serialize(buffer)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
-	def _serialize(self, buffer: memoryview):
-		buffer += self._type_.serialize()
-		buffer += self._version.to_bytes(1, byteorder='little', signed=False)
-		buffer += self._entity_body_reserved_1.to_bytes(2, byteorder='little', signed=False)
-		buffer += self._network.serialize()
-		buffer += self._timestamp.serialize()
-		buffer += self._signer_public_key_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._signer_public_key.serialize()
-		buffer += self._signature_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._signature.serialize()
-		buffer += self._fee.serialize()
-		buffer += self._deadline.serialize()
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = self._serialize_into(buffer, offset)
+		return offset
+
+	def _serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = self._type_.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = self._version.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		buffer[offset:offset + 2] = self._entity_body_reserved_1.to_bytes(2, byteorder='little', signed=False)
+		offset += 2
+		offset = self._network.serialize_into(buffer, offset)
+		offset = self._timestamp.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._signer_public_key_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._signer_public_key.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._signature_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._signature.serialize_into(buffer, offset)
+		offset = self._fee.serialize_into(buffer, offset)
+		offset = self._deadline.serialize_into(buffer, offset)
+		return offset
 
 	def __str__(self) -> str:
 		result = '('
@@ -364,7 +445,140 @@ class Transaction:
 		return result
 
 
+class TransactionView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 128:
+			raise ValueError(f'payload size {len(buffer)} is smaller than Transaction size {offset + 128}')
+
+		self._type__offset = offset
+		offset += 4
+		self._version_offset = offset
+		offset += 1
+		entity_body_reserved_1 = int.from_bytes(buffer[offset:offset + 2], byteorder='little', signed=False)
+		offset += 2
+		assert entity_body_reserved_1 == 0, f'Invalid value of reserved field ({entity_body_reserved_1})'
+		self._network_offset = offset
+		offset += 1
+		self._timestamp_offset = offset
+		offset += 4
+		signer_public_key_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert signer_public_key_size == 32, f'Invalid value of reserved field ({signer_public_key_size})'
+		self._signer_public_key_offset = offset
+		offset += 32
+		signature_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert signature_size == 64, f'Invalid value of reserved field ({signature_size})'
+		self._signature_offset = offset
+		offset += 64
+		self._fee_offset = offset
+		offset += 8
+		self._deadline_offset = offset
+		offset += 4
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def type_(self) -> TransactionType:
+		if 'type_' in self._cache:
+			return self._cache['type_']
+
+		buffer = self._buffer[self._type__offset:]
+		type_ = TransactionType.deserialize(buffer)
+		self._cache['type_'] = type_
+		return type_
+
+	@property
+	def version(self) -> int:
+		if 'version' in self._cache:
+			return self._cache['version']
+
+		buffer = self._buffer[self._version_offset:]
+		version = int.from_bytes(buffer[:1], byteorder='little', signed=False)
+		self._cache['version'] = version
+		return version
+
+	@property
+	def network(self) -> NetworkType:
+		if 'network' in self._cache:
+			return self._cache['network']
+
+		buffer = self._buffer[self._network_offset:]
+		network = NetworkType.deserialize(buffer)
+		self._cache['network'] = network
+		return network
+
+	@property
+	def timestamp(self) -> Timestamp:
+		if 'timestamp' in self._cache:
+			return self._cache['timestamp']
+
+		buffer = self._buffer[self._timestamp_offset:]
+		timestamp = Timestamp.deserialize(buffer)
+		self._cache['timestamp'] = timestamp
+		return timestamp
+
+	@property
+	def signer_public_key(self) -> PublicKey:
+		if 'signer_public_key' in self._cache:
+			return self._cache['signer_public_key']
+
+		buffer = self._buffer[self._signer_public_key_offset:]
+		signer_public_key = PublicKey.deserialize(buffer)
+		self._cache['signer_public_key'] = signer_public_key
+		return signer_public_key
+
+	@property
+	def signature(self) -> Signature:
+		if 'signature' in self._cache:
+			return self._cache['signature']
+
+		buffer = self._buffer[self._signature_offset:]
+		signature = Signature.deserialize(buffer)
+		self._cache['signature'] = signature
+		return signature
+
+	@property
+	def fee(self) -> Amount:
+		if 'fee' in self._cache:
+			return self._cache['fee']
+
+		buffer = self._buffer[self._fee_offset:]
+		fee = Amount.deserialize(buffer)
+		self._cache['fee'] = fee
+		return fee
+
+	@property
+	def deadline(self) -> Timestamp:
+		if 'deadline' in self._cache:
+			return self._cache['deadline']
+
+		buffer = self._buffer[self._deadline_offset:]
+		deadline = Timestamp.deserialize(buffer)
+		self._cache['deadline'] = deadline
+		return deadline
+
+
 class NonVerifiableTransaction:
+	__slots__ = (
+		'_type_',
+		'_version',
+		'_network',
+		'_timestamp',
+		'_signer_public_key',
+		'_fee',
+		'_deadline',
+		'_entity_body_reserved_1',
+		'_signer_public_key_size'
+	)
 	TYPE_HINTS = {
 		'type_': 'enum:TransactionType',
 		'network': 'enum:NetworkType',
@@ -493,20 +707,28 @@ class NonVerifiableTransaction:
 		return (size_ - len(buffer), size_)
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		self._serialize(buffer)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
-	def _serialize(self, buffer: memoryview):
-		buffer += self._type_.serialize()
-		buffer += self._version.to_bytes(1, byteorder='little', signed=False)
-		buffer += self._entity_body_reserved_1.to_bytes(2, byteorder='little', signed=False)
-		buffer += self._network.serialize()
-		buffer += self._timestamp.serialize()
-		buffer += self._signer_public_key_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._signer_public_key.serialize()
-		buffer += self._fee.serialize()
-		buffer += self._deadline.serialize()
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = self._serialize_into(buffer, offset)
+		return offset
+
+	def _serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = self._type_.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = self._version.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		buffer[offset:offset + 2] = self._entity_body_reserved_1.to_bytes(2, byteorder='little', signed=False)
+		offset += 2
+		offset = self._network.serialize_into(buffer, offset)
+		offset = self._timestamp.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._signer_public_key_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._signer_public_key.serialize_into(buffer, offset)
+		offset = self._fee.serialize_into(buffer, offset)
+		offset = self._deadline.serialize_into(buffer, offset)
+		return offset
 
 	def __str__(self) -> str:
 		result = '('
@@ -521,6 +743,113 @@ class NonVerifiableTransaction:
 		return result
 
 
+class NonVerifiableTransactionView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 60:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableTransaction size {offset + 60}')
+
+		self._type__offset = offset
+		offset += 4
+		self._version_offset = offset
+		offset += 1
+		entity_body_reserved_1 = int.from_bytes(buffer[offset:offset + 2], byteorder='little', signed=False)
+		offset += 2
+		assert entity_body_reserved_1 == 0, f'Invalid value of reserved field ({entity_body_reserved_1})'
+		self._network_offset = offset
+		offset += 1
+		self._timestamp_offset = offset
+		offset += 4
+		signer_public_key_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert signer_public_key_size == 32, f'Invalid value of reserved field ({signer_public_key_size})'
+		self._signer_public_key_offset = offset
+		offset += 32
+		self._fee_offset = offset
+		offset += 8
+		self._deadline_offset = offset
+		offset += 4
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def type_(self) -> TransactionType:
+		if 'type_' in self._cache:
+			return self._cache['type_']
+
+		buffer = self._buffer[self._type__offset:]
+		type_ = TransactionType.deserialize(buffer)
+		self._cache['type_'] = type_
+		return type_
+
+	@property
+	def version(self) -> int:
+		if 'version' in self._cache:
+			return self._cache['version']
+
+		buffer = self._buffer[self._version_offset:]
+		version = int.from_bytes(buffer[:1], byteorder='little', signed=False)
+		self._cache['version'] = version
+		return version
+
+	@property
+	def network(self) -> NetworkType:
+		if 'network' in self._cache:
+			return self._cache['network']
+
+		buffer = self._buffer[self._network_offset:]
+		network = NetworkType.deserialize(buffer)
+		self._cache['network'] = network
+		return network
+
+	@property
+	def timestamp(self) -> Timestamp:
+		if 'timestamp' in self._cache:
+			return self._cache['timestamp']
+
+		buffer = self._buffer[self._timestamp_offset:]
+		timestamp = Timestamp.deserialize(buffer)
+		self._cache['timestamp'] = timestamp
+		return timestamp
+
+	@property
+	def signer_public_key(self) -> PublicKey:
+		if 'signer_public_key' in self._cache:
+			return self._cache['signer_public_key']
+
+		buffer = self._buffer[self._signer_public_key_offset:]
+		signer_public_key = PublicKey.deserialize(buffer)
+		self._cache['signer_public_key'] = signer_public_key
+		return signer_public_key
+
+	@property
+	def fee(self) -> Amount:
+		if 'fee' in self._cache:
+			return self._cache['fee']
+
+		buffer = self._buffer[self._fee_offset:]
+		fee = Amount.deserialize(buffer)
+		self._cache['fee'] = fee
+		return fee
+
+	@property
+	def deadline(self) -> Timestamp:
+		if 'deadline' in self._cache:
+			return self._cache['deadline']
+
+		buffer = self._buffer[self._deadline_offset:]
+		deadline = Timestamp.deserialize(buffer)
+		self._cache['deadline'] = deadline
+		return deadline
+
+
 class LinkAction(Enum):
 	LINK = 1
 	UNLINK = 2
@@ -539,8 +868,13 @@ class LinkAction(Enum):
 		buffer += self.value.to_bytes(4, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 4] = self.value.to_bytes(4, byteorder='little', signed=False)
+		return offset + 4
+
 
 class AccountKeyLinkTransactionV1(Transaction):
+	__slots__ = ('_link_action', '_remote_public_key', '_remote_public_key_size')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.ACCOUNT_KEY_LINK
 	TYPE_HINTS = {
@@ -605,11 +939,50 @@ class AccountKeyLinkTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._link_action.serialize()
-		buffer += self._remote_public_key_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._remote_public_key.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
+		return buffer
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._link_action.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._remote_public_key_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._remote_public_key.serialize_into(buffer, offset)
+		return offset
+
+	def serialize_non_verifiable(self) -> bytes:
+		size = 0
+		size += self.type_.size
+		size += 1
+		size += 2
+		size += self.network.size
+		size += self.timestamp.size
+		size += 4
+		size += self.signer_public_key.size
+		size += self.fee.size
+		size += self.deadline.size
+		size += self.link_action.size
+		size += 4
+		size += self.remote_public_key.size
+		buffer = bytearray(size)
+		offset = 0
+		offset = self._type_.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = self._version.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		buffer[offset:offset + 2] = self._entity_body_reserved_1.to_bytes(2, byteorder='little', signed=False)
+		offset += 2
+		offset = self._network.serialize_into(buffer, offset)
+		offset = self._timestamp.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._signer_public_key_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._signer_public_key.serialize_into(buffer, offset)
+		offset = self._fee.serialize_into(buffer, offset)
+		offset = self._deadline.serialize_into(buffer, offset)
+		offset = self._link_action.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._remote_public_key_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._remote_public_key.serialize_into(buffer, offset)
 		return buffer
 
 	def __str__(self) -> str:
@@ -621,7 +994,48 @@ class AccountKeyLinkTransactionV1(Transaction):
 		return result
 
 
+class AccountKeyLinkTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than AccountKeyLinkTransactionV1 size {offset + 40}')
+
+		self._link_action_offset = offset
+		offset += 4
+		remote_public_key_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert remote_public_key_size == 32, f'Invalid value of reserved field ({remote_public_key_size})'
+		self._remote_public_key_offset = offset
+		offset += 32
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def link_action(self) -> LinkAction:
+		if 'link_action' in self._cache:
+			return self._cache['link_action']
+
+		buffer = self._buffer[self._link_action_offset:]
+		link_action = LinkAction.deserialize(buffer)
+		self._cache['link_action'] = link_action
+		return link_action
+
+	@property
+	def remote_public_key(self) -> PublicKey:
+		if 'remote_public_key' in self._cache:
+			return self._cache['remote_public_key']
+
+		buffer = self._buffer[self._remote_public_key_offset:]
+		remote_public_key = PublicKey.deserialize(buffer)
+		self._cache['remote_public_key'] = remote_public_key
+		return remote_public_key
+
+
 class NonVerifiableAccountKeyLinkTransactionV1(NonVerifiableTransaction):
+	__slots__ = ('_link_action', '_remote_public_key', '_remote_public_key_size')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.ACCOUNT_KEY_LINK
 	TYPE_HINTS = {
@@ -686,13 +1100,18 @@ class NonVerifiableAccountKeyLinkTransactionV1(NonVerifiableTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._link_action.serialize()
-		buffer += self._remote_public_key_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._remote_public_key.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._link_action.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._remote_public_key_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._remote_public_key.serialize_into(buffer, offset)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -702,7 +1121,48 @@ class NonVerifiableAccountKeyLinkTransactionV1(NonVerifiableTransaction):
 		return result
 
 
+class NonVerifiableAccountKeyLinkTransactionV1View(NonVerifiableTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableAccountKeyLinkTransactionV1 size {offset + 40}')
+
+		self._link_action_offset = offset
+		offset += 4
+		remote_public_key_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert remote_public_key_size == 32, f'Invalid value of reserved field ({remote_public_key_size})'
+		self._remote_public_key_offset = offset
+		offset += 32
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def link_action(self) -> LinkAction:
+		if 'link_action' in self._cache:
+			return self._cache['link_action']
+
+		buffer = self._buffer[self._link_action_offset:]
+		link_action = LinkAction.deserialize(buffer)
+		self._cache['link_action'] = link_action
+		return link_action
+
+	@property
+	def remote_public_key(self) -> PublicKey:
+		if 'remote_public_key' in self._cache:
+			return self._cache['remote_public_key']
+
+		buffer = self._buffer[self._remote_public_key_offset:]
+		remote_public_key = PublicKey.deserialize(buffer)
+		self._cache['remote_public_key'] = remote_public_key
+		return remote_public_key
+
+
 class NamespaceId:
+	__slots__ = ('_name',)
 	TYPE_HINTS = {
 		'name': 'bytes_array'
 	}
@@ -742,11 +1202,17 @@ class NamespaceId:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += len(self._name).to_bytes(4, byteorder='little', signed=False)  # name_size
-		buffer += self._name
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 4] = len(self._name).to_bytes(4, byteorder='little', signed=False)  # name_size
+		offset += 4
+		buffer[offset:offset + len(self._name)] = self._name
+		offset += len(self._name)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'name: {hexlify(self._name).decode("utf8")}, '
@@ -754,7 +1220,44 @@ class NamespaceId:
 		return result
 
 
+class NamespaceIdView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NamespaceId size {offset + 4}')
+
+		name_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._name_offset = offset
+		offset += name_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than NamespaceId size {offset}')
+
+		self._name_size = name_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def name(self) -> bytes:
+		if 'name' in self._cache:
+			return self._cache['name']
+
+		buffer = self._buffer[self._name_offset:]
+		name_size = self._name_size
+		name = ArrayHelpers.get_bytes(buffer, name_size)
+		self._cache['name'] = name
+		return name
+
+
 class MosaicId:
+	__slots__ = ('_namespace_id', '_name')
 	TYPE_HINTS = {
 		'namespace_id': 'struct:NamespaceId',
 		'name': 'bytes_array'
@@ -808,12 +1311,18 @@ class MosaicId:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._namespace_id.serialize()
-		buffer += len(self._name).to_bytes(4, byteorder='little', signed=False)  # name_size
-		buffer += self._name
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = self._namespace_id.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = len(self._name).to_bytes(4, byteorder='little', signed=False)  # name_size
+		offset += 4
+		buffer[offset:offset + len(self._name)] = self._name
+		offset += len(self._name)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'namespace_id: {self._namespace_id.__str__()}, '
@@ -822,7 +1331,53 @@ class MosaicId:
 		return result
 
 
+class MosaicIdView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		self._namespace_id_offset = offset
+		offset += NamespaceIdView(buffer[offset:]).size
+		name_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._name_offset = offset
+		offset += name_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicId size {offset}')
+
+		self._name_size = name_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def namespace_id(self) -> NamespaceId:
+		if 'namespace_id' in self._cache:
+			return self._cache['namespace_id']
+
+		buffer = self._buffer[self._namespace_id_offset:]
+		namespace_id = NamespaceId.deserialize(buffer)
+		self._cache['namespace_id'] = namespace_id
+		return namespace_id
+
+	@property
+	def name(self) -> bytes:
+		if 'name' in self._cache:
+			return self._cache['name']
+
+		buffer = self._buffer[self._name_offset:]
+		name_size = self._name_size
+		name = ArrayHelpers.get_bytes(buffer, name_size)
+		self._cache['name'] = name
+		return name
+
+
 class Mosaic:
+	__slots__ = ('_mosaic_id', '_amount')
 	TYPE_HINTS = {
 		'mosaic_id': 'struct:MosaicId',
 		'amount': 'pod:Amount'
@@ -877,12 +1432,19 @@ class Mosaic:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self.mosaic_id.size.to_bytes(4, byteorder='little', signed=False)  # mosaic_id_size
-		buffer += self._mosaic_id.serialize()
-		buffer += self._amount.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		mosaic_id_size_offset = offset
+		offset += 4  # mosaic_id_size
+		mosaic_id_offset = offset
+		offset = self._mosaic_id.serialize_into(buffer, offset)
+		buffer[mosaic_id_size_offset:mosaic_id_size_offset + 4] = (offset - mosaic_id_offset).to_bytes(4, byteorder='little', signed=False)
+		offset = self._amount.serialize_into(buffer, offset)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'mosaic_id: {self._mosaic_id.__str__()}, '
@@ -891,7 +1453,56 @@ class Mosaic:
 		return result
 
 
+class MosaicView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than Mosaic size {offset + 4}')
+
+		mosaic_id_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._mosaic_id_offset = offset
+		offset += mosaic_id_size
+		self._amount_offset = offset
+		offset += 8
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than Mosaic size {offset}')
+
+		self._mosaic_id_size = mosaic_id_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def mosaic_id(self) -> MosaicId:
+		if 'mosaic_id' in self._cache:
+			return self._cache['mosaic_id']
+
+		buffer = self._buffer[self._mosaic_id_offset:]
+		mosaic_id_size = self._mosaic_id_size
+		mosaic_id = MosaicId.deserialize(buffer[:mosaic_id_size])
+		self._cache['mosaic_id'] = mosaic_id
+		return mosaic_id
+
+	@property
+	def amount(self) -> Amount:
+		if 'amount' in self._cache:
+			return self._cache['amount']
+
+		buffer = self._buffer[self._amount_offset:]
+		amount = Amount.deserialize(buffer)
+		self._cache['amount'] = amount
+		return amount
+
+
 class SizePrefixedMosaic:
+	__slots__ = ('_mosaic',)
 	TYPE_HINTS = {
 		'mosaic': 'struct:Mosaic'
 	}
@@ -932,11 +1543,18 @@ class SizePrefixedMosaic:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self.mosaic.size.to_bytes(4, byteorder='little', signed=False)  # mosaic_size
-		buffer += self._mosaic.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		mosaic_size_offset = offset
+		offset += 4  # mosaic_size
+		mosaic_offset = offset
+		offset = self._mosaic.serialize_into(buffer, offset)
+		buffer[mosaic_size_offset:mosaic_size_offset + 4] = (offset - mosaic_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'mosaic: {self._mosaic.__str__()}, '
@@ -944,6 +1562,42 @@ class SizePrefixedMosaic:
 		return result
 
 
+class SizePrefixedMosaicView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than SizePrefixedMosaic size {offset + 4}')
+
+		mosaic_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._mosaic_offset = offset
+		offset += mosaic_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than SizePrefixedMosaic size {offset}')
+
+		self._mosaic_size = mosaic_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def mosaic(self) -> Mosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic_size = self._mosaic_size
+		mosaic = Mosaic.deserialize(buffer[:mosaic_size])
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+
 class MosaicTransferFeeType(Enum):
 	ABSOLUTE = 1
 	PERCENTILE = 2
@@ -962,8 +1616,13 @@ class MosaicTransferFeeType(Enum):
 		buffer += self.value.to_bytes(4, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 4] = self.value.to_bytes(4, byteorder='little', signed=False)
+		return offset + 4
+
 
 class MosaicLevy:
+	__slots__ = ('_transfer_fee_type', '_recipient_address', '_mosaic_id', '_fee', '_recipient_address_size')
 	TYPE_HINTS = {
 		'transfer_fee_type': 'enum:MosaicTransferFeeType',
 		'recipient_address': 'pod:Address',
@@ -1051,15 +1710,23 @@ class MosaicLevy:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._transfer_fee_type.serialize()
-		buffer += self._recipient_address_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._recipient_address.serialize()
-		buffer += self.mosaic_id.size.to_bytes(4, byteorder='little', signed=False)  # mosaic_id_size
-		buffer += self._mosaic_id.serialize()
-		buffer += self._fee.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = self._transfer_fee_type.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._recipient_address_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._recipient_address.serialize_into(buffer, offset)
+		mosaic_id_size_offset = offset
+		offset += 4  # mosaic_id_size
+		mosaic_id_offset = offset
+		offset = self._mosaic_id.serialize_into(buffer, offset)
+		buffer[mosaic_id_size_offset:mosaic_id_size_offset + 4] = (offset - mosaic_id_offset).to_bytes(4, byteorder='little', signed=False)
+		offset = self._fee.serialize_into(buffer, offset)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'transfer_fee_type: {self._transfer_fee_type.__str__()}, '
@@ -1070,21 +1737,97 @@ class MosaicLevy:
 		return result
 
 
-class MosaicProperty:
-	TYPE_HINTS = {
-		'name': 'bytes_array',
-		'value': 'bytes_array'
-	}
+class MosaicLevyView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 52:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicLevy size {offset + 52}')
+
+		self._transfer_fee_type_offset = offset
+		offset += 4
+		recipient_address_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert recipient_address_size == 40, f'Invalid value of reserved field ({recipient_address_size})'
+		self._recipient_address_offset = offset
+		offset += 40
+		mosaic_id_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._mosaic_id_offset = offset
+		offset += mosaic_id_size
+		self._fee_offset = offset
+		offset += 8
 
-	def __init__(self):
-		self._name = bytes()
-		self._value = bytes()
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicLevy size {offset}')
 
-	def sort(self) -> None:
-		pass
+		self._mosaic_id_size = mosaic_id_size
+		self._buffer = buffer
+		self._end_offset = offset
 
 	@property
-	def name(self) -> bytes:
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def transfer_fee_type(self) -> MosaicTransferFeeType:
+		if 'transfer_fee_type' in self._cache:
+			return self._cache['transfer_fee_type']
+
+		buffer = self._buffer[self._transfer_fee_type_offset:]
+		transfer_fee_type = MosaicTransferFeeType.deserialize(buffer)
+		self._cache['transfer_fee_type'] = transfer_fee_type
+		return transfer_fee_type
+
+	@property
+	def recipient_address(self) -> Address:
+		if 'recipient_address' in self._cache:
+			return self._cache['recipient_address']
+
+		buffer = self._buffer[self._recipient_address_offset:]
+		recipient_address = Address.deserialize(buffer)
+		self._cache['recipient_address'] = recipient_address
+		return recipient_address
+
+	@property
+	def mosaic_id(self) -> MosaicId:
+		if 'mosaic_id' in self._cache:
+			return self._cache['mosaic_id']
+
+		buffer = self._buffer[self._mosaic_id_offset:]
+		mosaic_id_size = self._mosaic_id_size
+		mosaic_id = MosaicId.deserialize(buffer[:mosaic_id_size])
+		self._cache['mosaic_id'] = mosaic_id
+		return mosaic_id
+
+	@property
+	def fee(self) -> Amount:
+		if 'fee' in self._cache:
+			return self._cache['fee']
+
+		buffer = self._buffer[self._fee_offset:]
+		fee = Amount.deserialize(buffer)
+		self._cache['fee'] = fee
+		return fee
+
+
+class MosaicProperty:
+	__slots__ = ('_name', '_value')
+	TYPE_HINTS = {
+		'name': 'bytes_array',
+		'value': 'bytes_array'
+	}
+
+	def __init__(self):
+		self._name = bytes()
+		self._value = bytes()
+
+	def sort(self) -> None:
+		pass
+
+	@property
+	def name(self) -> bytes:
 		return self._name
 
 	@property
@@ -1127,13 +1870,21 @@ class MosaicProperty:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += len(self._name).to_bytes(4, byteorder='little', signed=False)  # name_size
-		buffer += self._name
-		buffer += len(self._value).to_bytes(4, byteorder='little', signed=False)  # value_size
-		buffer += self._value
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 4] = len(self._name).to_bytes(4, byteorder='little', signed=False)  # name_size
+		offset += 4
+		buffer[offset:offset + len(self._name)] = self._name
+		offset += len(self._name)
+		buffer[offset:offset + 4] = len(self._value).to_bytes(4, byteorder='little', signed=False)  # value_size
+		offset += 4
+		buffer[offset:offset + len(self._value)] = self._value
+		offset += len(self._value)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'name: {hexlify(self._name).decode("utf8")}, '
@@ -1142,7 +1893,60 @@ class MosaicProperty:
 		return result
 
 
+class MosaicPropertyView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicProperty size {offset + 4}')
+
+		name_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._name_offset = offset
+		offset += name_size
+		value_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._value_offset = offset
+		offset += value_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicProperty size {offset}')
+
+		self._name_size = name_size
+		self._value_size = value_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def name(self) -> bytes:
+		if 'name' in self._cache:
+			return self._cache['name']
+
+		buffer = self._buffer[self._name_offset:]
+		name_size = self._name_size
+		name = ArrayHelpers.get_bytes(buffer, name_size)
+		self._cache['name'] = name
+		return name
+
+	@property
+	def value(self) -> bytes:
+		if 'value' in self._cache:
+			return self._cache['value']
+
+		buffer = self._buffer[self._value_offset:]
+		value_size = self._value_size
+		value = ArrayHelpers.get_bytes(buffer, value_size)
+		self._cache['value'] = value
+		return value
+
+
 class SizePrefixedMosaicProperty:
+	__slots__ = ('_property_',)
 	TYPE_HINTS = {
 		'property_': 'struct:MosaicProperty'
 	}
@@ -1183,11 +1987,18 @@ class SizePrefixedMosaicProperty:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self.property_.size.to_bytes(4, byteorder='little', signed=False)  # property_size
-		buffer += self._property_.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		property_size_offset = offset
+		offset += 4  # property_size
+		property__offset = offset
+		offset = self._property_.serialize_into(buffer, offset)
+		buffer[property_size_offset:property_size_offset + 4] = (offset - property__offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'property_: {self._property_.__str__()}, '
@@ -1195,7 +2006,44 @@ class SizePrefixedMosaicProperty:
 		return result
 
 
+class SizePrefixedMosaicPropertyView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than SizePrefixedMosaicProperty size {offset + 4}')
+
+		property_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._property__offset = offset
+		offset += property_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than SizePrefixedMosaicProperty size {offset}')
+
+		self._property_size = property_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def property_(self) -> MosaicProperty:
+		if 'property_' in self._cache:
+			return self._cache['property_']
+
+		buffer = self._buffer[self._property__offset:]
+		property_size = self._property_size
+		property_ = MosaicProperty.deserialize(buffer[:property_size])
+		self._cache['property_'] = property_
+		return property_
+
+
 class MosaicDefinition:
+	__slots__ = ('_owner_public_key', '_id', '_description', '_properties', '_levy', '_owner_public_key_size')
 	TYPE_HINTS = {
 		'owner_public_key': 'pod:PublicKey',
 		'id': 'struct:MosaicId',
@@ -1315,20 +2163,32 @@ class MosaicDefinition:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._owner_public_key_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._owner_public_key.serialize()
-		buffer += self.id.size.to_bytes(4, byteorder='little', signed=False)  # id_size
-		buffer += self._id.serialize()
-		buffer += len(self._description).to_bytes(4, byteorder='little', signed=False)  # description_size
-		buffer += self._description
-		buffer += len(self._properties).to_bytes(4, byteorder='little', signed=False)  # properties_count
-		buffer += ArrayHelpers.write_array(self._properties)
-		buffer += self.levy_size_computed.to_bytes(4, byteorder='little', signed=False)
-		if 0 != self.levy_size_computed:
-			buffer += self._levy.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 4] = self._owner_public_key_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._owner_public_key.serialize_into(buffer, offset)
+		id_size_offset = offset
+		offset += 4  # id_size
+		id_offset = offset
+		offset = self._id.serialize_into(buffer, offset)
+		buffer[id_size_offset:id_size_offset + 4] = (offset - id_offset).to_bytes(4, byteorder='little', signed=False)
+		buffer[offset:offset + 4] = len(self._description).to_bytes(4, byteorder='little', signed=False)  # description_size
+		offset += 4
+		buffer[offset:offset + len(self._description)] = self._description
+		offset += len(self._description)
+		buffer[offset:offset + 4] = len(self._properties).to_bytes(4, byteorder='little', signed=False)  # properties_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._properties)
+		buffer[offset:offset + 4] = self.levy_size_computed.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		if 0 != self.levy_size_computed:
+			offset = self._levy.serialize_into(buffer, offset)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'owner_public_key: {self._owner_public_key.__str__()}, '
@@ -1341,7 +2201,111 @@ class MosaicDefinition:
 		return result
 
 
+class MosaicDefinitionView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicDefinition size {offset + 40}')
+
+		owner_public_key_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert owner_public_key_size == 32, f'Invalid value of reserved field ({owner_public_key_size})'
+		self._owner_public_key_offset = offset
+		offset += 32
+		id_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._id_offset = offset
+		offset += id_size
+		description_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._description_offset = offset
+		offset += description_size
+		properties_count = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._properties_offset = offset
+		for _ in range(properties_count):
+			offset += SizePrefixedMosaicPropertyView(buffer[offset:]).size
+		levy_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._levy_offset = None
+		if 0 != levy_size:
+			self._levy_offset = offset
+			offset += MosaicLevyView(buffer[offset:]).size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicDefinition size {offset}')
+
+		self._description_size = description_size
+		self._id_size = id_size
+		self._properties_count = properties_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def owner_public_key(self) -> PublicKey:
+		if 'owner_public_key' in self._cache:
+			return self._cache['owner_public_key']
+
+		buffer = self._buffer[self._owner_public_key_offset:]
+		owner_public_key = PublicKey.deserialize(buffer)
+		self._cache['owner_public_key'] = owner_public_key
+		return owner_public_key
+
+	@property
+	def id(self) -> MosaicId:
+		if 'id' in self._cache:
+			return self._cache['id']
+
+		buffer = self._buffer[self._id_offset:]
+		id_size = self._id_size
+		id = MosaicId.deserialize(buffer[:id_size])
+		self._cache['id'] = id
+		return id
+
+	@property
+	def description(self) -> bytes:
+		if 'description' in self._cache:
+			return self._cache['description']
+
+		buffer = self._buffer[self._description_offset:]
+		description_size = self._description_size
+		description = ArrayHelpers.get_bytes(buffer, description_size)
+		self._cache['description'] = description
+		return description
+
+	@property
+	def properties(self) -> List[SizePrefixedMosaicProperty]:
+		if 'properties' in self._cache:
+			return self._cache['properties']
+
+		buffer = self._buffer[self._properties_offset:]
+		properties_count = self._properties_count
+		properties = ArrayHelpers.read_array_count(buffer, SizePrefixedMosaicProperty, properties_count)
+		self._cache['properties'] = properties
+		return properties
+
+	@property
+	def levy(self) -> MosaicLevy:
+		if self._levy_offset is None:
+			return None
+
+		if 'levy' in self._cache:
+			return self._cache['levy']
+
+		buffer = self._buffer[self._levy_offset:]
+		levy = MosaicLevy.deserialize(buffer)
+		self._cache['levy'] = levy
+		return levy
+
+
 class MosaicDefinitionTransactionV1(Transaction):
+	__slots__ = ('_mosaic_definition', '_rental_fee_sink', '_rental_fee', '_rental_fee_sink_size')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_DEFINITION
 	TYPE_HINTS = {
@@ -1424,13 +2388,62 @@ class MosaicDefinitionTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self.mosaic_definition.size.to_bytes(4, byteorder='little', signed=False)  # mosaic_definition_size
-		buffer += self._mosaic_definition.serialize()
-		buffer += self._rental_fee_sink_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._rental_fee_sink.serialize()
-		buffer += self._rental_fee.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
+		return buffer
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		mosaic_definition_size_offset = offset
+		offset += 4  # mosaic_definition_size
+		mosaic_definition_offset = offset
+		offset = self._mosaic_definition.serialize_into(buffer, offset)
+		buffer[mosaic_definition_size_offset:mosaic_definition_size_offset + 4] = (offset - mosaic_definition_offset).to_bytes(4, byteorder='little', signed=False)
+		buffer[offset:offset + 4] = self._rental_fee_sink_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._rental_fee_sink.serialize_into(buffer, offset)
+		offset = self._rental_fee.serialize_into(buffer, offset)
+		return offset
+
+	def serialize_non_verifiable(self) -> bytes:
+		size = 0
+		size += self.type_.size
+		size += 1
+		size += 2
+		size += self.network.size
+		size += self.timestamp.size
+		size += 4
+		size += self.signer_public_key.size
+		size += self.fee.size
+		size += self.deadline.size
+		size += 4
+		size += self.mosaic_definition.size
+		size += 4
+		size += self.rental_fee_sink.size
+		size += self.rental_fee.size
+		buffer = bytearray(size)
+		offset = 0
+		offset = self._type_.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = self._version.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		buffer[offset:offset + 2] = self._entity_body_reserved_1.to_bytes(2, byteorder='little', signed=False)
+		offset += 2
+		offset = self._network.serialize_into(buffer, offset)
+		offset = self._timestamp.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._signer_public_key_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._signer_public_key.serialize_into(buffer, offset)
+		offset = self._fee.serialize_into(buffer, offset)
+		offset = self._deadline.serialize_into(buffer, offset)
+		mosaic_definition_size_offset = offset
+		offset += 4  # mosaic_definition_size
+		mosaic_definition_offset = offset
+		offset = self._mosaic_definition.serialize_into(buffer, offset)
+		buffer[mosaic_definition_size_offset:mosaic_definition_size_offset + 4] = (offset - mosaic_definition_offset).to_bytes(4, byteorder='little', signed=False)
+		buffer[offset:offset + 4] = self._rental_fee_sink_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._rental_fee_sink.serialize_into(buffer, offset)
+		offset = self._rental_fee.serialize_into(buffer, offset)
 		return buffer
 
 	def __str__(self) -> str:
@@ -1443,7 +2456,67 @@ class MosaicDefinitionTransactionV1(Transaction):
 		return result
 
 
+class MosaicDefinitionTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicDefinitionTransactionV1 size {offset + 4}')
+
+		mosaic_definition_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._mosaic_definition_offset = offset
+		offset += mosaic_definition_size
+		rental_fee_sink_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert rental_fee_sink_size == 40, f'Invalid value of reserved field ({rental_fee_sink_size})'
+		self._rental_fee_sink_offset = offset
+		offset += 40
+		self._rental_fee_offset = offset
+		offset += 8
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicDefinitionTransactionV1 size {offset}')
+
+		self._mosaic_definition_size = mosaic_definition_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic_definition(self) -> MosaicDefinition:
+		if 'mosaic_definition' in self._cache:
+			return self._cache['mosaic_definition']
+
+		buffer = self._buffer[self._mosaic_definition_offset:]
+		mosaic_definition_size = self._mosaic_definition_size
+		mosaic_definition = MosaicDefinition.deserialize(buffer[:mosaic_definition_size])
+		self._cache['mosaic_definition'] = mosaic_definition
+		return mosaic_definition
+
+	@property
+	def rental_fee_sink(self) -> Address:
+		if 'rental_fee_sink' in self._cache:
+			return self._cache['rental_fee_sink']
+
+		buffer = self._buffer[self._rental_fee_sink_offset:]
+		rental_fee_sink = Address.deserialize(buffer)
+		self._cache['rental_fee_sink'] = rental_fee_sink
+		return rental_fee_sink
+
+	@property
+	def rental_fee(self) -> Amount:
+		if 'rental_fee' in self._cache:
+			return self._cache['rental_fee']
+
+		buffer = self._buffer[self._rental_fee_offset:]
+		rental_fee = Amount.deserialize(buffer)
+		self._cache['rental_fee'] = rental_fee
+		return rental_fee
+
+
 class NonVerifiableMosaicDefinitionTransactionV1(NonVerifiableTransaction):
+	__slots__ = ('_mosaic_definition', '_rental_fee_sink', '_rental_fee', '_rental_fee_sink_size')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_DEFINITION
 	TYPE_HINTS = {
@@ -1526,15 +2599,23 @@ class NonVerifiableMosaicDefinitionTransactionV1(NonVerifiableTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self.mosaic_definition.size.to_bytes(4, byteorder='little', signed=False)  # mosaic_definition_size
-		buffer += self._mosaic_definition.serialize()
-		buffer += self._rental_fee_sink_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._rental_fee_sink.serialize()
-		buffer += self._rental_fee.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		mosaic_definition_size_offset = offset
+		offset += 4  # mosaic_definition_size
+		mosaic_definition_offset = offset
+		offset = self._mosaic_definition.serialize_into(buffer, offset)
+		buffer[mosaic_definition_size_offset:mosaic_definition_size_offset + 4] = (offset - mosaic_definition_offset).to_bytes(4, byteorder='little', signed=False)
+		buffer[offset:offset + 4] = self._rental_fee_sink_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._rental_fee_sink.serialize_into(buffer, offset)
+		offset = self._rental_fee.serialize_into(buffer, offset)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -1545,6 +2626,65 @@ class NonVerifiableMosaicDefinitionTransactionV1(NonVerifiableTransaction):
 		return result
 
 
+class NonVerifiableMosaicDefinitionTransactionV1View(NonVerifiableTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableMosaicDefinitionTransactionV1 size {offset + 4}')
+
+		mosaic_definition_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._mosaic_definition_offset = offset
+		offset += mosaic_definition_size
+		rental_fee_sink_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert rental_fee_sink_size == 40, f'Invalid value of reserved field ({rental_fee_sink_size})'
+		self._rental_fee_sink_offset = offset
+		offset += 40
+		self._rental_fee_offset = offset
+		offset += 8
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableMosaicDefinitionTransactionV1 size {offset}')
+
+		self._mosaic_definition_size = mosaic_definition_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic_definition(self) -> MosaicDefinition:
+		if 'mosaic_definition' in self._cache:
+			return self._cache['mosaic_definition']
+
+		buffer = self._buffer[self._mosaic_definition_offset:]
+		mosaic_definition_size = self._mosaic_definition_size
+		mosaic_definition = MosaicDefinition.deserialize(buffer[:mosaic_definition_size])
+		self._cache['mosaic_definition'] = mosaic_definition
+		return mosaic_definition
+
+	@property
+	def rental_fee_sink(self) -> Address:
+		if 'rental_fee_sink' in self._cache:
+			return self._cache['rental_fee_sink']
+
+		buffer = self._buffer[self._rental_fee_sink_offset:]
+		rental_fee_sink = Address.deserialize(buffer)
+		self._cache['rental_fee_sink'] = rental_fee_sink
+		return rental_fee_sink
+
+	@property
+	def rental_fee(self) -> Amount:
+		if 'rental_fee' in self._cache:
+			return self._cache['rental_fee']
+
+		buffer = self._buffer[self._rental_fee_offset:]
+		rental_fee = Amount.deserialize(buffer)
+		self._cache['rental_fee'] = rental_fee
+		return rental_fee
+
+
 class MosaicSupplyChangeAction(Enum):
 	INCREASE = 1
 	DECREASE = 2
@@ -1563,8 +2703,13 @@ class MosaicSupplyChangeAction(Enum):
 		buffer += self.value.to_bytes(4, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 4] = self.value.to_bytes(4, byteorder='little', signed=False)
+		return offset + 4
+
 
 class MosaicSupplyChangeTransactionV1(Transaction):
+	__slots__ = ('_mosaic_id', '_action', '_delta')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_SUPPLY_CHANGE
 	TYPE_HINTS = {
@@ -1642,12 +2787,57 @@ class MosaicSupplyChangeTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self.mosaic_id.size.to_bytes(4, byteorder='little', signed=False)  # mosaic_id_size
-		buffer += self._mosaic_id.serialize()
-		buffer += self._action.serialize()
-		buffer += self._delta.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
+		return buffer
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		mosaic_id_size_offset = offset
+		offset += 4  # mosaic_id_size
+		mosaic_id_offset = offset
+		offset = self._mosaic_id.serialize_into(buffer, offset)
+		buffer[mosaic_id_size_offset:mosaic_id_size_offset + 4] = (offset - mosaic_id_offset).to_bytes(4, byteorder='little', signed=False)
+		offset = self._action.serialize_into(buffer, offset)
+		offset = self._delta.serialize_into(buffer, offset)
+		return offset
+
+	def serialize_non_verifiable(self) -> bytes:
+		size = 0
+		size += self.type_.size
+		size += 1
+		size += 2
+		size += self.network.size
+		size += self.timestamp.size
+		size += 4
+		size += self.signer_public_key.size
+		size += self.fee.size
+		size += self.deadline.size
+		size += 4
+		size += self.mosaic_id.size
+		size += self.action.size
+		size += self.delta.size
+		buffer = bytearray(size)
+		offset = 0
+		offset = self._type_.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = self._version.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		buffer[offset:offset + 2] = self._entity_body_reserved_1.to_bytes(2, byteorder='little', signed=False)
+		offset += 2
+		offset = self._network.serialize_into(buffer, offset)
+		offset = self._timestamp.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._signer_public_key_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._signer_public_key.serialize_into(buffer, offset)
+		offset = self._fee.serialize_into(buffer, offset)
+		offset = self._deadline.serialize_into(buffer, offset)
+		mosaic_id_size_offset = offset
+		offset += 4  # mosaic_id_size
+		mosaic_id_offset = offset
+		offset = self._mosaic_id.serialize_into(buffer, offset)
+		buffer[mosaic_id_size_offset:mosaic_id_size_offset + 4] = (offset - mosaic_id_offset).to_bytes(4, byteorder='little', signed=False)
+		offset = self._action.serialize_into(buffer, offset)
+		offset = self._delta.serialize_into(buffer, offset)
 		return buffer
 
 	def __str__(self) -> str:
@@ -1660,7 +2850,64 @@ class MosaicSupplyChangeTransactionV1(Transaction):
 		return result
 
 
+class MosaicSupplyChangeTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicSupplyChangeTransactionV1 size {offset + 4}')
+
+		mosaic_id_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._mosaic_id_offset = offset
+		offset += mosaic_id_size
+		self._action_offset = offset
+		offset += 4
+		self._delta_offset = offset
+		offset += 8
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicSupplyChangeTransactionV1 size {offset}')
+
+		self._mosaic_id_size = mosaic_id_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic_id(self) -> MosaicId:
+		if 'mosaic_id' in self._cache:
+			return self._cache['mosaic_id']
+
+		buffer = self._buffer[self._mosaic_id_offset:]
+		mosaic_id_size = self._mosaic_id_size
+		mosaic_id = MosaicId.deserialize(buffer[:mosaic_id_size])
+		self._cache['mosaic_id'] = mosaic_id
+		return mosaic_id
+
+	@property
+	def action(self) -> MosaicSupplyChangeAction:
+		if 'action' in self._cache:
+			return self._cache['action']
+
+		buffer = self._buffer[self._action_offset:]
+		action = MosaicSupplyChangeAction.deserialize(buffer)
+		self._cache['action'] = action
+		return action
+
+	@property
+	def delta(self) -> Amount:
+		if 'delta' in self._cache:
+			return self._cache['delta']
+
+		buffer = self._buffer[self._delta_offset:]
+		delta = Amount.deserialize(buffer)
+		self._cache['delta'] = delta
+		return delta
+
+
 class NonVerifiableMosaicSupplyChangeTransactionV1(NonVerifiableTransaction):
+	__slots__ = ('_mosaic_id', '_action', '_delta')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_SUPPLY_CHANGE
 	TYPE_HINTS = {
@@ -1738,14 +2985,21 @@ class NonVerifiableMosaicSupplyChangeTransactionV1(NonVerifiableTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self.mosaic_id.size.to_bytes(4, byteorder='little', signed=False)  # mosaic_id_size
-		buffer += self._mosaic_id.serialize()
-		buffer += self._action.serialize()
-		buffer += self._delta.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		mosaic_id_size_offset = offset
+		offset += 4  # mosaic_id_size
+		mosaic_id_offset = offset
+		offset = self._mosaic_id.serialize_into(buffer, offset)
+		buffer[mosaic_id_size_offset:mosaic_id_size_offset + 4] = (offset - mosaic_id_offset).to_bytes(4, byteorder='little', signed=False)
+		offset = self._action.serialize_into(buffer, offset)
+		offset = self._delta.serialize_into(buffer, offset)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -1756,6 +3010,62 @@ class NonVerifiableMosaicSupplyChangeTransactionV1(NonVerifiableTransaction):
 		return result
 
 
+class NonVerifiableMosaicSupplyChangeTransactionV1View(NonVerifiableTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableMosaicSupplyChangeTransactionV1 size {offset + 4}')
+
+		mosaic_id_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._mosaic_id_offset = offset
+		offset += mosaic_id_size
+		self._action_offset = offset
+		offset += 4
+		self._delta_offset = offset
+		offset += 8
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableMosaicSupplyChangeTransactionV1 size {offset}')
+
+		self._mosaic_id_size = mosaic_id_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic_id(self) -> MosaicId:
+		if 'mosaic_id' in self._cache:
+			return self._cache['mosaic_id']
+
+		buffer = self._buffer[self._mosaic_id_offset:]
+		mosaic_id_size = self._mosaic_id_size
+		mosaic_id = MosaicId.deserialize(buffer[:mosaic_id_size])
+		self._cache['mosaic_id'] = mosaic_id
+		return mosaic_id
+
+	@property
+	def action(self) -> MosaicSupplyChangeAction:
+		if 'action' in self._cache:
+			return self._cache['action']
+
+		buffer = self._buffer[self._action_offset:]
+		action = MosaicSupplyChangeAction.deserialize(buffer)
+		self._cache['action'] = action
+		return action
+
+	@property
+	def delta(self) -> Amount:
+		if 'delta' in self._cache:
+			return self._cache['delta']
+
+		buffer = self._buffer[self._delta_offset:]
+		delta = Amount.deserialize(buffer)
+		self._cache['delta'] = delta
+		return delta
+
+
 class MultisigAccountModificationType(Enum):
 	ADD_COSIGNATORY = 1
 	DELETE_COSIGNATORY = 2
@@ -1774,8 +3084,16 @@ class MultisigAccountModificationType(Enum):
 		buffer += self.value.to_bytes(4, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 4] = self.value.to_bytes(4, byteorder='little', signed=False)
+		return offset + 4
+
+
+_MULTISIG_ACCOUNT_MODIFICATION_CODEC = Struct('<II32s')
+
 
 class MultisigAccountModification:
+	__slots__ = ('_modification_type', '_cosignatory_public_key', '_cosignatory_public_key_size')
 	TYPE_HINTS = {
 		'modification_type': 'enum:MultisigAccountModificationType',
 		'cosignatory_public_key': 'pod:PublicKey'
@@ -1815,36 +3133,35 @@ class MultisigAccountModification:
 
 	@property
 	def size(self) -> int:
-		size = 0
-		size += self.modification_type.size
-		size += 4
-		size += self.cosignatory_public_key.size
-		return size
+		return 40
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> MultisigAccountModification:
-		buffer = memoryview(payload)
-		instance = MultisigAccountModification()
-		modification_type = MultisigAccountModificationType.deserialize(buffer)
-		buffer = buffer[modification_type.size:]
-		cosignatory_public_key_size = int.from_bytes(buffer[:4], byteorder='little', signed=False)
-		buffer = buffer[4:]
+		if len(payload) < 40:
+			raise ValueError(f'payload size {len(payload)} is smaller than MultisigAccountModification size 40')
+
+		return MultisigAccountModification.from_unpacked(_MULTISIG_ACCOUNT_MODIFICATION_CODEC.unpack_from(payload))
+
+	@classmethod
+	def from_unpacked(cls, values: tuple) -> MultisigAccountModification:
+		(modification_type, cosignatory_public_key_size, cosignatory_public_key) = values
 		assert cosignatory_public_key_size == 32, f'Invalid value of reserved field ({cosignatory_public_key_size})'
-		cosignatory_public_key = PublicKey.deserialize(buffer)
-		buffer = buffer[cosignatory_public_key.size:]
+		instance = MultisigAccountModification()
 
 		# pylint: disable=protected-access
-		instance._modification_type = modification_type
-		instance._cosignatory_public_key = cosignatory_public_key
+		instance._modification_type = MultisigAccountModificationType(modification_type)
+		instance._cosignatory_public_key = PublicKey.from_trusted(cosignatory_public_key)
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._modification_type.serialize()
-		buffer += self._cosignatory_public_key_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._cosignatory_public_key.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_MULTISIG_ACCOUNT_MODIFICATION_CODEC.pack_into(buffer, offset, self._modification_type.value, self._cosignatory_public_key_size, self._cosignatory_public_key.bytes)
+		return offset + 40
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'modification_type: {self._modification_type.__str__()}, '
@@ -1853,9 +3170,54 @@ class MultisigAccountModification:
 		return result
 
 
-class SizePrefixedMultisigAccountModification:
-	TYPE_HINTS = {
-		'modification': 'struct:MultisigAccountModification'
+class MultisigAccountModificationView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MultisigAccountModification size {offset + 40}')
+
+		self._modification_type_offset = offset
+		offset += 4
+		cosignatory_public_key_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert cosignatory_public_key_size == 32, f'Invalid value of reserved field ({cosignatory_public_key_size})'
+		self._cosignatory_public_key_offset = offset
+		offset += 32
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def modification_type(self) -> MultisigAccountModificationType:
+		if 'modification_type' in self._cache:
+			return self._cache['modification_type']
+
+		buffer = self._buffer[self._modification_type_offset:]
+		modification_type = MultisigAccountModificationType.deserialize(buffer)
+		self._cache['modification_type'] = modification_type
+		return modification_type
+
+	@property
+	def cosignatory_public_key(self) -> PublicKey:
+		if 'cosignatory_public_key' in self._cache:
+			return self._cache['cosignatory_public_key']
+
+		buffer = self._buffer[self._cosignatory_public_key_offset:]
+		cosignatory_public_key = PublicKey.deserialize(buffer)
+		self._cache['cosignatory_public_key'] = cosignatory_public_key
+		return cosignatory_public_key
+
+
+class SizePrefixedMultisigAccountModification:
+	__slots__ = ('_modification',)
+	TYPE_HINTS = {
+		'modification': 'struct:MultisigAccountModification'
 	}
 
 	def __init__(self):
@@ -1894,11 +3256,18 @@ class SizePrefixedMultisigAccountModification:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self.modification.size.to_bytes(4, byteorder='little', signed=False)  # modification_size
-		buffer += self._modification.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		modification_size_offset = offset
+		offset += 4  # modification_size
+		modification_offset = offset
+		offset = self._modification.serialize_into(buffer, offset)
+		buffer[modification_size_offset:modification_size_offset + 4] = (offset - modification_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'modification: {self._modification.__str__()}, '
@@ -1906,7 +3275,41 @@ class SizePrefixedMultisigAccountModification:
 		return result
 
 
+class SizePrefixedMultisigAccountModificationView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 44:
+			raise ValueError(f'payload size {len(buffer)} is smaller than SizePrefixedMultisigAccountModification size {offset + 44}')
+
+		modification_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._modification_offset = offset
+		offset += modification_size
+
+		self._modification_size = modification_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def modification(self) -> MultisigAccountModification:
+		if 'modification' in self._cache:
+			return self._cache['modification']
+
+		buffer = self._buffer[self._modification_offset:]
+		modification_size = self._modification_size
+		modification = MultisigAccountModification.deserialize(buffer[:modification_size])
+		self._cache['modification'] = modification
+		return modification
+
+
 class MultisigAccountModificationTransactionV1(Transaction):
+	__slots__ = ('_modifications',)
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MULTISIG_ACCOUNT_MODIFICATION
 	TYPE_HINTS = {
@@ -1955,10 +3358,47 @@ class MultisigAccountModificationTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += len(self._modifications).to_bytes(4, byteorder='little', signed=False)  # modifications_count
-		buffer += ArrayHelpers.write_array(self._modifications, lambda e: e.modification.comparer() if hasattr(e.modification, 'comparer') else e.modification)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
+		return buffer
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = len(self._modifications).to_bytes(4, byteorder='little', signed=False)  # modifications_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._modifications, lambda e: e.modification.comparer() if hasattr(e.modification, 'comparer') else e.modification)
+		return offset
+
+	def serialize_non_verifiable(self) -> bytes:
+		size = 0
+		size += self.type_.size
+		size += 1
+		size += 2
+		size += self.network.size
+		size += self.timestamp.size
+		size += 4
+		size += self.signer_public_key.size
+		size += self.fee.size
+		size += self.deadline.size
+		size += 4
+		size += ArrayHelpers.size(self.modifications)
+		buffer = bytearray(size)
+		offset = 0
+		offset = self._type_.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = self._version.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		buffer[offset:offset + 2] = self._entity_body_reserved_1.to_bytes(2, byteorder='little', signed=False)
+		offset += 2
+		offset = self._network.serialize_into(buffer, offset)
+		offset = self._timestamp.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._signer_public_key_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._signer_public_key.serialize_into(buffer, offset)
+		offset = self._fee.serialize_into(buffer, offset)
+		offset = self._deadline.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = len(self._modifications).to_bytes(4, byteorder='little', signed=False)  # modifications_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._modifications, lambda e: e.modification.comparer() if hasattr(e.modification, 'comparer') else e.modification)
 		return buffer
 
 	def __str__(self) -> str:
@@ -1969,7 +3409,40 @@ class MultisigAccountModificationTransactionV1(Transaction):
 		return result
 
 
+class MultisigAccountModificationTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MultisigAccountModificationTransactionV1 size {offset + 4}')
+
+		modifications_count = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._modifications_offset = offset
+		offset += modifications_count * 44
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than MultisigAccountModificationTransactionV1 size {offset}')
+
+		self._modifications_count = modifications_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def modifications(self) -> List[SizePrefixedMultisigAccountModification]:
+		if 'modifications' in self._cache:
+			return self._cache['modifications']
+
+		buffer = self._buffer[self._modifications_offset:]
+		modifications_count = self._modifications_count
+		modifications = ArrayHelpers.read_array_count(buffer, SizePrefixedMultisigAccountModification, modifications_count, lambda e: e.modification.comparer() if hasattr(e.modification, 'comparer') else e.modification)
+		self._cache['modifications'] = modifications
+		return modifications
+
+
 class NonVerifiableMultisigAccountModificationTransactionV1(NonVerifiableTransaction):
+	__slots__ = ('_modifications',)
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MULTISIG_ACCOUNT_MODIFICATION
 	TYPE_HINTS = {
@@ -2018,12 +3491,17 @@ class NonVerifiableMultisigAccountModificationTransactionV1(NonVerifiableTransac
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += len(self._modifications).to_bytes(4, byteorder='little', signed=False)  # modifications_count
-		buffer += ArrayHelpers.write_array(self._modifications, lambda e: e.modification.comparer() if hasattr(e.modification, 'comparer') else e.modification)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = len(self._modifications).to_bytes(4, byteorder='little', signed=False)  # modifications_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._modifications, lambda e: e.modification.comparer() if hasattr(e.modification, 'comparer') else e.modification)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -2032,7 +3510,40 @@ class NonVerifiableMultisigAccountModificationTransactionV1(NonVerifiableTransac
 		return result
 
 
+class NonVerifiableMultisigAccountModificationTransactionV1View(NonVerifiableTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableMultisigAccountModificationTransactionV1 size {offset + 4}')
+
+		modifications_count = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._modifications_offset = offset
+		offset += modifications_count * 44
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableMultisigAccountModificationTransactionV1 size {offset}')
+
+		self._modifications_count = modifications_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def modifications(self) -> List[SizePrefixedMultisigAccountModification]:
+		if 'modifications' in self._cache:
+			return self._cache['modifications']
+
+		buffer = self._buffer[self._modifications_offset:]
+		modifications_count = self._modifications_count
+		modifications = ArrayHelpers.read_array_count(buffer, SizePrefixedMultisigAccountModification, modifications_count, lambda e: e.modification.comparer() if hasattr(e.modification, 'comparer') else e.modification)
+		self._cache['modifications'] = modifications
+		return modifications
+
+
 class MultisigAccountModificationTransactionV2(Transaction):
+	__slots__ = ('_modifications', '_min_approval_delta', '_min_approval_delta_size')
 	TRANSACTION_VERSION: int = 2
 	TRANSACTION_TYPE: TransactionType = TransactionType.MULTISIG_ACCOUNT_MODIFICATION
 	TYPE_HINTS = {
@@ -2099,12 +3610,57 @@ class MultisigAccountModificationTransactionV2(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += len(self._modifications).to_bytes(4, byteorder='little', signed=False)  # modifications_count
-		buffer += ArrayHelpers.write_array(self._modifications, lambda e: e.modification.comparer() if hasattr(e.modification, 'comparer') else e.modification)
-		buffer += self._min_approval_delta_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._min_approval_delta.to_bytes(4, byteorder='little', signed=True)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
+		return buffer
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = len(self._modifications).to_bytes(4, byteorder='little', signed=False)  # modifications_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._modifications, lambda e: e.modification.comparer() if hasattr(e.modification, 'comparer') else e.modification)
+		buffer[offset:offset + 4] = self._min_approval_delta_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		buffer[offset:offset + 4] = self._min_approval_delta.to_bytes(4, byteorder='little', signed=True)
+		offset += 4
+		return offset
+
+	def serialize_non_verifiable(self) -> bytes:
+		size = 0
+		size += self.type_.size
+		size += 1
+		size += 2
+		size += self.network.size
+		size += self.timestamp.size
+		size += 4
+		size += self.signer_public_key.size
+		size += self.fee.size
+		size += self.deadline.size
+		size += 4
+		size += ArrayHelpers.size(self.modifications)
+		size += 4
+		size += 4
+		buffer = bytearray(size)
+		offset = 0
+		offset = self._type_.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = self._version.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		buffer[offset:offset + 2] = self._entity_body_reserved_1.to_bytes(2, byteorder='little', signed=False)
+		offset += 2
+		offset = self._network.serialize_into(buffer, offset)
+		offset = self._timestamp.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._signer_public_key_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._signer_public_key.serialize_into(buffer, offset)
+		offset = self._fee.serialize_into(buffer, offset)
+		offset = self._deadline.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = len(self._modifications).to_bytes(4, byteorder='little', signed=False)  # modifications_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._modifications, lambda e: e.modification.comparer() if hasattr(e.modification, 'comparer') else e.modification)
+		buffer[offset:offset + 4] = self._min_approval_delta_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		buffer[offset:offset + 4] = self._min_approval_delta.to_bytes(4, byteorder='little', signed=True)
+		offset += 4
 		return buffer
 
 	def __str__(self) -> str:
@@ -2116,7 +3672,55 @@ class MultisigAccountModificationTransactionV2(Transaction):
 		return result
 
 
+class MultisigAccountModificationTransactionV2View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MultisigAccountModificationTransactionV2 size {offset + 4}')
+
+		modifications_count = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._modifications_offset = offset
+		offset += modifications_count * 44
+		min_approval_delta_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert min_approval_delta_size == 4, f'Invalid value of reserved field ({min_approval_delta_size})'
+		self._min_approval_delta_offset = offset
+		offset += 4
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than MultisigAccountModificationTransactionV2 size {offset}')
+
+		self._modifications_count = modifications_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def modifications(self) -> List[SizePrefixedMultisigAccountModification]:
+		if 'modifications' in self._cache:
+			return self._cache['modifications']
+
+		buffer = self._buffer[self._modifications_offset:]
+		modifications_count = self._modifications_count
+		modifications = ArrayHelpers.read_array_count(buffer, SizePrefixedMultisigAccountModification, modifications_count, lambda e: e.modification.comparer() if hasattr(e.modification, 'comparer') else e.modification)
+		self._cache['modifications'] = modifications
+		return modifications
+
+	@property
+	def min_approval_delta(self) -> int:
+		if 'min_approval_delta' in self._cache:
+			return self._cache['min_approval_delta']
+
+		buffer = self._buffer[self._min_approval_delta_offset:]
+		min_approval_delta = int.from_bytes(buffer[:4], byteorder='little', signed=True)
+		self._cache['min_approval_delta'] = min_approval_delta
+		return min_approval_delta
+
+
 class NonVerifiableMultisigAccountModificationTransactionV2(NonVerifiableTransaction):
+	__slots__ = ('_modifications', '_min_approval_delta', '_min_approval_delta_size')
 	TRANSACTION_VERSION: int = 2
 	TRANSACTION_TYPE: TransactionType = TransactionType.MULTISIG_ACCOUNT_MODIFICATION
 	TYPE_HINTS = {
@@ -2183,14 +3787,21 @@ class NonVerifiableMultisigAccountModificationTransactionV2(NonVerifiableTransac
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += len(self._modifications).to_bytes(4, byteorder='little', signed=False)  # modifications_count
-		buffer += ArrayHelpers.write_array(self._modifications, lambda e: e.modification.comparer() if hasattr(e.modification, 'comparer') else e.modification)
-		buffer += self._min_approval_delta_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._min_approval_delta.to_bytes(4, byteorder='little', signed=True)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = len(self._modifications).to_bytes(4, byteorder='little', signed=False)  # modifications_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._modifications, lambda e: e.modification.comparer() if hasattr(e.modification, 'comparer') else e.modification)
+		buffer[offset:offset + 4] = self._min_approval_delta_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		buffer[offset:offset + 4] = self._min_approval_delta.to_bytes(4, byteorder='little', signed=True)
+		offset += 4
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -2200,7 +3811,61 @@ class NonVerifiableMultisigAccountModificationTransactionV2(NonVerifiableTransac
 		return result
 
 
+class NonVerifiableMultisigAccountModificationTransactionV2View(NonVerifiableTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableMultisigAccountModificationTransactionV2 size {offset + 4}')
+
+		modifications_count = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._modifications_offset = offset
+		offset += modifications_count * 44
+		min_approval_delta_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert min_approval_delta_size == 4, f'Invalid value of reserved field ({min_approval_delta_size})'
+		self._min_approval_delta_offset = offset
+		offset += 4
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableMultisigAccountModificationTransactionV2 size {offset}')
+
+		self._modifications_count = modifications_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def modifications(self) -> List[SizePrefixedMultisigAccountModification]:
+		if 'modifications' in self._cache:
+			return self._cache['modifications']
+
+		buffer = self._buffer[self._modifications_offset:]
+		modifications_count = self._modifications_count
+		modifications = ArrayHelpers.read_array_count(buffer, SizePrefixedMultisigAccountModification, modifications_count, lambda e: e.modification.comparer() if hasattr(e.modification, 'comparer') else e.modification)
+		self._cache['modifications'] = modifications
+		return modifications
+
+	@property
+	def min_approval_delta(self) -> int:
+		if 'min_approval_delta' in self._cache:
+			return self._cache['min_approval_delta']
+
+		buffer = self._buffer[self._min_approval_delta_offset:]
+		min_approval_delta = int.from_bytes(buffer[:4], byteorder='little', signed=True)
+		self._cache['min_approval_delta'] = min_approval_delta
+		return min_approval_delta
+
+
 class CosignatureV1(Transaction):
+	__slots__ = (
+		'_multisig_transaction_hash',
+		'_multisig_account_address',
+		'_multisig_transaction_hash_outer_size',
+		'_multisig_transaction_hash_size',
+		'_multisig_account_address_size'
+	)
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MULTISIG_COSIGNATURE
 	TYPE_HINTS = {
@@ -2275,15 +3940,22 @@ class CosignatureV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._multisig_transaction_hash_outer_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._multisig_transaction_hash_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._multisig_transaction_hash.serialize()
-		buffer += self._multisig_account_address_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._multisig_account_address.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._multisig_transaction_hash_outer_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		buffer[offset:offset + 4] = self._multisig_transaction_hash_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._multisig_transaction_hash.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._multisig_account_address_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._multisig_account_address.serialize_into(buffer, offset)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -2293,7 +3965,54 @@ class CosignatureV1(Transaction):
 		return result
 
 
+class CosignatureV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 84:
+			raise ValueError(f'payload size {len(buffer)} is smaller than CosignatureV1 size {offset + 84}')
+
+		multisig_transaction_hash_outer_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert multisig_transaction_hash_outer_size == 36, f'Invalid value of reserved field ({multisig_transaction_hash_outer_size})'
+		multisig_transaction_hash_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert multisig_transaction_hash_size == 32, f'Invalid value of reserved field ({multisig_transaction_hash_size})'
+		self._multisig_transaction_hash_offset = offset
+		offset += 32
+		multisig_account_address_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert multisig_account_address_size == 40, f'Invalid value of reserved field ({multisig_account_address_size})'
+		self._multisig_account_address_offset = offset
+		offset += 40
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def multisig_transaction_hash(self) -> Hash256:
+		if 'multisig_transaction_hash' in self._cache:
+			return self._cache['multisig_transaction_hash']
+
+		buffer = self._buffer[self._multisig_transaction_hash_offset:]
+		multisig_transaction_hash = Hash256.deserialize(buffer)
+		self._cache['multisig_transaction_hash'] = multisig_transaction_hash
+		return multisig_transaction_hash
+
+	@property
+	def multisig_account_address(self) -> Address:
+		if 'multisig_account_address' in self._cache:
+			return self._cache['multisig_account_address']
+
+		buffer = self._buffer[self._multisig_account_address_offset:]
+		multisig_account_address = Address.deserialize(buffer)
+		self._cache['multisig_account_address'] = multisig_account_address
+		return multisig_account_address
+
+
 class SizePrefixedCosignatureV1:
+	__slots__ = ('_cosignature',)
 	TYPE_HINTS = {
 		'cosignature': 'struct:CosignatureV1'
 	}
@@ -2334,11 +4053,18 @@ class SizePrefixedCosignatureV1:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self.cosignature.size.to_bytes(4, byteorder='little', signed=False)  # cosignature_size
-		buffer += self._cosignature.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		cosignature_size_offset = offset
+		offset += 4  # cosignature_size
+		cosignature_offset = offset
+		offset = self._cosignature.serialize_into(buffer, offset)
+		buffer[cosignature_size_offset:cosignature_size_offset + 4] = (offset - cosignature_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'cosignature: {self._cosignature.__str__()}, '
@@ -2346,7 +4072,44 @@ class SizePrefixedCosignatureV1:
 		return result
 
 
+class SizePrefixedCosignatureV1View:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than SizePrefixedCosignatureV1 size {offset + 4}')
+
+		cosignature_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._cosignature_offset = offset
+		offset += cosignature_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than SizePrefixedCosignatureV1 size {offset}')
+
+		self._cosignature_size = cosignature_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def cosignature(self) -> CosignatureV1:
+		if 'cosignature' in self._cache:
+			return self._cache['cosignature']
+
+		buffer = self._buffer[self._cosignature_offset:]
+		cosignature_size = self._cosignature_size
+		cosignature = CosignatureV1.deserialize(buffer[:cosignature_size])
+		self._cache['cosignature'] = cosignature
+		return cosignature
+
+
 class MultisigTransactionV1(Transaction):
+	__slots__ = ('_inner_transaction', '_cosignatures')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MULTISIG
 	TYPE_HINTS = {
@@ -2413,12 +4176,54 @@ class MultisigTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self.inner_transaction.size.to_bytes(4, byteorder='little', signed=False)  # inner_transaction_size
-		buffer += self._inner_transaction.serialize()
-		buffer += len(self._cosignatures).to_bytes(4, byteorder='little', signed=False)  # cosignatures_count
-		buffer += ArrayHelpers.write_array(self._cosignatures)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
+		return buffer
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		inner_transaction_size_offset = offset
+		offset += 4  # inner_transaction_size
+		inner_transaction_offset = offset
+		offset = self._inner_transaction.serialize_into(buffer, offset)
+		buffer[inner_transaction_size_offset:inner_transaction_size_offset + 4] = (offset - inner_transaction_offset).to_bytes(4, byteorder='little', signed=False)
+		buffer[offset:offset + 4] = len(self._cosignatures).to_bytes(4, byteorder='little', signed=False)  # cosignatures_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._cosignatures)
+		return offset
+
+	def serialize_non_verifiable(self) -> bytes:
+		size = 0
+		size += self.type_.size
+		size += 1
+		size += 2
+		size += self.network.size
+		size += self.timestamp.size
+		size += 4
+		size += self.signer_public_key.size
+		size += self.fee.size
+		size += self.deadline.size
+		size += 4
+		size += self.inner_transaction.size
+		buffer = bytearray(size)
+		offset = 0
+		offset = self._type_.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = self._version.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		buffer[offset:offset + 2] = self._entity_body_reserved_1.to_bytes(2, byteorder='little', signed=False)
+		offset += 2
+		offset = self._network.serialize_into(buffer, offset)
+		offset = self._timestamp.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._signer_public_key_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._signer_public_key.serialize_into(buffer, offset)
+		offset = self._fee.serialize_into(buffer, offset)
+		offset = self._deadline.serialize_into(buffer, offset)
+		inner_transaction_size_offset = offset
+		offset += 4  # inner_transaction_size
+		inner_transaction_offset = offset
+		offset = self._inner_transaction.serialize_into(buffer, offset)
+		buffer[inner_transaction_size_offset:inner_transaction_size_offset + 4] = (offset - inner_transaction_offset).to_bytes(4, byteorder='little', signed=False)
 		return buffer
 
 	def __str__(self) -> str:
@@ -2430,7 +4235,57 @@ class MultisigTransactionV1(Transaction):
 		return result
 
 
+class MultisigTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MultisigTransactionV1 size {offset + 4}')
+
+		inner_transaction_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._inner_transaction_offset = offset
+		offset += inner_transaction_size
+		cosignatures_count = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._cosignatures_offset = offset
+		for _ in range(cosignatures_count):
+			offset += SizePrefixedCosignatureV1View(buffer[offset:]).size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than MultisigTransactionV1 size {offset}')
+
+		self._cosignatures_count = cosignatures_count
+		self._inner_transaction_size = inner_transaction_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def inner_transaction(self) -> NonVerifiableTransaction:
+		if 'inner_transaction' in self._cache:
+			return self._cache['inner_transaction']
+
+		buffer = self._buffer[self._inner_transaction_offset:]
+		inner_transaction_size = self._inner_transaction_size
+		inner_transaction = NonVerifiableTransactionFactory.deserialize(buffer[:inner_transaction_size])
+		self._cache['inner_transaction'] = inner_transaction
+		return inner_transaction
+
+	@property
+	def cosignatures(self) -> List[SizePrefixedCosignatureV1]:
+		if 'cosignatures' in self._cache:
+			return self._cache['cosignatures']
+
+		buffer = self._buffer[self._cosignatures_offset:]
+		cosignatures_count = self._cosignatures_count
+		cosignatures = ArrayHelpers.read_array_count(buffer, SizePrefixedCosignatureV1, cosignatures_count)
+		self._cache['cosignatures'] = cosignatures
+		return cosignatures
+
+
 class NonVerifiableMultisigTransactionV1(NonVerifiableTransaction):
+	__slots__ = ('_inner_transaction',)
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MULTISIG
 	TYPE_HINTS = {
@@ -2480,12 +4335,19 @@ class NonVerifiableMultisigTransactionV1(NonVerifiableTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self.inner_transaction.size.to_bytes(4, byteorder='little', signed=False)  # inner_transaction_size
-		buffer += self._inner_transaction.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		inner_transaction_size_offset = offset
+		offset += 4  # inner_transaction_size
+		inner_transaction_offset = offset
+		offset = self._inner_transaction.serialize_into(buffer, offset)
+		buffer[inner_transaction_size_offset:inner_transaction_size_offset + 4] = (offset - inner_transaction_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -2494,7 +4356,40 @@ class NonVerifiableMultisigTransactionV1(NonVerifiableTransaction):
 		return result
 
 
+class NonVerifiableMultisigTransactionV1View(NonVerifiableTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableMultisigTransactionV1 size {offset + 4}')
+
+		inner_transaction_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._inner_transaction_offset = offset
+		offset += inner_transaction_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableMultisigTransactionV1 size {offset}')
+
+		self._inner_transaction_size = inner_transaction_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def inner_transaction(self) -> NonVerifiableTransaction:
+		if 'inner_transaction' in self._cache:
+			return self._cache['inner_transaction']
+
+		buffer = self._buffer[self._inner_transaction_offset:]
+		inner_transaction_size = self._inner_transaction_size
+		inner_transaction = NonVerifiableTransactionFactory.deserialize(buffer[:inner_transaction_size])
+		self._cache['inner_transaction'] = inner_transaction
+		return inner_transaction
+
+
 class NamespaceRegistrationTransactionV1(Transaction):
+	__slots__ = ('_rental_fee_sink', '_rental_fee', '_name', '_parent_name', '_rental_fee_sink_size')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.NAMESPACE_REGISTRATION
 	TYPE_HINTS = {
@@ -2596,16 +4491,73 @@ class NamespaceRegistrationTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._rental_fee_sink_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._rental_fee_sink.serialize()
-		buffer += self._rental_fee.serialize()
-		buffer += len(self._name).to_bytes(4, byteorder='little', signed=False)  # name_size
-		buffer += self._name
-		buffer += (len(self._parent_name) if self._parent_name is not None else 4294967295).to_bytes(4, byteorder='little', signed=False)  # parent_name_size
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
+		return buffer
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._rental_fee_sink_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._rental_fee_sink.serialize_into(buffer, offset)
+		offset = self._rental_fee.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = len(self._name).to_bytes(4, byteorder='little', signed=False)  # name_size
+		offset += 4
+		buffer[offset:offset + len(self._name)] = self._name
+		offset += len(self._name)
+		buffer[offset:offset + 4] = (len(self._parent_name) if self._parent_name is not None else 4294967295).to_bytes(4, byteorder='little', signed=False)  # parent_name_size
+		offset += 4
+		if self.parent_name:
+			buffer[offset:offset + len(self._parent_name)] = self._parent_name
+			offset += len(self._parent_name)
+		return offset
+
+	def serialize_non_verifiable(self) -> bytes:
+		size = 0
+		size += self.type_.size
+		size += 1
+		size += 2
+		size += self.network.size
+		size += self.timestamp.size
+		size += 4
+		size += self.signer_public_key.size
+		size += self.fee.size
+		size += self.deadline.size
+		size += 4
+		size += self.rental_fee_sink.size
+		size += self.rental_fee.size
+		size += 4
+		size += len(self._name)
+		size += 4
+		if self.parent_name:
+			size += len(self._parent_name)
+		buffer = bytearray(size)
+		offset = 0
+		offset = self._type_.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = self._version.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		buffer[offset:offset + 2] = self._entity_body_reserved_1.to_bytes(2, byteorder='little', signed=False)
+		offset += 2
+		offset = self._network.serialize_into(buffer, offset)
+		offset = self._timestamp.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._signer_public_key_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._signer_public_key.serialize_into(buffer, offset)
+		offset = self._fee.serialize_into(buffer, offset)
+		offset = self._deadline.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._rental_fee_sink_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._rental_fee_sink.serialize_into(buffer, offset)
+		offset = self._rental_fee.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = len(self._name).to_bytes(4, byteorder='little', signed=False)  # name_size
+		offset += 4
+		buffer[offset:offset + len(self._name)] = self._name
+		offset += len(self._name)
+		buffer[offset:offset + 4] = (len(self._parent_name) if self._parent_name is not None else 4294967295).to_bytes(4, byteorder='little', signed=False)  # parent_name_size
+		offset += 4
 		if self.parent_name:
-			buffer += self._parent_name
+			buffer[offset:offset + len(self._parent_name)] = self._parent_name
+			offset += len(self._parent_name)
 		return buffer
 
 	def __str__(self) -> str:
@@ -2620,7 +4572,88 @@ class NamespaceRegistrationTransactionV1(Transaction):
 		return result
 
 
+class NamespaceRegistrationTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 56:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NamespaceRegistrationTransactionV1 size {offset + 56}')
+
+		rental_fee_sink_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert rental_fee_sink_size == 40, f'Invalid value of reserved field ({rental_fee_sink_size})'
+		self._rental_fee_sink_offset = offset
+		offset += 40
+		self._rental_fee_offset = offset
+		offset += 8
+		name_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._name_offset = offset
+		offset += name_size
+		parent_name_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._parent_name_offset = None
+		if 4294967295 != parent_name_size:
+			self._parent_name_offset = offset
+			offset += parent_name_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than NamespaceRegistrationTransactionV1 size {offset}')
+
+		self._name_size = name_size
+		self._parent_name_size = parent_name_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def rental_fee_sink(self) -> Address:
+		if 'rental_fee_sink' in self._cache:
+			return self._cache['rental_fee_sink']
+
+		buffer = self._buffer[self._rental_fee_sink_offset:]
+		rental_fee_sink = Address.deserialize(buffer)
+		self._cache['rental_fee_sink'] = rental_fee_sink
+		return rental_fee_sink
+
+	@property
+	def rental_fee(self) -> Amount:
+		if 'rental_fee' in self._cache:
+			return self._cache['rental_fee']
+
+		buffer = self._buffer[self._rental_fee_offset:]
+		rental_fee = Amount.deserialize(buffer)
+		self._cache['rental_fee'] = rental_fee
+		return rental_fee
+
+	@property
+	def name(self) -> bytes:
+		if 'name' in self._cache:
+			return self._cache['name']
+
+		buffer = self._buffer[self._name_offset:]
+		name_size = self._name_size
+		name = ArrayHelpers.get_bytes(buffer, name_size)
+		self._cache['name'] = name
+		return name
+
+	@property
+	def parent_name(self) -> bytes:
+		if self._parent_name_offset is None:
+			return None
+
+		if 'parent_name' in self._cache:
+			return self._cache['parent_name']
+
+		buffer = self._buffer[self._parent_name_offset:]
+		parent_name_size = self._parent_name_size
+		parent_name = ArrayHelpers.get_bytes(buffer, parent_name_size)
+		self._cache['parent_name'] = parent_name
+		return parent_name
+
+
 class NonVerifiableNamespaceRegistrationTransactionV1(NonVerifiableTransaction):
+	__slots__ = ('_rental_fee_sink', '_rental_fee', '_name', '_parent_name', '_rental_fee_sink_size')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.NAMESPACE_REGISTRATION
 	TYPE_HINTS = {
@@ -2722,18 +4755,27 @@ class NonVerifiableNamespaceRegistrationTransactionV1(NonVerifiableTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._rental_fee_sink_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._rental_fee_sink.serialize()
-		buffer += self._rental_fee.serialize()
-		buffer += len(self._name).to_bytes(4, byteorder='little', signed=False)  # name_size
-		buffer += self._name
-		buffer += (len(self._parent_name) if self._parent_name is not None else 4294967295).to_bytes(4, byteorder='little', signed=False)  # parent_name_size
-		if self.parent_name:
-			buffer += self._parent_name
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._rental_fee_sink_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._rental_fee_sink.serialize_into(buffer, offset)
+		offset = self._rental_fee.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = len(self._name).to_bytes(4, byteorder='little', signed=False)  # name_size
+		offset += 4
+		buffer[offset:offset + len(self._name)] = self._name
+		offset += len(self._name)
+		buffer[offset:offset + 4] = (len(self._parent_name) if self._parent_name is not None else 4294967295).to_bytes(4, byteorder='little', signed=False)  # parent_name_size
+		offset += 4
+		if self.parent_name:
+			buffer[offset:offset + len(self._parent_name)] = self._parent_name
+			offset += len(self._parent_name)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -2746,6 +4788,86 @@ class NonVerifiableNamespaceRegistrationTransactionV1(NonVerifiableTransaction):
 		return result
 
 
+class NonVerifiableNamespaceRegistrationTransactionV1View(NonVerifiableTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 56:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableNamespaceRegistrationTransactionV1 size {offset + 56}')
+
+		rental_fee_sink_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert rental_fee_sink_size == 40, f'Invalid value of reserved field ({rental_fee_sink_size})'
+		self._rental_fee_sink_offset = offset
+		offset += 40
+		self._rental_fee_offset = offset
+		offset += 8
+		name_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._name_offset = offset
+		offset += name_size
+		parent_name_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._parent_name_offset = None
+		if 4294967295 != parent_name_size:
+			self._parent_name_offset = offset
+			offset += parent_name_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableNamespaceRegistrationTransactionV1 size {offset}')
+
+		self._name_size = name_size
+		self._parent_name_size = parent_name_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def rental_fee_sink(self) -> Address:
+		if 'rental_fee_sink' in self._cache:
+			return self._cache['rental_fee_sink']
+
+		buffer = self._buffer[self._rental_fee_sink_offset:]
+		rental_fee_sink = Address.deserialize(buffer)
+		self._cache['rental_fee_sink'] = rental_fee_sink
+		return rental_fee_sink
+
+	@property
+	def rental_fee(self) -> Amount:
+		if 'rental_fee' in self._cache:
+			return self._cache['rental_fee']
+
+		buffer = self._buffer[self._rental_fee_offset:]
+		rental_fee = Amount.deserialize(buffer)
+		self._cache['rental_fee'] = rental_fee
+		return rental_fee
+
+	@property
+	def name(self) -> bytes:
+		if 'name' in self._cache:
+			return self._cache['name']
+
+		buffer = self._buffer[self._name_offset:]
+		name_size = self._name_size
+		name = ArrayHelpers.get_bytes(buffer, name_size)
+		self._cache['name'] = name
+		return name
+
+	@property
+	def parent_name(self) -> bytes:
+		if self._parent_name_offset is None:
+			return None
+
+		if 'parent_name' in self._cache:
+			return self._cache['parent_name']
+
+		buffer = self._buffer[self._parent_name_offset:]
+		parent_name_size = self._parent_name_size
+		parent_name = ArrayHelpers.get_bytes(buffer, parent_name_size)
+		self._cache['parent_name'] = parent_name
+		return parent_name
+
+
 class MessageType(Enum):
 	PLAIN = 1
 	ENCRYPTED = 2
@@ -2764,8 +4886,13 @@ class MessageType(Enum):
 		buffer += self.value.to_bytes(4, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 4] = self.value.to_bytes(4, byteorder='little', signed=False)
+		return offset + 4
+
 
 class Message:
+	__slots__ = ('_message_type', '_message')
 	TYPE_HINTS = {
 		'message_type': 'enum:MessageType',
 		'message': 'bytes_array'
@@ -2819,12 +4946,18 @@ class Message:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._message_type.serialize()
-		buffer += len(self._message).to_bytes(4, byteorder='little', signed=False)  # message_size
-		buffer += self._message
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = self._message_type.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = len(self._message).to_bytes(4, byteorder='little', signed=False)  # message_size
+		offset += 4
+		buffer[offset:offset + len(self._message)] = self._message
+		offset += len(self._message)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'message_type: {self._message_type.__str__()}, '
@@ -2833,7 +4966,56 @@ class Message:
 		return result
 
 
+class MessageView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 8:
+			raise ValueError(f'payload size {len(buffer)} is smaller than Message size {offset + 8}')
+
+		self._message_type_offset = offset
+		offset += 4
+		message_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._message_offset = offset
+		offset += message_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than Message size {offset}')
+
+		self._message_size = message_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def message_type(self) -> MessageType:
+		if 'message_type' in self._cache:
+			return self._cache['message_type']
+
+		buffer = self._buffer[self._message_type_offset:]
+		message_type = MessageType.deserialize(buffer)
+		self._cache['message_type'] = message_type
+		return message_type
+
+	@property
+	def message(self) -> bytes:
+		if 'message' in self._cache:
+			return self._cache['message']
+
+		buffer = self._buffer[self._message_offset:]
+		message_size = self._message_size
+		message = ArrayHelpers.get_bytes(buffer, message_size)
+		self._cache['message'] = message
+		return message
+
+
 class TransferTransactionV1(Transaction):
+	__slots__ = ('_recipient_address', '_amount', '_message', '_recipient_address_size')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.TRANSFER
 	TYPE_HINTS = {
@@ -2923,14 +5105,61 @@ class TransferTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._recipient_address_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._recipient_address.serialize()
-		buffer += self._amount.serialize()
-		buffer += self.message_envelope_size_computed.to_bytes(4, byteorder='little', signed=False)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
+		return buffer
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._recipient_address_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._recipient_address.serialize_into(buffer, offset)
+		offset = self._amount.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self.message_envelope_size_computed.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		if 0 != self.message_envelope_size_computed:
+			offset = self._message.serialize_into(buffer, offset)
+		return offset
+
+	def serialize_non_verifiable(self) -> bytes:
+		size = 0
+		size += self.type_.size
+		size += 1
+		size += 2
+		size += self.network.size
+		size += self.timestamp.size
+		size += 4
+		size += self.signer_public_key.size
+		size += self.fee.size
+		size += self.deadline.size
+		size += 4
+		size += self.recipient_address.size
+		size += self.amount.size
+		size += 4
+		if 0 != self.message_envelope_size_computed:
+			size += self.message.size
+		buffer = bytearray(size)
+		offset = 0
+		offset = self._type_.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = self._version.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		buffer[offset:offset + 2] = self._entity_body_reserved_1.to_bytes(2, byteorder='little', signed=False)
+		offset += 2
+		offset = self._network.serialize_into(buffer, offset)
+		offset = self._timestamp.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._signer_public_key_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._signer_public_key.serialize_into(buffer, offset)
+		offset = self._fee.serialize_into(buffer, offset)
+		offset = self._deadline.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._recipient_address_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._recipient_address.serialize_into(buffer, offset)
+		offset = self._amount.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self.message_envelope_size_computed.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
 		if 0 != self.message_envelope_size_computed:
-			buffer += self._message.serialize()
+			offset = self._message.serialize_into(buffer, offset)
 		return buffer
 
 	def __str__(self) -> str:
@@ -2944,7 +5173,70 @@ class TransferTransactionV1(Transaction):
 		return result
 
 
+class TransferTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 56:
+			raise ValueError(f'payload size {len(buffer)} is smaller than TransferTransactionV1 size {offset + 56}')
+
+		recipient_address_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert recipient_address_size == 40, f'Invalid value of reserved field ({recipient_address_size})'
+		self._recipient_address_offset = offset
+		offset += 40
+		self._amount_offset = offset
+		offset += 8
+		message_envelope_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._message_offset = None
+		if 0 != message_envelope_size:
+			self._message_offset = offset
+			offset += MessageView(buffer[offset:]).size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than TransferTransactionV1 size {offset}')
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def recipient_address(self) -> Address:
+		if 'recipient_address' in self._cache:
+			return self._cache['recipient_address']
+
+		buffer = self._buffer[self._recipient_address_offset:]
+		recipient_address = Address.deserialize(buffer)
+		self._cache['recipient_address'] = recipient_address
+		return recipient_address
+
+	@property
+	def amount(self) -> Amount:
+		if 'amount' in self._cache:
+			return self._cache['amount']
+
+		buffer = self._buffer[self._amount_offset:]
+		amount = Amount.deserialize(buffer)
+		self._cache['amount'] = amount
+		return amount
+
+	@property
+	def message(self) -> Message:
+		if self._message_offset is None:
+			return None
+
+		if 'message' in self._cache:
+			return self._cache['message']
+
+		buffer = self._buffer[self._message_offset:]
+		message = Message.deserialize(buffer)
+		self._cache['message'] = message
+		return message
+
+
 class NonVerifiableTransferTransactionV1(NonVerifiableTransaction):
+	__slots__ = ('_recipient_address', '_amount', '_message', '_recipient_address_size')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.TRANSFER
 	TYPE_HINTS = {
@@ -3034,16 +5326,22 @@ class NonVerifiableTransferTransactionV1(NonVerifiableTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._recipient_address_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._recipient_address.serialize()
-		buffer += self._amount.serialize()
-		buffer += self.message_envelope_size_computed.to_bytes(4, byteorder='little', signed=False)
-		if 0 != self.message_envelope_size_computed:
-			buffer += self._message.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._recipient_address_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._recipient_address.serialize_into(buffer, offset)
+		offset = self._amount.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self.message_envelope_size_computed.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		if 0 != self.message_envelope_size_computed:
+			offset = self._message.serialize_into(buffer, offset)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -3055,7 +5353,70 @@ class NonVerifiableTransferTransactionV1(NonVerifiableTransaction):
 		return result
 
 
+class NonVerifiableTransferTransactionV1View(NonVerifiableTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 56:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableTransferTransactionV1 size {offset + 56}')
+
+		recipient_address_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert recipient_address_size == 40, f'Invalid value of reserved field ({recipient_address_size})'
+		self._recipient_address_offset = offset
+		offset += 40
+		self._amount_offset = offset
+		offset += 8
+		message_envelope_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._message_offset = None
+		if 0 != message_envelope_size:
+			self._message_offset = offset
+			offset += MessageView(buffer[offset:]).size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableTransferTransactionV1 size {offset}')
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def recipient_address(self) -> Address:
+		if 'recipient_address' in self._cache:
+			return self._cache['recipient_address']
+
+		buffer = self._buffer[self._recipient_address_offset:]
+		recipient_address = Address.deserialize(buffer)
+		self._cache['recipient_address'] = recipient_address
+		return recipient_address
+
+	@property
+	def amount(self) -> Amount:
+		if 'amount' in self._cache:
+			return self._cache['amount']
+
+		buffer = self._buffer[self._amount_offset:]
+		amount = Amount.deserialize(buffer)
+		self._cache['amount'] = amount
+		return amount
+
+	@property
+	def message(self) -> Message:
+		if self._message_offset is None:
+			return None
+
+		if 'message' in self._cache:
+			return self._cache['message']
+
+		buffer = self._buffer[self._message_offset:]
+		message = Message.deserialize(buffer)
+		self._cache['message'] = message
+		return message
+
+
 class TransferTransactionV2(Transaction):
+	__slots__ = ('_recipient_address', '_amount', '_message', '_mosaics', '_recipient_address_size')
 	TRANSACTION_VERSION: int = 2
 	TRANSACTION_TYPE: TransactionType = TransactionType.TRANSFER
 	TYPE_HINTS = {
@@ -3162,16 +5523,69 @@ class TransferTransactionV2(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._recipient_address_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._recipient_address.serialize()
-		buffer += self._amount.serialize()
-		buffer += self.message_envelope_size_computed.to_bytes(4, byteorder='little', signed=False)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
+		return buffer
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._recipient_address_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._recipient_address.serialize_into(buffer, offset)
+		offset = self._amount.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self.message_envelope_size_computed.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		if 0 != self.message_envelope_size_computed:
+			offset = self._message.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = len(self._mosaics).to_bytes(4, byteorder='little', signed=False)  # mosaics_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._mosaics)
+		return offset
+
+	def serialize_non_verifiable(self) -> bytes:
+		size = 0
+		size += self.type_.size
+		size += 1
+		size += 2
+		size += self.network.size
+		size += self.timestamp.size
+		size += 4
+		size += self.signer_public_key.size
+		size += self.fee.size
+		size += self.deadline.size
+		size += 4
+		size += self.recipient_address.size
+		size += self.amount.size
+		size += 4
 		if 0 != self.message_envelope_size_computed:
-			buffer += self._message.serialize()
-		buffer += len(self._mosaics).to_bytes(4, byteorder='little', signed=False)  # mosaics_count
-		buffer += ArrayHelpers.write_array(self._mosaics)
+			size += self.message.size
+		size += 4
+		size += ArrayHelpers.size(self.mosaics)
+		buffer = bytearray(size)
+		offset = 0
+		offset = self._type_.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = self._version.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		buffer[offset:offset + 2] = self._entity_body_reserved_1.to_bytes(2, byteorder='little', signed=False)
+		offset += 2
+		offset = self._network.serialize_into(buffer, offset)
+		offset = self._timestamp.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._signer_public_key_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._signer_public_key.serialize_into(buffer, offset)
+		offset = self._fee.serialize_into(buffer, offset)
+		offset = self._deadline.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._recipient_address_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._recipient_address.serialize_into(buffer, offset)
+		offset = self._amount.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self.message_envelope_size_computed.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		if 0 != self.message_envelope_size_computed:
+			offset = self._message.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = len(self._mosaics).to_bytes(4, byteorder='little', signed=False)  # mosaics_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._mosaics)
 		return buffer
 
 	def __str__(self) -> str:
@@ -3186,7 +5600,87 @@ class TransferTransactionV2(Transaction):
 		return result
 
 
+class TransferTransactionV2View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 56:
+			raise ValueError(f'payload size {len(buffer)} is smaller than TransferTransactionV2 size {offset + 56}')
+
+		recipient_address_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert recipient_address_size == 40, f'Invalid value of reserved field ({recipient_address_size})'
+		self._recipient_address_offset = offset
+		offset += 40
+		self._amount_offset = offset
+		offset += 8
+		message_envelope_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._message_offset = None
+		if 0 != message_envelope_size:
+			self._message_offset = offset
+			offset += MessageView(buffer[offset:]).size
+		mosaics_count = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._mosaics_offset = offset
+		for _ in range(mosaics_count):
+			offset += SizePrefixedMosaicView(buffer[offset:]).size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than TransferTransactionV2 size {offset}')
+
+		self._mosaics_count = mosaics_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def recipient_address(self) -> Address:
+		if 'recipient_address' in self._cache:
+			return self._cache['recipient_address']
+
+		buffer = self._buffer[self._recipient_address_offset:]
+		recipient_address = Address.deserialize(buffer)
+		self._cache['recipient_address'] = recipient_address
+		return recipient_address
+
+	@property
+	def amount(self) -> Amount:
+		if 'amount' in self._cache:
+			return self._cache['amount']
+
+		buffer = self._buffer[self._amount_offset:]
+		amount = Amount.deserialize(buffer)
+		self._cache['amount'] = amount
+		return amount
+
+	@property
+	def message(self) -> Message:
+		if self._message_offset is None:
+			return None
+
+		if 'message' in self._cache:
+			return self._cache['message']
+
+		buffer = self._buffer[self._message_offset:]
+		message = Message.deserialize(buffer)
+		self._cache['message'] = message
+		return message
+
+	@property
+	def mosaics(self) -> List[SizePrefixedMosaic]:
+		if 'mosaics' in self._cache:
+			return self._cache['mosaics']
+
+		buffer = self._buffer[self._mosaics_offset:]
+		mosaics_count = self._mosaics_count
+		mosaics = ArrayHelpers.read_array_count(buffer, SizePrefixedMosaic, mosaics_count)
+		self._cache['mosaics'] = mosaics
+		return mosaics
+
+
 class NonVerifiableTransferTransactionV2(NonVerifiableTransaction):
+	__slots__ = ('_recipient_address', '_amount', '_message', '_mosaics', '_recipient_address_size')
 	TRANSACTION_VERSION: int = 2
 	TRANSACTION_TYPE: TransactionType = TransactionType.TRANSFER
 	TYPE_HINTS = {
@@ -3293,18 +5787,25 @@ class NonVerifiableTransferTransactionV2(NonVerifiableTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._recipient_address_size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._recipient_address.serialize()
-		buffer += self._amount.serialize()
-		buffer += self.message_envelope_size_computed.to_bytes(4, byteorder='little', signed=False)
-		if 0 != self.message_envelope_size_computed:
-			buffer += self._message.serialize()
-		buffer += len(self._mosaics).to_bytes(4, byteorder='little', signed=False)  # mosaics_count
-		buffer += ArrayHelpers.write_array(self._mosaics)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = super()._serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._recipient_address_size.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._recipient_address.serialize_into(buffer, offset)
+		offset = self._amount.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self.message_envelope_size_computed.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		if 0 != self.message_envelope_size_computed:
+			offset = self._message.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = len(self._mosaics).to_bytes(4, byteorder='little', signed=False)  # mosaics_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._mosaics)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -3317,27 +5818,110 @@ class NonVerifiableTransferTransactionV2(NonVerifiableTransaction):
 		return result
 
 
+class NonVerifiableTransferTransactionV2View(NonVerifiableTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 56:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableTransferTransactionV2 size {offset + 56}')
+
+		recipient_address_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert recipient_address_size == 40, f'Invalid value of reserved field ({recipient_address_size})'
+		self._recipient_address_offset = offset
+		offset += 40
+		self._amount_offset = offset
+		offset += 8
+		message_envelope_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._message_offset = None
+		if 0 != message_envelope_size:
+			self._message_offset = offset
+			offset += MessageView(buffer[offset:]).size
+		mosaics_count = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._mosaics_offset = offset
+		for _ in range(mosaics_count):
+			offset += SizePrefixedMosaicView(buffer[offset:]).size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableTransferTransactionV2 size {offset}')
+
+		self._mosaics_count = mosaics_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def recipient_address(self) -> Address:
+		if 'recipient_address' in self._cache:
+			return self._cache['recipient_address']
+
+		buffer = self._buffer[self._recipient_address_offset:]
+		recipient_address = Address.deserialize(buffer)
+		self._cache['recipient_address'] = recipient_address
+		return recipient_address
+
+	@property
+	def amount(self) -> Amount:
+		if 'amount' in self._cache:
+			return self._cache['amount']
+
+		buffer = self._buffer[self._amount_offset:]
+		amount = Amount.deserialize(buffer)
+		self._cache['amount'] = amount
+		return amount
+
+	@property
+	def message(self) -> Message:
+		if self._message_offset is None:
+			return None
+
+		if 'message' in self._cache:
+			return self._cache['message']
+
+		buffer = self._buffer[self._message_offset:]
+		message = Message.deserialize(buffer)
+		self._cache['message'] = message
+		return message
+
+	@property
+	def mosaics(self) -> List[SizePrefixedMosaic]:
+		if 'mosaics' in self._cache:
+			return self._cache['mosaics']
+
+		buffer = self._buffer[self._mosaics_offset:]
+		mosaics_count = self._mosaics_count
+		mosaics = ArrayHelpers.read_array_count(buffer, SizePrefixedMosaic, mosaics_count)
+		self._cache['mosaics'] = mosaics
+		return mosaics
+
+
 class TransactionFactory:
+	MAPPING = {
+		(AccountKeyLinkTransactionV1.TRANSACTION_TYPE.value, AccountKeyLinkTransactionV1.TRANSACTION_VERSION): AccountKeyLinkTransactionV1,
+		(MosaicDefinitionTransactionV1.TRANSACTION_TYPE.value, MosaicDefinitionTransactionV1.TRANSACTION_VERSION): MosaicDefinitionTransactionV1,
+		(MosaicSupplyChangeTransactionV1.TRANSACTION_TYPE.value, MosaicSupplyChangeTransactionV1.TRANSACTION_VERSION): MosaicSupplyChangeTransactionV1,
+		(MultisigAccountModificationTransactionV1.TRANSACTION_TYPE.value, MultisigAccountModificationTransactionV1.TRANSACTION_VERSION): MultisigAccountModificationTransactionV1,
+		(MultisigAccountModificationTransactionV2.TRANSACTION_TYPE.value, MultisigAccountModificationTransactionV2.TRANSACTION_VERSION): MultisigAccountModificationTransactionV2,
+		(CosignatureV1.TRANSACTION_TYPE.value, CosignatureV1.TRANSACTION_VERSION): CosignatureV1,
+		(MultisigTransactionV1.TRANSACTION_TYPE.value, MultisigTransactionV1.TRANSACTION_VERSION): MultisigTransactionV1,
+		(NamespaceRegistrationTransactionV1.TRANSACTION_TYPE.value, NamespaceRegistrationTransactionV1.TRANSACTION_VERSION): NamespaceRegistrationTransactionV1,
+		(TransferTransactionV1.TRANSACTION_TYPE.value, TransferTransactionV1.TRANSACTION_VERSION): TransferTransactionV1,
+		(TransferTransactionV2.TRANSACTION_TYPE.value, TransferTransactionV2.TRANSACTION_VERSION): TransferTransactionV2
+	}
+
 	@classmethod
-	def deserialize(cls, payload: bytes) -> Transaction:
-		parent = Transaction()
-		buffer = bytes(payload)
-		Transaction._deserialize(buffer, parent)  # pylint: disable=protected-access
+	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Transaction:
+		buffer = memoryview(payload)
+		if len(buffer) < 128:
+			raise ValueError(f'payload size {len(buffer)} is smaller than Transaction header size 128')
+
+		discriminator = (int.from_bytes(buffer[0:4], byteorder='little', signed=False), int.from_bytes(buffer[4:5], byteorder='little', signed=False))
+		factory_class = cls.MAPPING.get(discriminator)
+		if factory_class is None:
+			raise ValueError(f'unknown discriminator {discriminator} for Transaction')
 
-		mapping = {
-			(AccountKeyLinkTransactionV1.TRANSACTION_TYPE, AccountKeyLinkTransactionV1.TRANSACTION_VERSION): AccountKeyLinkTransactionV1,
-			(MosaicDefinitionTransactionV1.TRANSACTION_TYPE, MosaicDefinitionTransactionV1.TRANSACTION_VERSION): MosaicDefinitionTransactionV1,
-			(MosaicSupplyChangeTransactionV1.TRANSACTION_TYPE, MosaicSupplyChangeTransactionV1.TRANSACTION_VERSION): MosaicSupplyChangeTransactionV1,
-			(MultisigAccountModificationTransactionV1.TRANSACTION_TYPE, MultisigAccountModificationTransactionV1.TRANSACTION_VERSION): MultisigAccountModificationTransactionV1,
-			(MultisigAccountModificationTransactionV2.TRANSACTION_TYPE, MultisigAccountModificationTransactionV2.TRANSACTION_VERSION): MultisigAccountModificationTransactionV2,
-			(CosignatureV1.TRANSACTION_TYPE, CosignatureV1.TRANSACTION_VERSION): CosignatureV1,
-			(MultisigTransactionV1.TRANSACTION_TYPE, MultisigTransactionV1.TRANSACTION_VERSION): MultisigTransactionV1,
-			(NamespaceRegistrationTransactionV1.TRANSACTION_TYPE, NamespaceRegistrationTransactionV1.TRANSACTION_VERSION): NamespaceRegistrationTransactionV1,
-			(TransferTransactionV1.TRANSACTION_TYPE, TransferTransactionV1.TRANSACTION_VERSION): TransferTransactionV1,
-			(TransferTransactionV2.TRANSACTION_TYPE, TransferTransactionV2.TRANSACTION_VERSION): TransferTransactionV2
-		}
-		discriminator = (parent.type_, parent.version)
-		factory_class = mapping[discriminator]
 		return factory_class.deserialize(buffer)
 
 	@classmethod
@@ -3362,25 +5946,29 @@ class TransactionFactory:
 
 
 class NonVerifiableTransactionFactory:
+	MAPPING = {
+		(NonVerifiableAccountKeyLinkTransactionV1.TRANSACTION_TYPE.value, NonVerifiableAccountKeyLinkTransactionV1.TRANSACTION_VERSION): NonVerifiableAccountKeyLinkTransactionV1,
+		(NonVerifiableMosaicDefinitionTransactionV1.TRANSACTION_TYPE.value, NonVerifiableMosaicDefinitionTransactionV1.TRANSACTION_VERSION): NonVerifiableMosaicDefinitionTransactionV1,
+		(NonVerifiableMosaicSupplyChangeTransactionV1.TRANSACTION_TYPE.value, NonVerifiableMosaicSupplyChangeTransactionV1.TRANSACTION_VERSION): NonVerifiableMosaicSupplyChangeTransactionV1,
+		(NonVerifiableMultisigAccountModificationTransactionV1.TRANSACTION_TYPE.value, NonVerifiableMultisigAccountModificationTransactionV1.TRANSACTION_VERSION): NonVerifiableMultisigAccountModificationTransactionV1,
+		(NonVerifiableMultisigAccountModificationTransactionV2.TRANSACTION_TYPE.value, NonVerifiableMultisigAccountModificationTransactionV2.TRANSACTION_VERSION): NonVerifiableMultisigAccountModificationTransactionV2,
+		(NonVerifiableMultisigTransactionV1.TRANSACTION_TYPE.value, NonVerifiableMultisigTransactionV1.TRANSACTION_VERSION): NonVerifiableMultisigTransactionV1,
+		(NonVerifiableNamespaceRegistrationTransactionV1.TRANSACTION_TYPE.value, NonVerifiableNamespaceRegistrationTransactionV1.TRANSACTION_VERSION): NonVerifiableNamespaceRegistrationTransactionV1,
+		(NonVerifiableTransferTransactionV1.TRANSACTION_TYPE.value, NonVerifiableTransferTransactionV1.TRANSACTION_VERSION): NonVerifiableTransferTransactionV1,
+		(NonVerifiableTransferTransactionV2.TRANSACTION_TYPE.value, NonVerifiableTransferTransactionV2.TRANSACTION_VERSION): NonVerifiableTransferTransactionV2
+	}
+
 	@classmethod
-	def deserialize(cls, payload: bytes) -> NonVerifiableTransaction:
-		parent = NonVerifiableTransaction()
-		buffer = bytes(payload)
-		NonVerifiableTransaction._deserialize(buffer, parent)  # pylint: disable=protected-access
+	def deserialize(cls, payload: bytes | bytearray | memoryview) -> NonVerifiableTransaction:
+		buffer = memoryview(payload)
+		if len(buffer) < 60:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NonVerifiableTransaction header size 60')
+
+		discriminator = (int.from_bytes(buffer[0:4], byteorder='little', signed=False), int.from_bytes(buffer[4:5], byteorder='little', signed=False))
+		factory_class = cls.MAPPING.get(discriminator)
+		if factory_class is None:
+			raise ValueError(f'unknown discriminator {discriminator} for NonVerifiableTransaction')
 
-		mapping = {
-			(NonVerifiableAccountKeyLinkTransactionV1.TRANSACTION_TYPE, NonVerifiableAccountKeyLinkTransactionV1.TRANSACTION_VERSION): NonVerifiableAccountKeyLinkTransactionV1,
-			(NonVerifiableMosaicDefinitionTransactionV1.TRANSACTION_TYPE, NonVerifiableMosaicDefinitionTransactionV1.TRANSACTION_VERSION): NonVerifiableMosaicDefinitionTransactionV1,
-			(NonVerifiableMosaicSupplyChangeTransactionV1.TRANSACTION_TYPE, NonVerifiableMosaicSupplyChangeTransactionV1.TRANSACTION_VERSION): NonVerifiableMosaicSupplyChangeTransactionV1,
-			(NonVerifiableMultisigAccountModificationTransactionV1.TRANSACTION_TYPE, NonVerifiableMultisigAccountModificationTransactionV1.TRANSACTION_VERSION): NonVerifiableMultisigAccountModificationTransactionV1,
-			(NonVerifiableMultisigAccountModificationTransactionV2.TRANSACTION_TYPE, NonVerifiableMultisigAccountModificationTransactionV2.TRANSACTION_VERSION): NonVerifiableMultisigAccountModificationTransactionV2,
-			(NonVerifiableMultisigTransactionV1.TRANSACTION_TYPE, NonVerifiableMultisigTransactionV1.TRANSACTION_VERSION): NonVerifiableMultisigTransactionV1,
-			(NonVerifiableNamespaceRegistrationTransactionV1.TRANSACTION_TYPE, NonVerifiableNamespaceRegistrationTransactionV1.TRANSACTION_VERSION): NonVerifiableNamespaceRegistrationTransactionV1,
-			(NonVerifiableTransferTransactionV1.TRANSACTION_TYPE, NonVerifiableTransferTransactionV1.TRANSACTION_VERSION): NonVerifiableTransferTransactionV1,
-			(NonVerifiableTransferTransactionV2.TRANSACTION_TYPE, NonVerifiableTransferTransactionV2.TRANSACTION_VERSION): NonVerifiableTransferTransactionV2
-		}
-		discriminator = (parent.type_, parent.version)
-		factory_class = mapping[discriminator]
 		return factory_class.deserialize(buffer)
 
 	@classmethod
@@ -13,13 +13,8 @@ from nacl.bindings import (
 from ..CryptoTypes import PrivateKey, PublicKey, Signature
 
 
-def _generate_nonce(secret_key, message):
-	hashed_secret = sha3.keccak_512(secret_key).digest()
-	hashobj = sha3.keccak_512()
-	hashobj.update(hashed_secret[32:])
-	hashobj.update(message)
-	final_hash = hashobj.digest()
-	return final_hash
+def _wipe(buffer):
+	buffer[:] = bytes(len(buffer))
 
 
 def _is_reduced_s(encoded_s):
@@ -37,15 +32,28 @@ def _is_canonical_s(encoded_s):
 
 
 class KeyPair:
-	"""Represents an ED25519 private and public key."""
+	"""
+	Represents an ED25519 private and public key.
+	Hashed and clamped private key scalar and nonce prefix are precomputed once in (wipeable) mutable buffers.
+	"""
 
 	def __init__(self, private_key):
 		"""Creates a key pair from a private key."""
-		self._sk = private_key.bytes[::-1]
+		self._sk = bytearray(private_key.bytes[::-1])
+
+		hashed_secret = bytearray(sha3.keccak_512(self._sk).digest())
 
 		# nacl does clamping
-		hashed_secret = sha3.keccak_512(self._sk).digest()
-		self._pk = crypto_scalarmult_ed25519_base(hashed_secret[:32])
+		self._pk = crypto_scalarmult_ed25519_base(bytes(hashed_secret[:32]))
+
+		# clamp private key scalar
+		self._a = hashed_secret[:32]
+		self._a[0] &= 0xF8
+		self._a[31] &= 0x7F
+		self._a[31] |= 0x40
+
+		self._nonce_prefix = hashed_secret[32:]
+		_wipe(hashed_secret)
 
 	@property
 	def public_key(self):
@@ -55,33 +63,51 @@ class KeyPair:
 	@property
 	def private_key(self):
 		"""Gets the private key."""
-		return PrivateKey(self._sk[::-1])
+		self._check_not_wiped()
+		return PrivateKey(bytes(self._sk[::-1]))
+
+	def _check_not_wiped(self):
+		if self._sk is None:
+			raise ValueError('key pair has been wiped')
+
+	def wipe(self):
+		"""Zeroes private key and all secrets derived from it, after which key pair can no longer sign."""
+		if self._sk is None:
+			return
+
+		for secret in (self._sk, self._a, self._nonce_prefix):
+			_wipe(secret)
+
+		self._sk = self._a = self._nonce_prefix = None
 
 	def sign(self, message):
 		"""Signs a message with the private key."""
+		self._check_not_wiped()
+		return self._sign(bytes(self._a), message)
+
+	def sign_many(self, messages):
+		"""Signs messages with the private key, sharing precomputed secrets across all signatures."""
+		self._check_not_wiped()
+
+		# scalar is copied into temporary immutable bytes once per batch, because nacl bindings only accept bytes
+		a = bytes(self._a)  # pylint: disable=invalid-name
+		return [self._sign(a, message) for message in messages]
 
+	def _sign(self, a, message):
 		# pylint: disable=invalid-name
 		# r = H(privHash[256:512] || data)
-		r = _generate_nonce(self._sk, message)
+		hashobj = sha3.keccak_512(self._nonce_prefix)
+		hashobj.update(message)
+		r = crypto_core_ed25519_scalar_reduce(hashobj.digest())
 
 		# R = r * base point
-		r = crypto_core_ed25519_scalar_reduce(r)
 		R = crypto_scalarmult_ed25519_base_noclamp(r)
 
 		# h = H(encodedR || public || data)
-		hashobj = sha3.keccak_512()
-		hashobj.update(R[:32])
+		hashobj = sha3.keccak_512(R)
 		hashobj.update(self._pk)
 		hashobj.update(message)
-		h = hashobj.digest()
-		h = crypto_core_ed25519_scalar_reduce(h)
-
-		# hash and clamp private key
-		a = bytearray(sha3.keccak_512(self._sk).digest()[:32])
-		a[0] &= 0xF8
-		a[31] &= 0x7F
-		a[31] |= 0x40
-		a = bytes(a)
+		h = crypto_core_ed25519_scalar_reduce(hashobj.digest())
 
 		# S = (r + h * a) mod L
 		h_a = crypto_core_ed25519_scalar_mul(a, h)
@@ -90,8 +116,7 @@ class KeyPair:
 		# ensure resulting signature is canonical (this is a sanity check that should never get triggered)
 		assert bytes(32) == S or _is_reduced_s(S)
 
-		act_sig = R + S
-		return Signature(act_sig)
+		return Signature(R + S)
 
 
 class Verifier:
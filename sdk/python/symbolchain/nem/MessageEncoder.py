@@ -3,19 +3,21 @@ import warnings
 import cryptography
 
 from symbolchain.CryptoTypes import PublicKey
-from symbolchain.impl.CipherHelpers import decode_aes_cbc, decode_aes_gcm, encode_aes_cbc, encode_aes_gcm
+from symbolchain.impl.CipherHelpers import decode_aes_cbc, decode_aes_gcm, encode_aes_cbc, encode_aes_gcm, try_decode_many
 from symbolchain.nc import Message, MessageType
 from symbolchain.nem.KeyPair import KeyPair
 from symbolchain.nem.SharedKey import SharedKey
+from symbolchain.SharedKeyCache import SharedKeyCache
 
 
 class MessageEncoder:
 	"""Encrypts and encodes messages between two parties."""
 
-	def __init__(self, key_pair: KeyPair):
-		"""Creates message encoder around key pair."""
+	def __init__(self, key_pair: KeyPair, shared_key_cache: SharedKeyCache = None):
+		"""Creates message encoder around key pair and (optional) cache of shared keys."""
 
 		self.key_pair = key_pair
+		self.shared_key_cache = shared_key_cache
 
 	def try_decode(self, recipient_public_key, encoded_message: Message):
 		"""Tries to decode encoded message, returns tuple:
@@ -27,7 +29,7 @@ class MessageEncoder:
 			raise RuntimeError('invalid message format')
 
 		try:
-			message = decode_aes_gcm(SharedKey, self.key_pair, recipient_public_key, encoded_message.message)
+			message = decode_aes_gcm(SharedKey, self.key_pair, recipient_public_key, encoded_message.message, self.shared_key_cache)
 			return True, message
 		except cryptography.exceptions.InvalidTag:
 			pass
@@ -48,13 +50,18 @@ class MessageEncoder:
 	def encode(self, recipient_public_key: PublicKey, message: bytes):
 		"""Encodes message to recipient using recommended format."""
 
-		tag, initialization_vector, cipher_text = encode_aes_gcm(SharedKey, self.key_pair, recipient_public_key, message)
+		tag, initialization_vector, cipher_text = encode_aes_gcm(SharedKey, self.key_pair, recipient_public_key, message, self.shared_key_cache)
 
 		encoded_messsage = Message()
 		encoded_messsage.message_type = MessageType.ENCRYPTED
 		encoded_messsage.message = tag + initialization_vector + cipher_text
 		return encoded_messsage
 
+	def try_decode_many(self, pairs, executor=None):
+		"""Tries to decode many (recipient public key, encoded message) pairs in parallel, returns try_decode tuples in input order."""
+
+		return try_decode_many(self, SharedKey, pairs, executor)
+
 	def encode_deprecated(self, recipient_public_key: PublicKey, message: bytes):
 		"""Encodes message to recipient using deprecated encryption and key derivation."""
 
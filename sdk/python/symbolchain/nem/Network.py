@@ -19,6 +19,8 @@ class NetworkTimestamp(BasicNetworkTimestamp):
 class Address(ByteArray):
 	"""Represents a nem address."""
 
+	__slots__ = ()
+
 	SIZE = 25
 	ENCODED_SIZE = 40
 
@@ -1,8 +1,8 @@
 import sha3
 
 from ..CryptoTypes import SharedKey256
-from ..external import ed25519
 from ..SharedKey import SharedKey as BasicSharedKey
+from ..SharedKey import derive_shared_secret
 
 
 class SharedKey(BasicSharedKey):
@@ -21,6 +21,6 @@ class SharedKey(BasicSharedKey):
 		"""
 
 		# note: key_pair.private_key is "unreversed", so need to reverse here again
-		shared_secret = ed25519.derive_shared_secret_unsafe(other_public_key.bytes, key_pair.private_key.bytes[::-1], sha3.keccak_512)
+		shared_secret = derive_shared_secret(other_public_key.bytes, key_pair.private_key.bytes[::-1], sha3.keccak_512)
 		key = bytes([shared_secret[i] ^ salt[i] for i in range(32)])
 		return SharedKey256(sha3.keccak_256(key).digest())
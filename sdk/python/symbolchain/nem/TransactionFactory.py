@@ -42,27 +42,51 @@ class TransactionFactory:
 	@staticmethod
 	def to_non_verifiable_transaction(transaction):
 		"""Converts a transaction to a non-verifiable transaction."""
+		if isinstance(transaction, (nc.Transaction, nc.NonVerifiableTransaction)):
+			non_verifiable_payload = TransactionFactory.serialize_non_verifiable_transaction(transaction)
+			return nc.NonVerifiableTransactionFactory.deserialize(non_verifiable_payload)
+
+		return TransactionFactory._copy_to_non_verifiable_transaction(transaction)
+
+	@staticmethod
+	def _copy_to_non_verifiable_transaction(transaction):
 		non_verifiable_class_name = type(transaction).__name__
 		if not non_verifiable_class_name.startswith('NonVerifiable'):
 			non_verifiable_class_name = f'NonVerifiable{non_verifiable_class_name}'
 
 		non_verifiable_class = getattr(nc, non_verifiable_class_name)
 		non_verifiable_transaction = non_verifiable_class()
-		for key in dir(non_verifiable_transaction):
-			# isupper() to quickly filter out class properties like TRANSACTION_VERSION or TYPE_HINTS
-			if key.startswith('_') or key[0].isupper() or key in ('size', 'serialize', 'deserialize') or key.endswith('_computed'):
+		for key in dir(non_verifiable_class):
+			# only settable properties are fields (generated models have slots, so methods cannot be copied onto instances)
+			attribute = getattr(non_verifiable_class, key)
+			if not isinstance(attribute, property) or not attribute.fset or key.endswith('_computed'):
 				continue
 
 			setattr(non_verifiable_transaction, key, getattr(transaction, key))
 
 		return non_verifiable_transaction
 
+	@staticmethod
+	def serialize_non_verifiable_transaction(transaction):
+		"""
+		Serializes the non-verifiable portion of a (verifiable or non-verifiable) transaction.
+		Generated verifiable transactions write it directly without creating an intermediate non-verifiable transaction.
+		"""
+		if isinstance(transaction, nc.Transaction):
+			return transaction.serialize_non_verifiable()
+
+		if isinstance(transaction, nc.NonVerifiableTransaction):
+			return transaction.serialize()
+
+		# fallback for other transaction-like objects, e.g. views
+		return TransactionFactory._copy_to_non_verifiable_transaction(transaction).serialize()
+
 	@staticmethod
 	def attach_signature(transaction, signature):
 		"""Attaches a signature to a transaction."""
 		transaction.signature = nc.Signature(signature.bytes)
 
-		transaction_hex = hexlify(TransactionFactory.to_non_verifiable_transaction(transaction).serialize()).decode('utf8').upper()
+		transaction_hex = hexlify(TransactionFactory.serialize_non_verifiable_transaction(transaction)).decode('utf8').upper()
 		signature_hex = str(signature)
 		json_payload = f'{{"data":"{transaction_hex}", "signature":"{signature_hex}"}}'
 		return json_payload
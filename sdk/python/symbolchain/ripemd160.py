@@ -1,16 +1,32 @@
 import hashlib
 
-if 'ripemd160' not in hashlib.algorithms_guaranteed:
+
+def _is_native_ripemd160_available():
+	# ripemd160 is never guaranteed, but it is usually available via OpenSSL (unless legacy algorithms are disabled)
+	try:
+		hashlib.new('ripemd160')
+		return True
+	except ValueError:
+		return False
+
+
+if not _is_native_ripemd160_available():
 	from ripemd import ripemd160 as ripemd160_impl
 
+	def ripemd160_hasher():
+		"""Creates a RIPEMD-160 hasher."""
+
+		return ripemd160_impl.new()
+else:
+	def ripemd160_hasher():
+		"""Creates a RIPEMD-160 hasher."""
 
-def _factory():
-	return hashlib.new('ripemd160') if 'ripemd160' in hashlib.algorithms_guaranteed else ripemd160_impl.new()
+		return hashlib.new('ripemd160')
 
 
 def ripemd160(data):
 	"""Calculates RIPEMD-160 hash of data."""
 
-	builder = _factory()
+	builder = ripemd160_hasher()
 	builder.update(data)
 	return builder.digest()
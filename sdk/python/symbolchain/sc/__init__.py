@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from binascii import hexlify
 from enum import Enum, Flag
+from struct import Struct
 from typing import List, TypeVar
 
 from ..ArrayHelpers import ArrayHelpers
@@ -20,7 +21,11 @@ from ..ByteArray import ByteArray
 StrBytes = TypeVar('StrBytes', str, bytes)
 
 
+_AMOUNT_CODEC = Struct('<Q')
+
+
 class Amount(BaseValue):
+	__slots__ = ()
 	SIZE = 8
 
 	def __init__(self, amount: int = 0):
@@ -28,14 +33,24 @@ class Amount(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Amount:
-		buffer = memoryview(payload)
-		return Amount(int.from_bytes(buffer[:8], byteorder='little', signed=False))
+		if len(payload) < 8:
+			raise ValueError(f'payload size {len(payload)} is smaller than Amount size 8')
+
+		return Amount.from_trusted(_AMOUNT_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(8, byteorder='little', signed=False)
+		return _AMOUNT_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_AMOUNT_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 8
+
+
+_BLOCK_DURATION_CODEC = Struct('<Q')
 
 
 class BlockDuration(BaseValue):
+	__slots__ = ()
 	SIZE = 8
 
 	def __init__(self, block_duration: int = 0):
@@ -43,14 +58,24 @@ class BlockDuration(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> BlockDuration:
-		buffer = memoryview(payload)
-		return BlockDuration(int.from_bytes(buffer[:8], byteorder='little', signed=False))
+		if len(payload) < 8:
+			raise ValueError(f'payload size {len(payload)} is smaller than BlockDuration size 8')
+
+		return BlockDuration.from_trusted(_BLOCK_DURATION_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(8, byteorder='little', signed=False)
+		return _BLOCK_DURATION_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_BLOCK_DURATION_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 8
+
+
+_BLOCK_FEE_MULTIPLIER_CODEC = Struct('<I')
 
 
 class BlockFeeMultiplier(BaseValue):
+	__slots__ = ()
 	SIZE = 4
 
 	def __init__(self, block_fee_multiplier: int = 0):
@@ -58,14 +83,24 @@ class BlockFeeMultiplier(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> BlockFeeMultiplier:
-		buffer = memoryview(payload)
-		return BlockFeeMultiplier(int.from_bytes(buffer[:4], byteorder='little', signed=False))
+		if len(payload) < 4:
+			raise ValueError(f'payload size {len(payload)} is smaller than BlockFeeMultiplier size 4')
+
+		return BlockFeeMultiplier.from_trusted(_BLOCK_FEE_MULTIPLIER_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(4, byteorder='little', signed=False)
+		return _BLOCK_FEE_MULTIPLIER_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_BLOCK_FEE_MULTIPLIER_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 4
+
+
+_DIFFICULTY_CODEC = Struct('<Q')
 
 
 class Difficulty(BaseValue):
+	__slots__ = ()
 	SIZE = 8
 
 	def __init__(self, difficulty: int = 0):
@@ -73,14 +108,24 @@ class Difficulty(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Difficulty:
-		buffer = memoryview(payload)
-		return Difficulty(int.from_bytes(buffer[:8], byteorder='little', signed=False))
+		if len(payload) < 8:
+			raise ValueError(f'payload size {len(payload)} is smaller than Difficulty size 8')
+
+		return Difficulty.from_trusted(_DIFFICULTY_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(8, byteorder='little', signed=False)
+		return _DIFFICULTY_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_DIFFICULTY_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 8
+
+
+_FINALIZATION_EPOCH_CODEC = Struct('<I')
 
 
 class FinalizationEpoch(BaseValue):
+	__slots__ = ()
 	SIZE = 4
 
 	def __init__(self, finalization_epoch: int = 0):
@@ -88,14 +133,24 @@ class FinalizationEpoch(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> FinalizationEpoch:
-		buffer = memoryview(payload)
-		return FinalizationEpoch(int.from_bytes(buffer[:4], byteorder='little', signed=False))
+		if len(payload) < 4:
+			raise ValueError(f'payload size {len(payload)} is smaller than FinalizationEpoch size 4')
+
+		return FinalizationEpoch.from_trusted(_FINALIZATION_EPOCH_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(4, byteorder='little', signed=False)
+		return _FINALIZATION_EPOCH_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_FINALIZATION_EPOCH_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 4
+
+
+_FINALIZATION_POINT_CODEC = Struct('<I')
 
 
 class FinalizationPoint(BaseValue):
+	__slots__ = ()
 	SIZE = 4
 
 	def __init__(self, finalization_point: int = 0):
@@ -103,14 +158,24 @@ class FinalizationPoint(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> FinalizationPoint:
-		buffer = memoryview(payload)
-		return FinalizationPoint(int.from_bytes(buffer[:4], byteorder='little', signed=False))
+		if len(payload) < 4:
+			raise ValueError(f'payload size {len(payload)} is smaller than FinalizationPoint size 4')
+
+		return FinalizationPoint.from_trusted(_FINALIZATION_POINT_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(4, byteorder='little', signed=False)
+		return _FINALIZATION_POINT_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_FINALIZATION_POINT_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 4
+
+
+_HEIGHT_CODEC = Struct('<Q')
 
 
 class Height(BaseValue):
+	__slots__ = ()
 	SIZE = 8
 
 	def __init__(self, height: int = 0):
@@ -118,14 +183,24 @@ class Height(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Height:
-		buffer = memoryview(payload)
-		return Height(int.from_bytes(buffer[:8], byteorder='little', signed=False))
+		if len(payload) < 8:
+			raise ValueError(f'payload size {len(payload)} is smaller than Height size 8')
+
+		return Height.from_trusted(_HEIGHT_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(8, byteorder='little', signed=False)
+		return _HEIGHT_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_HEIGHT_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 8
+
+
+_IMPORTANCE_CODEC = Struct('<Q')
 
 
 class Importance(BaseValue):
+	__slots__ = ()
 	SIZE = 8
 
 	def __init__(self, importance: int = 0):
@@ -133,14 +208,24 @@ class Importance(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Importance:
-		buffer = memoryview(payload)
-		return Importance(int.from_bytes(buffer[:8], byteorder='little', signed=False))
+		if len(payload) < 8:
+			raise ValueError(f'payload size {len(payload)} is smaller than Importance size 8')
+
+		return Importance.from_trusted(_IMPORTANCE_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(8, byteorder='little', signed=False)
+		return _IMPORTANCE_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_IMPORTANCE_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 8
+
+
+_IMPORTANCE_HEIGHT_CODEC = Struct('<Q')
 
 
 class ImportanceHeight(BaseValue):
+	__slots__ = ()
 	SIZE = 8
 
 	def __init__(self, importance_height: int = 0):
@@ -148,14 +233,24 @@ class ImportanceHeight(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> ImportanceHeight:
-		buffer = memoryview(payload)
-		return ImportanceHeight(int.from_bytes(buffer[:8], byteorder='little', signed=False))
+		if len(payload) < 8:
+			raise ValueError(f'payload size {len(payload)} is smaller than ImportanceHeight size 8')
+
+		return ImportanceHeight.from_trusted(_IMPORTANCE_HEIGHT_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(8, byteorder='little', signed=False)
+		return _IMPORTANCE_HEIGHT_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_IMPORTANCE_HEIGHT_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 8
+
+
+_UNRESOLVED_MOSAIC_ID_CODEC = Struct('<Q')
 
 
 class UnresolvedMosaicId(BaseValue):
+	__slots__ = ()
 	SIZE = 8
 
 	def __init__(self, unresolved_mosaic_id: int = 0):
@@ -163,14 +258,24 @@ class UnresolvedMosaicId(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> UnresolvedMosaicId:
-		buffer = memoryview(payload)
-		return UnresolvedMosaicId(int.from_bytes(buffer[:8], byteorder='little', signed=False))
+		if len(payload) < 8:
+			raise ValueError(f'payload size {len(payload)} is smaller than UnresolvedMosaicId size 8')
+
+		return UnresolvedMosaicId.from_trusted(_UNRESOLVED_MOSAIC_ID_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(8, byteorder='little', signed=False)
+		return _UNRESOLVED_MOSAIC_ID_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_UNRESOLVED_MOSAIC_ID_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 8
+
+
+_MOSAIC_ID_CODEC = Struct('<Q')
 
 
 class MosaicId(BaseValue):
+	__slots__ = ()
 	SIZE = 8
 
 	def __init__(self, mosaic_id: int = 0):
@@ -178,14 +283,24 @@ class MosaicId(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> MosaicId:
-		buffer = memoryview(payload)
-		return MosaicId(int.from_bytes(buffer[:8], byteorder='little', signed=False))
+		if len(payload) < 8:
+			raise ValueError(f'payload size {len(payload)} is smaller than MosaicId size 8')
+
+		return MosaicId.from_trusted(_MOSAIC_ID_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(8, byteorder='little', signed=False)
+		return _MOSAIC_ID_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_MOSAIC_ID_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 8
+
+
+_TIMESTAMP_CODEC = Struct('<Q')
 
 
 class Timestamp(BaseValue):
+	__slots__ = ()
 	SIZE = 8
 
 	def __init__(self, timestamp: int = 0):
@@ -193,14 +308,21 @@ class Timestamp(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Timestamp:
-		buffer = memoryview(payload)
-		return Timestamp(int.from_bytes(buffer[:8], byteorder='little', signed=False))
+		if len(payload) < 8:
+			raise ValueError(f'payload size {len(payload)} is smaller than Timestamp size 8')
+
+		return Timestamp.from_trusted(_TIMESTAMP_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(8, byteorder='little', signed=False)
+		return _TIMESTAMP_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_TIMESTAMP_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 8
 
 
 class UnresolvedAddress(ByteArray):
+	__slots__ = ()
 	SIZE = 24
 
 	def __init__(self, unresolved_address: StrBytes = bytes(24)):
@@ -213,13 +335,18 @@ class UnresolvedAddress(ByteArray):
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> UnresolvedAddress:
 		buffer = memoryview(payload)
-		return UnresolvedAddress(ArrayHelpers.get_bytes(buffer, 24))
+		return UnresolvedAddress.from_trusted(ArrayHelpers.get_bytes(buffer, 24))
 
 	def serialize(self) -> bytes:
 		return self.bytes
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 24] = self.bytes
+		return offset + 24
+
 
 class Address(ByteArray):
+	__slots__ = ()
 	SIZE = 24
 
 	def __init__(self, address: StrBytes = bytes(24)):
@@ -232,13 +359,18 @@ class Address(ByteArray):
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Address:
 		buffer = memoryview(payload)
-		return Address(ArrayHelpers.get_bytes(buffer, 24))
+		return Address.from_trusted(ArrayHelpers.get_bytes(buffer, 24))
 
 	def serialize(self) -> bytes:
 		return self.bytes
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 24] = self.bytes
+		return offset + 24
+
 
 class Hash256(ByteArray):
+	__slots__ = ()
 	SIZE = 32
 
 	def __init__(self, hash256: StrBytes = bytes(32)):
@@ -251,13 +383,18 @@ class Hash256(ByteArray):
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Hash256:
 		buffer = memoryview(payload)
-		return Hash256(ArrayHelpers.get_bytes(buffer, 32))
+		return Hash256.from_trusted(ArrayHelpers.get_bytes(buffer, 32))
 
 	def serialize(self) -> bytes:
 		return self.bytes
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 32] = self.bytes
+		return offset + 32
+
 
 class Hash512(ByteArray):
+	__slots__ = ()
 	SIZE = 64
 
 	def __init__(self, hash512: StrBytes = bytes(64)):
@@ -270,13 +407,18 @@ class Hash512(ByteArray):
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Hash512:
 		buffer = memoryview(payload)
-		return Hash512(ArrayHelpers.get_bytes(buffer, 64))
+		return Hash512.from_trusted(ArrayHelpers.get_bytes(buffer, 64))
 
 	def serialize(self) -> bytes:
 		return self.bytes
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 64] = self.bytes
+		return offset + 64
+
 
 class PublicKey(ByteArray):
+	__slots__ = ()
 	SIZE = 32
 
 	def __init__(self, public_key: StrBytes = bytes(32)):
@@ -289,13 +431,18 @@ class PublicKey(ByteArray):
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> PublicKey:
 		buffer = memoryview(payload)
-		return PublicKey(ArrayHelpers.get_bytes(buffer, 32))
+		return PublicKey.from_trusted(ArrayHelpers.get_bytes(buffer, 32))
 
 	def serialize(self) -> bytes:
 		return self.bytes
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 32] = self.bytes
+		return offset + 32
+
 
 class VotingPublicKey(ByteArray):
+	__slots__ = ()
 	SIZE = 32
 
 	def __init__(self, voting_public_key: StrBytes = bytes(32)):
@@ -308,13 +455,18 @@ class VotingPublicKey(ByteArray):
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> VotingPublicKey:
 		buffer = memoryview(payload)
-		return VotingPublicKey(ArrayHelpers.get_bytes(buffer, 32))
+		return VotingPublicKey.from_trusted(ArrayHelpers.get_bytes(buffer, 32))
 
 	def serialize(self) -> bytes:
 		return self.bytes
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 32] = self.bytes
+		return offset + 32
+
 
 class Signature(ByteArray):
+	__slots__ = ()
 	SIZE = 64
 
 	def __init__(self, signature: StrBytes = bytes(64)):
@@ -327,13 +479,21 @@ class Signature(ByteArray):
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Signature:
 		buffer = memoryview(payload)
-		return Signature(ArrayHelpers.get_bytes(buffer, 64))
+		return Signature.from_trusted(ArrayHelpers.get_bytes(buffer, 64))
 
 	def serialize(self) -> bytes:
 		return self.bytes
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 64] = self.bytes
+		return offset + 64
+
+
+_MOSAIC_CODEC = Struct('<QQ')
+
 
 class Mosaic:
+	__slots__ = ('_mosaic_id', '_amount')
 	TYPE_HINTS = {
 		'mosaic_id': 'pod:MosaicId',
 		'amount': 'pod:Amount'
@@ -364,31 +524,34 @@ class Mosaic:
 
 	@property
 	def size(self) -> int:
-		size = 0
-		size += self.mosaic_id.size
-		size += self.amount.size
-		return size
+		return 16
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Mosaic:
-		buffer = memoryview(payload)
+		if len(payload) < 16:
+			raise ValueError(f'payload size {len(payload)} is smaller than Mosaic size 16')
+
+		return Mosaic.from_unpacked(_MOSAIC_CODEC.unpack_from(payload))
+
+	@classmethod
+	def from_unpacked(cls, values: tuple) -> Mosaic:
+		(mosaic_id, amount) = values
 		instance = Mosaic()
-		mosaic_id = MosaicId.deserialize(buffer)
-		buffer = buffer[mosaic_id.size:]
-		amount = Amount.deserialize(buffer)
-		buffer = buffer[amount.size:]
 
 		# pylint: disable=protected-access
-		instance._mosaic_id = mosaic_id
-		instance._amount = amount
+		instance._mosaic_id = MosaicId.from_trusted(mosaic_id)
+		instance._amount = Amount.from_trusted(amount)
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._mosaic_id.serialize()
-		buffer += self._amount.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_MOSAIC_CODEC.pack_into(buffer, offset, self._mosaic_id.value, self._amount.value)
+		return offset + 16
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'mosaic_id: {self._mosaic_id.__str__()}, '
@@ -397,7 +560,52 @@ class Mosaic:
 		return result
 
 
+class MosaicView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 16:
+			raise ValueError(f'payload size {len(buffer)} is smaller than Mosaic size {offset + 16}')
+
+		self._mosaic_id_offset = offset
+		offset += 8
+		self._amount_offset = offset
+		offset += 8
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def mosaic_id(self) -> MosaicId:
+		if 'mosaic_id' in self._cache:
+			return self._cache['mosaic_id']
+
+		buffer = self._buffer[self._mosaic_id_offset:]
+		mosaic_id = MosaicId.deserialize(buffer)
+		self._cache['mosaic_id'] = mosaic_id
+		return mosaic_id
+
+	@property
+	def amount(self) -> Amount:
+		if 'amount' in self._cache:
+			return self._cache['amount']
+
+		buffer = self._buffer[self._amount_offset:]
+		amount = Amount.deserialize(buffer)
+		self._cache['amount'] = amount
+		return amount
+
+
+_UNRESOLVED_MOSAIC_CODEC = Struct('<QQ')
+
+
 class UnresolvedMosaic:
+	__slots__ = ('_mosaic_id', '_amount')
 	TYPE_HINTS = {
 		'mosaic_id': 'pod:UnresolvedMosaicId',
 		'amount': 'pod:Amount'
@@ -428,31 +636,34 @@ class UnresolvedMosaic:
 
 	@property
 	def size(self) -> int:
-		size = 0
-		size += self.mosaic_id.size
-		size += self.amount.size
-		return size
+		return 16
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> UnresolvedMosaic:
-		buffer = memoryview(payload)
+		if len(payload) < 16:
+			raise ValueError(f'payload size {len(payload)} is smaller than UnresolvedMosaic size 16')
+
+		return UnresolvedMosaic.from_unpacked(_UNRESOLVED_MOSAIC_CODEC.unpack_from(payload))
+
+	@classmethod
+	def from_unpacked(cls, values: tuple) -> UnresolvedMosaic:
+		(mosaic_id, amount) = values
 		instance = UnresolvedMosaic()
-		mosaic_id = UnresolvedMosaicId.deserialize(buffer)
-		buffer = buffer[mosaic_id.size:]
-		amount = Amount.deserialize(buffer)
-		buffer = buffer[amount.size:]
 
 		# pylint: disable=protected-access
-		instance._mosaic_id = mosaic_id
-		instance._amount = amount
+		instance._mosaic_id = UnresolvedMosaicId.from_trusted(mosaic_id)
+		instance._amount = Amount.from_trusted(amount)
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._mosaic_id.serialize()
-		buffer += self._amount.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_UNRESOLVED_MOSAIC_CODEC.pack_into(buffer, offset, self._mosaic_id.value, self._amount.value)
+		return offset + 16
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'mosaic_id: {self._mosaic_id.__str__()}, '
@@ -461,6 +672,47 @@ class UnresolvedMosaic:
 		return result
 
 
+class UnresolvedMosaicView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 16:
+			raise ValueError(f'payload size {len(buffer)} is smaller than UnresolvedMosaic size {offset + 16}')
+
+		self._mosaic_id_offset = offset
+		offset += 8
+		self._amount_offset = offset
+		offset += 8
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def mosaic_id(self) -> UnresolvedMosaicId:
+		if 'mosaic_id' in self._cache:
+			return self._cache['mosaic_id']
+
+		buffer = self._buffer[self._mosaic_id_offset:]
+		mosaic_id = UnresolvedMosaicId.deserialize(buffer)
+		self._cache['mosaic_id'] = mosaic_id
+		return mosaic_id
+
+	@property
+	def amount(self) -> Amount:
+		if 'amount' in self._cache:
+			return self._cache['amount']
+
+		buffer = self._buffer[self._amount_offset:]
+		amount = Amount.deserialize(buffer)
+		self._cache['amount'] = amount
+		return amount
+
+
 class LinkAction(Enum):
 	UNLINK = 0
 	LINK = 1
@@ -479,6 +731,10 @@ class LinkAction(Enum):
 		buffer += self.value.to_bytes(1, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 1] = self.value.to_bytes(1, byteorder='little', signed=False)
+		return offset + 1
+
 
 class NetworkType(Enum):
 	MAINNET = 104
@@ -498,6 +754,10 @@ class NetworkType(Enum):
 		buffer += self.value.to_bytes(1, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 1] = self.value.to_bytes(1, byteorder='little', signed=False)
+		return offset + 1
+
 
 class TransactionType(Enum):
 	ACCOUNT_KEY_LINK = 16716
@@ -540,8 +800,23 @@ class TransactionType(Enum):
 		buffer += self.value.to_bytes(2, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 2] = self.value.to_bytes(2, byteorder='little', signed=False)
+		return offset + 2
+
 
 class Transaction:
+	__slots__ = (
+		'_signature',
+		'_signer_public_key',
+		'_version',
+		'_network',
+		'_type_',
+		'_fee',
+		'_deadline',
+		'_verifiable_entity_header_reserved_1',
+		'_entity_body_reserved_1'
+	)
 	TYPE_HINTS = {
 		'signature': 'pod:Signature',
 		'signer_public_key': 'pod:PublicKey',
@@ -672,21 +947,31 @@ class Transaction:
 		return (size_ - len(buffer), size_)
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		self._serialize(buffer)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
-	def _serialize(self, buffer: memoryview):
-		buffer += self.size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._verifiable_entity_header_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._signature.serialize()
-		buffer += self._signer_public_key.serialize()
-		buffer += self._entity_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._version.to_bytes(1, byteorder='little', signed=False)
-		buffer += self._network.serialize()
-		buffer += self._type_.serialize()
-		buffer += self._fee.serialize()
-		buffer += self._deadline.serialize()
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = self._serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
+	def _serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset += 4  # size
+		buffer[offset:offset + 4] = self._verifiable_entity_header_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._signature.serialize_into(buffer, offset)
+		offset = self._signer_public_key.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._entity_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		buffer[offset:offset + 1] = self._version.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		offset = self._network.serialize_into(buffer, offset)
+		offset = self._type_.serialize_into(buffer, offset)
+		offset = self._fee.serialize_into(buffer, offset)
+		offset = self._deadline.serialize_into(buffer, offset)
+		return offset
 
 	def __str__(self) -> str:
 		result = '('
@@ -701,7 +986,121 @@ class Transaction:
 		return result
 
 
+class TransactionView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 128:
+			raise ValueError(f'payload size {len(buffer)} is smaller than Transaction size {offset + 128}')
+
+		size_ = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		if size_ > len(buffer):
+			raise ValueError(f'size should not exceed {len(buffer)}. The value of size was: {size_}.')
+
+		buffer = buffer[:size_]
+		offset += 4
+		verifiable_entity_header_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert verifiable_entity_header_reserved_1 == 0, f'Invalid value of reserved field ({verifiable_entity_header_reserved_1})'
+		self._signature_offset = offset
+		offset += 64
+		self._signer_public_key_offset = offset
+		offset += 32
+		entity_body_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert entity_body_reserved_1 == 0, f'Invalid value of reserved field ({entity_body_reserved_1})'
+		self._version_offset = offset
+		offset += 1
+		self._network_offset = offset
+		offset += 1
+		self._type__offset = offset
+		offset += 2
+		self._fee_offset = offset
+		offset += 8
+		self._deadline_offset = offset
+		offset += 8
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return len(self._buffer)
+
+	@property
+	def signature(self) -> Signature:
+		if 'signature' in self._cache:
+			return self._cache['signature']
+
+		buffer = self._buffer[self._signature_offset:]
+		signature = Signature.deserialize(buffer)
+		self._cache['signature'] = signature
+		return signature
+
+	@property
+	def signer_public_key(self) -> PublicKey:
+		if 'signer_public_key' in self._cache:
+			return self._cache['signer_public_key']
+
+		buffer = self._buffer[self._signer_public_key_offset:]
+		signer_public_key = PublicKey.deserialize(buffer)
+		self._cache['signer_public_key'] = signer_public_key
+		return signer_public_key
+
+	@property
+	def version(self) -> int:
+		if 'version' in self._cache:
+			return self._cache['version']
+
+		buffer = self._buffer[self._version_offset:]
+		version = int.from_bytes(buffer[:1], byteorder='little', signed=False)
+		self._cache['version'] = version
+		return version
+
+	@property
+	def network(self) -> NetworkType:
+		if 'network' in self._cache:
+			return self._cache['network']
+
+		buffer = self._buffer[self._network_offset:]
+		network = NetworkType.deserialize(buffer)
+		self._cache['network'] = network
+		return network
+
+	@property
+	def type_(self) -> TransactionType:
+		if 'type_' in self._cache:
+			return self._cache['type_']
+
+		buffer = self._buffer[self._type__offset:]
+		type_ = TransactionType.deserialize(buffer)
+		self._cache['type_'] = type_
+		return type_
+
+	@property
+	def fee(self) -> Amount:
+		if 'fee' in self._cache:
+			return self._cache['fee']
+
+		buffer = self._buffer[self._fee_offset:]
+		fee = Amount.deserialize(buffer)
+		self._cache['fee'] = fee
+		return fee
+
+	@property
+	def deadline(self) -> Timestamp:
+		if 'deadline' in self._cache:
+			return self._cache['deadline']
+
+		buffer = self._buffer[self._deadline_offset:]
+		deadline = Timestamp.deserialize(buffer)
+		self._cache['deadline'] = deadline
+		return deadline
+
+
 class EmbeddedTransaction:
+	__slots__ = ('_signer_public_key', '_version', '_network', '_type_', '_embedded_transaction_header_reserved_1', '_entity_body_reserved_1')
 	TYPE_HINTS = {
 		'signer_public_key': 'pod:PublicKey',
 		'network': 'enum:NetworkType',
@@ -790,18 +1189,28 @@ class EmbeddedTransaction:
 		return (size_ - len(buffer), size_)
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		self._serialize(buffer)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
-	def _serialize(self, buffer: memoryview):
-		buffer += self.size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._embedded_transaction_header_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._signer_public_key.serialize()
-		buffer += self._entity_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._version.to_bytes(1, byteorder='little', signed=False)
-		buffer += self._network.serialize()
-		buffer += self._type_.serialize()
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = self._serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
+	def _serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset += 4  # size
+		buffer[offset:offset + 4] = self._embedded_transaction_header_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._signer_public_key.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._entity_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		buffer[offset:offset + 1] = self._version.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		offset = self._network.serialize_into(buffer, offset)
+		offset = self._type_.serialize_into(buffer, offset)
+		return offset
 
 	def __str__(self) -> str:
 		result = '('
@@ -813,7 +1222,85 @@ class EmbeddedTransaction:
 		return result
 
 
+class EmbeddedTransactionView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 48:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedTransaction size {offset + 48}')
+
+		size_ = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		if size_ > len(buffer):
+			raise ValueError(f'size should not exceed {len(buffer)}. The value of size was: {size_}.')
+
+		buffer = buffer[:size_]
+		offset += 4
+		embedded_transaction_header_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert embedded_transaction_header_reserved_1 == 0, f'Invalid value of reserved field ({embedded_transaction_header_reserved_1})'
+		self._signer_public_key_offset = offset
+		offset += 32
+		entity_body_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert entity_body_reserved_1 == 0, f'Invalid value of reserved field ({entity_body_reserved_1})'
+		self._version_offset = offset
+		offset += 1
+		self._network_offset = offset
+		offset += 1
+		self._type__offset = offset
+		offset += 2
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return len(self._buffer)
+
+	@property
+	def signer_public_key(self) -> PublicKey:
+		if 'signer_public_key' in self._cache:
+			return self._cache['signer_public_key']
+
+		buffer = self._buffer[self._signer_public_key_offset:]
+		signer_public_key = PublicKey.deserialize(buffer)
+		self._cache['signer_public_key'] = signer_public_key
+		return signer_public_key
+
+	@property
+	def version(self) -> int:
+		if 'version' in self._cache:
+			return self._cache['version']
+
+		buffer = self._buffer[self._version_offset:]
+		version = int.from_bytes(buffer[:1], byteorder='little', signed=False)
+		self._cache['version'] = version
+		return version
+
+	@property
+	def network(self) -> NetworkType:
+		if 'network' in self._cache:
+			return self._cache['network']
+
+		buffer = self._buffer[self._network_offset:]
+		network = NetworkType.deserialize(buffer)
+		self._cache['network'] = network
+		return network
+
+	@property
+	def type_(self) -> TransactionType:
+		if 'type_' in self._cache:
+			return self._cache['type_']
+
+		buffer = self._buffer[self._type__offset:]
+		type_ = TransactionType.deserialize(buffer)
+		self._cache['type_'] = type_
+		return type_
+
+
 class ProofGamma(ByteArray):
+	__slots__ = ()
 	SIZE = 32
 
 	def __init__(self, proof_gamma: StrBytes = bytes(32)):
@@ -826,13 +1313,18 @@ class ProofGamma(ByteArray):
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> ProofGamma:
 		buffer = memoryview(payload)
-		return ProofGamma(ArrayHelpers.get_bytes(buffer, 32))
+		return ProofGamma.from_trusted(ArrayHelpers.get_bytes(buffer, 32))
 
 	def serialize(self) -> bytes:
 		return self.bytes
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 32] = self.bytes
+		return offset + 32
+
 
 class ProofVerificationHash(ByteArray):
+	__slots__ = ()
 	SIZE = 16
 
 	def __init__(self, proof_verification_hash: StrBytes = bytes(16)):
@@ -845,13 +1337,18 @@ class ProofVerificationHash(ByteArray):
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> ProofVerificationHash:
 		buffer = memoryview(payload)
-		return ProofVerificationHash(ArrayHelpers.get_bytes(buffer, 16))
+		return ProofVerificationHash.from_trusted(ArrayHelpers.get_bytes(buffer, 16))
 
 	def serialize(self) -> bytes:
 		return self.bytes
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 16] = self.bytes
+		return offset + 16
+
 
 class ProofScalar(ByteArray):
+	__slots__ = ()
 	SIZE = 32
 
 	def __init__(self, proof_scalar: StrBytes = bytes(32)):
@@ -864,11 +1361,15 @@ class ProofScalar(ByteArray):
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> ProofScalar:
 		buffer = memoryview(payload)
-		return ProofScalar(ArrayHelpers.get_bytes(buffer, 32))
+		return ProofScalar.from_trusted(ArrayHelpers.get_bytes(buffer, 32))
 
 	def serialize(self) -> bytes:
 		return self.bytes
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 32] = self.bytes
+		return offset + 32
+
 
 class BlockType(Enum):
 	NEMESIS = 32835
@@ -889,8 +1390,16 @@ class BlockType(Enum):
 		buffer += self.value.to_bytes(2, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 2] = self.value.to_bytes(2, byteorder='little', signed=False)
+		return offset + 2
+
+
+_VRF_PROOF_CODEC = Struct('<32s16s32s')
+
 
 class VrfProof:
+	__slots__ = ('_gamma', '_verification_hash', '_scalar')
 	TYPE_HINTS = {
 		'gamma': 'pod:ProofGamma',
 		'verification_hash': 'pod:ProofVerificationHash',
@@ -931,36 +1440,35 @@ class VrfProof:
 
 	@property
 	def size(self) -> int:
-		size = 0
-		size += self.gamma.size
-		size += self.verification_hash.size
-		size += self.scalar.size
-		return size
+		return 80
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> VrfProof:
-		buffer = memoryview(payload)
+		if len(payload) < 80:
+			raise ValueError(f'payload size {len(payload)} is smaller than VrfProof size 80')
+
+		return VrfProof.from_unpacked(_VRF_PROOF_CODEC.unpack_from(payload))
+
+	@classmethod
+	def from_unpacked(cls, values: tuple) -> VrfProof:
+		(gamma, verification_hash, scalar) = values
 		instance = VrfProof()
-		gamma = ProofGamma.deserialize(buffer)
-		buffer = buffer[gamma.size:]
-		verification_hash = ProofVerificationHash.deserialize(buffer)
-		buffer = buffer[verification_hash.size:]
-		scalar = ProofScalar.deserialize(buffer)
-		buffer = buffer[scalar.size:]
 
 		# pylint: disable=protected-access
-		instance._gamma = gamma
-		instance._verification_hash = verification_hash
-		instance._scalar = scalar
+		instance._gamma = ProofGamma.from_trusted(gamma)
+		instance._verification_hash = ProofVerificationHash.from_trusted(verification_hash)
+		instance._scalar = ProofScalar.from_trusted(scalar)
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._gamma.serialize()
-		buffer += self._verification_hash.serialize()
-		buffer += self._scalar.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_VRF_PROOF_CODEC.pack_into(buffer, offset, self._gamma.bytes, self._verification_hash.bytes, self._scalar.bytes)
+		return offset + 80
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'gamma: {self._gamma.__str__()}, '
@@ -970,7 +1478,79 @@ class VrfProof:
 		return result
 
 
+class VrfProofView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 80:
+			raise ValueError(f'payload size {len(buffer)} is smaller than VrfProof size {offset + 80}')
+
+		self._gamma_offset = offset
+		offset += 32
+		self._verification_hash_offset = offset
+		offset += 16
+		self._scalar_offset = offset
+		offset += 32
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def gamma(self) -> ProofGamma:
+		if 'gamma' in self._cache:
+			return self._cache['gamma']
+
+		buffer = self._buffer[self._gamma_offset:]
+		gamma = ProofGamma.deserialize(buffer)
+		self._cache['gamma'] = gamma
+		return gamma
+
+	@property
+	def verification_hash(self) -> ProofVerificationHash:
+		if 'verification_hash' in self._cache:
+			return self._cache['verification_hash']
+
+		buffer = self._buffer[self._verification_hash_offset:]
+		verification_hash = ProofVerificationHash.deserialize(buffer)
+		self._cache['verification_hash'] = verification_hash
+		return verification_hash
+
+	@property
+	def scalar(self) -> ProofScalar:
+		if 'scalar' in self._cache:
+			return self._cache['scalar']
+
+		buffer = self._buffer[self._scalar_offset:]
+		scalar = ProofScalar.deserialize(buffer)
+		self._cache['scalar'] = scalar
+		return scalar
+
+
 class Block:
+	__slots__ = (
+		'_signature',
+		'_signer_public_key',
+		'_version',
+		'_network',
+		'_type_',
+		'_height',
+		'_timestamp',
+		'_difficulty',
+		'_generation_hash_proof',
+		'_previous_block_hash',
+		'_transactions_hash',
+		'_receipts_hash',
+		'_state_hash',
+		'_beneficiary_address',
+		'_fee_multiplier',
+		'_verifiable_entity_header_reserved_1',
+		'_entity_body_reserved_1'
+	)
 	TYPE_HINTS = {
 		'signature': 'pod:Signature',
 		'signer_public_key': 'pod:PublicKey',
@@ -1213,29 +1793,39 @@ class Block:
 		return (size_ - len(buffer), size_)
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		self._serialize(buffer)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
-	def _serialize(self, buffer: memoryview):
-		buffer += self.size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._verifiable_entity_header_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._signature.serialize()
-		buffer += self._signer_public_key.serialize()
-		buffer += self._entity_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._version.to_bytes(1, byteorder='little', signed=False)
-		buffer += self._network.serialize()
-		buffer += self._type_.serialize()
-		buffer += self._height.serialize()
-		buffer += self._timestamp.serialize()
-		buffer += self._difficulty.serialize()
-		buffer += self._generation_hash_proof.serialize()
-		buffer += self._previous_block_hash.serialize()
-		buffer += self._transactions_hash.serialize()
-		buffer += self._receipts_hash.serialize()
-		buffer += self._state_hash.serialize()
-		buffer += self._beneficiary_address.serialize()
-		buffer += self._fee_multiplier.serialize()
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = self._serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
+	def _serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset += 4  # size
+		buffer[offset:offset + 4] = self._verifiable_entity_header_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = self._signature.serialize_into(buffer, offset)
+		offset = self._signer_public_key.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._entity_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		buffer[offset:offset + 1] = self._version.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		offset = self._network.serialize_into(buffer, offset)
+		offset = self._type_.serialize_into(buffer, offset)
+		offset = self._height.serialize_into(buffer, offset)
+		offset = self._timestamp.serialize_into(buffer, offset)
+		offset = self._difficulty.serialize_into(buffer, offset)
+		offset = self._generation_hash_proof.serialize_into(buffer, offset)
+		offset = self._previous_block_hash.serialize_into(buffer, offset)
+		offset = self._transactions_hash.serialize_into(buffer, offset)
+		offset = self._receipts_hash.serialize_into(buffer, offset)
+		offset = self._state_hash.serialize_into(buffer, offset)
+		offset = self._beneficiary_address.serialize_into(buffer, offset)
+		offset = self._fee_multiplier.serialize_into(buffer, offset)
+		return offset
 
 	def __str__(self) -> str:
 		result = '('
@@ -1258,8 +1848,224 @@ class Block:
 		return result
 
 
-class NemesisBlockV1(Block):
-	BLOCK_VERSION: int = 1
+class BlockView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 372:
+			raise ValueError(f'payload size {len(buffer)} is smaller than Block size {offset + 372}')
+
+		size_ = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		if size_ > len(buffer):
+			raise ValueError(f'size should not exceed {len(buffer)}. The value of size was: {size_}.')
+
+		buffer = buffer[:size_]
+		offset += 4
+		verifiable_entity_header_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert verifiable_entity_header_reserved_1 == 0, f'Invalid value of reserved field ({verifiable_entity_header_reserved_1})'
+		self._signature_offset = offset
+		offset += 64
+		self._signer_public_key_offset = offset
+		offset += 32
+		entity_body_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert entity_body_reserved_1 == 0, f'Invalid value of reserved field ({entity_body_reserved_1})'
+		self._version_offset = offset
+		offset += 1
+		self._network_offset = offset
+		offset += 1
+		self._type__offset = offset
+		offset += 2
+		self._height_offset = offset
+		offset += 8
+		self._timestamp_offset = offset
+		offset += 8
+		self._difficulty_offset = offset
+		offset += 8
+		self._generation_hash_proof_offset = offset
+		offset += 80
+		self._previous_block_hash_offset = offset
+		offset += 32
+		self._transactions_hash_offset = offset
+		offset += 32
+		self._receipts_hash_offset = offset
+		offset += 32
+		self._state_hash_offset = offset
+		offset += 32
+		self._beneficiary_address_offset = offset
+		offset += 24
+		self._fee_multiplier_offset = offset
+		offset += 4
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return len(self._buffer)
+
+	@property
+	def signature(self) -> Signature:
+		if 'signature' in self._cache:
+			return self._cache['signature']
+
+		buffer = self._buffer[self._signature_offset:]
+		signature = Signature.deserialize(buffer)
+		self._cache['signature'] = signature
+		return signature
+
+	@property
+	def signer_public_key(self) -> PublicKey:
+		if 'signer_public_key' in self._cache:
+			return self._cache['signer_public_key']
+
+		buffer = self._buffer[self._signer_public_key_offset:]
+		signer_public_key = PublicKey.deserialize(buffer)
+		self._cache['signer_public_key'] = signer_public_key
+		return signer_public_key
+
+	@property
+	def version(self) -> int:
+		if 'version' in self._cache:
+			return self._cache['version']
+
+		buffer = self._buffer[self._version_offset:]
+		version = int.from_bytes(buffer[:1], byteorder='little', signed=False)
+		self._cache['version'] = version
+		return version
+
+	@property
+	def network(self) -> NetworkType:
+		if 'network' in self._cache:
+			return self._cache['network']
+
+		buffer = self._buffer[self._network_offset:]
+		network = NetworkType.deserialize(buffer)
+		self._cache['network'] = network
+		return network
+
+	@property
+	def type_(self) -> BlockType:
+		if 'type_' in self._cache:
+			return self._cache['type_']
+
+		buffer = self._buffer[self._type__offset:]
+		type_ = BlockType.deserialize(buffer)
+		self._cache['type_'] = type_
+		return type_
+
+	@property
+	def height(self) -> Height:
+		if 'height' in self._cache:
+			return self._cache['height']
+
+		buffer = self._buffer[self._height_offset:]
+		height = Height.deserialize(buffer)
+		self._cache['height'] = height
+		return height
+
+	@property
+	def timestamp(self) -> Timestamp:
+		if 'timestamp' in self._cache:
+			return self._cache['timestamp']
+
+		buffer = self._buffer[self._timestamp_offset:]
+		timestamp = Timestamp.deserialize(buffer)
+		self._cache['timestamp'] = timestamp
+		return timestamp
+
+	@property
+	def difficulty(self) -> Difficulty:
+		if 'difficulty' in self._cache:
+			return self._cache['difficulty']
+
+		buffer = self._buffer[self._difficulty_offset:]
+		difficulty = Difficulty.deserialize(buffer)
+		self._cache['difficulty'] = difficulty
+		return difficulty
+
+	@property
+	def generation_hash_proof(self) -> VrfProof:
+		if 'generation_hash_proof' in self._cache:
+			return self._cache['generation_hash_proof']
+
+		buffer = self._buffer[self._generation_hash_proof_offset:]
+		generation_hash_proof = VrfProof.deserialize(buffer)
+		self._cache['generation_hash_proof'] = generation_hash_proof
+		return generation_hash_proof
+
+	@property
+	def previous_block_hash(self) -> Hash256:
+		if 'previous_block_hash' in self._cache:
+			return self._cache['previous_block_hash']
+
+		buffer = self._buffer[self._previous_block_hash_offset:]
+		previous_block_hash = Hash256.deserialize(buffer)
+		self._cache['previous_block_hash'] = previous_block_hash
+		return previous_block_hash
+
+	@property
+	def transactions_hash(self) -> Hash256:
+		if 'transactions_hash' in self._cache:
+			return self._cache['transactions_hash']
+
+		buffer = self._buffer[self._transactions_hash_offset:]
+		transactions_hash = Hash256.deserialize(buffer)
+		self._cache['transactions_hash'] = transactions_hash
+		return transactions_hash
+
+	@property
+	def receipts_hash(self) -> Hash256:
+		if 'receipts_hash' in self._cache:
+			return self._cache['receipts_hash']
+
+		buffer = self._buffer[self._receipts_hash_offset:]
+		receipts_hash = Hash256.deserialize(buffer)
+		self._cache['receipts_hash'] = receipts_hash
+		return receipts_hash
+
+	@property
+	def state_hash(self) -> Hash256:
+		if 'state_hash' in self._cache:
+			return self._cache['state_hash']
+
+		buffer = self._buffer[self._state_hash_offset:]
+		state_hash = Hash256.deserialize(buffer)
+		self._cache['state_hash'] = state_hash
+		return state_hash
+
+	@property
+	def beneficiary_address(self) -> Address:
+		if 'beneficiary_address' in self._cache:
+			return self._cache['beneficiary_address']
+
+		buffer = self._buffer[self._beneficiary_address_offset:]
+		beneficiary_address = Address.deserialize(buffer)
+		self._cache['beneficiary_address'] = beneficiary_address
+		return beneficiary_address
+
+	@property
+	def fee_multiplier(self) -> BlockFeeMultiplier:
+		if 'fee_multiplier' in self._cache:
+			return self._cache['fee_multiplier']
+
+		buffer = self._buffer[self._fee_multiplier_offset:]
+		fee_multiplier = BlockFeeMultiplier.deserialize(buffer)
+		self._cache['fee_multiplier'] = fee_multiplier
+		return fee_multiplier
+
+
+class NemesisBlockV1(Block):
+	__slots__ = (
+		'_voting_eligible_accounts_count',
+		'_harvesting_eligible_accounts_count',
+		'_total_voting_balance',
+		'_previous_importance_block_hash',
+		'_transactions'
+	)
+	BLOCK_VERSION: int = 1
 	BLOCK_TYPE: BlockType = BlockType.NEMESIS
 	TYPE_HINTS = {
 		**Block.TYPE_HINTS,
@@ -1358,15 +2164,23 @@ class NemesisBlockV1(Block):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._voting_eligible_accounts_count.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._harvesting_eligible_accounts_count.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._total_voting_balance.serialize()
-		buffer += self._previous_importance_block_hash.serialize()
-		buffer += ArrayHelpers.write_variable_size_elements(self._transactions, 8, skip_last_element_padding=True)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._voting_eligible_accounts_count.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		buffer[offset:offset + 8] = self._harvesting_eligible_accounts_count.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		offset = self._total_voting_balance.serialize_into(buffer, offset)
+		offset = self._previous_importance_block_hash.serialize_into(buffer, offset)
+		offset = ArrayHelpers.write_variable_size_elements_into(buffer, offset, self._transactions, 8, skip_last_element_padding=True)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -1379,7 +2193,84 @@ class NemesisBlockV1(Block):
 		return result
 
 
+class NemesisBlockV1View(BlockView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 52:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NemesisBlockV1 size {offset + 52}')
+
+		self._voting_eligible_accounts_count_offset = offset
+		offset += 4
+		self._harvesting_eligible_accounts_count_offset = offset
+		offset += 8
+		self._total_voting_balance_offset = offset
+		offset += 8
+		self._previous_importance_block_hash_offset = offset
+		offset += 32
+		self._transactions_offset = offset
+		offset = len(buffer)
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than NemesisBlockV1 size {offset}')
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def voting_eligible_accounts_count(self) -> int:
+		if 'voting_eligible_accounts_count' in self._cache:
+			return self._cache['voting_eligible_accounts_count']
+
+		buffer = self._buffer[self._voting_eligible_accounts_count_offset:]
+		voting_eligible_accounts_count = int.from_bytes(buffer[:4], byteorder='little', signed=False)
+		self._cache['voting_eligible_accounts_count'] = voting_eligible_accounts_count
+		return voting_eligible_accounts_count
+
+	@property
+	def harvesting_eligible_accounts_count(self) -> int:
+		if 'harvesting_eligible_accounts_count' in self._cache:
+			return self._cache['harvesting_eligible_accounts_count']
+
+		buffer = self._buffer[self._harvesting_eligible_accounts_count_offset:]
+		harvesting_eligible_accounts_count = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['harvesting_eligible_accounts_count'] = harvesting_eligible_accounts_count
+		return harvesting_eligible_accounts_count
+
+	@property
+	def total_voting_balance(self) -> Amount:
+		if 'total_voting_balance' in self._cache:
+			return self._cache['total_voting_balance']
+
+		buffer = self._buffer[self._total_voting_balance_offset:]
+		total_voting_balance = Amount.deserialize(buffer)
+		self._cache['total_voting_balance'] = total_voting_balance
+		return total_voting_balance
+
+	@property
+	def previous_importance_block_hash(self) -> Hash256:
+		if 'previous_importance_block_hash' in self._cache:
+			return self._cache['previous_importance_block_hash']
+
+		buffer = self._buffer[self._previous_importance_block_hash_offset:]
+		previous_importance_block_hash = Hash256.deserialize(buffer)
+		self._cache['previous_importance_block_hash'] = previous_importance_block_hash
+		return previous_importance_block_hash
+
+	@property
+	def transactions(self) -> List[Transaction]:
+		if 'transactions' in self._cache:
+			return self._cache['transactions']
+
+		buffer = self._buffer[self._transactions_offset:]
+		transactions = ArrayHelpers.read_variable_size_elements(buffer, TransactionFactory, 8, skip_last_element_padding=True)
+		self._cache['transactions'] = transactions
+		return transactions
+
+
 class NormalBlockV1(Block):
+	__slots__ = ('_transactions', '_block_header_reserved_1')
 	BLOCK_VERSION: int = 1
 	BLOCK_TYPE: BlockType = BlockType.NORMAL
 	TYPE_HINTS = {
@@ -1430,12 +2321,19 @@ class NormalBlockV1(Block):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._block_header_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += ArrayHelpers.write_variable_size_elements(self._transactions, 8, skip_last_element_padding=True)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._block_header_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = ArrayHelpers.write_variable_size_elements_into(buffer, offset, self._transactions, 8, skip_last_element_padding=True)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -1444,7 +2342,45 @@ class NormalBlockV1(Block):
 		return result
 
 
+class NormalBlockV1View(BlockView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NormalBlockV1 size {offset + 4}')
+
+		block_header_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert block_header_reserved_1 == 0, f'Invalid value of reserved field ({block_header_reserved_1})'
+		self._transactions_offset = offset
+		offset = len(buffer)
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than NormalBlockV1 size {offset}')
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def transactions(self) -> List[Transaction]:
+		if 'transactions' in self._cache:
+			return self._cache['transactions']
+
+		buffer = self._buffer[self._transactions_offset:]
+		transactions = ArrayHelpers.read_variable_size_elements(buffer, TransactionFactory, 8, skip_last_element_padding=True)
+		self._cache['transactions'] = transactions
+		return transactions
+
+
 class ImportanceBlockV1(Block):
+	__slots__ = (
+		'_voting_eligible_accounts_count',
+		'_harvesting_eligible_accounts_count',
+		'_total_voting_balance',
+		'_previous_importance_block_hash',
+		'_transactions'
+	)
 	BLOCK_VERSION: int = 1
 	BLOCK_TYPE: BlockType = BlockType.IMPORTANCE
 	TYPE_HINTS = {
@@ -1544,15 +2480,23 @@ class ImportanceBlockV1(Block):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._voting_eligible_accounts_count.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._harvesting_eligible_accounts_count.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._total_voting_balance.serialize()
-		buffer += self._previous_importance_block_hash.serialize()
-		buffer += ArrayHelpers.write_variable_size_elements(self._transactions, 8, skip_last_element_padding=True)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = self._voting_eligible_accounts_count.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		buffer[offset:offset + 8] = self._harvesting_eligible_accounts_count.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		offset = self._total_voting_balance.serialize_into(buffer, offset)
+		offset = self._previous_importance_block_hash.serialize_into(buffer, offset)
+		offset = ArrayHelpers.write_variable_size_elements_into(buffer, offset, self._transactions, 8, skip_last_element_padding=True)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -1565,7 +2509,87 @@ class ImportanceBlockV1(Block):
 		return result
 
 
+class ImportanceBlockV1View(BlockView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 52:
+			raise ValueError(f'payload size {len(buffer)} is smaller than ImportanceBlockV1 size {offset + 52}')
+
+		self._voting_eligible_accounts_count_offset = offset
+		offset += 4
+		self._harvesting_eligible_accounts_count_offset = offset
+		offset += 8
+		self._total_voting_balance_offset = offset
+		offset += 8
+		self._previous_importance_block_hash_offset = offset
+		offset += 32
+		self._transactions_offset = offset
+		offset = len(buffer)
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than ImportanceBlockV1 size {offset}')
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def voting_eligible_accounts_count(self) -> int:
+		if 'voting_eligible_accounts_count' in self._cache:
+			return self._cache['voting_eligible_accounts_count']
+
+		buffer = self._buffer[self._voting_eligible_accounts_count_offset:]
+		voting_eligible_accounts_count = int.from_bytes(buffer[:4], byteorder='little', signed=False)
+		self._cache['voting_eligible_accounts_count'] = voting_eligible_accounts_count
+		return voting_eligible_accounts_count
+
+	@property
+	def harvesting_eligible_accounts_count(self) -> int:
+		if 'harvesting_eligible_accounts_count' in self._cache:
+			return self._cache['harvesting_eligible_accounts_count']
+
+		buffer = self._buffer[self._harvesting_eligible_accounts_count_offset:]
+		harvesting_eligible_accounts_count = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['harvesting_eligible_accounts_count'] = harvesting_eligible_accounts_count
+		return harvesting_eligible_accounts_count
+
+	@property
+	def total_voting_balance(self) -> Amount:
+		if 'total_voting_balance' in self._cache:
+			return self._cache['total_voting_balance']
+
+		buffer = self._buffer[self._total_voting_balance_offset:]
+		total_voting_balance = Amount.deserialize(buffer)
+		self._cache['total_voting_balance'] = total_voting_balance
+		return total_voting_balance
+
+	@property
+	def previous_importance_block_hash(self) -> Hash256:
+		if 'previous_importance_block_hash' in self._cache:
+			return self._cache['previous_importance_block_hash']
+
+		buffer = self._buffer[self._previous_importance_block_hash_offset:]
+		previous_importance_block_hash = Hash256.deserialize(buffer)
+		self._cache['previous_importance_block_hash'] = previous_importance_block_hash
+		return previous_importance_block_hash
+
+	@property
+	def transactions(self) -> List[Transaction]:
+		if 'transactions' in self._cache:
+			return self._cache['transactions']
+
+		buffer = self._buffer[self._transactions_offset:]
+		transactions = ArrayHelpers.read_variable_size_elements(buffer, TransactionFactory, 8, skip_last_element_padding=True)
+		self._cache['transactions'] = transactions
+		return transactions
+
+
+_FINALIZATION_ROUND_CODEC = Struct('<II')
+
+
 class FinalizationRound:
+	__slots__ = ('_epoch', '_point')
 	TYPE_HINTS = {
 		'epoch': 'pod:FinalizationEpoch',
 		'point': 'pod:FinalizationPoint'
@@ -1596,31 +2620,34 @@ class FinalizationRound:
 
 	@property
 	def size(self) -> int:
-		size = 0
-		size += self.epoch.size
-		size += self.point.size
-		return size
+		return 8
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> FinalizationRound:
-		buffer = memoryview(payload)
+		if len(payload) < 8:
+			raise ValueError(f'payload size {len(payload)} is smaller than FinalizationRound size 8')
+
+		return FinalizationRound.from_unpacked(_FINALIZATION_ROUND_CODEC.unpack_from(payload))
+
+	@classmethod
+	def from_unpacked(cls, values: tuple) -> FinalizationRound:
+		(epoch, point) = values
 		instance = FinalizationRound()
-		epoch = FinalizationEpoch.deserialize(buffer)
-		buffer = buffer[epoch.size:]
-		point = FinalizationPoint.deserialize(buffer)
-		buffer = buffer[point.size:]
 
 		# pylint: disable=protected-access
-		instance._epoch = epoch
-		instance._point = point
+		instance._epoch = FinalizationEpoch.from_trusted(epoch)
+		instance._point = FinalizationPoint.from_trusted(point)
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._epoch.serialize()
-		buffer += self._point.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_FINALIZATION_ROUND_CODEC.pack_into(buffer, offset, self._epoch.value, self._point.value)
+		return offset + 8
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'epoch: {self._epoch.__str__()}, '
@@ -1629,7 +2656,49 @@ class FinalizationRound:
 		return result
 
 
+class FinalizationRoundView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 8:
+			raise ValueError(f'payload size {len(buffer)} is smaller than FinalizationRound size {offset + 8}')
+
+		self._epoch_offset = offset
+		offset += 4
+		self._point_offset = offset
+		offset += 4
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def epoch(self) -> FinalizationEpoch:
+		if 'epoch' in self._cache:
+			return self._cache['epoch']
+
+		buffer = self._buffer[self._epoch_offset:]
+		epoch = FinalizationEpoch.deserialize(buffer)
+		self._cache['epoch'] = epoch
+		return epoch
+
+	@property
+	def point(self) -> FinalizationPoint:
+		if 'point' in self._cache:
+			return self._cache['point']
+
+		buffer = self._buffer[self._point_offset:]
+		point = FinalizationPoint.deserialize(buffer)
+		self._cache['point'] = point
+		return point
+
+
 class FinalizedBlockHeader:
+	__slots__ = ('_round', '_height', '_hash')
 	TYPE_HINTS = {
 		'round': 'struct:FinalizationRound',
 		'height': 'pod:Height',
@@ -1694,12 +2763,16 @@ class FinalizedBlockHeader:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._round.serialize()
-		buffer += self._height.serialize()
-		buffer += self._hash.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = self._round.serialize_into(buffer, offset)
+		offset = self._height.serialize_into(buffer, offset)
+		offset = self._hash.serialize_into(buffer, offset)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'round: {self._round.__str__()}, '
@@ -1709,6 +2782,59 @@ class FinalizedBlockHeader:
 		return result
 
 
+class FinalizedBlockHeaderView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 48:
+			raise ValueError(f'payload size {len(buffer)} is smaller than FinalizedBlockHeader size {offset + 48}')
+
+		self._round_offset = offset
+		offset += 8
+		self._height_offset = offset
+		offset += 8
+		self._hash_offset = offset
+		offset += 32
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def round(self) -> FinalizationRound:
+		if 'round' in self._cache:
+			return self._cache['round']
+
+		buffer = self._buffer[self._round_offset:]
+		round = FinalizationRound.deserialize(buffer)
+		self._cache['round'] = round
+		return round
+
+	@property
+	def height(self) -> Height:
+		if 'height' in self._cache:
+			return self._cache['height']
+
+		buffer = self._buffer[self._height_offset:]
+		height = Height.deserialize(buffer)
+		self._cache['height'] = height
+		return height
+
+	@property
+	def hash(self) -> Hash256:
+		if 'hash' in self._cache:
+			return self._cache['hash']
+
+		buffer = self._buffer[self._hash_offset:]
+		hash = Hash256.deserialize(buffer)
+		self._cache['hash'] = hash
+		return hash
+
+
 class ReceiptType(Enum):
 	MOSAIC_RENTAL_FEE = 4685
 	NAMESPACE_RENTAL_FEE = 4942
@@ -1741,8 +2867,13 @@ class ReceiptType(Enum):
 		buffer += self.value.to_bytes(2, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 2] = self.value.to_bytes(2, byteorder='little', signed=False)
+		return offset + 2
+
 
 class Receipt:
+	__slots__ = ('_version', '_type_')
 	TYPE_HINTS = {
 		'type_': 'enum:ReceiptType'
 	}
@@ -1793,14 +2924,22 @@ class Receipt:
 		return (size_ - len(buffer), size_)
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		self._serialize(buffer)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
-	def _serialize(self, buffer: memoryview):
-		buffer += self.size.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._version.to_bytes(2, byteorder='little', signed=False)
-		buffer += self._type_.serialize()
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = self._serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
+	def _serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset += 4  # size
+		buffer[offset:offset + 2] = self._version.to_bytes(2, byteorder='little', signed=False)
+		offset += 2
+		offset = self._type_.serialize_into(buffer, offset)
+		return offset
 
 	def __str__(self) -> str:
 		result = '('
@@ -1810,7 +2949,55 @@ class Receipt:
 		return result
 
 
+class ReceiptView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 8:
+			raise ValueError(f'payload size {len(buffer)} is smaller than Receipt size {offset + 8}')
+
+		size_ = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		if size_ > len(buffer):
+			raise ValueError(f'size should not exceed {len(buffer)}. The value of size was: {size_}.')
+
+		buffer = buffer[:size_]
+		offset += 4
+		self._version_offset = offset
+		offset += 2
+		self._type__offset = offset
+		offset += 2
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return len(self._buffer)
+
+	@property
+	def version(self) -> int:
+		if 'version' in self._cache:
+			return self._cache['version']
+
+		buffer = self._buffer[self._version_offset:]
+		version = int.from_bytes(buffer[:2], byteorder='little', signed=False)
+		self._cache['version'] = version
+		return version
+
+	@property
+	def type_(self) -> ReceiptType:
+		if 'type_' in self._cache:
+			return self._cache['type_']
+
+		buffer = self._buffer[self._type__offset:]
+		type_ = ReceiptType.deserialize(buffer)
+		self._cache['type_'] = type_
+		return type_
+
+
 class HarvestFeeReceipt(Receipt):
+	__slots__ = ('_mosaic', '_target_address')
 	RECEIPT_TYPE: ReceiptType = ReceiptType.HARVEST_FEE
 	TYPE_HINTS = {
 		**Receipt.TYPE_HINTS,
@@ -1868,12 +3055,18 @@ class HarvestFeeReceipt(Receipt):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic.serialize()
-		buffer += self._target_address.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic.serialize_into(buffer, offset)
+		offset = self._target_address.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -1883,7 +3076,45 @@ class HarvestFeeReceipt(Receipt):
 		return result
 
 
+class HarvestFeeReceiptView(ReceiptView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than HarvestFeeReceipt size {offset + 40}')
+
+		self._mosaic_offset = offset
+		offset += 16
+		self._target_address_offset = offset
+		offset += 24
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic(self) -> Mosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic = Mosaic.deserialize(buffer)
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+	@property
+	def target_address(self) -> Address:
+		if 'target_address' in self._cache:
+			return self._cache['target_address']
+
+		buffer = self._buffer[self._target_address_offset:]
+		target_address = Address.deserialize(buffer)
+		self._cache['target_address'] = target_address
+		return target_address
+
+
 class InflationReceipt(Receipt):
+	__slots__ = ('_mosaic',)
 	RECEIPT_TYPE: ReceiptType = ReceiptType.INFLATION
 	TYPE_HINTS = {
 		**Receipt.TYPE_HINTS,
@@ -1927,11 +3158,17 @@ class InflationReceipt(Receipt):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -1940,7 +3177,33 @@ class InflationReceipt(Receipt):
 		return result
 
 
+class InflationReceiptView(ReceiptView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 16:
+			raise ValueError(f'payload size {len(buffer)} is smaller than InflationReceipt size {offset + 16}')
+
+		self._mosaic_offset = offset
+		offset += 16
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic(self) -> Mosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic = Mosaic.deserialize(buffer)
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+
 class LockHashCreatedFeeReceipt(Receipt):
+	__slots__ = ('_mosaic', '_target_address')
 	RECEIPT_TYPE: ReceiptType = ReceiptType.LOCK_HASH_CREATED
 	TYPE_HINTS = {
 		**Receipt.TYPE_HINTS,
@@ -1998,12 +3261,18 @@ class LockHashCreatedFeeReceipt(Receipt):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic.serialize()
-		buffer += self._target_address.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic.serialize_into(buffer, offset)
+		offset = self._target_address.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -2013,7 +3282,45 @@ class LockHashCreatedFeeReceipt(Receipt):
 		return result
 
 
+class LockHashCreatedFeeReceiptView(ReceiptView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than LockHashCreatedFeeReceipt size {offset + 40}')
+
+		self._mosaic_offset = offset
+		offset += 16
+		self._target_address_offset = offset
+		offset += 24
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic(self) -> Mosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic = Mosaic.deserialize(buffer)
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+	@property
+	def target_address(self) -> Address:
+		if 'target_address' in self._cache:
+			return self._cache['target_address']
+
+		buffer = self._buffer[self._target_address_offset:]
+		target_address = Address.deserialize(buffer)
+		self._cache['target_address'] = target_address
+		return target_address
+
+
 class LockHashCompletedFeeReceipt(Receipt):
+	__slots__ = ('_mosaic', '_target_address')
 	RECEIPT_TYPE: ReceiptType = ReceiptType.LOCK_HASH_COMPLETED
 	TYPE_HINTS = {
 		**Receipt.TYPE_HINTS,
@@ -2071,12 +3378,18 @@ class LockHashCompletedFeeReceipt(Receipt):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic.serialize()
-		buffer += self._target_address.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic.serialize_into(buffer, offset)
+		offset = self._target_address.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -2086,7 +3399,45 @@ class LockHashCompletedFeeReceipt(Receipt):
 		return result
 
 
+class LockHashCompletedFeeReceiptView(ReceiptView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than LockHashCompletedFeeReceipt size {offset + 40}')
+
+		self._mosaic_offset = offset
+		offset += 16
+		self._target_address_offset = offset
+		offset += 24
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic(self) -> Mosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic = Mosaic.deserialize(buffer)
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+	@property
+	def target_address(self) -> Address:
+		if 'target_address' in self._cache:
+			return self._cache['target_address']
+
+		buffer = self._buffer[self._target_address_offset:]
+		target_address = Address.deserialize(buffer)
+		self._cache['target_address'] = target_address
+		return target_address
+
+
 class LockHashExpiredFeeReceipt(Receipt):
+	__slots__ = ('_mosaic', '_target_address')
 	RECEIPT_TYPE: ReceiptType = ReceiptType.LOCK_HASH_EXPIRED
 	TYPE_HINTS = {
 		**Receipt.TYPE_HINTS,
@@ -2144,12 +3495,18 @@ class LockHashExpiredFeeReceipt(Receipt):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic.serialize()
-		buffer += self._target_address.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic.serialize_into(buffer, offset)
+		offset = self._target_address.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -2159,7 +3516,45 @@ class LockHashExpiredFeeReceipt(Receipt):
 		return result
 
 
+class LockHashExpiredFeeReceiptView(ReceiptView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than LockHashExpiredFeeReceipt size {offset + 40}')
+
+		self._mosaic_offset = offset
+		offset += 16
+		self._target_address_offset = offset
+		offset += 24
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic(self) -> Mosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic = Mosaic.deserialize(buffer)
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+	@property
+	def target_address(self) -> Address:
+		if 'target_address' in self._cache:
+			return self._cache['target_address']
+
+		buffer = self._buffer[self._target_address_offset:]
+		target_address = Address.deserialize(buffer)
+		self._cache['target_address'] = target_address
+		return target_address
+
+
 class LockSecretCreatedFeeReceipt(Receipt):
+	__slots__ = ('_mosaic', '_target_address')
 	RECEIPT_TYPE: ReceiptType = ReceiptType.LOCK_SECRET_CREATED
 	TYPE_HINTS = {
 		**Receipt.TYPE_HINTS,
@@ -2217,12 +3612,18 @@ class LockSecretCreatedFeeReceipt(Receipt):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic.serialize()
-		buffer += self._target_address.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic.serialize_into(buffer, offset)
+		offset = self._target_address.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -2232,7 +3633,45 @@ class LockSecretCreatedFeeReceipt(Receipt):
 		return result
 
 
+class LockSecretCreatedFeeReceiptView(ReceiptView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than LockSecretCreatedFeeReceipt size {offset + 40}')
+
+		self._mosaic_offset = offset
+		offset += 16
+		self._target_address_offset = offset
+		offset += 24
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic(self) -> Mosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic = Mosaic.deserialize(buffer)
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+	@property
+	def target_address(self) -> Address:
+		if 'target_address' in self._cache:
+			return self._cache['target_address']
+
+		buffer = self._buffer[self._target_address_offset:]
+		target_address = Address.deserialize(buffer)
+		self._cache['target_address'] = target_address
+		return target_address
+
+
 class LockSecretCompletedFeeReceipt(Receipt):
+	__slots__ = ('_mosaic', '_target_address')
 	RECEIPT_TYPE: ReceiptType = ReceiptType.LOCK_SECRET_COMPLETED
 	TYPE_HINTS = {
 		**Receipt.TYPE_HINTS,
@@ -2290,12 +3729,18 @@ class LockSecretCompletedFeeReceipt(Receipt):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic.serialize()
-		buffer += self._target_address.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic.serialize_into(buffer, offset)
+		offset = self._target_address.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -2305,7 +3750,45 @@ class LockSecretCompletedFeeReceipt(Receipt):
 		return result
 
 
+class LockSecretCompletedFeeReceiptView(ReceiptView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than LockSecretCompletedFeeReceipt size {offset + 40}')
+
+		self._mosaic_offset = offset
+		offset += 16
+		self._target_address_offset = offset
+		offset += 24
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic(self) -> Mosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic = Mosaic.deserialize(buffer)
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+	@property
+	def target_address(self) -> Address:
+		if 'target_address' in self._cache:
+			return self._cache['target_address']
+
+		buffer = self._buffer[self._target_address_offset:]
+		target_address = Address.deserialize(buffer)
+		self._cache['target_address'] = target_address
+		return target_address
+
+
 class LockSecretExpiredFeeReceipt(Receipt):
+	__slots__ = ('_mosaic', '_target_address')
 	RECEIPT_TYPE: ReceiptType = ReceiptType.LOCK_SECRET_EXPIRED
 	TYPE_HINTS = {
 		**Receipt.TYPE_HINTS,
@@ -2363,12 +3846,18 @@ class LockSecretExpiredFeeReceipt(Receipt):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic.serialize()
-		buffer += self._target_address.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic.serialize_into(buffer, offset)
+		offset = self._target_address.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -2378,7 +3867,45 @@ class LockSecretExpiredFeeReceipt(Receipt):
 		return result
 
 
+class LockSecretExpiredFeeReceiptView(ReceiptView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than LockSecretExpiredFeeReceipt size {offset + 40}')
+
+		self._mosaic_offset = offset
+		offset += 16
+		self._target_address_offset = offset
+		offset += 24
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic(self) -> Mosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic = Mosaic.deserialize(buffer)
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+	@property
+	def target_address(self) -> Address:
+		if 'target_address' in self._cache:
+			return self._cache['target_address']
+
+		buffer = self._buffer[self._target_address_offset:]
+		target_address = Address.deserialize(buffer)
+		self._cache['target_address'] = target_address
+		return target_address
+
+
 class MosaicExpiredReceipt(Receipt):
+	__slots__ = ('_artifact_id',)
 	RECEIPT_TYPE: ReceiptType = ReceiptType.MOSAIC_EXPIRED
 	TYPE_HINTS = {
 		**Receipt.TYPE_HINTS,
@@ -2422,11 +3949,17 @@ class MosaicExpiredReceipt(Receipt):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._artifact_id.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._artifact_id.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -2435,7 +3968,33 @@ class MosaicExpiredReceipt(Receipt):
 		return result
 
 
+class MosaicExpiredReceiptView(ReceiptView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 8:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicExpiredReceipt size {offset + 8}')
+
+		self._artifact_id_offset = offset
+		offset += 8
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def artifact_id(self) -> MosaicId:
+		if 'artifact_id' in self._cache:
+			return self._cache['artifact_id']
+
+		buffer = self._buffer[self._artifact_id_offset:]
+		artifact_id = MosaicId.deserialize(buffer)
+		self._cache['artifact_id'] = artifact_id
+		return artifact_id
+
+
 class MosaicRentalFeeReceipt(Receipt):
+	__slots__ = ('_mosaic', '_sender_address', '_recipient_address')
 	RECEIPT_TYPE: ReceiptType = ReceiptType.MOSAIC_RENTAL_FEE
 	TYPE_HINTS = {
 		**Receipt.TYPE_HINTS,
@@ -2507,13 +4066,19 @@ class MosaicRentalFeeReceipt(Receipt):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic.serialize()
-		buffer += self._sender_address.serialize()
-		buffer += self._recipient_address.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic.serialize_into(buffer, offset)
+		offset = self._sender_address.serialize_into(buffer, offset)
+		offset = self._recipient_address.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -2524,7 +4089,60 @@ class MosaicRentalFeeReceipt(Receipt):
 		return result
 
 
+class MosaicRentalFeeReceiptView(ReceiptView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 64:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicRentalFeeReceipt size {offset + 64}')
+
+		self._mosaic_offset = offset
+		offset += 16
+		self._sender_address_offset = offset
+		offset += 24
+		self._recipient_address_offset = offset
+		offset += 24
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic(self) -> Mosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic = Mosaic.deserialize(buffer)
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+	@property
+	def sender_address(self) -> Address:
+		if 'sender_address' in self._cache:
+			return self._cache['sender_address']
+
+		buffer = self._buffer[self._sender_address_offset:]
+		sender_address = Address.deserialize(buffer)
+		self._cache['sender_address'] = sender_address
+		return sender_address
+
+	@property
+	def recipient_address(self) -> Address:
+		if 'recipient_address' in self._cache:
+			return self._cache['recipient_address']
+
+		buffer = self._buffer[self._recipient_address_offset:]
+		recipient_address = Address.deserialize(buffer)
+		self._cache['recipient_address'] = recipient_address
+		return recipient_address
+
+
+_NAMESPACE_ID_CODEC = Struct('<Q')
+
+
 class NamespaceId(BaseValue):
+	__slots__ = ()
 	SIZE = 8
 
 	def __init__(self, namespace_id: int = 0):
@@ -2532,11 +4150,17 @@ class NamespaceId(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> NamespaceId:
-		buffer = memoryview(payload)
-		return NamespaceId(int.from_bytes(buffer[:8], byteorder='little', signed=False))
+		if len(payload) < 8:
+			raise ValueError(f'payload size {len(payload)} is smaller than NamespaceId size 8')
+
+		return NamespaceId.from_trusted(_NAMESPACE_ID_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(8, byteorder='little', signed=False)
+		return _NAMESPACE_ID_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_NAMESPACE_ID_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 8
 
 
 class NamespaceRegistrationType(Enum):
@@ -2557,6 +4181,10 @@ class NamespaceRegistrationType(Enum):
 		buffer += self.value.to_bytes(1, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 1] = self.value.to_bytes(1, byteorder='little', signed=False)
+		return offset + 1
+
 
 class AliasAction(Enum):
 	UNLINK = 0
@@ -2576,8 +4204,13 @@ class AliasAction(Enum):
 		buffer += self.value.to_bytes(1, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 1] = self.value.to_bytes(1, byteorder='little', signed=False)
+		return offset + 1
+
 
 class NamespaceExpiredReceipt(Receipt):
+	__slots__ = ('_artifact_id',)
 	RECEIPT_TYPE: ReceiptType = ReceiptType.NAMESPACE_EXPIRED
 	TYPE_HINTS = {
 		**Receipt.TYPE_HINTS,
@@ -2621,11 +4254,17 @@ class NamespaceExpiredReceipt(Receipt):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._artifact_id.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._artifact_id.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -2634,7 +4273,33 @@ class NamespaceExpiredReceipt(Receipt):
 		return result
 
 
+class NamespaceExpiredReceiptView(ReceiptView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 8:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NamespaceExpiredReceipt size {offset + 8}')
+
+		self._artifact_id_offset = offset
+		offset += 8
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def artifact_id(self) -> NamespaceId:
+		if 'artifact_id' in self._cache:
+			return self._cache['artifact_id']
+
+		buffer = self._buffer[self._artifact_id_offset:]
+		artifact_id = NamespaceId.deserialize(buffer)
+		self._cache['artifact_id'] = artifact_id
+		return artifact_id
+
+
 class NamespaceDeletedReceipt(Receipt):
+	__slots__ = ('_artifact_id',)
 	RECEIPT_TYPE: ReceiptType = ReceiptType.NAMESPACE_DELETED
 	TYPE_HINTS = {
 		**Receipt.TYPE_HINTS,
@@ -2678,11 +4343,17 @@ class NamespaceDeletedReceipt(Receipt):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._artifact_id.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._artifact_id.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -2691,7 +4362,33 @@ class NamespaceDeletedReceipt(Receipt):
 		return result
 
 
+class NamespaceDeletedReceiptView(ReceiptView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 8:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NamespaceDeletedReceipt size {offset + 8}')
+
+		self._artifact_id_offset = offset
+		offset += 8
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def artifact_id(self) -> NamespaceId:
+		if 'artifact_id' in self._cache:
+			return self._cache['artifact_id']
+
+		buffer = self._buffer[self._artifact_id_offset:]
+		artifact_id = NamespaceId.deserialize(buffer)
+		self._cache['artifact_id'] = artifact_id
+		return artifact_id
+
+
 class NamespaceRentalFeeReceipt(Receipt):
+	__slots__ = ('_mosaic', '_sender_address', '_recipient_address')
 	RECEIPT_TYPE: ReceiptType = ReceiptType.NAMESPACE_RENTAL_FEE
 	TYPE_HINTS = {
 		**Receipt.TYPE_HINTS,
@@ -2763,13 +4460,19 @@ class NamespaceRentalFeeReceipt(Receipt):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic.serialize()
-		buffer += self._sender_address.serialize()
-		buffer += self._recipient_address.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic.serialize_into(buffer, offset)
+		offset = self._sender_address.serialize_into(buffer, offset)
+		offset = self._recipient_address.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -2780,7 +4483,60 @@ class NamespaceRentalFeeReceipt(Receipt):
 		return result
 
 
+class NamespaceRentalFeeReceiptView(ReceiptView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 64:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NamespaceRentalFeeReceipt size {offset + 64}')
+
+		self._mosaic_offset = offset
+		offset += 16
+		self._sender_address_offset = offset
+		offset += 24
+		self._recipient_address_offset = offset
+		offset += 24
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic(self) -> Mosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic = Mosaic.deserialize(buffer)
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+	@property
+	def sender_address(self) -> Address:
+		if 'sender_address' in self._cache:
+			return self._cache['sender_address']
+
+		buffer = self._buffer[self._sender_address_offset:]
+		sender_address = Address.deserialize(buffer)
+		self._cache['sender_address'] = sender_address
+		return sender_address
+
+	@property
+	def recipient_address(self) -> Address:
+		if 'recipient_address' in self._cache:
+			return self._cache['recipient_address']
+
+		buffer = self._buffer[self._recipient_address_offset:]
+		recipient_address = Address.deserialize(buffer)
+		self._cache['recipient_address'] = recipient_address
+		return recipient_address
+
+
+_RECEIPT_SOURCE_CODEC = Struct('<II')
+
+
 class ReceiptSource:
+	__slots__ = ('_primary_id', '_secondary_id')
 	TYPE_HINTS = {
 	}
 
@@ -2809,19 +4565,19 @@ class ReceiptSource:
 
 	@property
 	def size(self) -> int:
-		size = 0
-		size += 4
-		size += 4
-		return size
+		return 8
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> ReceiptSource:
-		buffer = memoryview(payload)
+		if len(payload) < 8:
+			raise ValueError(f'payload size {len(payload)} is smaller than ReceiptSource size 8')
+
+		return ReceiptSource.from_unpacked(_RECEIPT_SOURCE_CODEC.unpack_from(payload))
+
+	@classmethod
+	def from_unpacked(cls, values: tuple) -> ReceiptSource:
+		(primary_id, secondary_id) = values
 		instance = ReceiptSource()
-		primary_id = int.from_bytes(buffer[:4], byteorder='little', signed=False)
-		buffer = buffer[4:]
-		secondary_id = int.from_bytes(buffer[:4], byteorder='little', signed=False)
-		buffer = buffer[4:]
 
 		# pylint: disable=protected-access
 		instance._primary_id = primary_id
@@ -2829,11 +4585,14 @@ class ReceiptSource:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._primary_id.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._secondary_id.to_bytes(4, byteorder='little', signed=False)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_RECEIPT_SOURCE_CODEC.pack_into(buffer, offset, self._primary_id, self._secondary_id)
+		return offset + 8
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'primary_id: 0x{self._primary_id:X}, '
@@ -2842,7 +4601,49 @@ class ReceiptSource:
 		return result
 
 
+class ReceiptSourceView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 8:
+			raise ValueError(f'payload size {len(buffer)} is smaller than ReceiptSource size {offset + 8}')
+
+		self._primary_id_offset = offset
+		offset += 4
+		self._secondary_id_offset = offset
+		offset += 4
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def primary_id(self) -> int:
+		if 'primary_id' in self._cache:
+			return self._cache['primary_id']
+
+		buffer = self._buffer[self._primary_id_offset:]
+		primary_id = int.from_bytes(buffer[:4], byteorder='little', signed=False)
+		self._cache['primary_id'] = primary_id
+		return primary_id
+
+	@property
+	def secondary_id(self) -> int:
+		if 'secondary_id' in self._cache:
+			return self._cache['secondary_id']
+
+		buffer = self._buffer[self._secondary_id_offset:]
+		secondary_id = int.from_bytes(buffer[:4], byteorder='little', signed=False)
+		self._cache['secondary_id'] = secondary_id
+		return secondary_id
+
+
 class AddressResolutionEntry:
+	__slots__ = ('_source', '_resolved_value')
 	TYPE_HINTS = {
 		'source': 'struct:ReceiptSource',
 		'resolved_value': 'pod:Address'
@@ -2893,11 +4694,15 @@ class AddressResolutionEntry:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._source.serialize()
-		buffer += self._resolved_value.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = self._source.serialize_into(buffer, offset)
+		offset = self._resolved_value.serialize_into(buffer, offset)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'source: {self._source.__str__()}, '
@@ -2906,7 +4711,49 @@ class AddressResolutionEntry:
 		return result
 
 
+class AddressResolutionEntryView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 32:
+			raise ValueError(f'payload size {len(buffer)} is smaller than AddressResolutionEntry size {offset + 32}')
+
+		self._source_offset = offset
+		offset += 8
+		self._resolved_value_offset = offset
+		offset += 24
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def source(self) -> ReceiptSource:
+		if 'source' in self._cache:
+			return self._cache['source']
+
+		buffer = self._buffer[self._source_offset:]
+		source = ReceiptSource.deserialize(buffer)
+		self._cache['source'] = source
+		return source
+
+	@property
+	def resolved_value(self) -> Address:
+		if 'resolved_value' in self._cache:
+			return self._cache['resolved_value']
+
+		buffer = self._buffer[self._resolved_value_offset:]
+		resolved_value = Address.deserialize(buffer)
+		self._cache['resolved_value'] = resolved_value
+		return resolved_value
+
+
 class AddressResolutionStatement:
+	__slots__ = ('_unresolved', '_resolution_entries')
 	TYPE_HINTS = {
 		'unresolved': 'pod:UnresolvedAddress',
 		'resolution_entries': 'array[AddressResolutionEntry]'
@@ -2960,12 +4807,17 @@ class AddressResolutionStatement:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._unresolved.serialize()
-		buffer += len(self._resolution_entries).to_bytes(4, byteorder='little', signed=False)  # resolution_entries_count
-		buffer += ArrayHelpers.write_array(self._resolution_entries)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = self._unresolved.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = len(self._resolution_entries).to_bytes(4, byteorder='little', signed=False)  # resolution_entries_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._resolution_entries)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'unresolved: {self._unresolved.__str__()}, '
@@ -2974,7 +4826,56 @@ class AddressResolutionStatement:
 		return result
 
 
+class AddressResolutionStatementView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 28:
+			raise ValueError(f'payload size {len(buffer)} is smaller than AddressResolutionStatement size {offset + 28}')
+
+		self._unresolved_offset = offset
+		offset += 24
+		resolution_entries_count = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._resolution_entries_offset = offset
+		offset += resolution_entries_count * 32
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than AddressResolutionStatement size {offset}')
+
+		self._resolution_entries_count = resolution_entries_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def unresolved(self) -> UnresolvedAddress:
+		if 'unresolved' in self._cache:
+			return self._cache['unresolved']
+
+		buffer = self._buffer[self._unresolved_offset:]
+		unresolved = UnresolvedAddress.deserialize(buffer)
+		self._cache['unresolved'] = unresolved
+		return unresolved
+
+	@property
+	def resolution_entries(self) -> List[AddressResolutionEntry]:
+		if 'resolution_entries' in self._cache:
+			return self._cache['resolution_entries']
+
+		buffer = self._buffer[self._resolution_entries_offset:]
+		resolution_entries_count = self._resolution_entries_count
+		resolution_entries = ArrayHelpers.read_array_count(buffer, AddressResolutionEntry, resolution_entries_count)
+		self._cache['resolution_entries'] = resolution_entries
+		return resolution_entries
+
+
 class MosaicResolutionEntry:
+	__slots__ = ('_source', '_resolved_value')
 	TYPE_HINTS = {
 		'source': 'struct:ReceiptSource',
 		'resolved_value': 'pod:MosaicId'
@@ -3025,11 +4926,15 @@ class MosaicResolutionEntry:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._source.serialize()
-		buffer += self._resolved_value.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = self._source.serialize_into(buffer, offset)
+		offset = self._resolved_value.serialize_into(buffer, offset)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'source: {self._source.__str__()}, '
@@ -3038,7 +4943,49 @@ class MosaicResolutionEntry:
 		return result
 
 
+class MosaicResolutionEntryView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 16:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicResolutionEntry size {offset + 16}')
+
+		self._source_offset = offset
+		offset += 8
+		self._resolved_value_offset = offset
+		offset += 8
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def source(self) -> ReceiptSource:
+		if 'source' in self._cache:
+			return self._cache['source']
+
+		buffer = self._buffer[self._source_offset:]
+		source = ReceiptSource.deserialize(buffer)
+		self._cache['source'] = source
+		return source
+
+	@property
+	def resolved_value(self) -> MosaicId:
+		if 'resolved_value' in self._cache:
+			return self._cache['resolved_value']
+
+		buffer = self._buffer[self._resolved_value_offset:]
+		resolved_value = MosaicId.deserialize(buffer)
+		self._cache['resolved_value'] = resolved_value
+		return resolved_value
+
+
 class MosaicResolutionStatement:
+	__slots__ = ('_unresolved', '_resolution_entries')
 	TYPE_HINTS = {
 		'unresolved': 'pod:UnresolvedMosaicId',
 		'resolution_entries': 'array[MosaicResolutionEntry]'
@@ -3092,12 +5039,17 @@ class MosaicResolutionStatement:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._unresolved.serialize()
-		buffer += len(self._resolution_entries).to_bytes(4, byteorder='little', signed=False)  # resolution_entries_count
-		buffer += ArrayHelpers.write_array(self._resolution_entries)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		offset = self._unresolved.serialize_into(buffer, offset)
+		buffer[offset:offset + 4] = len(self._resolution_entries).to_bytes(4, byteorder='little', signed=False)  # resolution_entries_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._resolution_entries)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'unresolved: {self._unresolved.__str__()}, '
@@ -3106,7 +5058,56 @@ class MosaicResolutionStatement:
 		return result
 
 
+class MosaicResolutionStatementView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 12:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicResolutionStatement size {offset + 12}')
+
+		self._unresolved_offset = offset
+		offset += 8
+		resolution_entries_count = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._resolution_entries_offset = offset
+		offset += resolution_entries_count * 16
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicResolutionStatement size {offset}')
+
+		self._resolution_entries_count = resolution_entries_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def unresolved(self) -> UnresolvedMosaicId:
+		if 'unresolved' in self._cache:
+			return self._cache['unresolved']
+
+		buffer = self._buffer[self._unresolved_offset:]
+		unresolved = UnresolvedMosaicId.deserialize(buffer)
+		self._cache['unresolved'] = unresolved
+		return unresolved
+
+	@property
+	def resolution_entries(self) -> List[MosaicResolutionEntry]:
+		if 'resolution_entries' in self._cache:
+			return self._cache['resolution_entries']
+
+		buffer = self._buffer[self._resolution_entries_offset:]
+		resolution_entries_count = self._resolution_entries_count
+		resolution_entries = ArrayHelpers.read_array_count(buffer, MosaicResolutionEntry, resolution_entries_count)
+		self._cache['resolution_entries'] = resolution_entries
+		return resolution_entries
+
+
 class TransactionStatement:
+	__slots__ = ('_primary_id', '_secondary_id', '_receipts')
 	TYPE_HINTS = {
 		'receipts': 'array[Receipt]'
 	}
@@ -3172,13 +5173,20 @@ class TransactionStatement:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._primary_id.to_bytes(4, byteorder='little', signed=False)
-		buffer += self._secondary_id.to_bytes(4, byteorder='little', signed=False)
-		buffer += len(self._receipts).to_bytes(4, byteorder='little', signed=False)  # receipt_count
-		buffer += ArrayHelpers.write_array(self._receipts)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 4] = self._primary_id.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		buffer[offset:offset + 4] = self._secondary_id.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		buffer[offset:offset + 4] = len(self._receipts).to_bytes(4, byteorder='little', signed=False)  # receipt_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._receipts)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'primary_id: 0x{self._primary_id:X}, '
@@ -3188,7 +5196,69 @@ class TransactionStatement:
 		return result
 
 
+class TransactionStatementView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 12:
+			raise ValueError(f'payload size {len(buffer)} is smaller than TransactionStatement size {offset + 12}')
+
+		self._primary_id_offset = offset
+		offset += 4
+		self._secondary_id_offset = offset
+		offset += 4
+		receipt_count = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._receipts_offset = offset
+		for _ in range(receipt_count):
+			offset += ReceiptView(buffer[offset:]).size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than TransactionStatement size {offset}')
+
+		self._receipt_count = receipt_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def primary_id(self) -> int:
+		if 'primary_id' in self._cache:
+			return self._cache['primary_id']
+
+		buffer = self._buffer[self._primary_id_offset:]
+		primary_id = int.from_bytes(buffer[:4], byteorder='little', signed=False)
+		self._cache['primary_id'] = primary_id
+		return primary_id
+
+	@property
+	def secondary_id(self) -> int:
+		if 'secondary_id' in self._cache:
+			return self._cache['secondary_id']
+
+		buffer = self._buffer[self._secondary_id_offset:]
+		secondary_id = int.from_bytes(buffer[:4], byteorder='little', signed=False)
+		self._cache['secondary_id'] = secondary_id
+		return secondary_id
+
+	@property
+	def receipts(self) -> List[Receipt]:
+		if 'receipts' in self._cache:
+			return self._cache['receipts']
+
+		buffer = self._buffer[self._receipts_offset:]
+		receipt_count = self._receipt_count
+		receipts = ArrayHelpers.read_array_count(buffer, ReceiptFactory, receipt_count)
+		self._cache['receipts'] = receipts
+		return receipts
+
+
 class BlockStatement:
+	__slots__ = ('_transaction_statements', '_address_resolution_statements', '_mosaic_resolution_statements')
 	TYPE_HINTS = {
 		'transaction_statements': 'array[TransactionStatement]',
 		'address_resolution_statements': 'array[AddressResolutionStatement]',
@@ -3262,15 +5332,22 @@ class BlockStatement:
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += len(self._transaction_statements).to_bytes(4, byteorder='little', signed=False)  # transaction_statement_count
-		buffer += ArrayHelpers.write_array(self._transaction_statements)
-		buffer += len(self._address_resolution_statements).to_bytes(4, byteorder='little', signed=False)  # address_resolution_statement_count
-		buffer += ArrayHelpers.write_array(self._address_resolution_statements)
-		buffer += len(self._mosaic_resolution_statements).to_bytes(4, byteorder='little', signed=False)  # mosaic_resolution_statement_count
-		buffer += ArrayHelpers.write_array(self._mosaic_resolution_statements)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 4] = len(self._transaction_statements).to_bytes(4, byteorder='little', signed=False)  # transaction_statement_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._transaction_statements)
+		buffer[offset:offset + 4] = len(self._address_resolution_statements).to_bytes(4, byteorder='little', signed=False)  # address_resolution_statement_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._address_resolution_statements)
+		buffer[offset:offset + 4] = len(self._mosaic_resolution_statements).to_bytes(4, byteorder='little', signed=False)  # mosaic_resolution_statement_count
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._mosaic_resolution_statements)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'transaction_statements: {list(map(str, self._transaction_statements))}, '
@@ -3280,7 +5357,79 @@ class BlockStatement:
 		return result
 
 
+class BlockStatementView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 4:
+			raise ValueError(f'payload size {len(buffer)} is smaller than BlockStatement size {offset + 4}')
+
+		transaction_statement_count = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._transaction_statements_offset = offset
+		for _ in range(transaction_statement_count):
+			offset += TransactionStatementView(buffer[offset:]).size
+		address_resolution_statement_count = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._address_resolution_statements_offset = offset
+		for _ in range(address_resolution_statement_count):
+			offset += AddressResolutionStatementView(buffer[offset:]).size
+		mosaic_resolution_statement_count = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		self._mosaic_resolution_statements_offset = offset
+		for _ in range(mosaic_resolution_statement_count):
+			offset += MosaicResolutionStatementView(buffer[offset:]).size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than BlockStatement size {offset}')
+
+		self._address_resolution_statement_count = address_resolution_statement_count
+		self._mosaic_resolution_statement_count = mosaic_resolution_statement_count
+		self._transaction_statement_count = transaction_statement_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def transaction_statements(self) -> List[TransactionStatement]:
+		if 'transaction_statements' in self._cache:
+			return self._cache['transaction_statements']
+
+		buffer = self._buffer[self._transaction_statements_offset:]
+		transaction_statement_count = self._transaction_statement_count
+		transaction_statements = ArrayHelpers.read_array_count(buffer, TransactionStatement, transaction_statement_count)
+		self._cache['transaction_statements'] = transaction_statements
+		return transaction_statements
+
+	@property
+	def address_resolution_statements(self) -> List[AddressResolutionStatement]:
+		if 'address_resolution_statements' in self._cache:
+			return self._cache['address_resolution_statements']
+
+		buffer = self._buffer[self._address_resolution_statements_offset:]
+		address_resolution_statement_count = self._address_resolution_statement_count
+		address_resolution_statements = ArrayHelpers.read_array_count(buffer, AddressResolutionStatement, address_resolution_statement_count)
+		self._cache['address_resolution_statements'] = address_resolution_statements
+		return address_resolution_statements
+
+	@property
+	def mosaic_resolution_statements(self) -> List[MosaicResolutionStatement]:
+		if 'mosaic_resolution_statements' in self._cache:
+			return self._cache['mosaic_resolution_statements']
+
+		buffer = self._buffer[self._mosaic_resolution_statements_offset:]
+		mosaic_resolution_statement_count = self._mosaic_resolution_statement_count
+		mosaic_resolution_statements = ArrayHelpers.read_array_count(buffer, MosaicResolutionStatement, mosaic_resolution_statement_count)
+		self._cache['mosaic_resolution_statements'] = mosaic_resolution_statements
+		return mosaic_resolution_statements
+
+
 class AccountKeyLinkTransactionV1(Transaction):
+	__slots__ = ('_linked_public_key', '_link_action')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.ACCOUNT_KEY_LINK
 	TYPE_HINTS = {
@@ -3340,12 +5489,18 @@ class AccountKeyLinkTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._linked_public_key.serialize()
-		buffer += self._link_action.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._linked_public_key.serialize_into(buffer, offset)
+		offset = self._link_action.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -3355,7 +5510,45 @@ class AccountKeyLinkTransactionV1(Transaction):
 		return result
 
 
+class AccountKeyLinkTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 33:
+			raise ValueError(f'payload size {len(buffer)} is smaller than AccountKeyLinkTransactionV1 size {offset + 33}')
+
+		self._linked_public_key_offset = offset
+		offset += 32
+		self._link_action_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def linked_public_key(self) -> PublicKey:
+		if 'linked_public_key' in self._cache:
+			return self._cache['linked_public_key']
+
+		buffer = self._buffer[self._linked_public_key_offset:]
+		linked_public_key = PublicKey.deserialize(buffer)
+		self._cache['linked_public_key'] = linked_public_key
+		return linked_public_key
+
+	@property
+	def link_action(self) -> LinkAction:
+		if 'link_action' in self._cache:
+			return self._cache['link_action']
+
+		buffer = self._buffer[self._link_action_offset:]
+		link_action = LinkAction.deserialize(buffer)
+		self._cache['link_action'] = link_action
+		return link_action
+
+
 class EmbeddedAccountKeyLinkTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_linked_public_key', '_link_action')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.ACCOUNT_KEY_LINK
 	TYPE_HINTS = {
@@ -3415,12 +5608,18 @@ class EmbeddedAccountKeyLinkTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._linked_public_key.serialize()
-		buffer += self._link_action.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._linked_public_key.serialize_into(buffer, offset)
+		offset = self._link_action.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -3430,7 +5629,45 @@ class EmbeddedAccountKeyLinkTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedAccountKeyLinkTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 33:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedAccountKeyLinkTransactionV1 size {offset + 33}')
+
+		self._linked_public_key_offset = offset
+		offset += 32
+		self._link_action_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def linked_public_key(self) -> PublicKey:
+		if 'linked_public_key' in self._cache:
+			return self._cache['linked_public_key']
+
+		buffer = self._buffer[self._linked_public_key_offset:]
+		linked_public_key = PublicKey.deserialize(buffer)
+		self._cache['linked_public_key'] = linked_public_key
+		return linked_public_key
+
+	@property
+	def link_action(self) -> LinkAction:
+		if 'link_action' in self._cache:
+			return self._cache['link_action']
+
+		buffer = self._buffer[self._link_action_offset:]
+		link_action = LinkAction.deserialize(buffer)
+		self._cache['link_action'] = link_action
+		return link_action
+
+
 class NodeKeyLinkTransactionV1(Transaction):
+	__slots__ = ('_linked_public_key', '_link_action')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.NODE_KEY_LINK
 	TYPE_HINTS = {
@@ -3490,12 +5727,18 @@ class NodeKeyLinkTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._linked_public_key.serialize()
-		buffer += self._link_action.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._linked_public_key.serialize_into(buffer, offset)
+		offset = self._link_action.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -3505,7 +5748,45 @@ class NodeKeyLinkTransactionV1(Transaction):
 		return result
 
 
+class NodeKeyLinkTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 33:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NodeKeyLinkTransactionV1 size {offset + 33}')
+
+		self._linked_public_key_offset = offset
+		offset += 32
+		self._link_action_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def linked_public_key(self) -> PublicKey:
+		if 'linked_public_key' in self._cache:
+			return self._cache['linked_public_key']
+
+		buffer = self._buffer[self._linked_public_key_offset:]
+		linked_public_key = PublicKey.deserialize(buffer)
+		self._cache['linked_public_key'] = linked_public_key
+		return linked_public_key
+
+	@property
+	def link_action(self) -> LinkAction:
+		if 'link_action' in self._cache:
+			return self._cache['link_action']
+
+		buffer = self._buffer[self._link_action_offset:]
+		link_action = LinkAction.deserialize(buffer)
+		self._cache['link_action'] = link_action
+		return link_action
+
+
 class EmbeddedNodeKeyLinkTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_linked_public_key', '_link_action')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.NODE_KEY_LINK
 	TYPE_HINTS = {
@@ -3565,12 +5846,18 @@ class EmbeddedNodeKeyLinkTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._linked_public_key.serialize()
-		buffer += self._link_action.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._linked_public_key.serialize_into(buffer, offset)
+		offset = self._link_action.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -3580,7 +5867,48 @@ class EmbeddedNodeKeyLinkTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedNodeKeyLinkTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 33:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedNodeKeyLinkTransactionV1 size {offset + 33}')
+
+		self._linked_public_key_offset = offset
+		offset += 32
+		self._link_action_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def linked_public_key(self) -> PublicKey:
+		if 'linked_public_key' in self._cache:
+			return self._cache['linked_public_key']
+
+		buffer = self._buffer[self._linked_public_key_offset:]
+		linked_public_key = PublicKey.deserialize(buffer)
+		self._cache['linked_public_key'] = linked_public_key
+		return linked_public_key
+
+	@property
+	def link_action(self) -> LinkAction:
+		if 'link_action' in self._cache:
+			return self._cache['link_action']
+
+		buffer = self._buffer[self._link_action_offset:]
+		link_action = LinkAction.deserialize(buffer)
+		self._cache['link_action'] = link_action
+		return link_action
+
+
+_COSIGNATURE_CODEC = Struct('<Q32s64s')
+
+
 class Cosignature:
+	__slots__ = ('_version', '_signer_public_key', '_signature')
 	TYPE_HINTS = {
 		'signer_public_key': 'pod:PublicKey',
 		'signature': 'pod:Signature'
@@ -3620,46 +5948,102 @@ class Cosignature:
 
 	@property
 	def size(self) -> int:
-		size = 0
-		size += 8
-		size += self.signer_public_key.size
-		size += self.signature.size
-		return size
+		return 104
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Cosignature:
-		buffer = memoryview(payload)
+		if len(payload) < 104:
+			raise ValueError(f'payload size {len(payload)} is smaller than Cosignature size 104')
+
+		return Cosignature.from_unpacked(_COSIGNATURE_CODEC.unpack_from(payload))
+
+	@classmethod
+	def from_unpacked(cls, values: tuple) -> Cosignature:
+		(version, signer_public_key, signature) = values
 		instance = Cosignature()
+
+		# pylint: disable=protected-access
+		instance._version = version
+		instance._signer_public_key = PublicKey.from_trusted(signer_public_key)
+		instance._signature = Signature.from_trusted(signature)
+		return instance
+
+	def serialize(self) -> bytes:
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
+		return buffer
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_COSIGNATURE_CODEC.pack_into(buffer, offset, self._version, self._signer_public_key.bytes, self._signature.bytes)
+		return offset + 104
+
+	def __str__(self) -> str:
+		result = '('
+		result += f'version: 0x{self._version:X}, '
+		result += f'signer_public_key: {self._signer_public_key.__str__()}, '
+		result += f'signature: {self._signature.__str__()}, '
+		result += ')'
+		return result
+
+
+class CosignatureView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 104:
+			raise ValueError(f'payload size {len(buffer)} is smaller than Cosignature size {offset + 104}')
+
+		self._version_offset = offset
+		offset += 8
+		self._signer_public_key_offset = offset
+		offset += 32
+		self._signature_offset = offset
+		offset += 64
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def version(self) -> int:
+		if 'version' in self._cache:
+			return self._cache['version']
+
+		buffer = self._buffer[self._version_offset:]
 		version = int.from_bytes(buffer[:8], byteorder='little', signed=False)
-		buffer = buffer[8:]
+		self._cache['version'] = version
+		return version
+
+	@property
+	def signer_public_key(self) -> PublicKey:
+		if 'signer_public_key' in self._cache:
+			return self._cache['signer_public_key']
+
+		buffer = self._buffer[self._signer_public_key_offset:]
 		signer_public_key = PublicKey.deserialize(buffer)
-		buffer = buffer[signer_public_key.size:]
-		signature = Signature.deserialize(buffer)
-		buffer = buffer[signature.size:]
+		self._cache['signer_public_key'] = signer_public_key
+		return signer_public_key
 
-		# pylint: disable=protected-access
-		instance._version = version
-		instance._signer_public_key = signer_public_key
-		instance._signature = signature
-		return instance
+	@property
+	def signature(self) -> Signature:
+		if 'signature' in self._cache:
+			return self._cache['signature']
 
-	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._version.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._signer_public_key.serialize()
-		buffer += self._signature.serialize()
-		return buffer
+		buffer = self._buffer[self._signature_offset:]
+		signature = Signature.deserialize(buffer)
+		self._cache['signature'] = signature
+		return signature
 
-	def __str__(self) -> str:
-		result = '('
-		result += f'version: 0x{self._version:X}, '
-		result += f'signer_public_key: {self._signer_public_key.__str__()}, '
-		result += f'signature: {self._signature.__str__()}, '
-		result += ')'
-		return result
+
+_DETACHED_COSIGNATURE_CODEC = Struct('<Q32s64s32s')
 
 
 class DetachedCosignature:
+	__slots__ = ('_version', '_signer_public_key', '_signature', '_parent_hash')
 	TYPE_HINTS = {
 		'signer_public_key': 'pod:PublicKey',
 		'signature': 'pod:Signature',
@@ -3709,41 +6093,36 @@ class DetachedCosignature:
 
 	@property
 	def size(self) -> int:
-		size = 0
-		size += 8
-		size += self.signer_public_key.size
-		size += self.signature.size
-		size += self.parent_hash.size
-		return size
+		return 136
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> DetachedCosignature:
-		buffer = memoryview(payload)
+		if len(payload) < 136:
+			raise ValueError(f'payload size {len(payload)} is smaller than DetachedCosignature size 136')
+
+		return DetachedCosignature.from_unpacked(_DETACHED_COSIGNATURE_CODEC.unpack_from(payload))
+
+	@classmethod
+	def from_unpacked(cls, values: tuple) -> DetachedCosignature:
+		(version, signer_public_key, signature, parent_hash) = values
 		instance = DetachedCosignature()
-		version = int.from_bytes(buffer[:8], byteorder='little', signed=False)
-		buffer = buffer[8:]
-		signer_public_key = PublicKey.deserialize(buffer)
-		buffer = buffer[signer_public_key.size:]
-		signature = Signature.deserialize(buffer)
-		buffer = buffer[signature.size:]
-		parent_hash = Hash256.deserialize(buffer)
-		buffer = buffer[parent_hash.size:]
 
 		# pylint: disable=protected-access
 		instance._version = version
-		instance._signer_public_key = signer_public_key
-		instance._signature = signature
-		instance._parent_hash = parent_hash
+		instance._signer_public_key = PublicKey.from_trusted(signer_public_key)
+		instance._signature = Signature.from_trusted(signature)
+		instance._parent_hash = Hash256.from_trusted(parent_hash)
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		buffer += self._version.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._signer_public_key.serialize()
-		buffer += self._signature.serialize()
-		buffer += self._parent_hash.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_DETACHED_COSIGNATURE_CODEC.pack_into(buffer, offset, self._version, self._signer_public_key.bytes, self._signature.bytes, self._parent_hash.bytes)
+		return offset + 136
+
 	def __str__(self) -> str:
 		result = '('
 		result += f'version: 0x{self._version:X}, '
@@ -3754,7 +6133,73 @@ class DetachedCosignature:
 		return result
 
 
+class DetachedCosignatureView:
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		buffer = memoryview(payload)
+		offset = 0
+		self._cache = {}
+		if len(buffer) < offset + 136:
+			raise ValueError(f'payload size {len(buffer)} is smaller than DetachedCosignature size {offset + 136}')
+
+		self._version_offset = offset
+		offset += 8
+		self._signer_public_key_offset = offset
+		offset += 32
+		self._signature_offset = offset
+		offset += 64
+		self._parent_hash_offset = offset
+		offset += 32
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def size(self) -> int:
+		return self._end_offset
+
+	@property
+	def version(self) -> int:
+		if 'version' in self._cache:
+			return self._cache['version']
+
+		buffer = self._buffer[self._version_offset:]
+		version = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['version'] = version
+		return version
+
+	@property
+	def signer_public_key(self) -> PublicKey:
+		if 'signer_public_key' in self._cache:
+			return self._cache['signer_public_key']
+
+		buffer = self._buffer[self._signer_public_key_offset:]
+		signer_public_key = PublicKey.deserialize(buffer)
+		self._cache['signer_public_key'] = signer_public_key
+		return signer_public_key
+
+	@property
+	def signature(self) -> Signature:
+		if 'signature' in self._cache:
+			return self._cache['signature']
+
+		buffer = self._buffer[self._signature_offset:]
+		signature = Signature.deserialize(buffer)
+		self._cache['signature'] = signature
+		return signature
+
+	@property
+	def parent_hash(self) -> Hash256:
+		if 'parent_hash' in self._cache:
+			return self._cache['parent_hash']
+
+		buffer = self._buffer[self._parent_hash_offset:]
+		parent_hash = Hash256.deserialize(buffer)
+		self._cache['parent_hash'] = parent_hash
+		return parent_hash
+
+
 class AggregateCompleteTransactionV1(Transaction):
+	__slots__ = ('_transactions_hash', '_transactions', '_cosignatures', '_aggregate_transaction_header_reserved_1')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.AGGREGATE_COMPLETE
 	TYPE_HINTS = {
@@ -3826,7 +6271,7 @@ class AggregateCompleteTransactionV1(Transaction):
 		assert aggregate_transaction_header_reserved_1 == 0, f'Invalid value of reserved field ({aggregate_transaction_header_reserved_1})'
 		transactions = ArrayHelpers.read_variable_size_elements(buffer[:payload_size], EmbeddedTransactionFactory, 8, skip_last_element_padding=False)
 		buffer = buffer[payload_size:]
-		cosignatures = ArrayHelpers.read_array(buffer, Cosignature)
+		cosignatures = ArrayHelpers.read_fixed_size_array(buffer, Cosignature, _COSIGNATURE_CODEC)
 		buffer = buffer[ArrayHelpers.size(cosignatures):]
 
 		# pylint: disable=protected-access
@@ -3836,15 +6281,25 @@ class AggregateCompleteTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._transactions_hash.serialize()
-		buffer += ArrayHelpers.size(self.transactions, 8, skip_last_element_padding=False).to_bytes(4, byteorder='little', signed=False)  # payload_size
-		buffer += self._aggregate_transaction_header_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += ArrayHelpers.write_variable_size_elements(self._transactions, 8, skip_last_element_padding=False)
-		buffer += ArrayHelpers.write_array(self._cosignatures)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._transactions_hash.serialize_into(buffer, offset)
+		payload_size_offset = offset
+		offset += 4  # payload_size
+		buffer[offset:offset + 4] = self._aggregate_transaction_header_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		transactions_offset = offset
+		offset = ArrayHelpers.write_variable_size_elements_into(buffer, offset, self._transactions, 8, skip_last_element_padding=False)
+		buffer[payload_size_offset:payload_size_offset + 4] = (offset - transactions_offset).to_bytes(4, byteorder='little', signed=False)
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._cosignatures)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -3855,7 +6310,67 @@ class AggregateCompleteTransactionV1(Transaction):
 		return result
 
 
+class AggregateCompleteTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than AggregateCompleteTransactionV1 size {offset + 40}')
+
+		self._transactions_hash_offset = offset
+		offset += 32
+		payload_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		aggregate_transaction_header_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert aggregate_transaction_header_reserved_1 == 0, f'Invalid value of reserved field ({aggregate_transaction_header_reserved_1})'
+		self._transactions_offset = offset
+		offset += payload_size
+		self._cosignatures_offset = offset
+		offset = len(buffer)
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than AggregateCompleteTransactionV1 size {offset}')
+
+		self._payload_size = payload_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def transactions_hash(self) -> Hash256:
+		if 'transactions_hash' in self._cache:
+			return self._cache['transactions_hash']
+
+		buffer = self._buffer[self._transactions_hash_offset:]
+		transactions_hash = Hash256.deserialize(buffer)
+		self._cache['transactions_hash'] = transactions_hash
+		return transactions_hash
+
+	@property
+	def transactions(self) -> List[EmbeddedTransaction]:
+		if 'transactions' in self._cache:
+			return self._cache['transactions']
+
+		buffer = self._buffer[self._transactions_offset:]
+		payload_size = self._payload_size
+		transactions = ArrayHelpers.read_variable_size_elements(buffer[:payload_size], EmbeddedTransactionFactory, 8, skip_last_element_padding=False)
+		self._cache['transactions'] = transactions
+		return transactions
+
+	@property
+	def cosignatures(self) -> List[Cosignature]:
+		if 'cosignatures' in self._cache:
+			return self._cache['cosignatures']
+
+		buffer = self._buffer[self._cosignatures_offset:]
+		cosignatures = ArrayHelpers.read_fixed_size_array(buffer, Cosignature, _COSIGNATURE_CODEC)
+		self._cache['cosignatures'] = cosignatures
+		return cosignatures
+
+
 class AggregateCompleteTransactionV2(Transaction):
+	__slots__ = ('_transactions_hash', '_transactions', '_cosignatures', '_aggregate_transaction_header_reserved_1')
 	TRANSACTION_VERSION: int = 2
 	TRANSACTION_TYPE: TransactionType = TransactionType.AGGREGATE_COMPLETE
 	TYPE_HINTS = {
@@ -3927,7 +6442,7 @@ class AggregateCompleteTransactionV2(Transaction):
 		assert aggregate_transaction_header_reserved_1 == 0, f'Invalid value of reserved field ({aggregate_transaction_header_reserved_1})'
 		transactions = ArrayHelpers.read_variable_size_elements(buffer[:payload_size], EmbeddedTransactionFactory, 8, skip_last_element_padding=False)
 		buffer = buffer[payload_size:]
-		cosignatures = ArrayHelpers.read_array(buffer, Cosignature)
+		cosignatures = ArrayHelpers.read_fixed_size_array(buffer, Cosignature, _COSIGNATURE_CODEC)
 		buffer = buffer[ArrayHelpers.size(cosignatures):]
 
 		# pylint: disable=protected-access
@@ -3937,15 +6452,25 @@ class AggregateCompleteTransactionV2(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._transactions_hash.serialize()
-		buffer += ArrayHelpers.size(self.transactions, 8, skip_last_element_padding=False).to_bytes(4, byteorder='little', signed=False)  # payload_size
-		buffer += self._aggregate_transaction_header_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += ArrayHelpers.write_variable_size_elements(self._transactions, 8, skip_last_element_padding=False)
-		buffer += ArrayHelpers.write_array(self._cosignatures)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._transactions_hash.serialize_into(buffer, offset)
+		payload_size_offset = offset
+		offset += 4  # payload_size
+		buffer[offset:offset + 4] = self._aggregate_transaction_header_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		transactions_offset = offset
+		offset = ArrayHelpers.write_variable_size_elements_into(buffer, offset, self._transactions, 8, skip_last_element_padding=False)
+		buffer[payload_size_offset:payload_size_offset + 4] = (offset - transactions_offset).to_bytes(4, byteorder='little', signed=False)
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._cosignatures)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -3956,7 +6481,67 @@ class AggregateCompleteTransactionV2(Transaction):
 		return result
 
 
+class AggregateCompleteTransactionV2View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than AggregateCompleteTransactionV2 size {offset + 40}')
+
+		self._transactions_hash_offset = offset
+		offset += 32
+		payload_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		aggregate_transaction_header_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert aggregate_transaction_header_reserved_1 == 0, f'Invalid value of reserved field ({aggregate_transaction_header_reserved_1})'
+		self._transactions_offset = offset
+		offset += payload_size
+		self._cosignatures_offset = offset
+		offset = len(buffer)
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than AggregateCompleteTransactionV2 size {offset}')
+
+		self._payload_size = payload_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def transactions_hash(self) -> Hash256:
+		if 'transactions_hash' in self._cache:
+			return self._cache['transactions_hash']
+
+		buffer = self._buffer[self._transactions_hash_offset:]
+		transactions_hash = Hash256.deserialize(buffer)
+		self._cache['transactions_hash'] = transactions_hash
+		return transactions_hash
+
+	@property
+	def transactions(self) -> List[EmbeddedTransaction]:
+		if 'transactions' in self._cache:
+			return self._cache['transactions']
+
+		buffer = self._buffer[self._transactions_offset:]
+		payload_size = self._payload_size
+		transactions = ArrayHelpers.read_variable_size_elements(buffer[:payload_size], EmbeddedTransactionFactory, 8, skip_last_element_padding=False)
+		self._cache['transactions'] = transactions
+		return transactions
+
+	@property
+	def cosignatures(self) -> List[Cosignature]:
+		if 'cosignatures' in self._cache:
+			return self._cache['cosignatures']
+
+		buffer = self._buffer[self._cosignatures_offset:]
+		cosignatures = ArrayHelpers.read_fixed_size_array(buffer, Cosignature, _COSIGNATURE_CODEC)
+		self._cache['cosignatures'] = cosignatures
+		return cosignatures
+
+
 class AggregateBondedTransactionV1(Transaction):
+	__slots__ = ('_transactions_hash', '_transactions', '_cosignatures', '_aggregate_transaction_header_reserved_1')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.AGGREGATE_BONDED
 	TYPE_HINTS = {
@@ -4028,7 +6613,7 @@ class AggregateBondedTransactionV1(Transaction):
 		assert aggregate_transaction_header_reserved_1 == 0, f'Invalid value of reserved field ({aggregate_transaction_header_reserved_1})'
 		transactions = ArrayHelpers.read_variable_size_elements(buffer[:payload_size], EmbeddedTransactionFactory, 8, skip_last_element_padding=False)
 		buffer = buffer[payload_size:]
-		cosignatures = ArrayHelpers.read_array(buffer, Cosignature)
+		cosignatures = ArrayHelpers.read_fixed_size_array(buffer, Cosignature, _COSIGNATURE_CODEC)
 		buffer = buffer[ArrayHelpers.size(cosignatures):]
 
 		# pylint: disable=protected-access
@@ -4038,15 +6623,25 @@ class AggregateBondedTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._transactions_hash.serialize()
-		buffer += ArrayHelpers.size(self.transactions, 8, skip_last_element_padding=False).to_bytes(4, byteorder='little', signed=False)  # payload_size
-		buffer += self._aggregate_transaction_header_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += ArrayHelpers.write_variable_size_elements(self._transactions, 8, skip_last_element_padding=False)
-		buffer += ArrayHelpers.write_array(self._cosignatures)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._transactions_hash.serialize_into(buffer, offset)
+		payload_size_offset = offset
+		offset += 4  # payload_size
+		buffer[offset:offset + 4] = self._aggregate_transaction_header_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		transactions_offset = offset
+		offset = ArrayHelpers.write_variable_size_elements_into(buffer, offset, self._transactions, 8, skip_last_element_padding=False)
+		buffer[payload_size_offset:payload_size_offset + 4] = (offset - transactions_offset).to_bytes(4, byteorder='little', signed=False)
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._cosignatures)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -4057,7 +6652,67 @@ class AggregateBondedTransactionV1(Transaction):
 		return result
 
 
+class AggregateBondedTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than AggregateBondedTransactionV1 size {offset + 40}')
+
+		self._transactions_hash_offset = offset
+		offset += 32
+		payload_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		aggregate_transaction_header_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert aggregate_transaction_header_reserved_1 == 0, f'Invalid value of reserved field ({aggregate_transaction_header_reserved_1})'
+		self._transactions_offset = offset
+		offset += payload_size
+		self._cosignatures_offset = offset
+		offset = len(buffer)
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than AggregateBondedTransactionV1 size {offset}')
+
+		self._payload_size = payload_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def transactions_hash(self) -> Hash256:
+		if 'transactions_hash' in self._cache:
+			return self._cache['transactions_hash']
+
+		buffer = self._buffer[self._transactions_hash_offset:]
+		transactions_hash = Hash256.deserialize(buffer)
+		self._cache['transactions_hash'] = transactions_hash
+		return transactions_hash
+
+	@property
+	def transactions(self) -> List[EmbeddedTransaction]:
+		if 'transactions' in self._cache:
+			return self._cache['transactions']
+
+		buffer = self._buffer[self._transactions_offset:]
+		payload_size = self._payload_size
+		transactions = ArrayHelpers.read_variable_size_elements(buffer[:payload_size], EmbeddedTransactionFactory, 8, skip_last_element_padding=False)
+		self._cache['transactions'] = transactions
+		return transactions
+
+	@property
+	def cosignatures(self) -> List[Cosignature]:
+		if 'cosignatures' in self._cache:
+			return self._cache['cosignatures']
+
+		buffer = self._buffer[self._cosignatures_offset:]
+		cosignatures = ArrayHelpers.read_fixed_size_array(buffer, Cosignature, _COSIGNATURE_CODEC)
+		self._cache['cosignatures'] = cosignatures
+		return cosignatures
+
+
 class AggregateBondedTransactionV2(Transaction):
+	__slots__ = ('_transactions_hash', '_transactions', '_cosignatures', '_aggregate_transaction_header_reserved_1')
 	TRANSACTION_VERSION: int = 2
 	TRANSACTION_TYPE: TransactionType = TransactionType.AGGREGATE_BONDED
 	TYPE_HINTS = {
@@ -4129,7 +6784,7 @@ class AggregateBondedTransactionV2(Transaction):
 		assert aggregate_transaction_header_reserved_1 == 0, f'Invalid value of reserved field ({aggregate_transaction_header_reserved_1})'
 		transactions = ArrayHelpers.read_variable_size_elements(buffer[:payload_size], EmbeddedTransactionFactory, 8, skip_last_element_padding=False)
 		buffer = buffer[payload_size:]
-		cosignatures = ArrayHelpers.read_array(buffer, Cosignature)
+		cosignatures = ArrayHelpers.read_fixed_size_array(buffer, Cosignature, _COSIGNATURE_CODEC)
 		buffer = buffer[ArrayHelpers.size(cosignatures):]
 
 		# pylint: disable=protected-access
@@ -4139,15 +6794,25 @@ class AggregateBondedTransactionV2(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._transactions_hash.serialize()
-		buffer += ArrayHelpers.size(self.transactions, 8, skip_last_element_padding=False).to_bytes(4, byteorder='little', signed=False)  # payload_size
-		buffer += self._aggregate_transaction_header_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += ArrayHelpers.write_variable_size_elements(self._transactions, 8, skip_last_element_padding=False)
-		buffer += ArrayHelpers.write_array(self._cosignatures)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._transactions_hash.serialize_into(buffer, offset)
+		payload_size_offset = offset
+		offset += 4  # payload_size
+		buffer[offset:offset + 4] = self._aggregate_transaction_header_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		transactions_offset = offset
+		offset = ArrayHelpers.write_variable_size_elements_into(buffer, offset, self._transactions, 8, skip_last_element_padding=False)
+		buffer[payload_size_offset:payload_size_offset + 4] = (offset - transactions_offset).to_bytes(4, byteorder='little', signed=False)
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._cosignatures)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -4158,7 +6823,67 @@ class AggregateBondedTransactionV2(Transaction):
 		return result
 
 
+class AggregateBondedTransactionV2View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than AggregateBondedTransactionV2 size {offset + 40}')
+
+		self._transactions_hash_offset = offset
+		offset += 32
+		payload_size = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		aggregate_transaction_header_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert aggregate_transaction_header_reserved_1 == 0, f'Invalid value of reserved field ({aggregate_transaction_header_reserved_1})'
+		self._transactions_offset = offset
+		offset += payload_size
+		self._cosignatures_offset = offset
+		offset = len(buffer)
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than AggregateBondedTransactionV2 size {offset}')
+
+		self._payload_size = payload_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def transactions_hash(self) -> Hash256:
+		if 'transactions_hash' in self._cache:
+			return self._cache['transactions_hash']
+
+		buffer = self._buffer[self._transactions_hash_offset:]
+		transactions_hash = Hash256.deserialize(buffer)
+		self._cache['transactions_hash'] = transactions_hash
+		return transactions_hash
+
+	@property
+	def transactions(self) -> List[EmbeddedTransaction]:
+		if 'transactions' in self._cache:
+			return self._cache['transactions']
+
+		buffer = self._buffer[self._transactions_offset:]
+		payload_size = self._payload_size
+		transactions = ArrayHelpers.read_variable_size_elements(buffer[:payload_size], EmbeddedTransactionFactory, 8, skip_last_element_padding=False)
+		self._cache['transactions'] = transactions
+		return transactions
+
+	@property
+	def cosignatures(self) -> List[Cosignature]:
+		if 'cosignatures' in self._cache:
+			return self._cache['cosignatures']
+
+		buffer = self._buffer[self._cosignatures_offset:]
+		cosignatures = ArrayHelpers.read_fixed_size_array(buffer, Cosignature, _COSIGNATURE_CODEC)
+		self._cache['cosignatures'] = cosignatures
+		return cosignatures
+
+
 class VotingKeyLinkTransactionV1(Transaction):
+	__slots__ = ('_linked_public_key', '_start_epoch', '_end_epoch', '_link_action')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.VOTING_KEY_LINK
 	TYPE_HINTS = {
@@ -4246,14 +6971,20 @@ class VotingKeyLinkTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._linked_public_key.serialize()
-		buffer += self._start_epoch.serialize()
-		buffer += self._end_epoch.serialize()
-		buffer += self._link_action.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._linked_public_key.serialize_into(buffer, offset)
+		offset = self._start_epoch.serialize_into(buffer, offset)
+		offset = self._end_epoch.serialize_into(buffer, offset)
+		offset = self._link_action.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -4265,7 +6996,69 @@ class VotingKeyLinkTransactionV1(Transaction):
 		return result
 
 
+class VotingKeyLinkTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 41:
+			raise ValueError(f'payload size {len(buffer)} is smaller than VotingKeyLinkTransactionV1 size {offset + 41}')
+
+		self._linked_public_key_offset = offset
+		offset += 32
+		self._start_epoch_offset = offset
+		offset += 4
+		self._end_epoch_offset = offset
+		offset += 4
+		self._link_action_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def linked_public_key(self) -> VotingPublicKey:
+		if 'linked_public_key' in self._cache:
+			return self._cache['linked_public_key']
+
+		buffer = self._buffer[self._linked_public_key_offset:]
+		linked_public_key = VotingPublicKey.deserialize(buffer)
+		self._cache['linked_public_key'] = linked_public_key
+		return linked_public_key
+
+	@property
+	def start_epoch(self) -> FinalizationEpoch:
+		if 'start_epoch' in self._cache:
+			return self._cache['start_epoch']
+
+		buffer = self._buffer[self._start_epoch_offset:]
+		start_epoch = FinalizationEpoch.deserialize(buffer)
+		self._cache['start_epoch'] = start_epoch
+		return start_epoch
+
+	@property
+	def end_epoch(self) -> FinalizationEpoch:
+		if 'end_epoch' in self._cache:
+			return self._cache['end_epoch']
+
+		buffer = self._buffer[self._end_epoch_offset:]
+		end_epoch = FinalizationEpoch.deserialize(buffer)
+		self._cache['end_epoch'] = end_epoch
+		return end_epoch
+
+	@property
+	def link_action(self) -> LinkAction:
+		if 'link_action' in self._cache:
+			return self._cache['link_action']
+
+		buffer = self._buffer[self._link_action_offset:]
+		link_action = LinkAction.deserialize(buffer)
+		self._cache['link_action'] = link_action
+		return link_action
+
+
 class EmbeddedVotingKeyLinkTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_linked_public_key', '_start_epoch', '_end_epoch', '_link_action')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.VOTING_KEY_LINK
 	TYPE_HINTS = {
@@ -4353,14 +7146,20 @@ class EmbeddedVotingKeyLinkTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._linked_public_key.serialize()
-		buffer += self._start_epoch.serialize()
-		buffer += self._end_epoch.serialize()
-		buffer += self._link_action.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._linked_public_key.serialize_into(buffer, offset)
+		offset = self._start_epoch.serialize_into(buffer, offset)
+		offset = self._end_epoch.serialize_into(buffer, offset)
+		offset = self._link_action.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -4372,7 +7171,69 @@ class EmbeddedVotingKeyLinkTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedVotingKeyLinkTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 41:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedVotingKeyLinkTransactionV1 size {offset + 41}')
+
+		self._linked_public_key_offset = offset
+		offset += 32
+		self._start_epoch_offset = offset
+		offset += 4
+		self._end_epoch_offset = offset
+		offset += 4
+		self._link_action_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def linked_public_key(self) -> VotingPublicKey:
+		if 'linked_public_key' in self._cache:
+			return self._cache['linked_public_key']
+
+		buffer = self._buffer[self._linked_public_key_offset:]
+		linked_public_key = VotingPublicKey.deserialize(buffer)
+		self._cache['linked_public_key'] = linked_public_key
+		return linked_public_key
+
+	@property
+	def start_epoch(self) -> FinalizationEpoch:
+		if 'start_epoch' in self._cache:
+			return self._cache['start_epoch']
+
+		buffer = self._buffer[self._start_epoch_offset:]
+		start_epoch = FinalizationEpoch.deserialize(buffer)
+		self._cache['start_epoch'] = start_epoch
+		return start_epoch
+
+	@property
+	def end_epoch(self) -> FinalizationEpoch:
+		if 'end_epoch' in self._cache:
+			return self._cache['end_epoch']
+
+		buffer = self._buffer[self._end_epoch_offset:]
+		end_epoch = FinalizationEpoch.deserialize(buffer)
+		self._cache['end_epoch'] = end_epoch
+		return end_epoch
+
+	@property
+	def link_action(self) -> LinkAction:
+		if 'link_action' in self._cache:
+			return self._cache['link_action']
+
+		buffer = self._buffer[self._link_action_offset:]
+		link_action = LinkAction.deserialize(buffer)
+		self._cache['link_action'] = link_action
+		return link_action
+
+
 class VrfKeyLinkTransactionV1(Transaction):
+	__slots__ = ('_linked_public_key', '_link_action')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.VRF_KEY_LINK
 	TYPE_HINTS = {
@@ -4432,12 +7293,18 @@ class VrfKeyLinkTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._linked_public_key.serialize()
-		buffer += self._link_action.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._linked_public_key.serialize_into(buffer, offset)
+		offset = self._link_action.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -4447,7 +7314,45 @@ class VrfKeyLinkTransactionV1(Transaction):
 		return result
 
 
+class VrfKeyLinkTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 33:
+			raise ValueError(f'payload size {len(buffer)} is smaller than VrfKeyLinkTransactionV1 size {offset + 33}')
+
+		self._linked_public_key_offset = offset
+		offset += 32
+		self._link_action_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def linked_public_key(self) -> PublicKey:
+		if 'linked_public_key' in self._cache:
+			return self._cache['linked_public_key']
+
+		buffer = self._buffer[self._linked_public_key_offset:]
+		linked_public_key = PublicKey.deserialize(buffer)
+		self._cache['linked_public_key'] = linked_public_key
+		return linked_public_key
+
+	@property
+	def link_action(self) -> LinkAction:
+		if 'link_action' in self._cache:
+			return self._cache['link_action']
+
+		buffer = self._buffer[self._link_action_offset:]
+		link_action = LinkAction.deserialize(buffer)
+		self._cache['link_action'] = link_action
+		return link_action
+
+
 class EmbeddedVrfKeyLinkTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_linked_public_key', '_link_action')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.VRF_KEY_LINK
 	TYPE_HINTS = {
@@ -4507,12 +7412,18 @@ class EmbeddedVrfKeyLinkTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._linked_public_key.serialize()
-		buffer += self._link_action.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._linked_public_key.serialize_into(buffer, offset)
+		offset = self._link_action.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -4522,7 +7433,45 @@ class EmbeddedVrfKeyLinkTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedVrfKeyLinkTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 33:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedVrfKeyLinkTransactionV1 size {offset + 33}')
+
+		self._linked_public_key_offset = offset
+		offset += 32
+		self._link_action_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def linked_public_key(self) -> PublicKey:
+		if 'linked_public_key' in self._cache:
+			return self._cache['linked_public_key']
+
+		buffer = self._buffer[self._linked_public_key_offset:]
+		linked_public_key = PublicKey.deserialize(buffer)
+		self._cache['linked_public_key'] = linked_public_key
+		return linked_public_key
+
+	@property
+	def link_action(self) -> LinkAction:
+		if 'link_action' in self._cache:
+			return self._cache['link_action']
+
+		buffer = self._buffer[self._link_action_offset:]
+		link_action = LinkAction.deserialize(buffer)
+		self._cache['link_action'] = link_action
+		return link_action
+
+
 class HashLockTransactionV1(Transaction):
+	__slots__ = ('_mosaic', '_duration', '_hash')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.HASH_LOCK
 	TYPE_HINTS = {
@@ -4596,13 +7545,19 @@ class HashLockTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic.serialize()
-		buffer += self._duration.serialize()
-		buffer += self._hash.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic.serialize_into(buffer, offset)
+		offset = self._duration.serialize_into(buffer, offset)
+		offset = self._hash.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -4613,7 +7568,57 @@ class HashLockTransactionV1(Transaction):
 		return result
 
 
+class HashLockTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 56:
+			raise ValueError(f'payload size {len(buffer)} is smaller than HashLockTransactionV1 size {offset + 56}')
+
+		self._mosaic_offset = offset
+		offset += 16
+		self._duration_offset = offset
+		offset += 8
+		self._hash_offset = offset
+		offset += 32
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic(self) -> UnresolvedMosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic = UnresolvedMosaic.deserialize(buffer)
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+	@property
+	def duration(self) -> BlockDuration:
+		if 'duration' in self._cache:
+			return self._cache['duration']
+
+		buffer = self._buffer[self._duration_offset:]
+		duration = BlockDuration.deserialize(buffer)
+		self._cache['duration'] = duration
+		return duration
+
+	@property
+	def hash(self) -> Hash256:
+		if 'hash' in self._cache:
+			return self._cache['hash']
+
+		buffer = self._buffer[self._hash_offset:]
+		hash = Hash256.deserialize(buffer)
+		self._cache['hash'] = hash
+		return hash
+
+
 class EmbeddedHashLockTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_mosaic', '_duration', '_hash')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.HASH_LOCK
 	TYPE_HINTS = {
@@ -4687,13 +7692,19 @@ class EmbeddedHashLockTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic.serialize()
-		buffer += self._duration.serialize()
-		buffer += self._hash.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic.serialize_into(buffer, offset)
+		offset = self._duration.serialize_into(buffer, offset)
+		offset = self._hash.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -4704,6 +7715,55 @@ class EmbeddedHashLockTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedHashLockTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 56:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedHashLockTransactionV1 size {offset + 56}')
+
+		self._mosaic_offset = offset
+		offset += 16
+		self._duration_offset = offset
+		offset += 8
+		self._hash_offset = offset
+		offset += 32
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic(self) -> UnresolvedMosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic = UnresolvedMosaic.deserialize(buffer)
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+	@property
+	def duration(self) -> BlockDuration:
+		if 'duration' in self._cache:
+			return self._cache['duration']
+
+		buffer = self._buffer[self._duration_offset:]
+		duration = BlockDuration.deserialize(buffer)
+		self._cache['duration'] = duration
+		return duration
+
+	@property
+	def hash(self) -> Hash256:
+		if 'hash' in self._cache:
+			return self._cache['hash']
+
+		buffer = self._buffer[self._hash_offset:]
+		hash = Hash256.deserialize(buffer)
+		self._cache['hash'] = hash
+		return hash
+
+
 class LockHashAlgorithm(Enum):
 	SHA3_256 = 0
 	HASH_160 = 1
@@ -4723,8 +7783,13 @@ class LockHashAlgorithm(Enum):
 		buffer += self.value.to_bytes(1, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 1] = self.value.to_bytes(1, byteorder='little', signed=False)
+		return offset + 1
+
 
 class SecretLockTransactionV1(Transaction):
+	__slots__ = ('_recipient_address', '_secret', '_mosaic', '_duration', '_hash_algorithm')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.SECRET_LOCK
 	TYPE_HINTS = {
@@ -4826,15 +7891,21 @@ class SecretLockTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._recipient_address.serialize()
-		buffer += self._secret.serialize()
-		buffer += self._mosaic.serialize()
-		buffer += self._duration.serialize()
-		buffer += self._hash_algorithm.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._recipient_address.serialize_into(buffer, offset)
+		offset = self._secret.serialize_into(buffer, offset)
+		offset = self._mosaic.serialize_into(buffer, offset)
+		offset = self._duration.serialize_into(buffer, offset)
+		offset = self._hash_algorithm.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -4847,7 +7918,81 @@ class SecretLockTransactionV1(Transaction):
 		return result
 
 
+class SecretLockTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 81:
+			raise ValueError(f'payload size {len(buffer)} is smaller than SecretLockTransactionV1 size {offset + 81}')
+
+		self._recipient_address_offset = offset
+		offset += 24
+		self._secret_offset = offset
+		offset += 32
+		self._mosaic_offset = offset
+		offset += 16
+		self._duration_offset = offset
+		offset += 8
+		self._hash_algorithm_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def recipient_address(self) -> UnresolvedAddress:
+		if 'recipient_address' in self._cache:
+			return self._cache['recipient_address']
+
+		buffer = self._buffer[self._recipient_address_offset:]
+		recipient_address = UnresolvedAddress.deserialize(buffer)
+		self._cache['recipient_address'] = recipient_address
+		return recipient_address
+
+	@property
+	def secret(self) -> Hash256:
+		if 'secret' in self._cache:
+			return self._cache['secret']
+
+		buffer = self._buffer[self._secret_offset:]
+		secret = Hash256.deserialize(buffer)
+		self._cache['secret'] = secret
+		return secret
+
+	@property
+	def mosaic(self) -> UnresolvedMosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic = UnresolvedMosaic.deserialize(buffer)
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+	@property
+	def duration(self) -> BlockDuration:
+		if 'duration' in self._cache:
+			return self._cache['duration']
+
+		buffer = self._buffer[self._duration_offset:]
+		duration = BlockDuration.deserialize(buffer)
+		self._cache['duration'] = duration
+		return duration
+
+	@property
+	def hash_algorithm(self) -> LockHashAlgorithm:
+		if 'hash_algorithm' in self._cache:
+			return self._cache['hash_algorithm']
+
+		buffer = self._buffer[self._hash_algorithm_offset:]
+		hash_algorithm = LockHashAlgorithm.deserialize(buffer)
+		self._cache['hash_algorithm'] = hash_algorithm
+		return hash_algorithm
+
+
 class EmbeddedSecretLockTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_recipient_address', '_secret', '_mosaic', '_duration', '_hash_algorithm')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.SECRET_LOCK
 	TYPE_HINTS = {
@@ -4949,15 +8094,21 @@ class EmbeddedSecretLockTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._recipient_address.serialize()
-		buffer += self._secret.serialize()
-		buffer += self._mosaic.serialize()
-		buffer += self._duration.serialize()
-		buffer += self._hash_algorithm.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._recipient_address.serialize_into(buffer, offset)
+		offset = self._secret.serialize_into(buffer, offset)
+		offset = self._mosaic.serialize_into(buffer, offset)
+		offset = self._duration.serialize_into(buffer, offset)
+		offset = self._hash_algorithm.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -4970,7 +8121,81 @@ class EmbeddedSecretLockTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedSecretLockTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 81:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedSecretLockTransactionV1 size {offset + 81}')
+
+		self._recipient_address_offset = offset
+		offset += 24
+		self._secret_offset = offset
+		offset += 32
+		self._mosaic_offset = offset
+		offset += 16
+		self._duration_offset = offset
+		offset += 8
+		self._hash_algorithm_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def recipient_address(self) -> UnresolvedAddress:
+		if 'recipient_address' in self._cache:
+			return self._cache['recipient_address']
+
+		buffer = self._buffer[self._recipient_address_offset:]
+		recipient_address = UnresolvedAddress.deserialize(buffer)
+		self._cache['recipient_address'] = recipient_address
+		return recipient_address
+
+	@property
+	def secret(self) -> Hash256:
+		if 'secret' in self._cache:
+			return self._cache['secret']
+
+		buffer = self._buffer[self._secret_offset:]
+		secret = Hash256.deserialize(buffer)
+		self._cache['secret'] = secret
+		return secret
+
+	@property
+	def mosaic(self) -> UnresolvedMosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic = UnresolvedMosaic.deserialize(buffer)
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+	@property
+	def duration(self) -> BlockDuration:
+		if 'duration' in self._cache:
+			return self._cache['duration']
+
+		buffer = self._buffer[self._duration_offset:]
+		duration = BlockDuration.deserialize(buffer)
+		self._cache['duration'] = duration
+		return duration
+
+	@property
+	def hash_algorithm(self) -> LockHashAlgorithm:
+		if 'hash_algorithm' in self._cache:
+			return self._cache['hash_algorithm']
+
+		buffer = self._buffer[self._hash_algorithm_offset:]
+		hash_algorithm = LockHashAlgorithm.deserialize(buffer)
+		self._cache['hash_algorithm'] = hash_algorithm
+		return hash_algorithm
+
+
 class SecretProofTransactionV1(Transaction):
+	__slots__ = ('_recipient_address', '_secret', '_hash_algorithm', '_proof')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.SECRET_PROOF
 	TYPE_HINTS = {
@@ -5061,15 +8286,23 @@ class SecretProofTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._recipient_address.serialize()
-		buffer += self._secret.serialize()
-		buffer += len(self._proof).to_bytes(2, byteorder='little', signed=False)  # proof_size
-		buffer += self._hash_algorithm.serialize()
-		buffer += self._proof
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._recipient_address.serialize_into(buffer, offset)
+		offset = self._secret.serialize_into(buffer, offset)
+		buffer[offset:offset + 2] = len(self._proof).to_bytes(2, byteorder='little', signed=False)  # proof_size
+		offset += 2
+		offset = self._hash_algorithm.serialize_into(buffer, offset)
+		buffer[offset:offset + len(self._proof)] = self._proof
+		offset += len(self._proof)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -5081,7 +8314,76 @@ class SecretProofTransactionV1(Transaction):
 		return result
 
 
+class SecretProofTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 59:
+			raise ValueError(f'payload size {len(buffer)} is smaller than SecretProofTransactionV1 size {offset + 59}')
+
+		self._recipient_address_offset = offset
+		offset += 24
+		self._secret_offset = offset
+		offset += 32
+		proof_size = int.from_bytes(buffer[offset:offset + 2], byteorder='little', signed=False)
+		offset += 2
+		self._hash_algorithm_offset = offset
+		offset += 1
+		self._proof_offset = offset
+		offset += proof_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than SecretProofTransactionV1 size {offset}')
+
+		self._proof_size = proof_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def recipient_address(self) -> UnresolvedAddress:
+		if 'recipient_address' in self._cache:
+			return self._cache['recipient_address']
+
+		buffer = self._buffer[self._recipient_address_offset:]
+		recipient_address = UnresolvedAddress.deserialize(buffer)
+		self._cache['recipient_address'] = recipient_address
+		return recipient_address
+
+	@property
+	def secret(self) -> Hash256:
+		if 'secret' in self._cache:
+			return self._cache['secret']
+
+		buffer = self._buffer[self._secret_offset:]
+		secret = Hash256.deserialize(buffer)
+		self._cache['secret'] = secret
+		return secret
+
+	@property
+	def hash_algorithm(self) -> LockHashAlgorithm:
+		if 'hash_algorithm' in self._cache:
+			return self._cache['hash_algorithm']
+
+		buffer = self._buffer[self._hash_algorithm_offset:]
+		hash_algorithm = LockHashAlgorithm.deserialize(buffer)
+		self._cache['hash_algorithm'] = hash_algorithm
+		return hash_algorithm
+
+	@property
+	def proof(self) -> bytes:
+		if 'proof' in self._cache:
+			return self._cache['proof']
+
+		buffer = self._buffer[self._proof_offset:]
+		proof_size = self._proof_size
+		proof = ArrayHelpers.get_bytes(buffer, proof_size)
+		self._cache['proof'] = proof
+		return proof
+
+
 class EmbeddedSecretProofTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_recipient_address', '_secret', '_hash_algorithm', '_proof')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.SECRET_PROOF
 	TYPE_HINTS = {
@@ -5172,15 +8474,23 @@ class EmbeddedSecretProofTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._recipient_address.serialize()
-		buffer += self._secret.serialize()
-		buffer += len(self._proof).to_bytes(2, byteorder='little', signed=False)  # proof_size
-		buffer += self._hash_algorithm.serialize()
-		buffer += self._proof
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._recipient_address.serialize_into(buffer, offset)
+		offset = self._secret.serialize_into(buffer, offset)
+		buffer[offset:offset + 2] = len(self._proof).to_bytes(2, byteorder='little', signed=False)  # proof_size
+		offset += 2
+		offset = self._hash_algorithm.serialize_into(buffer, offset)
+		buffer[offset:offset + len(self._proof)] = self._proof
+		offset += len(self._proof)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -5192,7 +8502,76 @@ class EmbeddedSecretProofTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedSecretProofTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 59:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedSecretProofTransactionV1 size {offset + 59}')
+
+		self._recipient_address_offset = offset
+		offset += 24
+		self._secret_offset = offset
+		offset += 32
+		proof_size = int.from_bytes(buffer[offset:offset + 2], byteorder='little', signed=False)
+		offset += 2
+		self._hash_algorithm_offset = offset
+		offset += 1
+		self._proof_offset = offset
+		offset += proof_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedSecretProofTransactionV1 size {offset}')
+
+		self._proof_size = proof_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def recipient_address(self) -> UnresolvedAddress:
+		if 'recipient_address' in self._cache:
+			return self._cache['recipient_address']
+
+		buffer = self._buffer[self._recipient_address_offset:]
+		recipient_address = UnresolvedAddress.deserialize(buffer)
+		self._cache['recipient_address'] = recipient_address
+		return recipient_address
+
+	@property
+	def secret(self) -> Hash256:
+		if 'secret' in self._cache:
+			return self._cache['secret']
+
+		buffer = self._buffer[self._secret_offset:]
+		secret = Hash256.deserialize(buffer)
+		self._cache['secret'] = secret
+		return secret
+
+	@property
+	def hash_algorithm(self) -> LockHashAlgorithm:
+		if 'hash_algorithm' in self._cache:
+			return self._cache['hash_algorithm']
+
+		buffer = self._buffer[self._hash_algorithm_offset:]
+		hash_algorithm = LockHashAlgorithm.deserialize(buffer)
+		self._cache['hash_algorithm'] = hash_algorithm
+		return hash_algorithm
+
+	@property
+	def proof(self) -> bytes:
+		if 'proof' in self._cache:
+			return self._cache['proof']
+
+		buffer = self._buffer[self._proof_offset:]
+		proof_size = self._proof_size
+		proof = ArrayHelpers.get_bytes(buffer, proof_size)
+		self._cache['proof'] = proof
+		return proof
+
+
 class AccountMetadataTransactionV1(Transaction):
+	__slots__ = ('_target_address', '_scoped_metadata_key', '_value_size_delta', '_value')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.ACCOUNT_METADATA
 	TYPE_HINTS = {
@@ -5281,15 +8660,25 @@ class AccountMetadataTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._target_address.serialize()
-		buffer += self._scoped_metadata_key.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._value_size_delta.to_bytes(2, byteorder='little', signed=True)
-		buffer += len(self._value).to_bytes(2, byteorder='little', signed=False)  # value_size
-		buffer += self._value
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._target_address.serialize_into(buffer, offset)
+		buffer[offset:offset + 8] = self._scoped_metadata_key.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		buffer[offset:offset + 2] = self._value_size_delta.to_bytes(2, byteorder='little', signed=True)
+		offset += 2
+		buffer[offset:offset + 2] = len(self._value).to_bytes(2, byteorder='little', signed=False)  # value_size
+		offset += 2
+		buffer[offset:offset + len(self._value)] = self._value
+		offset += len(self._value)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -5301,7 +8690,76 @@ class AccountMetadataTransactionV1(Transaction):
 		return result
 
 
+class AccountMetadataTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 36:
+			raise ValueError(f'payload size {len(buffer)} is smaller than AccountMetadataTransactionV1 size {offset + 36}')
+
+		self._target_address_offset = offset
+		offset += 24
+		self._scoped_metadata_key_offset = offset
+		offset += 8
+		self._value_size_delta_offset = offset
+		offset += 2
+		value_size = int.from_bytes(buffer[offset:offset + 2], byteorder='little', signed=False)
+		offset += 2
+		self._value_offset = offset
+		offset += value_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than AccountMetadataTransactionV1 size {offset}')
+
+		self._value_size = value_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def target_address(self) -> UnresolvedAddress:
+		if 'target_address' in self._cache:
+			return self._cache['target_address']
+
+		buffer = self._buffer[self._target_address_offset:]
+		target_address = UnresolvedAddress.deserialize(buffer)
+		self._cache['target_address'] = target_address
+		return target_address
+
+	@property
+	def scoped_metadata_key(self) -> int:
+		if 'scoped_metadata_key' in self._cache:
+			return self._cache['scoped_metadata_key']
+
+		buffer = self._buffer[self._scoped_metadata_key_offset:]
+		scoped_metadata_key = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['scoped_metadata_key'] = scoped_metadata_key
+		return scoped_metadata_key
+
+	@property
+	def value_size_delta(self) -> int:
+		if 'value_size_delta' in self._cache:
+			return self._cache['value_size_delta']
+
+		buffer = self._buffer[self._value_size_delta_offset:]
+		value_size_delta = int.from_bytes(buffer[:2], byteorder='little', signed=True)
+		self._cache['value_size_delta'] = value_size_delta
+		return value_size_delta
+
+	@property
+	def value(self) -> bytes:
+		if 'value' in self._cache:
+			return self._cache['value']
+
+		buffer = self._buffer[self._value_offset:]
+		value_size = self._value_size
+		value = ArrayHelpers.get_bytes(buffer, value_size)
+		self._cache['value'] = value
+		return value
+
+
 class EmbeddedAccountMetadataTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_target_address', '_scoped_metadata_key', '_value_size_delta', '_value')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.ACCOUNT_METADATA
 	TYPE_HINTS = {
@@ -5390,15 +8848,25 @@ class EmbeddedAccountMetadataTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._target_address.serialize()
-		buffer += self._scoped_metadata_key.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._value_size_delta.to_bytes(2, byteorder='little', signed=True)
-		buffer += len(self._value).to_bytes(2, byteorder='little', signed=False)  # value_size
-		buffer += self._value
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._target_address.serialize_into(buffer, offset)
+		buffer[offset:offset + 8] = self._scoped_metadata_key.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		buffer[offset:offset + 2] = self._value_size_delta.to_bytes(2, byteorder='little', signed=True)
+		offset += 2
+		buffer[offset:offset + 2] = len(self._value).to_bytes(2, byteorder='little', signed=False)  # value_size
+		offset += 2
+		buffer[offset:offset + len(self._value)] = self._value
+		offset += len(self._value)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -5410,7 +8878,76 @@ class EmbeddedAccountMetadataTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedAccountMetadataTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 36:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedAccountMetadataTransactionV1 size {offset + 36}')
+
+		self._target_address_offset = offset
+		offset += 24
+		self._scoped_metadata_key_offset = offset
+		offset += 8
+		self._value_size_delta_offset = offset
+		offset += 2
+		value_size = int.from_bytes(buffer[offset:offset + 2], byteorder='little', signed=False)
+		offset += 2
+		self._value_offset = offset
+		offset += value_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedAccountMetadataTransactionV1 size {offset}')
+
+		self._value_size = value_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def target_address(self) -> UnresolvedAddress:
+		if 'target_address' in self._cache:
+			return self._cache['target_address']
+
+		buffer = self._buffer[self._target_address_offset:]
+		target_address = UnresolvedAddress.deserialize(buffer)
+		self._cache['target_address'] = target_address
+		return target_address
+
+	@property
+	def scoped_metadata_key(self) -> int:
+		if 'scoped_metadata_key' in self._cache:
+			return self._cache['scoped_metadata_key']
+
+		buffer = self._buffer[self._scoped_metadata_key_offset:]
+		scoped_metadata_key = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['scoped_metadata_key'] = scoped_metadata_key
+		return scoped_metadata_key
+
+	@property
+	def value_size_delta(self) -> int:
+		if 'value_size_delta' in self._cache:
+			return self._cache['value_size_delta']
+
+		buffer = self._buffer[self._value_size_delta_offset:]
+		value_size_delta = int.from_bytes(buffer[:2], byteorder='little', signed=True)
+		self._cache['value_size_delta'] = value_size_delta
+		return value_size_delta
+
+	@property
+	def value(self) -> bytes:
+		if 'value' in self._cache:
+			return self._cache['value']
+
+		buffer = self._buffer[self._value_offset:]
+		value_size = self._value_size
+		value = ArrayHelpers.get_bytes(buffer, value_size)
+		self._cache['value'] = value
+		return value
+
+
 class MosaicMetadataTransactionV1(Transaction):
+	__slots__ = ('_target_address', '_scoped_metadata_key', '_target_mosaic_id', '_value_size_delta', '_value')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_METADATA
 	TYPE_HINTS = {
@@ -5513,16 +9050,26 @@ class MosaicMetadataTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._target_address.serialize()
-		buffer += self._scoped_metadata_key.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._target_mosaic_id.serialize()
-		buffer += self._value_size_delta.to_bytes(2, byteorder='little', signed=True)
-		buffer += len(self._value).to_bytes(2, byteorder='little', signed=False)  # value_size
-		buffer += self._value
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._target_address.serialize_into(buffer, offset)
+		buffer[offset:offset + 8] = self._scoped_metadata_key.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		offset = self._target_mosaic_id.serialize_into(buffer, offset)
+		buffer[offset:offset + 2] = self._value_size_delta.to_bytes(2, byteorder='little', signed=True)
+		offset += 2
+		buffer[offset:offset + 2] = len(self._value).to_bytes(2, byteorder='little', signed=False)  # value_size
+		offset += 2
+		buffer[offset:offset + len(self._value)] = self._value
+		offset += len(self._value)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -5535,7 +9082,88 @@ class MosaicMetadataTransactionV1(Transaction):
 		return result
 
 
+class MosaicMetadataTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 44:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicMetadataTransactionV1 size {offset + 44}')
+
+		self._target_address_offset = offset
+		offset += 24
+		self._scoped_metadata_key_offset = offset
+		offset += 8
+		self._target_mosaic_id_offset = offset
+		offset += 8
+		self._value_size_delta_offset = offset
+		offset += 2
+		value_size = int.from_bytes(buffer[offset:offset + 2], byteorder='little', signed=False)
+		offset += 2
+		self._value_offset = offset
+		offset += value_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicMetadataTransactionV1 size {offset}')
+
+		self._value_size = value_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def target_address(self) -> UnresolvedAddress:
+		if 'target_address' in self._cache:
+			return self._cache['target_address']
+
+		buffer = self._buffer[self._target_address_offset:]
+		target_address = UnresolvedAddress.deserialize(buffer)
+		self._cache['target_address'] = target_address
+		return target_address
+
+	@property
+	def scoped_metadata_key(self) -> int:
+		if 'scoped_metadata_key' in self._cache:
+			return self._cache['scoped_metadata_key']
+
+		buffer = self._buffer[self._scoped_metadata_key_offset:]
+		scoped_metadata_key = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['scoped_metadata_key'] = scoped_metadata_key
+		return scoped_metadata_key
+
+	@property
+	def target_mosaic_id(self) -> UnresolvedMosaicId:
+		if 'target_mosaic_id' in self._cache:
+			return self._cache['target_mosaic_id']
+
+		buffer = self._buffer[self._target_mosaic_id_offset:]
+		target_mosaic_id = UnresolvedMosaicId.deserialize(buffer)
+		self._cache['target_mosaic_id'] = target_mosaic_id
+		return target_mosaic_id
+
+	@property
+	def value_size_delta(self) -> int:
+		if 'value_size_delta' in self._cache:
+			return self._cache['value_size_delta']
+
+		buffer = self._buffer[self._value_size_delta_offset:]
+		value_size_delta = int.from_bytes(buffer[:2], byteorder='little', signed=True)
+		self._cache['value_size_delta'] = value_size_delta
+		return value_size_delta
+
+	@property
+	def value(self) -> bytes:
+		if 'value' in self._cache:
+			return self._cache['value']
+
+		buffer = self._buffer[self._value_offset:]
+		value_size = self._value_size
+		value = ArrayHelpers.get_bytes(buffer, value_size)
+		self._cache['value'] = value
+		return value
+
+
 class EmbeddedMosaicMetadataTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_target_address', '_scoped_metadata_key', '_target_mosaic_id', '_value_size_delta', '_value')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_METADATA
 	TYPE_HINTS = {
@@ -5638,16 +9266,26 @@ class EmbeddedMosaicMetadataTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._target_address.serialize()
-		buffer += self._scoped_metadata_key.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._target_mosaic_id.serialize()
-		buffer += self._value_size_delta.to_bytes(2, byteorder='little', signed=True)
-		buffer += len(self._value).to_bytes(2, byteorder='little', signed=False)  # value_size
-		buffer += self._value
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._target_address.serialize_into(buffer, offset)
+		buffer[offset:offset + 8] = self._scoped_metadata_key.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		offset = self._target_mosaic_id.serialize_into(buffer, offset)
+		buffer[offset:offset + 2] = self._value_size_delta.to_bytes(2, byteorder='little', signed=True)
+		offset += 2
+		buffer[offset:offset + 2] = len(self._value).to_bytes(2, byteorder='little', signed=False)  # value_size
+		offset += 2
+		buffer[offset:offset + len(self._value)] = self._value
+		offset += len(self._value)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -5660,7 +9298,88 @@ class EmbeddedMosaicMetadataTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedMosaicMetadataTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 44:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedMosaicMetadataTransactionV1 size {offset + 44}')
+
+		self._target_address_offset = offset
+		offset += 24
+		self._scoped_metadata_key_offset = offset
+		offset += 8
+		self._target_mosaic_id_offset = offset
+		offset += 8
+		self._value_size_delta_offset = offset
+		offset += 2
+		value_size = int.from_bytes(buffer[offset:offset + 2], byteorder='little', signed=False)
+		offset += 2
+		self._value_offset = offset
+		offset += value_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedMosaicMetadataTransactionV1 size {offset}')
+
+		self._value_size = value_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def target_address(self) -> UnresolvedAddress:
+		if 'target_address' in self._cache:
+			return self._cache['target_address']
+
+		buffer = self._buffer[self._target_address_offset:]
+		target_address = UnresolvedAddress.deserialize(buffer)
+		self._cache['target_address'] = target_address
+		return target_address
+
+	@property
+	def scoped_metadata_key(self) -> int:
+		if 'scoped_metadata_key' in self._cache:
+			return self._cache['scoped_metadata_key']
+
+		buffer = self._buffer[self._scoped_metadata_key_offset:]
+		scoped_metadata_key = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['scoped_metadata_key'] = scoped_metadata_key
+		return scoped_metadata_key
+
+	@property
+	def target_mosaic_id(self) -> UnresolvedMosaicId:
+		if 'target_mosaic_id' in self._cache:
+			return self._cache['target_mosaic_id']
+
+		buffer = self._buffer[self._target_mosaic_id_offset:]
+		target_mosaic_id = UnresolvedMosaicId.deserialize(buffer)
+		self._cache['target_mosaic_id'] = target_mosaic_id
+		return target_mosaic_id
+
+	@property
+	def value_size_delta(self) -> int:
+		if 'value_size_delta' in self._cache:
+			return self._cache['value_size_delta']
+
+		buffer = self._buffer[self._value_size_delta_offset:]
+		value_size_delta = int.from_bytes(buffer[:2], byteorder='little', signed=True)
+		self._cache['value_size_delta'] = value_size_delta
+		return value_size_delta
+
+	@property
+	def value(self) -> bytes:
+		if 'value' in self._cache:
+			return self._cache['value']
+
+		buffer = self._buffer[self._value_offset:]
+		value_size = self._value_size
+		value = ArrayHelpers.get_bytes(buffer, value_size)
+		self._cache['value'] = value
+		return value
+
+
 class NamespaceMetadataTransactionV1(Transaction):
+	__slots__ = ('_target_address', '_scoped_metadata_key', '_target_namespace_id', '_value_size_delta', '_value')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.NAMESPACE_METADATA
 	TYPE_HINTS = {
@@ -5763,16 +9482,26 @@ class NamespaceMetadataTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._target_address.serialize()
-		buffer += self._scoped_metadata_key.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._target_namespace_id.serialize()
-		buffer += self._value_size_delta.to_bytes(2, byteorder='little', signed=True)
-		buffer += len(self._value).to_bytes(2, byteorder='little', signed=False)  # value_size
-		buffer += self._value
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._target_address.serialize_into(buffer, offset)
+		buffer[offset:offset + 8] = self._scoped_metadata_key.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		offset = self._target_namespace_id.serialize_into(buffer, offset)
+		buffer[offset:offset + 2] = self._value_size_delta.to_bytes(2, byteorder='little', signed=True)
+		offset += 2
+		buffer[offset:offset + 2] = len(self._value).to_bytes(2, byteorder='little', signed=False)  # value_size
+		offset += 2
+		buffer[offset:offset + len(self._value)] = self._value
+		offset += len(self._value)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -5785,7 +9514,88 @@ class NamespaceMetadataTransactionV1(Transaction):
 		return result
 
 
+class NamespaceMetadataTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 44:
+			raise ValueError(f'payload size {len(buffer)} is smaller than NamespaceMetadataTransactionV1 size {offset + 44}')
+
+		self._target_address_offset = offset
+		offset += 24
+		self._scoped_metadata_key_offset = offset
+		offset += 8
+		self._target_namespace_id_offset = offset
+		offset += 8
+		self._value_size_delta_offset = offset
+		offset += 2
+		value_size = int.from_bytes(buffer[offset:offset + 2], byteorder='little', signed=False)
+		offset += 2
+		self._value_offset = offset
+		offset += value_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than NamespaceMetadataTransactionV1 size {offset}')
+
+		self._value_size = value_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def target_address(self) -> UnresolvedAddress:
+		if 'target_address' in self._cache:
+			return self._cache['target_address']
+
+		buffer = self._buffer[self._target_address_offset:]
+		target_address = UnresolvedAddress.deserialize(buffer)
+		self._cache['target_address'] = target_address
+		return target_address
+
+	@property
+	def scoped_metadata_key(self) -> int:
+		if 'scoped_metadata_key' in self._cache:
+			return self._cache['scoped_metadata_key']
+
+		buffer = self._buffer[self._scoped_metadata_key_offset:]
+		scoped_metadata_key = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['scoped_metadata_key'] = scoped_metadata_key
+		return scoped_metadata_key
+
+	@property
+	def target_namespace_id(self) -> NamespaceId:
+		if 'target_namespace_id' in self._cache:
+			return self._cache['target_namespace_id']
+
+		buffer = self._buffer[self._target_namespace_id_offset:]
+		target_namespace_id = NamespaceId.deserialize(buffer)
+		self._cache['target_namespace_id'] = target_namespace_id
+		return target_namespace_id
+
+	@property
+	def value_size_delta(self) -> int:
+		if 'value_size_delta' in self._cache:
+			return self._cache['value_size_delta']
+
+		buffer = self._buffer[self._value_size_delta_offset:]
+		value_size_delta = int.from_bytes(buffer[:2], byteorder='little', signed=True)
+		self._cache['value_size_delta'] = value_size_delta
+		return value_size_delta
+
+	@property
+	def value(self) -> bytes:
+		if 'value' in self._cache:
+			return self._cache['value']
+
+		buffer = self._buffer[self._value_offset:]
+		value_size = self._value_size
+		value = ArrayHelpers.get_bytes(buffer, value_size)
+		self._cache['value'] = value
+		return value
+
+
 class EmbeddedNamespaceMetadataTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_target_address', '_scoped_metadata_key', '_target_namespace_id', '_value_size_delta', '_value')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.NAMESPACE_METADATA
 	TYPE_HINTS = {
@@ -5888,16 +9698,26 @@ class EmbeddedNamespaceMetadataTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._target_address.serialize()
-		buffer += self._scoped_metadata_key.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._target_namespace_id.serialize()
-		buffer += self._value_size_delta.to_bytes(2, byteorder='little', signed=True)
-		buffer += len(self._value).to_bytes(2, byteorder='little', signed=False)  # value_size
-		buffer += self._value
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._target_address.serialize_into(buffer, offset)
+		buffer[offset:offset + 8] = self._scoped_metadata_key.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		offset = self._target_namespace_id.serialize_into(buffer, offset)
+		buffer[offset:offset + 2] = self._value_size_delta.to_bytes(2, byteorder='little', signed=True)
+		offset += 2
+		buffer[offset:offset + 2] = len(self._value).to_bytes(2, byteorder='little', signed=False)  # value_size
+		offset += 2
+		buffer[offset:offset + len(self._value)] = self._value
+		offset += len(self._value)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -5910,7 +9730,91 @@ class EmbeddedNamespaceMetadataTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedNamespaceMetadataTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 44:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedNamespaceMetadataTransactionV1 size {offset + 44}')
+
+		self._target_address_offset = offset
+		offset += 24
+		self._scoped_metadata_key_offset = offset
+		offset += 8
+		self._target_namespace_id_offset = offset
+		offset += 8
+		self._value_size_delta_offset = offset
+		offset += 2
+		value_size = int.from_bytes(buffer[offset:offset + 2], byteorder='little', signed=False)
+		offset += 2
+		self._value_offset = offset
+		offset += value_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedNamespaceMetadataTransactionV1 size {offset}')
+
+		self._value_size = value_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def target_address(self) -> UnresolvedAddress:
+		if 'target_address' in self._cache:
+			return self._cache['target_address']
+
+		buffer = self._buffer[self._target_address_offset:]
+		target_address = UnresolvedAddress.deserialize(buffer)
+		self._cache['target_address'] = target_address
+		return target_address
+
+	@property
+	def scoped_metadata_key(self) -> int:
+		if 'scoped_metadata_key' in self._cache:
+			return self._cache['scoped_metadata_key']
+
+		buffer = self._buffer[self._scoped_metadata_key_offset:]
+		scoped_metadata_key = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['scoped_metadata_key'] = scoped_metadata_key
+		return scoped_metadata_key
+
+	@property
+	def target_namespace_id(self) -> NamespaceId:
+		if 'target_namespace_id' in self._cache:
+			return self._cache['target_namespace_id']
+
+		buffer = self._buffer[self._target_namespace_id_offset:]
+		target_namespace_id = NamespaceId.deserialize(buffer)
+		self._cache['target_namespace_id'] = target_namespace_id
+		return target_namespace_id
+
+	@property
+	def value_size_delta(self) -> int:
+		if 'value_size_delta' in self._cache:
+			return self._cache['value_size_delta']
+
+		buffer = self._buffer[self._value_size_delta_offset:]
+		value_size_delta = int.from_bytes(buffer[:2], byteorder='little', signed=True)
+		self._cache['value_size_delta'] = value_size_delta
+		return value_size_delta
+
+	@property
+	def value(self) -> bytes:
+		if 'value' in self._cache:
+			return self._cache['value']
+
+		buffer = self._buffer[self._value_offset:]
+		value_size = self._value_size
+		value = ArrayHelpers.get_bytes(buffer, value_size)
+		self._cache['value'] = value
+		return value
+
+
+_MOSAIC_NONCE_CODEC = Struct('<I')
+
+
 class MosaicNonce(BaseValue):
+	__slots__ = ()
 	SIZE = 4
 
 	def __init__(self, mosaic_nonce: int = 0):
@@ -5918,11 +9822,17 @@ class MosaicNonce(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> MosaicNonce:
-		buffer = memoryview(payload)
-		return MosaicNonce(int.from_bytes(buffer[:4], byteorder='little', signed=False))
+		if len(payload) < 4:
+			raise ValueError(f'payload size {len(payload)} is smaller than MosaicNonce size 4')
+
+		return MosaicNonce.from_trusted(_MOSAIC_NONCE_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(4, byteorder='little', signed=False)
+		return _MOSAIC_NONCE_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_MOSAIC_NONCE_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 4
 
 
 class MosaicFlags(Flag):
@@ -5946,6 +9856,10 @@ class MosaicFlags(Flag):
 		buffer += self.value.to_bytes(1, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 1] = self.value.to_bytes(1, byteorder='little', signed=False)
+		return offset + 1
+
 
 class MosaicSupplyChangeAction(Enum):
 	DECREASE = 0
@@ -5965,8 +9879,13 @@ class MosaicSupplyChangeAction(Enum):
 		buffer += self.value.to_bytes(1, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 1] = self.value.to_bytes(1, byteorder='little', signed=False)
+		return offset + 1
+
 
 class MosaicDefinitionTransactionV1(Transaction):
+	__slots__ = ('_id', '_duration', '_nonce', '_flags', '_divisibility')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_DEFINITION
 	TYPE_HINTS = {
@@ -6067,15 +9986,22 @@ class MosaicDefinitionTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._id.serialize()
-		buffer += self._duration.serialize()
-		buffer += self._nonce.serialize()
-		buffer += self._flags.serialize()
-		buffer += self._divisibility.to_bytes(1, byteorder='little', signed=False)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._id.serialize_into(buffer, offset)
+		offset = self._duration.serialize_into(buffer, offset)
+		offset = self._nonce.serialize_into(buffer, offset)
+		offset = self._flags.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = self._divisibility.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -6088,7 +10014,81 @@ class MosaicDefinitionTransactionV1(Transaction):
 		return result
 
 
+class MosaicDefinitionTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 22:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicDefinitionTransactionV1 size {offset + 22}')
+
+		self._id_offset = offset
+		offset += 8
+		self._duration_offset = offset
+		offset += 8
+		self._nonce_offset = offset
+		offset += 4
+		self._flags_offset = offset
+		offset += 1
+		self._divisibility_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def id(self) -> MosaicId:
+		if 'id' in self._cache:
+			return self._cache['id']
+
+		buffer = self._buffer[self._id_offset:]
+		id = MosaicId.deserialize(buffer)
+		self._cache['id'] = id
+		return id
+
+	@property
+	def duration(self) -> BlockDuration:
+		if 'duration' in self._cache:
+			return self._cache['duration']
+
+		buffer = self._buffer[self._duration_offset:]
+		duration = BlockDuration.deserialize(buffer)
+		self._cache['duration'] = duration
+		return duration
+
+	@property
+	def nonce(self) -> MosaicNonce:
+		if 'nonce' in self._cache:
+			return self._cache['nonce']
+
+		buffer = self._buffer[self._nonce_offset:]
+		nonce = MosaicNonce.deserialize(buffer)
+		self._cache['nonce'] = nonce
+		return nonce
+
+	@property
+	def flags(self) -> MosaicFlags:
+		if 'flags' in self._cache:
+			return self._cache['flags']
+
+		buffer = self._buffer[self._flags_offset:]
+		flags = MosaicFlags.deserialize(buffer)
+		self._cache['flags'] = flags
+		return flags
+
+	@property
+	def divisibility(self) -> int:
+		if 'divisibility' in self._cache:
+			return self._cache['divisibility']
+
+		buffer = self._buffer[self._divisibility_offset:]
+		divisibility = int.from_bytes(buffer[:1], byteorder='little', signed=False)
+		self._cache['divisibility'] = divisibility
+		return divisibility
+
+
 class EmbeddedMosaicDefinitionTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_id', '_duration', '_nonce', '_flags', '_divisibility')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_DEFINITION
 	TYPE_HINTS = {
@@ -6189,15 +10189,22 @@ class EmbeddedMosaicDefinitionTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._id.serialize()
-		buffer += self._duration.serialize()
-		buffer += self._nonce.serialize()
-		buffer += self._flags.serialize()
-		buffer += self._divisibility.to_bytes(1, byteorder='little', signed=False)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._id.serialize_into(buffer, offset)
+		offset = self._duration.serialize_into(buffer, offset)
+		offset = self._nonce.serialize_into(buffer, offset)
+		offset = self._flags.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = self._divisibility.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -6210,7 +10217,81 @@ class EmbeddedMosaicDefinitionTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedMosaicDefinitionTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 22:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedMosaicDefinitionTransactionV1 size {offset + 22}')
+
+		self._id_offset = offset
+		offset += 8
+		self._duration_offset = offset
+		offset += 8
+		self._nonce_offset = offset
+		offset += 4
+		self._flags_offset = offset
+		offset += 1
+		self._divisibility_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def id(self) -> MosaicId:
+		if 'id' in self._cache:
+			return self._cache['id']
+
+		buffer = self._buffer[self._id_offset:]
+		id = MosaicId.deserialize(buffer)
+		self._cache['id'] = id
+		return id
+
+	@property
+	def duration(self) -> BlockDuration:
+		if 'duration' in self._cache:
+			return self._cache['duration']
+
+		buffer = self._buffer[self._duration_offset:]
+		duration = BlockDuration.deserialize(buffer)
+		self._cache['duration'] = duration
+		return duration
+
+	@property
+	def nonce(self) -> MosaicNonce:
+		if 'nonce' in self._cache:
+			return self._cache['nonce']
+
+		buffer = self._buffer[self._nonce_offset:]
+		nonce = MosaicNonce.deserialize(buffer)
+		self._cache['nonce'] = nonce
+		return nonce
+
+	@property
+	def flags(self) -> MosaicFlags:
+		if 'flags' in self._cache:
+			return self._cache['flags']
+
+		buffer = self._buffer[self._flags_offset:]
+		flags = MosaicFlags.deserialize(buffer)
+		self._cache['flags'] = flags
+		return flags
+
+	@property
+	def divisibility(self) -> int:
+		if 'divisibility' in self._cache:
+			return self._cache['divisibility']
+
+		buffer = self._buffer[self._divisibility_offset:]
+		divisibility = int.from_bytes(buffer[:1], byteorder='little', signed=False)
+		self._cache['divisibility'] = divisibility
+		return divisibility
+
+
 class MosaicSupplyChangeTransactionV1(Transaction):
+	__slots__ = ('_mosaic_id', '_delta', '_action')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_SUPPLY_CHANGE
 	TYPE_HINTS = {
@@ -6284,13 +10365,19 @@ class MosaicSupplyChangeTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic_id.serialize()
-		buffer += self._delta.serialize()
-		buffer += self._action.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic_id.serialize_into(buffer, offset)
+		offset = self._delta.serialize_into(buffer, offset)
+		offset = self._action.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -6301,7 +10388,57 @@ class MosaicSupplyChangeTransactionV1(Transaction):
 		return result
 
 
+class MosaicSupplyChangeTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 17:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicSupplyChangeTransactionV1 size {offset + 17}')
+
+		self._mosaic_id_offset = offset
+		offset += 8
+		self._delta_offset = offset
+		offset += 8
+		self._action_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic_id(self) -> UnresolvedMosaicId:
+		if 'mosaic_id' in self._cache:
+			return self._cache['mosaic_id']
+
+		buffer = self._buffer[self._mosaic_id_offset:]
+		mosaic_id = UnresolvedMosaicId.deserialize(buffer)
+		self._cache['mosaic_id'] = mosaic_id
+		return mosaic_id
+
+	@property
+	def delta(self) -> Amount:
+		if 'delta' in self._cache:
+			return self._cache['delta']
+
+		buffer = self._buffer[self._delta_offset:]
+		delta = Amount.deserialize(buffer)
+		self._cache['delta'] = delta
+		return delta
+
+	@property
+	def action(self) -> MosaicSupplyChangeAction:
+		if 'action' in self._cache:
+			return self._cache['action']
+
+		buffer = self._buffer[self._action_offset:]
+		action = MosaicSupplyChangeAction.deserialize(buffer)
+		self._cache['action'] = action
+		return action
+
+
 class EmbeddedMosaicSupplyChangeTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_mosaic_id', '_delta', '_action')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_SUPPLY_CHANGE
 	TYPE_HINTS = {
@@ -6375,13 +10512,19 @@ class EmbeddedMosaicSupplyChangeTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic_id.serialize()
-		buffer += self._delta.serialize()
-		buffer += self._action.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic_id.serialize_into(buffer, offset)
+		offset = self._delta.serialize_into(buffer, offset)
+		offset = self._action.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -6392,7 +10535,57 @@ class EmbeddedMosaicSupplyChangeTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedMosaicSupplyChangeTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 17:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedMosaicSupplyChangeTransactionV1 size {offset + 17}')
+
+		self._mosaic_id_offset = offset
+		offset += 8
+		self._delta_offset = offset
+		offset += 8
+		self._action_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic_id(self) -> UnresolvedMosaicId:
+		if 'mosaic_id' in self._cache:
+			return self._cache['mosaic_id']
+
+		buffer = self._buffer[self._mosaic_id_offset:]
+		mosaic_id = UnresolvedMosaicId.deserialize(buffer)
+		self._cache['mosaic_id'] = mosaic_id
+		return mosaic_id
+
+	@property
+	def delta(self) -> Amount:
+		if 'delta' in self._cache:
+			return self._cache['delta']
+
+		buffer = self._buffer[self._delta_offset:]
+		delta = Amount.deserialize(buffer)
+		self._cache['delta'] = delta
+		return delta
+
+	@property
+	def action(self) -> MosaicSupplyChangeAction:
+		if 'action' in self._cache:
+			return self._cache['action']
+
+		buffer = self._buffer[self._action_offset:]
+		action = MosaicSupplyChangeAction.deserialize(buffer)
+		self._cache['action'] = action
+		return action
+
+
 class MosaicSupplyRevocationTransactionV1(Transaction):
+	__slots__ = ('_source_address', '_mosaic')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_SUPPLY_REVOCATION
 	TYPE_HINTS = {
@@ -6452,12 +10645,18 @@ class MosaicSupplyRevocationTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._source_address.serialize()
-		buffer += self._mosaic.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._source_address.serialize_into(buffer, offset)
+		offset = self._mosaic.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -6467,7 +10666,45 @@ class MosaicSupplyRevocationTransactionV1(Transaction):
 		return result
 
 
+class MosaicSupplyRevocationTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicSupplyRevocationTransactionV1 size {offset + 40}')
+
+		self._source_address_offset = offset
+		offset += 24
+		self._mosaic_offset = offset
+		offset += 16
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def source_address(self) -> UnresolvedAddress:
+		if 'source_address' in self._cache:
+			return self._cache['source_address']
+
+		buffer = self._buffer[self._source_address_offset:]
+		source_address = UnresolvedAddress.deserialize(buffer)
+		self._cache['source_address'] = source_address
+		return source_address
+
+	@property
+	def mosaic(self) -> UnresolvedMosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic = UnresolvedMosaic.deserialize(buffer)
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+
 class EmbeddedMosaicSupplyRevocationTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_source_address', '_mosaic')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_SUPPLY_REVOCATION
 	TYPE_HINTS = {
@@ -6527,12 +10764,18 @@ class EmbeddedMosaicSupplyRevocationTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._source_address.serialize()
-		buffer += self._mosaic.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._source_address.serialize_into(buffer, offset)
+		offset = self._mosaic.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -6542,7 +10785,51 @@ class EmbeddedMosaicSupplyRevocationTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedMosaicSupplyRevocationTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 40:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedMosaicSupplyRevocationTransactionV1 size {offset + 40}')
+
+		self._source_address_offset = offset
+		offset += 24
+		self._mosaic_offset = offset
+		offset += 16
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def source_address(self) -> UnresolvedAddress:
+		if 'source_address' in self._cache:
+			return self._cache['source_address']
+
+		buffer = self._buffer[self._source_address_offset:]
+		source_address = UnresolvedAddress.deserialize(buffer)
+		self._cache['source_address'] = source_address
+		return source_address
+
+	@property
+	def mosaic(self) -> UnresolvedMosaic:
+		if 'mosaic' in self._cache:
+			return self._cache['mosaic']
+
+		buffer = self._buffer[self._mosaic_offset:]
+		mosaic = UnresolvedMosaic.deserialize(buffer)
+		self._cache['mosaic'] = mosaic
+		return mosaic
+
+
 class MultisigAccountModificationTransactionV1(Transaction):
+	__slots__ = (
+		'_min_removal_delta',
+		'_min_approval_delta',
+		'_address_additions',
+		'_address_deletions',
+		'_multisig_account_modification_transaction_body_reserved_1'
+	)
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MULTISIG_ACCOUNT_MODIFICATION
 	TYPE_HINTS = {
@@ -6639,17 +10926,28 @@ class MultisigAccountModificationTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._min_removal_delta.to_bytes(1, byteorder='little', signed=True)
-		buffer += self._min_approval_delta.to_bytes(1, byteorder='little', signed=True)
-		buffer += len(self._address_additions).to_bytes(1, byteorder='little', signed=False)  # address_additions_count
-		buffer += len(self._address_deletions).to_bytes(1, byteorder='little', signed=False)  # address_deletions_count
-		buffer += self._multisig_account_modification_transaction_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += ArrayHelpers.write_array(self._address_additions)
-		buffer += ArrayHelpers.write_array(self._address_deletions)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = self._min_removal_delta.to_bytes(1, byteorder='little', signed=True)
+		offset += 1
+		buffer[offset:offset + 1] = self._min_approval_delta.to_bytes(1, byteorder='little', signed=True)
+		offset += 1
+		buffer[offset:offset + 1] = len(self._address_additions).to_bytes(1, byteorder='little', signed=False)  # address_additions_count
+		offset += 1
+		buffer[offset:offset + 1] = len(self._address_deletions).to_bytes(1, byteorder='little', signed=False)  # address_deletions_count
+		offset += 1
+		buffer[offset:offset + 4] = self._multisig_account_modification_transaction_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._address_additions)
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._address_deletions)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -6661,7 +10959,89 @@ class MultisigAccountModificationTransactionV1(Transaction):
 		return result
 
 
+class MultisigAccountModificationTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 8:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MultisigAccountModificationTransactionV1 size {offset + 8}')
+
+		self._min_removal_delta_offset = offset
+		offset += 1
+		self._min_approval_delta_offset = offset
+		offset += 1
+		address_additions_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		address_deletions_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		multisig_account_modification_transaction_body_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert multisig_account_modification_transaction_body_reserved_1 == 0, f'Invalid value of reserved field ({multisig_account_modification_transaction_body_reserved_1})'
+		self._address_additions_offset = offset
+		offset += address_additions_count * 24
+		self._address_deletions_offset = offset
+		offset += address_deletions_count * 24
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than MultisigAccountModificationTransactionV1 size {offset}')
+
+		self._address_additions_count = address_additions_count
+		self._address_deletions_count = address_deletions_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def min_removal_delta(self) -> int:
+		if 'min_removal_delta' in self._cache:
+			return self._cache['min_removal_delta']
+
+		buffer = self._buffer[self._min_removal_delta_offset:]
+		min_removal_delta = int.from_bytes(buffer[:1], byteorder='little', signed=True)
+		self._cache['min_removal_delta'] = min_removal_delta
+		return min_removal_delta
+
+	@property
+	def min_approval_delta(self) -> int:
+		if 'min_approval_delta' in self._cache:
+			return self._cache['min_approval_delta']
+
+		buffer = self._buffer[self._min_approval_delta_offset:]
+		min_approval_delta = int.from_bytes(buffer[:1], byteorder='little', signed=True)
+		self._cache['min_approval_delta'] = min_approval_delta
+		return min_approval_delta
+
+	@property
+	def address_additions(self) -> List[UnresolvedAddress]:
+		if 'address_additions' in self._cache:
+			return self._cache['address_additions']
+
+		buffer = self._buffer[self._address_additions_offset:]
+		address_additions_count = self._address_additions_count
+		address_additions = ArrayHelpers.read_array_count(buffer, UnresolvedAddress, address_additions_count)
+		self._cache['address_additions'] = address_additions
+		return address_additions
+
+	@property
+	def address_deletions(self) -> List[UnresolvedAddress]:
+		if 'address_deletions' in self._cache:
+			return self._cache['address_deletions']
+
+		buffer = self._buffer[self._address_deletions_offset:]
+		address_deletions_count = self._address_deletions_count
+		address_deletions = ArrayHelpers.read_array_count(buffer, UnresolvedAddress, address_deletions_count)
+		self._cache['address_deletions'] = address_deletions
+		return address_deletions
+
+
 class EmbeddedMultisigAccountModificationTransactionV1(EmbeddedTransaction):
+	__slots__ = (
+		'_min_removal_delta',
+		'_min_approval_delta',
+		'_address_additions',
+		'_address_deletions',
+		'_multisig_account_modification_transaction_body_reserved_1'
+	)
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MULTISIG_ACCOUNT_MODIFICATION
 	TYPE_HINTS = {
@@ -6758,17 +11138,28 @@ class EmbeddedMultisigAccountModificationTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._min_removal_delta.to_bytes(1, byteorder='little', signed=True)
-		buffer += self._min_approval_delta.to_bytes(1, byteorder='little', signed=True)
-		buffer += len(self._address_additions).to_bytes(1, byteorder='little', signed=False)  # address_additions_count
-		buffer += len(self._address_deletions).to_bytes(1, byteorder='little', signed=False)  # address_deletions_count
-		buffer += self._multisig_account_modification_transaction_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += ArrayHelpers.write_array(self._address_additions)
-		buffer += ArrayHelpers.write_array(self._address_deletions)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = self._min_removal_delta.to_bytes(1, byteorder='little', signed=True)
+		offset += 1
+		buffer[offset:offset + 1] = self._min_approval_delta.to_bytes(1, byteorder='little', signed=True)
+		offset += 1
+		buffer[offset:offset + 1] = len(self._address_additions).to_bytes(1, byteorder='little', signed=False)  # address_additions_count
+		offset += 1
+		buffer[offset:offset + 1] = len(self._address_deletions).to_bytes(1, byteorder='little', signed=False)  # address_deletions_count
+		offset += 1
+		buffer[offset:offset + 4] = self._multisig_account_modification_transaction_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._address_additions)
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._address_deletions)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -6780,7 +11171,83 @@ class EmbeddedMultisigAccountModificationTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedMultisigAccountModificationTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 8:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedMultisigAccountModificationTransactionV1 size {offset + 8}')
+
+		self._min_removal_delta_offset = offset
+		offset += 1
+		self._min_approval_delta_offset = offset
+		offset += 1
+		address_additions_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		address_deletions_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		multisig_account_modification_transaction_body_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert multisig_account_modification_transaction_body_reserved_1 == 0, f'Invalid value of reserved field ({multisig_account_modification_transaction_body_reserved_1})'
+		self._address_additions_offset = offset
+		offset += address_additions_count * 24
+		self._address_deletions_offset = offset
+		offset += address_deletions_count * 24
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedMultisigAccountModificationTransactionV1 size {offset}')
+
+		self._address_additions_count = address_additions_count
+		self._address_deletions_count = address_deletions_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def min_removal_delta(self) -> int:
+		if 'min_removal_delta' in self._cache:
+			return self._cache['min_removal_delta']
+
+		buffer = self._buffer[self._min_removal_delta_offset:]
+		min_removal_delta = int.from_bytes(buffer[:1], byteorder='little', signed=True)
+		self._cache['min_removal_delta'] = min_removal_delta
+		return min_removal_delta
+
+	@property
+	def min_approval_delta(self) -> int:
+		if 'min_approval_delta' in self._cache:
+			return self._cache['min_approval_delta']
+
+		buffer = self._buffer[self._min_approval_delta_offset:]
+		min_approval_delta = int.from_bytes(buffer[:1], byteorder='little', signed=True)
+		self._cache['min_approval_delta'] = min_approval_delta
+		return min_approval_delta
+
+	@property
+	def address_additions(self) -> List[UnresolvedAddress]:
+		if 'address_additions' in self._cache:
+			return self._cache['address_additions']
+
+		buffer = self._buffer[self._address_additions_offset:]
+		address_additions_count = self._address_additions_count
+		address_additions = ArrayHelpers.read_array_count(buffer, UnresolvedAddress, address_additions_count)
+		self._cache['address_additions'] = address_additions
+		return address_additions
+
+	@property
+	def address_deletions(self) -> List[UnresolvedAddress]:
+		if 'address_deletions' in self._cache:
+			return self._cache['address_deletions']
+
+		buffer = self._buffer[self._address_deletions_offset:]
+		address_deletions_count = self._address_deletions_count
+		address_deletions = ArrayHelpers.read_array_count(buffer, UnresolvedAddress, address_deletions_count)
+		self._cache['address_deletions'] = address_deletions
+		return address_deletions
+
+
 class AddressAliasTransactionV1(Transaction):
+	__slots__ = ('_namespace_id', '_address', '_alias_action')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.ADDRESS_ALIAS
 	TYPE_HINTS = {
@@ -6854,13 +11321,19 @@ class AddressAliasTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._namespace_id.serialize()
-		buffer += self._address.serialize()
-		buffer += self._alias_action.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._namespace_id.serialize_into(buffer, offset)
+		offset = self._address.serialize_into(buffer, offset)
+		offset = self._alias_action.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -6871,7 +11344,57 @@ class AddressAliasTransactionV1(Transaction):
 		return result
 
 
+class AddressAliasTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 33:
+			raise ValueError(f'payload size {len(buffer)} is smaller than AddressAliasTransactionV1 size {offset + 33}')
+
+		self._namespace_id_offset = offset
+		offset += 8
+		self._address_offset = offset
+		offset += 24
+		self._alias_action_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def namespace_id(self) -> NamespaceId:
+		if 'namespace_id' in self._cache:
+			return self._cache['namespace_id']
+
+		buffer = self._buffer[self._namespace_id_offset:]
+		namespace_id = NamespaceId.deserialize(buffer)
+		self._cache['namespace_id'] = namespace_id
+		return namespace_id
+
+	@property
+	def address(self) -> Address:
+		if 'address' in self._cache:
+			return self._cache['address']
+
+		buffer = self._buffer[self._address_offset:]
+		address = Address.deserialize(buffer)
+		self._cache['address'] = address
+		return address
+
+	@property
+	def alias_action(self) -> AliasAction:
+		if 'alias_action' in self._cache:
+			return self._cache['alias_action']
+
+		buffer = self._buffer[self._alias_action_offset:]
+		alias_action = AliasAction.deserialize(buffer)
+		self._cache['alias_action'] = alias_action
+		return alias_action
+
+
 class EmbeddedAddressAliasTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_namespace_id', '_address', '_alias_action')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.ADDRESS_ALIAS
 	TYPE_HINTS = {
@@ -6945,13 +11468,19 @@ class EmbeddedAddressAliasTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._namespace_id.serialize()
-		buffer += self._address.serialize()
-		buffer += self._alias_action.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._namespace_id.serialize_into(buffer, offset)
+		offset = self._address.serialize_into(buffer, offset)
+		offset = self._alias_action.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -6962,7 +11491,57 @@ class EmbeddedAddressAliasTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedAddressAliasTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 33:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedAddressAliasTransactionV1 size {offset + 33}')
+
+		self._namespace_id_offset = offset
+		offset += 8
+		self._address_offset = offset
+		offset += 24
+		self._alias_action_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def namespace_id(self) -> NamespaceId:
+		if 'namespace_id' in self._cache:
+			return self._cache['namespace_id']
+
+		buffer = self._buffer[self._namespace_id_offset:]
+		namespace_id = NamespaceId.deserialize(buffer)
+		self._cache['namespace_id'] = namespace_id
+		return namespace_id
+
+	@property
+	def address(self) -> Address:
+		if 'address' in self._cache:
+			return self._cache['address']
+
+		buffer = self._buffer[self._address_offset:]
+		address = Address.deserialize(buffer)
+		self._cache['address'] = address
+		return address
+
+	@property
+	def alias_action(self) -> AliasAction:
+		if 'alias_action' in self._cache:
+			return self._cache['alias_action']
+
+		buffer = self._buffer[self._alias_action_offset:]
+		alias_action = AliasAction.deserialize(buffer)
+		self._cache['alias_action'] = alias_action
+		return alias_action
+
+
 class MosaicAliasTransactionV1(Transaction):
+	__slots__ = ('_namespace_id', '_mosaic_id', '_alias_action')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_ALIAS
 	TYPE_HINTS = {
@@ -7036,13 +11615,19 @@ class MosaicAliasTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._namespace_id.serialize()
-		buffer += self._mosaic_id.serialize()
-		buffer += self._alias_action.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._namespace_id.serialize_into(buffer, offset)
+		offset = self._mosaic_id.serialize_into(buffer, offset)
+		offset = self._alias_action.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -7053,7 +11638,57 @@ class MosaicAliasTransactionV1(Transaction):
 		return result
 
 
+class MosaicAliasTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 17:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicAliasTransactionV1 size {offset + 17}')
+
+		self._namespace_id_offset = offset
+		offset += 8
+		self._mosaic_id_offset = offset
+		offset += 8
+		self._alias_action_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def namespace_id(self) -> NamespaceId:
+		if 'namespace_id' in self._cache:
+			return self._cache['namespace_id']
+
+		buffer = self._buffer[self._namespace_id_offset:]
+		namespace_id = NamespaceId.deserialize(buffer)
+		self._cache['namespace_id'] = namespace_id
+		return namespace_id
+
+	@property
+	def mosaic_id(self) -> MosaicId:
+		if 'mosaic_id' in self._cache:
+			return self._cache['mosaic_id']
+
+		buffer = self._buffer[self._mosaic_id_offset:]
+		mosaic_id = MosaicId.deserialize(buffer)
+		self._cache['mosaic_id'] = mosaic_id
+		return mosaic_id
+
+	@property
+	def alias_action(self) -> AliasAction:
+		if 'alias_action' in self._cache:
+			return self._cache['alias_action']
+
+		buffer = self._buffer[self._alias_action_offset:]
+		alias_action = AliasAction.deserialize(buffer)
+		self._cache['alias_action'] = alias_action
+		return alias_action
+
+
 class EmbeddedMosaicAliasTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_namespace_id', '_mosaic_id', '_alias_action')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_ALIAS
 	TYPE_HINTS = {
@@ -7127,13 +11762,19 @@ class EmbeddedMosaicAliasTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._namespace_id.serialize()
-		buffer += self._mosaic_id.serialize()
-		buffer += self._alias_action.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._namespace_id.serialize_into(buffer, offset)
+		offset = self._mosaic_id.serialize_into(buffer, offset)
+		offset = self._alias_action.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -7144,7 +11785,57 @@ class EmbeddedMosaicAliasTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedMosaicAliasTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 17:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedMosaicAliasTransactionV1 size {offset + 17}')
+
+		self._namespace_id_offset = offset
+		offset += 8
+		self._mosaic_id_offset = offset
+		offset += 8
+		self._alias_action_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def namespace_id(self) -> NamespaceId:
+		if 'namespace_id' in self._cache:
+			return self._cache['namespace_id']
+
+		buffer = self._buffer[self._namespace_id_offset:]
+		namespace_id = NamespaceId.deserialize(buffer)
+		self._cache['namespace_id'] = namespace_id
+		return namespace_id
+
+	@property
+	def mosaic_id(self) -> MosaicId:
+		if 'mosaic_id' in self._cache:
+			return self._cache['mosaic_id']
+
+		buffer = self._buffer[self._mosaic_id_offset:]
+		mosaic_id = MosaicId.deserialize(buffer)
+		self._cache['mosaic_id'] = mosaic_id
+		return mosaic_id
+
+	@property
+	def alias_action(self) -> AliasAction:
+		if 'alias_action' in self._cache:
+			return self._cache['alias_action']
+
+		buffer = self._buffer[self._alias_action_offset:]
+		alias_action = AliasAction.deserialize(buffer)
+		self._cache['alias_action'] = alias_action
+		return alias_action
+
+
 class NamespaceRegistrationTransactionV1(Transaction):
+	__slots__ = ('_duration', '_parent_id', '_id', '_registration_type', '_name')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.NAMESPACE_REGISTRATION
 	TYPE_HINTS = {
@@ -7260,17 +11951,25 @@ class NamespaceRegistrationTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
+		return buffer
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
 		if NamespaceRegistrationType.ROOT == self.registration_type:
-			buffer += self._duration.serialize()
+			offset = self._duration.serialize_into(buffer, offset)
 		if NamespaceRegistrationType.CHILD == self.registration_type:
-			buffer += self._parent_id.serialize()
-		buffer += self._id.serialize()
-		buffer += self._registration_type.serialize()
-		buffer += len(self._name).to_bytes(1, byteorder='little', signed=False)  # name_size
-		buffer += self._name
-		return buffer
+			offset = self._parent_id.serialize_into(buffer, offset)
+		offset = self._id.serialize_into(buffer, offset)
+		offset = self._registration_type.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = len(self._name).to_bytes(1, byteorder='little', signed=False)  # name_size
+		offset += 1
+		buffer[offset:offset + len(self._name)] = self._name
+		offset += len(self._name)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
 
 	def __str__(self) -> str:
 		result = '('
@@ -7286,7 +11985,96 @@ class NamespaceRegistrationTransactionV1(Transaction):
 		return result
 
 
+class NamespaceRegistrationTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		registration_type_condition_offset = offset
+		offset += 8
+		self._id_offset = offset
+		offset += 8
+		self._registration_type_offset = offset
+		registration_type = NamespaceRegistrationType.deserialize(buffer[offset:])
+		offset += 1
+		self._duration_offset = None
+		if NamespaceRegistrationType.ROOT == registration_type:
+			self._duration_offset = registration_type_condition_offset
+		self._parent_id_offset = None
+		if NamespaceRegistrationType.CHILD == registration_type:
+			self._parent_id_offset = registration_type_condition_offset
+		name_size = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		self._name_offset = offset
+		offset += name_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than NamespaceRegistrationTransactionV1 size {offset}')
+
+		self._name_size = name_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def duration(self) -> BlockDuration:
+		if self._duration_offset is None:
+			return None
+
+		if 'duration' in self._cache:
+			return self._cache['duration']
+
+		buffer = self._buffer[self._duration_offset:]
+		duration = BlockDuration.deserialize(buffer)
+		self._cache['duration'] = duration
+		return duration
+
+	@property
+	def parent_id(self) -> NamespaceId:
+		if self._parent_id_offset is None:
+			return None
+
+		if 'parent_id' in self._cache:
+			return self._cache['parent_id']
+
+		buffer = self._buffer[self._parent_id_offset:]
+		parent_id = NamespaceId.deserialize(buffer)
+		self._cache['parent_id'] = parent_id
+		return parent_id
+
+	@property
+	def id(self) -> NamespaceId:
+		if 'id' in self._cache:
+			return self._cache['id']
+
+		buffer = self._buffer[self._id_offset:]
+		id = NamespaceId.deserialize(buffer)
+		self._cache['id'] = id
+		return id
+
+	@property
+	def registration_type(self) -> NamespaceRegistrationType:
+		if 'registration_type' in self._cache:
+			return self._cache['registration_type']
+
+		buffer = self._buffer[self._registration_type_offset:]
+		registration_type = NamespaceRegistrationType.deserialize(buffer)
+		self._cache['registration_type'] = registration_type
+		return registration_type
+
+	@property
+	def name(self) -> bytes:
+		if 'name' in self._cache:
+			return self._cache['name']
+
+		buffer = self._buffer[self._name_offset:]
+		name_size = self._name_size
+		name = ArrayHelpers.get_bytes(buffer, name_size)
+		self._cache['name'] = name
+		return name
+
+
 class EmbeddedNamespaceRegistrationTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_duration', '_parent_id', '_id', '_registration_type', '_name')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.NAMESPACE_REGISTRATION
 	TYPE_HINTS = {
@@ -7402,17 +12190,25 @@ class EmbeddedNamespaceRegistrationTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
+		return buffer
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
 		if NamespaceRegistrationType.ROOT == self.registration_type:
-			buffer += self._duration.serialize()
+			offset = self._duration.serialize_into(buffer, offset)
 		if NamespaceRegistrationType.CHILD == self.registration_type:
-			buffer += self._parent_id.serialize()
-		buffer += self._id.serialize()
-		buffer += self._registration_type.serialize()
-		buffer += len(self._name).to_bytes(1, byteorder='little', signed=False)  # name_size
-		buffer += self._name
-		return buffer
+			offset = self._parent_id.serialize_into(buffer, offset)
+		offset = self._id.serialize_into(buffer, offset)
+		offset = self._registration_type.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = len(self._name).to_bytes(1, byteorder='little', signed=False)  # name_size
+		offset += 1
+		buffer[offset:offset + len(self._name)] = self._name
+		offset += len(self._name)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
 
 	def __str__(self) -> str:
 		result = '('
@@ -7428,6 +12224,94 @@ class EmbeddedNamespaceRegistrationTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedNamespaceRegistrationTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		registration_type_condition_offset = offset
+		offset += 8
+		self._id_offset = offset
+		offset += 8
+		self._registration_type_offset = offset
+		registration_type = NamespaceRegistrationType.deserialize(buffer[offset:])
+		offset += 1
+		self._duration_offset = None
+		if NamespaceRegistrationType.ROOT == registration_type:
+			self._duration_offset = registration_type_condition_offset
+		self._parent_id_offset = None
+		if NamespaceRegistrationType.CHILD == registration_type:
+			self._parent_id_offset = registration_type_condition_offset
+		name_size = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		self._name_offset = offset
+		offset += name_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedNamespaceRegistrationTransactionV1 size {offset}')
+
+		self._name_size = name_size
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def duration(self) -> BlockDuration:
+		if self._duration_offset is None:
+			return None
+
+		if 'duration' in self._cache:
+			return self._cache['duration']
+
+		buffer = self._buffer[self._duration_offset:]
+		duration = BlockDuration.deserialize(buffer)
+		self._cache['duration'] = duration
+		return duration
+
+	@property
+	def parent_id(self) -> NamespaceId:
+		if self._parent_id_offset is None:
+			return None
+
+		if 'parent_id' in self._cache:
+			return self._cache['parent_id']
+
+		buffer = self._buffer[self._parent_id_offset:]
+		parent_id = NamespaceId.deserialize(buffer)
+		self._cache['parent_id'] = parent_id
+		return parent_id
+
+	@property
+	def id(self) -> NamespaceId:
+		if 'id' in self._cache:
+			return self._cache['id']
+
+		buffer = self._buffer[self._id_offset:]
+		id = NamespaceId.deserialize(buffer)
+		self._cache['id'] = id
+		return id
+
+	@property
+	def registration_type(self) -> NamespaceRegistrationType:
+		if 'registration_type' in self._cache:
+			return self._cache['registration_type']
+
+		buffer = self._buffer[self._registration_type_offset:]
+		registration_type = NamespaceRegistrationType.deserialize(buffer)
+		self._cache['registration_type'] = registration_type
+		return registration_type
+
+	@property
+	def name(self) -> bytes:
+		if 'name' in self._cache:
+			return self._cache['name']
+
+		buffer = self._buffer[self._name_offset:]
+		name_size = self._name_size
+		name = ArrayHelpers.get_bytes(buffer, name_size)
+		self._cache['name'] = name
+		return name
+
+
 class AccountRestrictionFlags(Flag):
 	ADDRESS = 1
 	MOSAIC_ID = 2
@@ -7449,8 +12333,13 @@ class AccountRestrictionFlags(Flag):
 		buffer += self.value.to_bytes(2, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 2] = self.value.to_bytes(2, byteorder='little', signed=False)
+		return offset + 2
+
 
 class AccountAddressRestrictionTransactionV1(Transaction):
+	__slots__ = ('_restriction_flags', '_restriction_additions', '_restriction_deletions', '_account_restriction_transaction_body_reserved_1')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.ACCOUNT_ADDRESS_RESTRICTION
 	TYPE_HINTS = {
@@ -7535,16 +12424,25 @@ class AccountAddressRestrictionTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._restriction_flags.serialize()
-		buffer += len(self._restriction_additions).to_bytes(1, byteorder='little', signed=False)  # restriction_additions_count
-		buffer += len(self._restriction_deletions).to_bytes(1, byteorder='little', signed=False)  # restriction_deletions_count
-		buffer += self._account_restriction_transaction_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += ArrayHelpers.write_array(self._restriction_additions)
-		buffer += ArrayHelpers.write_array(self._restriction_deletions)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._restriction_flags.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = len(self._restriction_additions).to_bytes(1, byteorder='little', signed=False)  # restriction_additions_count
+		offset += 1
+		buffer[offset:offset + 1] = len(self._restriction_deletions).to_bytes(1, byteorder='little', signed=False)  # restriction_deletions_count
+		offset += 1
+		buffer[offset:offset + 4] = self._account_restriction_transaction_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._restriction_additions)
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._restriction_deletions)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -7555,7 +12453,71 @@ class AccountAddressRestrictionTransactionV1(Transaction):
 		return result
 
 
+class AccountAddressRestrictionTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 8:
+			raise ValueError(f'payload size {len(buffer)} is smaller than AccountAddressRestrictionTransactionV1 size {offset + 8}')
+
+		self._restriction_flags_offset = offset
+		offset += 2
+		restriction_additions_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		restriction_deletions_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		account_restriction_transaction_body_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert account_restriction_transaction_body_reserved_1 == 0, f'Invalid value of reserved field ({account_restriction_transaction_body_reserved_1})'
+		self._restriction_additions_offset = offset
+		offset += restriction_additions_count * 24
+		self._restriction_deletions_offset = offset
+		offset += restriction_deletions_count * 24
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than AccountAddressRestrictionTransactionV1 size {offset}')
+
+		self._restriction_additions_count = restriction_additions_count
+		self._restriction_deletions_count = restriction_deletions_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def restriction_flags(self) -> AccountRestrictionFlags:
+		if 'restriction_flags' in self._cache:
+			return self._cache['restriction_flags']
+
+		buffer = self._buffer[self._restriction_flags_offset:]
+		restriction_flags = AccountRestrictionFlags.deserialize(buffer)
+		self._cache['restriction_flags'] = restriction_flags
+		return restriction_flags
+
+	@property
+	def restriction_additions(self) -> List[UnresolvedAddress]:
+		if 'restriction_additions' in self._cache:
+			return self._cache['restriction_additions']
+
+		buffer = self._buffer[self._restriction_additions_offset:]
+		restriction_additions_count = self._restriction_additions_count
+		restriction_additions = ArrayHelpers.read_array_count(buffer, UnresolvedAddress, restriction_additions_count)
+		self._cache['restriction_additions'] = restriction_additions
+		return restriction_additions
+
+	@property
+	def restriction_deletions(self) -> List[UnresolvedAddress]:
+		if 'restriction_deletions' in self._cache:
+			return self._cache['restriction_deletions']
+
+		buffer = self._buffer[self._restriction_deletions_offset:]
+		restriction_deletions_count = self._restriction_deletions_count
+		restriction_deletions = ArrayHelpers.read_array_count(buffer, UnresolvedAddress, restriction_deletions_count)
+		self._cache['restriction_deletions'] = restriction_deletions
+		return restriction_deletions
+
+
 class EmbeddedAccountAddressRestrictionTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_restriction_flags', '_restriction_additions', '_restriction_deletions', '_account_restriction_transaction_body_reserved_1')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.ACCOUNT_ADDRESS_RESTRICTION
 	TYPE_HINTS = {
@@ -7640,16 +12602,25 @@ class EmbeddedAccountAddressRestrictionTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._restriction_flags.serialize()
-		buffer += len(self._restriction_additions).to_bytes(1, byteorder='little', signed=False)  # restriction_additions_count
-		buffer += len(self._restriction_deletions).to_bytes(1, byteorder='little', signed=False)  # restriction_deletions_count
-		buffer += self._account_restriction_transaction_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += ArrayHelpers.write_array(self._restriction_additions)
-		buffer += ArrayHelpers.write_array(self._restriction_deletions)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._restriction_flags.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = len(self._restriction_additions).to_bytes(1, byteorder='little', signed=False)  # restriction_additions_count
+		offset += 1
+		buffer[offset:offset + 1] = len(self._restriction_deletions).to_bytes(1, byteorder='little', signed=False)  # restriction_deletions_count
+		offset += 1
+		buffer[offset:offset + 4] = self._account_restriction_transaction_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._restriction_additions)
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._restriction_deletions)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -7660,7 +12631,71 @@ class EmbeddedAccountAddressRestrictionTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedAccountAddressRestrictionTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 8:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedAccountAddressRestrictionTransactionV1 size {offset + 8}')
+
+		self._restriction_flags_offset = offset
+		offset += 2
+		restriction_additions_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		restriction_deletions_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		account_restriction_transaction_body_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert account_restriction_transaction_body_reserved_1 == 0, f'Invalid value of reserved field ({account_restriction_transaction_body_reserved_1})'
+		self._restriction_additions_offset = offset
+		offset += restriction_additions_count * 24
+		self._restriction_deletions_offset = offset
+		offset += restriction_deletions_count * 24
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedAccountAddressRestrictionTransactionV1 size {offset}')
+
+		self._restriction_additions_count = restriction_additions_count
+		self._restriction_deletions_count = restriction_deletions_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def restriction_flags(self) -> AccountRestrictionFlags:
+		if 'restriction_flags' in self._cache:
+			return self._cache['restriction_flags']
+
+		buffer = self._buffer[self._restriction_flags_offset:]
+		restriction_flags = AccountRestrictionFlags.deserialize(buffer)
+		self._cache['restriction_flags'] = restriction_flags
+		return restriction_flags
+
+	@property
+	def restriction_additions(self) -> List[UnresolvedAddress]:
+		if 'restriction_additions' in self._cache:
+			return self._cache['restriction_additions']
+
+		buffer = self._buffer[self._restriction_additions_offset:]
+		restriction_additions_count = self._restriction_additions_count
+		restriction_additions = ArrayHelpers.read_array_count(buffer, UnresolvedAddress, restriction_additions_count)
+		self._cache['restriction_additions'] = restriction_additions
+		return restriction_additions
+
+	@property
+	def restriction_deletions(self) -> List[UnresolvedAddress]:
+		if 'restriction_deletions' in self._cache:
+			return self._cache['restriction_deletions']
+
+		buffer = self._buffer[self._restriction_deletions_offset:]
+		restriction_deletions_count = self._restriction_deletions_count
+		restriction_deletions = ArrayHelpers.read_array_count(buffer, UnresolvedAddress, restriction_deletions_count)
+		self._cache['restriction_deletions'] = restriction_deletions
+		return restriction_deletions
+
+
 class AccountMosaicRestrictionTransactionV1(Transaction):
+	__slots__ = ('_restriction_flags', '_restriction_additions', '_restriction_deletions', '_account_restriction_transaction_body_reserved_1')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.ACCOUNT_MOSAIC_RESTRICTION
 	TYPE_HINTS = {
@@ -7745,16 +12780,25 @@ class AccountMosaicRestrictionTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._restriction_flags.serialize()
-		buffer += len(self._restriction_additions).to_bytes(1, byteorder='little', signed=False)  # restriction_additions_count
-		buffer += len(self._restriction_deletions).to_bytes(1, byteorder='little', signed=False)  # restriction_deletions_count
-		buffer += self._account_restriction_transaction_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += ArrayHelpers.write_array(self._restriction_additions)
-		buffer += ArrayHelpers.write_array(self._restriction_deletions)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._restriction_flags.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = len(self._restriction_additions).to_bytes(1, byteorder='little', signed=False)  # restriction_additions_count
+		offset += 1
+		buffer[offset:offset + 1] = len(self._restriction_deletions).to_bytes(1, byteorder='little', signed=False)  # restriction_deletions_count
+		offset += 1
+		buffer[offset:offset + 4] = self._account_restriction_transaction_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._restriction_additions)
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._restriction_deletions)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -7765,7 +12809,71 @@ class AccountMosaicRestrictionTransactionV1(Transaction):
 		return result
 
 
+class AccountMosaicRestrictionTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 8:
+			raise ValueError(f'payload size {len(buffer)} is smaller than AccountMosaicRestrictionTransactionV1 size {offset + 8}')
+
+		self._restriction_flags_offset = offset
+		offset += 2
+		restriction_additions_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		restriction_deletions_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		account_restriction_transaction_body_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert account_restriction_transaction_body_reserved_1 == 0, f'Invalid value of reserved field ({account_restriction_transaction_body_reserved_1})'
+		self._restriction_additions_offset = offset
+		offset += restriction_additions_count * 8
+		self._restriction_deletions_offset = offset
+		offset += restriction_deletions_count * 8
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than AccountMosaicRestrictionTransactionV1 size {offset}')
+
+		self._restriction_additions_count = restriction_additions_count
+		self._restriction_deletions_count = restriction_deletions_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def restriction_flags(self) -> AccountRestrictionFlags:
+		if 'restriction_flags' in self._cache:
+			return self._cache['restriction_flags']
+
+		buffer = self._buffer[self._restriction_flags_offset:]
+		restriction_flags = AccountRestrictionFlags.deserialize(buffer)
+		self._cache['restriction_flags'] = restriction_flags
+		return restriction_flags
+
+	@property
+	def restriction_additions(self) -> List[UnresolvedMosaicId]:
+		if 'restriction_additions' in self._cache:
+			return self._cache['restriction_additions']
+
+		buffer = self._buffer[self._restriction_additions_offset:]
+		restriction_additions_count = self._restriction_additions_count
+		restriction_additions = ArrayHelpers.read_array_count(buffer, UnresolvedMosaicId, restriction_additions_count)
+		self._cache['restriction_additions'] = restriction_additions
+		return restriction_additions
+
+	@property
+	def restriction_deletions(self) -> List[UnresolvedMosaicId]:
+		if 'restriction_deletions' in self._cache:
+			return self._cache['restriction_deletions']
+
+		buffer = self._buffer[self._restriction_deletions_offset:]
+		restriction_deletions_count = self._restriction_deletions_count
+		restriction_deletions = ArrayHelpers.read_array_count(buffer, UnresolvedMosaicId, restriction_deletions_count)
+		self._cache['restriction_deletions'] = restriction_deletions
+		return restriction_deletions
+
+
 class EmbeddedAccountMosaicRestrictionTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_restriction_flags', '_restriction_additions', '_restriction_deletions', '_account_restriction_transaction_body_reserved_1')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.ACCOUNT_MOSAIC_RESTRICTION
 	TYPE_HINTS = {
@@ -7850,16 +12958,25 @@ class EmbeddedAccountMosaicRestrictionTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._restriction_flags.serialize()
-		buffer += len(self._restriction_additions).to_bytes(1, byteorder='little', signed=False)  # restriction_additions_count
-		buffer += len(self._restriction_deletions).to_bytes(1, byteorder='little', signed=False)  # restriction_deletions_count
-		buffer += self._account_restriction_transaction_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += ArrayHelpers.write_array(self._restriction_additions)
-		buffer += ArrayHelpers.write_array(self._restriction_deletions)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._restriction_flags.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = len(self._restriction_additions).to_bytes(1, byteorder='little', signed=False)  # restriction_additions_count
+		offset += 1
+		buffer[offset:offset + 1] = len(self._restriction_deletions).to_bytes(1, byteorder='little', signed=False)  # restriction_deletions_count
+		offset += 1
+		buffer[offset:offset + 4] = self._account_restriction_transaction_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._restriction_additions)
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._restriction_deletions)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -7870,7 +12987,71 @@ class EmbeddedAccountMosaicRestrictionTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedAccountMosaicRestrictionTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 8:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedAccountMosaicRestrictionTransactionV1 size {offset + 8}')
+
+		self._restriction_flags_offset = offset
+		offset += 2
+		restriction_additions_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		restriction_deletions_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		account_restriction_transaction_body_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert account_restriction_transaction_body_reserved_1 == 0, f'Invalid value of reserved field ({account_restriction_transaction_body_reserved_1})'
+		self._restriction_additions_offset = offset
+		offset += restriction_additions_count * 8
+		self._restriction_deletions_offset = offset
+		offset += restriction_deletions_count * 8
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedAccountMosaicRestrictionTransactionV1 size {offset}')
+
+		self._restriction_additions_count = restriction_additions_count
+		self._restriction_deletions_count = restriction_deletions_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def restriction_flags(self) -> AccountRestrictionFlags:
+		if 'restriction_flags' in self._cache:
+			return self._cache['restriction_flags']
+
+		buffer = self._buffer[self._restriction_flags_offset:]
+		restriction_flags = AccountRestrictionFlags.deserialize(buffer)
+		self._cache['restriction_flags'] = restriction_flags
+		return restriction_flags
+
+	@property
+	def restriction_additions(self) -> List[UnresolvedMosaicId]:
+		if 'restriction_additions' in self._cache:
+			return self._cache['restriction_additions']
+
+		buffer = self._buffer[self._restriction_additions_offset:]
+		restriction_additions_count = self._restriction_additions_count
+		restriction_additions = ArrayHelpers.read_array_count(buffer, UnresolvedMosaicId, restriction_additions_count)
+		self._cache['restriction_additions'] = restriction_additions
+		return restriction_additions
+
+	@property
+	def restriction_deletions(self) -> List[UnresolvedMosaicId]:
+		if 'restriction_deletions' in self._cache:
+			return self._cache['restriction_deletions']
+
+		buffer = self._buffer[self._restriction_deletions_offset:]
+		restriction_deletions_count = self._restriction_deletions_count
+		restriction_deletions = ArrayHelpers.read_array_count(buffer, UnresolvedMosaicId, restriction_deletions_count)
+		self._cache['restriction_deletions'] = restriction_deletions
+		return restriction_deletions
+
+
 class AccountOperationRestrictionTransactionV1(Transaction):
+	__slots__ = ('_restriction_flags', '_restriction_additions', '_restriction_deletions', '_account_restriction_transaction_body_reserved_1')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.ACCOUNT_OPERATION_RESTRICTION
 	TYPE_HINTS = {
@@ -7955,16 +13136,25 @@ class AccountOperationRestrictionTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._restriction_flags.serialize()
-		buffer += len(self._restriction_additions).to_bytes(1, byteorder='little', signed=False)  # restriction_additions_count
-		buffer += len(self._restriction_deletions).to_bytes(1, byteorder='little', signed=False)  # restriction_deletions_count
-		buffer += self._account_restriction_transaction_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += ArrayHelpers.write_array(self._restriction_additions)
-		buffer += ArrayHelpers.write_array(self._restriction_deletions)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._restriction_flags.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = len(self._restriction_additions).to_bytes(1, byteorder='little', signed=False)  # restriction_additions_count
+		offset += 1
+		buffer[offset:offset + 1] = len(self._restriction_deletions).to_bytes(1, byteorder='little', signed=False)  # restriction_deletions_count
+		offset += 1
+		buffer[offset:offset + 4] = self._account_restriction_transaction_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._restriction_additions)
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._restriction_deletions)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -7975,7 +13165,71 @@ class AccountOperationRestrictionTransactionV1(Transaction):
 		return result
 
 
+class AccountOperationRestrictionTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 8:
+			raise ValueError(f'payload size {len(buffer)} is smaller than AccountOperationRestrictionTransactionV1 size {offset + 8}')
+
+		self._restriction_flags_offset = offset
+		offset += 2
+		restriction_additions_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		restriction_deletions_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		account_restriction_transaction_body_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert account_restriction_transaction_body_reserved_1 == 0, f'Invalid value of reserved field ({account_restriction_transaction_body_reserved_1})'
+		self._restriction_additions_offset = offset
+		offset += restriction_additions_count * 2
+		self._restriction_deletions_offset = offset
+		offset += restriction_deletions_count * 2
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than AccountOperationRestrictionTransactionV1 size {offset}')
+
+		self._restriction_additions_count = restriction_additions_count
+		self._restriction_deletions_count = restriction_deletions_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def restriction_flags(self) -> AccountRestrictionFlags:
+		if 'restriction_flags' in self._cache:
+			return self._cache['restriction_flags']
+
+		buffer = self._buffer[self._restriction_flags_offset:]
+		restriction_flags = AccountRestrictionFlags.deserialize(buffer)
+		self._cache['restriction_flags'] = restriction_flags
+		return restriction_flags
+
+	@property
+	def restriction_additions(self) -> List[TransactionType]:
+		if 'restriction_additions' in self._cache:
+			return self._cache['restriction_additions']
+
+		buffer = self._buffer[self._restriction_additions_offset:]
+		restriction_additions_count = self._restriction_additions_count
+		restriction_additions = ArrayHelpers.read_array_count(buffer, TransactionType, restriction_additions_count)
+		self._cache['restriction_additions'] = restriction_additions
+		return restriction_additions
+
+	@property
+	def restriction_deletions(self) -> List[TransactionType]:
+		if 'restriction_deletions' in self._cache:
+			return self._cache['restriction_deletions']
+
+		buffer = self._buffer[self._restriction_deletions_offset:]
+		restriction_deletions_count = self._restriction_deletions_count
+		restriction_deletions = ArrayHelpers.read_array_count(buffer, TransactionType, restriction_deletions_count)
+		self._cache['restriction_deletions'] = restriction_deletions
+		return restriction_deletions
+
+
 class EmbeddedAccountOperationRestrictionTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_restriction_flags', '_restriction_additions', '_restriction_deletions', '_account_restriction_transaction_body_reserved_1')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.ACCOUNT_OPERATION_RESTRICTION
 	TYPE_HINTS = {
@@ -8060,16 +13314,25 @@ class EmbeddedAccountOperationRestrictionTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._restriction_flags.serialize()
-		buffer += len(self._restriction_additions).to_bytes(1, byteorder='little', signed=False)  # restriction_additions_count
-		buffer += len(self._restriction_deletions).to_bytes(1, byteorder='little', signed=False)  # restriction_deletions_count
-		buffer += self._account_restriction_transaction_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
-		buffer += ArrayHelpers.write_array(self._restriction_additions)
-		buffer += ArrayHelpers.write_array(self._restriction_deletions)
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._restriction_flags.serialize_into(buffer, offset)
+		buffer[offset:offset + 1] = len(self._restriction_additions).to_bytes(1, byteorder='little', signed=False)  # restriction_additions_count
+		offset += 1
+		buffer[offset:offset + 1] = len(self._restriction_deletions).to_bytes(1, byteorder='little', signed=False)  # restriction_deletions_count
+		offset += 1
+		buffer[offset:offset + 4] = self._account_restriction_transaction_body_reserved_1.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._restriction_additions)
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._restriction_deletions)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -8080,7 +13343,71 @@ class EmbeddedAccountOperationRestrictionTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedAccountOperationRestrictionTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 8:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedAccountOperationRestrictionTransactionV1 size {offset + 8}')
+
+		self._restriction_flags_offset = offset
+		offset += 2
+		restriction_additions_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		restriction_deletions_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		account_restriction_transaction_body_reserved_1 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert account_restriction_transaction_body_reserved_1 == 0, f'Invalid value of reserved field ({account_restriction_transaction_body_reserved_1})'
+		self._restriction_additions_offset = offset
+		offset += restriction_additions_count * 2
+		self._restriction_deletions_offset = offset
+		offset += restriction_deletions_count * 2
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedAccountOperationRestrictionTransactionV1 size {offset}')
+
+		self._restriction_additions_count = restriction_additions_count
+		self._restriction_deletions_count = restriction_deletions_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def restriction_flags(self) -> AccountRestrictionFlags:
+		if 'restriction_flags' in self._cache:
+			return self._cache['restriction_flags']
+
+		buffer = self._buffer[self._restriction_flags_offset:]
+		restriction_flags = AccountRestrictionFlags.deserialize(buffer)
+		self._cache['restriction_flags'] = restriction_flags
+		return restriction_flags
+
+	@property
+	def restriction_additions(self) -> List[TransactionType]:
+		if 'restriction_additions' in self._cache:
+			return self._cache['restriction_additions']
+
+		buffer = self._buffer[self._restriction_additions_offset:]
+		restriction_additions_count = self._restriction_additions_count
+		restriction_additions = ArrayHelpers.read_array_count(buffer, TransactionType, restriction_additions_count)
+		self._cache['restriction_additions'] = restriction_additions
+		return restriction_additions
+
+	@property
+	def restriction_deletions(self) -> List[TransactionType]:
+		if 'restriction_deletions' in self._cache:
+			return self._cache['restriction_deletions']
+
+		buffer = self._buffer[self._restriction_deletions_offset:]
+		restriction_deletions_count = self._restriction_deletions_count
+		restriction_deletions = ArrayHelpers.read_array_count(buffer, TransactionType, restriction_deletions_count)
+		self._cache['restriction_deletions'] = restriction_deletions
+		return restriction_deletions
+
+
 class MosaicAddressRestrictionTransactionV1(Transaction):
+	__slots__ = ('_mosaic_id', '_restriction_key', '_previous_restriction_value', '_new_restriction_value', '_target_address')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_ADDRESS_RESTRICTION
 	TYPE_HINTS = {
@@ -8179,15 +13506,24 @@ class MosaicAddressRestrictionTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic_id.serialize()
-		buffer += self._restriction_key.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._previous_restriction_value.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._new_restriction_value.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._target_address.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic_id.serialize_into(buffer, offset)
+		buffer[offset:offset + 8] = self._restriction_key.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		buffer[offset:offset + 8] = self._previous_restriction_value.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		buffer[offset:offset + 8] = self._new_restriction_value.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		offset = self._target_address.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -8200,7 +13536,81 @@ class MosaicAddressRestrictionTransactionV1(Transaction):
 		return result
 
 
+class MosaicAddressRestrictionTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 56:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicAddressRestrictionTransactionV1 size {offset + 56}')
+
+		self._mosaic_id_offset = offset
+		offset += 8
+		self._restriction_key_offset = offset
+		offset += 8
+		self._previous_restriction_value_offset = offset
+		offset += 8
+		self._new_restriction_value_offset = offset
+		offset += 8
+		self._target_address_offset = offset
+		offset += 24
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic_id(self) -> UnresolvedMosaicId:
+		if 'mosaic_id' in self._cache:
+			return self._cache['mosaic_id']
+
+		buffer = self._buffer[self._mosaic_id_offset:]
+		mosaic_id = UnresolvedMosaicId.deserialize(buffer)
+		self._cache['mosaic_id'] = mosaic_id
+		return mosaic_id
+
+	@property
+	def restriction_key(self) -> int:
+		if 'restriction_key' in self._cache:
+			return self._cache['restriction_key']
+
+		buffer = self._buffer[self._restriction_key_offset:]
+		restriction_key = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['restriction_key'] = restriction_key
+		return restriction_key
+
+	@property
+	def previous_restriction_value(self) -> int:
+		if 'previous_restriction_value' in self._cache:
+			return self._cache['previous_restriction_value']
+
+		buffer = self._buffer[self._previous_restriction_value_offset:]
+		previous_restriction_value = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['previous_restriction_value'] = previous_restriction_value
+		return previous_restriction_value
+
+	@property
+	def new_restriction_value(self) -> int:
+		if 'new_restriction_value' in self._cache:
+			return self._cache['new_restriction_value']
+
+		buffer = self._buffer[self._new_restriction_value_offset:]
+		new_restriction_value = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['new_restriction_value'] = new_restriction_value
+		return new_restriction_value
+
+	@property
+	def target_address(self) -> UnresolvedAddress:
+		if 'target_address' in self._cache:
+			return self._cache['target_address']
+
+		buffer = self._buffer[self._target_address_offset:]
+		target_address = UnresolvedAddress.deserialize(buffer)
+		self._cache['target_address'] = target_address
+		return target_address
+
+
 class EmbeddedMosaicAddressRestrictionTransactionV1(EmbeddedTransaction):
+	__slots__ = ('_mosaic_id', '_restriction_key', '_previous_restriction_value', '_new_restriction_value', '_target_address')
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_ADDRESS_RESTRICTION
 	TYPE_HINTS = {
@@ -8299,15 +13709,24 @@ class EmbeddedMosaicAddressRestrictionTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic_id.serialize()
-		buffer += self._restriction_key.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._previous_restriction_value.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._new_restriction_value.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._target_address.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic_id.serialize_into(buffer, offset)
+		buffer[offset:offset + 8] = self._restriction_key.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		buffer[offset:offset + 8] = self._previous_restriction_value.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		buffer[offset:offset + 8] = self._new_restriction_value.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		offset = self._target_address.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -8320,7 +13739,84 @@ class EmbeddedMosaicAddressRestrictionTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedMosaicAddressRestrictionTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 56:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedMosaicAddressRestrictionTransactionV1 size {offset + 56}')
+
+		self._mosaic_id_offset = offset
+		offset += 8
+		self._restriction_key_offset = offset
+		offset += 8
+		self._previous_restriction_value_offset = offset
+		offset += 8
+		self._new_restriction_value_offset = offset
+		offset += 8
+		self._target_address_offset = offset
+		offset += 24
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic_id(self) -> UnresolvedMosaicId:
+		if 'mosaic_id' in self._cache:
+			return self._cache['mosaic_id']
+
+		buffer = self._buffer[self._mosaic_id_offset:]
+		mosaic_id = UnresolvedMosaicId.deserialize(buffer)
+		self._cache['mosaic_id'] = mosaic_id
+		return mosaic_id
+
+	@property
+	def restriction_key(self) -> int:
+		if 'restriction_key' in self._cache:
+			return self._cache['restriction_key']
+
+		buffer = self._buffer[self._restriction_key_offset:]
+		restriction_key = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['restriction_key'] = restriction_key
+		return restriction_key
+
+	@property
+	def previous_restriction_value(self) -> int:
+		if 'previous_restriction_value' in self._cache:
+			return self._cache['previous_restriction_value']
+
+		buffer = self._buffer[self._previous_restriction_value_offset:]
+		previous_restriction_value = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['previous_restriction_value'] = previous_restriction_value
+		return previous_restriction_value
+
+	@property
+	def new_restriction_value(self) -> int:
+		if 'new_restriction_value' in self._cache:
+			return self._cache['new_restriction_value']
+
+		buffer = self._buffer[self._new_restriction_value_offset:]
+		new_restriction_value = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['new_restriction_value'] = new_restriction_value
+		return new_restriction_value
+
+	@property
+	def target_address(self) -> UnresolvedAddress:
+		if 'target_address' in self._cache:
+			return self._cache['target_address']
+
+		buffer = self._buffer[self._target_address_offset:]
+		target_address = UnresolvedAddress.deserialize(buffer)
+		self._cache['target_address'] = target_address
+		return target_address
+
+
+_MOSAIC_RESTRICTION_KEY_CODEC = Struct('<Q')
+
+
 class MosaicRestrictionKey(BaseValue):
+	__slots__ = ()
 	SIZE = 8
 
 	def __init__(self, mosaic_restriction_key: int = 0):
@@ -8328,11 +13824,17 @@ class MosaicRestrictionKey(BaseValue):
 
 	@classmethod
 	def deserialize(cls, payload: bytes | bytearray | memoryview) -> MosaicRestrictionKey:
-		buffer = memoryview(payload)
-		return MosaicRestrictionKey(int.from_bytes(buffer[:8], byteorder='little', signed=False))
+		if len(payload) < 8:
+			raise ValueError(f'payload size {len(payload)} is smaller than MosaicRestrictionKey size 8')
+
+		return MosaicRestrictionKey.from_trusted(_MOSAIC_RESTRICTION_KEY_CODEC.unpack_from(payload)[0])
 
 	def serialize(self) -> bytes:
-		return self.value.to_bytes(8, byteorder='little', signed=False)
+		return _MOSAIC_RESTRICTION_KEY_CODEC.pack(self.value)
+
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		_MOSAIC_RESTRICTION_KEY_CODEC.pack_into(buffer, offset, self.value)
+		return offset + 8
 
 
 class MosaicRestrictionType(Enum):
@@ -8358,8 +13860,21 @@ class MosaicRestrictionType(Enum):
 		buffer += self.value.to_bytes(1, byteorder='little', signed=False)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		buffer[offset:offset + 1] = self.value.to_bytes(1, byteorder='little', signed=False)
+		return offset + 1
+
 
 class MosaicGlobalRestrictionTransactionV1(Transaction):
+	__slots__ = (
+		'_mosaic_id',
+		'_reference_mosaic_id',
+		'_restriction_key',
+		'_previous_restriction_value',
+		'_new_restriction_value',
+		'_previous_restriction_type',
+		'_new_restriction_type'
+	)
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_GLOBAL_RESTRICTION
 	TYPE_HINTS = {
@@ -8486,17 +14001,26 @@ class MosaicGlobalRestrictionTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic_id.serialize()
-		buffer += self._reference_mosaic_id.serialize()
-		buffer += self._restriction_key.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._previous_restriction_value.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._new_restriction_value.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._previous_restriction_type.serialize()
-		buffer += self._new_restriction_type.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic_id.serialize_into(buffer, offset)
+		offset = self._reference_mosaic_id.serialize_into(buffer, offset)
+		buffer[offset:offset + 8] = self._restriction_key.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		buffer[offset:offset + 8] = self._previous_restriction_value.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		buffer[offset:offset + 8] = self._new_restriction_value.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		offset = self._previous_restriction_type.serialize_into(buffer, offset)
+		offset = self._new_restriction_type.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -8511,7 +14035,113 @@ class MosaicGlobalRestrictionTransactionV1(Transaction):
 		return result
 
 
+class MosaicGlobalRestrictionTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 42:
+			raise ValueError(f'payload size {len(buffer)} is smaller than MosaicGlobalRestrictionTransactionV1 size {offset + 42}')
+
+		self._mosaic_id_offset = offset
+		offset += 8
+		self._reference_mosaic_id_offset = offset
+		offset += 8
+		self._restriction_key_offset = offset
+		offset += 8
+		self._previous_restriction_value_offset = offset
+		offset += 8
+		self._new_restriction_value_offset = offset
+		offset += 8
+		self._previous_restriction_type_offset = offset
+		offset += 1
+		self._new_restriction_type_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic_id(self) -> UnresolvedMosaicId:
+		if 'mosaic_id' in self._cache:
+			return self._cache['mosaic_id']
+
+		buffer = self._buffer[self._mosaic_id_offset:]
+		mosaic_id = UnresolvedMosaicId.deserialize(buffer)
+		self._cache['mosaic_id'] = mosaic_id
+		return mosaic_id
+
+	@property
+	def reference_mosaic_id(self) -> UnresolvedMosaicId:
+		if 'reference_mosaic_id' in self._cache:
+			return self._cache['reference_mosaic_id']
+
+		buffer = self._buffer[self._reference_mosaic_id_offset:]
+		reference_mosaic_id = UnresolvedMosaicId.deserialize(buffer)
+		self._cache['reference_mosaic_id'] = reference_mosaic_id
+		return reference_mosaic_id
+
+	@property
+	def restriction_key(self) -> int:
+		if 'restriction_key' in self._cache:
+			return self._cache['restriction_key']
+
+		buffer = self._buffer[self._restriction_key_offset:]
+		restriction_key = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['restriction_key'] = restriction_key
+		return restriction_key
+
+	@property
+	def previous_restriction_value(self) -> int:
+		if 'previous_restriction_value' in self._cache:
+			return self._cache['previous_restriction_value']
+
+		buffer = self._buffer[self._previous_restriction_value_offset:]
+		previous_restriction_value = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['previous_restriction_value'] = previous_restriction_value
+		return previous_restriction_value
+
+	@property
+	def new_restriction_value(self) -> int:
+		if 'new_restriction_value' in self._cache:
+			return self._cache['new_restriction_value']
+
+		buffer = self._buffer[self._new_restriction_value_offset:]
+		new_restriction_value = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['new_restriction_value'] = new_restriction_value
+		return new_restriction_value
+
+	@property
+	def previous_restriction_type(self) -> MosaicRestrictionType:
+		if 'previous_restriction_type' in self._cache:
+			return self._cache['previous_restriction_type']
+
+		buffer = self._buffer[self._previous_restriction_type_offset:]
+		previous_restriction_type = MosaicRestrictionType.deserialize(buffer)
+		self._cache['previous_restriction_type'] = previous_restriction_type
+		return previous_restriction_type
+
+	@property
+	def new_restriction_type(self) -> MosaicRestrictionType:
+		if 'new_restriction_type' in self._cache:
+			return self._cache['new_restriction_type']
+
+		buffer = self._buffer[self._new_restriction_type_offset:]
+		new_restriction_type = MosaicRestrictionType.deserialize(buffer)
+		self._cache['new_restriction_type'] = new_restriction_type
+		return new_restriction_type
+
+
 class EmbeddedMosaicGlobalRestrictionTransactionV1(EmbeddedTransaction):
+	__slots__ = (
+		'_mosaic_id',
+		'_reference_mosaic_id',
+		'_restriction_key',
+		'_previous_restriction_value',
+		'_new_restriction_value',
+		'_previous_restriction_type',
+		'_new_restriction_type'
+	)
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.MOSAIC_GLOBAL_RESTRICTION
 	TYPE_HINTS = {
@@ -8638,17 +14268,26 @@ class EmbeddedMosaicGlobalRestrictionTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._mosaic_id.serialize()
-		buffer += self._reference_mosaic_id.serialize()
-		buffer += self._restriction_key.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._previous_restriction_value.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._new_restriction_value.to_bytes(8, byteorder='little', signed=False)
-		buffer += self._previous_restriction_type.serialize()
-		buffer += self._new_restriction_type.serialize()
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._mosaic_id.serialize_into(buffer, offset)
+		offset = self._reference_mosaic_id.serialize_into(buffer, offset)
+		buffer[offset:offset + 8] = self._restriction_key.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		buffer[offset:offset + 8] = self._previous_restriction_value.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		buffer[offset:offset + 8] = self._new_restriction_value.to_bytes(8, byteorder='little', signed=False)
+		offset += 8
+		offset = self._previous_restriction_type.serialize_into(buffer, offset)
+		offset = self._new_restriction_type.serialize_into(buffer, offset)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -8663,7 +14302,111 @@ class EmbeddedMosaicGlobalRestrictionTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedMosaicGlobalRestrictionTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 42:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedMosaicGlobalRestrictionTransactionV1 size {offset + 42}')
+
+		self._mosaic_id_offset = offset
+		offset += 8
+		self._reference_mosaic_id_offset = offset
+		offset += 8
+		self._restriction_key_offset = offset
+		offset += 8
+		self._previous_restriction_value_offset = offset
+		offset += 8
+		self._new_restriction_value_offset = offset
+		offset += 8
+		self._previous_restriction_type_offset = offset
+		offset += 1
+		self._new_restriction_type_offset = offset
+		offset += 1
+
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def mosaic_id(self) -> UnresolvedMosaicId:
+		if 'mosaic_id' in self._cache:
+			return self._cache['mosaic_id']
+
+		buffer = self._buffer[self._mosaic_id_offset:]
+		mosaic_id = UnresolvedMosaicId.deserialize(buffer)
+		self._cache['mosaic_id'] = mosaic_id
+		return mosaic_id
+
+	@property
+	def reference_mosaic_id(self) -> UnresolvedMosaicId:
+		if 'reference_mosaic_id' in self._cache:
+			return self._cache['reference_mosaic_id']
+
+		buffer = self._buffer[self._reference_mosaic_id_offset:]
+		reference_mosaic_id = UnresolvedMosaicId.deserialize(buffer)
+		self._cache['reference_mosaic_id'] = reference_mosaic_id
+		return reference_mosaic_id
+
+	@property
+	def restriction_key(self) -> int:
+		if 'restriction_key' in self._cache:
+			return self._cache['restriction_key']
+
+		buffer = self._buffer[self._restriction_key_offset:]
+		restriction_key = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['restriction_key'] = restriction_key
+		return restriction_key
+
+	@property
+	def previous_restriction_value(self) -> int:
+		if 'previous_restriction_value' in self._cache:
+			return self._cache['previous_restriction_value']
+
+		buffer = self._buffer[self._previous_restriction_value_offset:]
+		previous_restriction_value = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['previous_restriction_value'] = previous_restriction_value
+		return previous_restriction_value
+
+	@property
+	def new_restriction_value(self) -> int:
+		if 'new_restriction_value' in self._cache:
+			return self._cache['new_restriction_value']
+
+		buffer = self._buffer[self._new_restriction_value_offset:]
+		new_restriction_value = int.from_bytes(buffer[:8], byteorder='little', signed=False)
+		self._cache['new_restriction_value'] = new_restriction_value
+		return new_restriction_value
+
+	@property
+	def previous_restriction_type(self) -> MosaicRestrictionType:
+		if 'previous_restriction_type' in self._cache:
+			return self._cache['previous_restriction_type']
+
+		buffer = self._buffer[self._previous_restriction_type_offset:]
+		previous_restriction_type = MosaicRestrictionType.deserialize(buffer)
+		self._cache['previous_restriction_type'] = previous_restriction_type
+		return previous_restriction_type
+
+	@property
+	def new_restriction_type(self) -> MosaicRestrictionType:
+		if 'new_restriction_type' in self._cache:
+			return self._cache['new_restriction_type']
+
+		buffer = self._buffer[self._new_restriction_type_offset:]
+		new_restriction_type = MosaicRestrictionType.deserialize(buffer)
+		self._cache['new_restriction_type'] = new_restriction_type
+		return new_restriction_type
+
+
 class TransferTransactionV1(Transaction):
+	__slots__ = (
+		'_recipient_address',
+		'_mosaics',
+		'_message',
+		'_transfer_transaction_body_reserved_1',
+		'_transfer_transaction_body_reserved_2'
+	)
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.TRANSFER
 	TYPE_HINTS = {
@@ -8741,7 +14484,7 @@ class TransferTransactionV1(Transaction):
 		transfer_transaction_body_reserved_2 = int.from_bytes(buffer[:4], byteorder='little', signed=False)
 		buffer = buffer[4:]
 		assert transfer_transaction_body_reserved_2 == 0, f'Invalid value of reserved field ({transfer_transaction_body_reserved_2})'
-		mosaics = ArrayHelpers.read_array_count(buffer, UnresolvedMosaic, mosaics_count, lambda e: e.mosaic_id.comparer() if hasattr(e.mosaic_id, 'comparer') else e.mosaic_id)
+		mosaics = ArrayHelpers.read_fixed_size_array(buffer, UnresolvedMosaic, _UNRESOLVED_MOSAIC_CODEC, mosaics_count, lambda e: e.mosaic_id.comparer() if hasattr(e.mosaic_id, 'comparer') else e.mosaic_id)
 		buffer = buffer[ArrayHelpers.size(mosaics):]
 		message = ArrayHelpers.get_bytes(buffer, message_size)
 		buffer = buffer[message_size:]
@@ -8753,17 +14496,28 @@ class TransferTransactionV1(Transaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._recipient_address.serialize()
-		buffer += len(self._message).to_bytes(2, byteorder='little', signed=False)  # message_size
-		buffer += len(self._mosaics).to_bytes(1, byteorder='little', signed=False)  # mosaics_count
-		buffer += self._transfer_transaction_body_reserved_1.to_bytes(1, byteorder='little', signed=False)
-		buffer += self._transfer_transaction_body_reserved_2.to_bytes(4, byteorder='little', signed=False)
-		buffer += ArrayHelpers.write_array(self._mosaics, lambda e: e.mosaic_id.comparer() if hasattr(e.mosaic_id, 'comparer') else e.mosaic_id)
-		buffer += self._message
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._recipient_address.serialize_into(buffer, offset)
+		buffer[offset:offset + 2] = len(self._message).to_bytes(2, byteorder='little', signed=False)  # message_size
+		offset += 2
+		buffer[offset:offset + 1] = len(self._mosaics).to_bytes(1, byteorder='little', signed=False)  # mosaics_count
+		offset += 1
+		buffer[offset:offset + 1] = self._transfer_transaction_body_reserved_1.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		buffer[offset:offset + 4] = self._transfer_transaction_body_reserved_2.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._mosaics, lambda e: e.mosaic_id.comparer() if hasattr(e.mosaic_id, 'comparer') else e.mosaic_id)
+		buffer[offset:offset + len(self._message)] = self._message
+		offset += len(self._message)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -8774,7 +14528,80 @@ class TransferTransactionV1(Transaction):
 		return result
 
 
+class TransferTransactionV1View(TransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 32:
+			raise ValueError(f'payload size {len(buffer)} is smaller than TransferTransactionV1 size {offset + 32}')
+
+		self._recipient_address_offset = offset
+		offset += 24
+		message_size = int.from_bytes(buffer[offset:offset + 2], byteorder='little', signed=False)
+		offset += 2
+		mosaics_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		transfer_transaction_body_reserved_1 = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		assert transfer_transaction_body_reserved_1 == 0, f'Invalid value of reserved field ({transfer_transaction_body_reserved_1})'
+		transfer_transaction_body_reserved_2 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert transfer_transaction_body_reserved_2 == 0, f'Invalid value of reserved field ({transfer_transaction_body_reserved_2})'
+		self._mosaics_offset = offset
+		offset += mosaics_count * 16
+		self._message_offset = offset
+		offset += message_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than TransferTransactionV1 size {offset}')
+
+		self._message_size = message_size
+		self._mosaics_count = mosaics_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def recipient_address(self) -> UnresolvedAddress:
+		if 'recipient_address' in self._cache:
+			return self._cache['recipient_address']
+
+		buffer = self._buffer[self._recipient_address_offset:]
+		recipient_address = UnresolvedAddress.deserialize(buffer)
+		self._cache['recipient_address'] = recipient_address
+		return recipient_address
+
+	@property
+	def mosaics(self) -> List[UnresolvedMosaic]:
+		if 'mosaics' in self._cache:
+			return self._cache['mosaics']
+
+		buffer = self._buffer[self._mosaics_offset:]
+		mosaics_count = self._mosaics_count
+		mosaics = ArrayHelpers.read_fixed_size_array(buffer, UnresolvedMosaic, _UNRESOLVED_MOSAIC_CODEC, mosaics_count, lambda e: e.mosaic_id.comparer() if hasattr(e.mosaic_id, 'comparer') else e.mosaic_id)
+		self._cache['mosaics'] = mosaics
+		return mosaics
+
+	@property
+	def message(self) -> bytes:
+		if 'message' in self._cache:
+			return self._cache['message']
+
+		buffer = self._buffer[self._message_offset:]
+		message_size = self._message_size
+		message = ArrayHelpers.get_bytes(buffer, message_size)
+		self._cache['message'] = message
+		return message
+
+
 class EmbeddedTransferTransactionV1(EmbeddedTransaction):
+	__slots__ = (
+		'_recipient_address',
+		'_mosaics',
+		'_message',
+		'_transfer_transaction_body_reserved_1',
+		'_transfer_transaction_body_reserved_2'
+	)
 	TRANSACTION_VERSION: int = 1
 	TRANSACTION_TYPE: TransactionType = TransactionType.TRANSFER
 	TYPE_HINTS = {
@@ -8852,7 +14679,7 @@ class EmbeddedTransferTransactionV1(EmbeddedTransaction):
 		transfer_transaction_body_reserved_2 = int.from_bytes(buffer[:4], byteorder='little', signed=False)
 		buffer = buffer[4:]
 		assert transfer_transaction_body_reserved_2 == 0, f'Invalid value of reserved field ({transfer_transaction_body_reserved_2})'
-		mosaics = ArrayHelpers.read_array_count(buffer, UnresolvedMosaic, mosaics_count, lambda e: e.mosaic_id.comparer() if hasattr(e.mosaic_id, 'comparer') else e.mosaic_id)
+		mosaics = ArrayHelpers.read_fixed_size_array(buffer, UnresolvedMosaic, _UNRESOLVED_MOSAIC_CODEC, mosaics_count, lambda e: e.mosaic_id.comparer() if hasattr(e.mosaic_id, 'comparer') else e.mosaic_id)
 		buffer = buffer[ArrayHelpers.size(mosaics):]
 		message = ArrayHelpers.get_bytes(buffer, message_size)
 		buffer = buffer[message_size:]
@@ -8864,17 +14691,28 @@ class EmbeddedTransferTransactionV1(EmbeddedTransaction):
 		return instance
 
 	def serialize(self) -> bytes:
-		buffer = bytearray()
-		super()._serialize(buffer)
-		buffer += self._recipient_address.serialize()
-		buffer += len(self._message).to_bytes(2, byteorder='little', signed=False)  # message_size
-		buffer += len(self._mosaics).to_bytes(1, byteorder='little', signed=False)  # mosaics_count
-		buffer += self._transfer_transaction_body_reserved_1.to_bytes(1, byteorder='little', signed=False)
-		buffer += self._transfer_transaction_body_reserved_2.to_bytes(4, byteorder='little', signed=False)
-		buffer += ArrayHelpers.write_array(self._mosaics, lambda e: e.mosaic_id.comparer() if hasattr(e.mosaic_id, 'comparer') else e.mosaic_id)
-		buffer += self._message
+		buffer = bytearray(self.size)
+		self.serialize_into(buffer, 0)
 		return buffer
 
+	def serialize_into(self, buffer: bytearray | memoryview, offset: int) -> int:
+		size_offset = offset
+		offset = super()._serialize_into(buffer, offset)
+		offset = self._recipient_address.serialize_into(buffer, offset)
+		buffer[offset:offset + 2] = len(self._message).to_bytes(2, byteorder='little', signed=False)  # message_size
+		offset += 2
+		buffer[offset:offset + 1] = len(self._mosaics).to_bytes(1, byteorder='little', signed=False)  # mosaics_count
+		offset += 1
+		buffer[offset:offset + 1] = self._transfer_transaction_body_reserved_1.to_bytes(1, byteorder='little', signed=False)
+		offset += 1
+		buffer[offset:offset + 4] = self._transfer_transaction_body_reserved_2.to_bytes(4, byteorder='little', signed=False)
+		offset += 4
+		offset = ArrayHelpers.write_array_into(buffer, offset, self._mosaics, lambda e: e.mosaic_id.comparer() if hasattr(e.mosaic_id, 'comparer') else e.mosaic_id)
+		buffer[offset:offset + len(self._message)] = self._message
+		offset += len(self._message)
+		buffer[size_offset:size_offset + 4] = (offset - size_offset).to_bytes(4, byteorder='little', signed=False)
+		return offset
+
 	def __str__(self) -> str:
 		result = '('
 		result += super().__str__()
@@ -8885,44 +14723,114 @@ class EmbeddedTransferTransactionV1(EmbeddedTransaction):
 		return result
 
 
+class EmbeddedTransferTransactionV1View(EmbeddedTransactionView):
+	def __init__(self, payload: bytes | bytearray | memoryview):
+		super().__init__(payload)
+		buffer = self._buffer
+		offset = self._end_offset
+		if len(buffer) < offset + 32:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedTransferTransactionV1 size {offset + 32}')
+
+		self._recipient_address_offset = offset
+		offset += 24
+		message_size = int.from_bytes(buffer[offset:offset + 2], byteorder='little', signed=False)
+		offset += 2
+		mosaics_count = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		transfer_transaction_body_reserved_1 = int.from_bytes(buffer[offset:offset + 1], byteorder='little', signed=False)
+		offset += 1
+		assert transfer_transaction_body_reserved_1 == 0, f'Invalid value of reserved field ({transfer_transaction_body_reserved_1})'
+		transfer_transaction_body_reserved_2 = int.from_bytes(buffer[offset:offset + 4], byteorder='little', signed=False)
+		offset += 4
+		assert transfer_transaction_body_reserved_2 == 0, f'Invalid value of reserved field ({transfer_transaction_body_reserved_2})'
+		self._mosaics_offset = offset
+		offset += mosaics_count * 16
+		self._message_offset = offset
+		offset += message_size
+
+		if offset > len(buffer):
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedTransferTransactionV1 size {offset}')
+
+		self._message_size = message_size
+		self._mosaics_count = mosaics_count
+		self._buffer = buffer
+		self._end_offset = offset
+
+	@property
+	def recipient_address(self) -> UnresolvedAddress:
+		if 'recipient_address' in self._cache:
+			return self._cache['recipient_address']
+
+		buffer = self._buffer[self._recipient_address_offset:]
+		recipient_address = UnresolvedAddress.deserialize(buffer)
+		self._cache['recipient_address'] = recipient_address
+		return recipient_address
+
+	@property
+	def mosaics(self) -> List[UnresolvedMosaic]:
+		if 'mosaics' in self._cache:
+			return self._cache['mosaics']
+
+		buffer = self._buffer[self._mosaics_offset:]
+		mosaics_count = self._mosaics_count
+		mosaics = ArrayHelpers.read_fixed_size_array(buffer, UnresolvedMosaic, _UNRESOLVED_MOSAIC_CODEC, mosaics_count, lambda e: e.mosaic_id.comparer() if hasattr(e.mosaic_id, 'comparer') else e.mosaic_id)
+		self._cache['mosaics'] = mosaics
+		return mosaics
+
+	@property
+	def message(self) -> bytes:
+		if 'message' in self._cache:
+			return self._cache['message']
+
+		buffer = self._buffer[self._message_offset:]
+		message_size = self._message_size
+		message = ArrayHelpers.get_bytes(buffer, message_size)
+		self._cache['message'] = message
+		return message
+
+
 class TransactionFactory:
+	MAPPING = {
+		(AccountKeyLinkTransactionV1.TRANSACTION_TYPE.value, AccountKeyLinkTransactionV1.TRANSACTION_VERSION): AccountKeyLinkTransactionV1,
+		(NodeKeyLinkTransactionV1.TRANSACTION_TYPE.value, NodeKeyLinkTransactionV1.TRANSACTION_VERSION): NodeKeyLinkTransactionV1,
+		(AggregateCompleteTransactionV1.TRANSACTION_TYPE.value, AggregateCompleteTransactionV1.TRANSACTION_VERSION): AggregateCompleteTransactionV1,
+		(AggregateCompleteTransactionV2.TRANSACTION_TYPE.value, AggregateCompleteTransactionV2.TRANSACTION_VERSION): AggregateCompleteTransactionV2,
+		(AggregateBondedTransactionV1.TRANSACTION_TYPE.value, AggregateBondedTransactionV1.TRANSACTION_VERSION): AggregateBondedTransactionV1,
+		(AggregateBondedTransactionV2.TRANSACTION_TYPE.value, AggregateBondedTransactionV2.TRANSACTION_VERSION): AggregateBondedTransactionV2,
+		(VotingKeyLinkTransactionV1.TRANSACTION_TYPE.value, VotingKeyLinkTransactionV1.TRANSACTION_VERSION): VotingKeyLinkTransactionV1,
+		(VrfKeyLinkTransactionV1.TRANSACTION_TYPE.value, VrfKeyLinkTransactionV1.TRANSACTION_VERSION): VrfKeyLinkTransactionV1,
+		(HashLockTransactionV1.TRANSACTION_TYPE.value, HashLockTransactionV1.TRANSACTION_VERSION): HashLockTransactionV1,
+		(SecretLockTransactionV1.TRANSACTION_TYPE.value, SecretLockTransactionV1.TRANSACTION_VERSION): SecretLockTransactionV1,
+		(SecretProofTransactionV1.TRANSACTION_TYPE.value, SecretProofTransactionV1.TRANSACTION_VERSION): SecretProofTransactionV1,
+		(AccountMetadataTransactionV1.TRANSACTION_TYPE.value, AccountMetadataTransactionV1.TRANSACTION_VERSION): AccountMetadataTransactionV1,
+		(MosaicMetadataTransactionV1.TRANSACTION_TYPE.value, MosaicMetadataTransactionV1.TRANSACTION_VERSION): MosaicMetadataTransactionV1,
+		(NamespaceMetadataTransactionV1.TRANSACTION_TYPE.value, NamespaceMetadataTransactionV1.TRANSACTION_VERSION): NamespaceMetadataTransactionV1,
+		(MosaicDefinitionTransactionV1.TRANSACTION_TYPE.value, MosaicDefinitionTransactionV1.TRANSACTION_VERSION): MosaicDefinitionTransactionV1,
+		(MosaicSupplyChangeTransactionV1.TRANSACTION_TYPE.value, MosaicSupplyChangeTransactionV1.TRANSACTION_VERSION): MosaicSupplyChangeTransactionV1,
+		(MosaicSupplyRevocationTransactionV1.TRANSACTION_TYPE.value, MosaicSupplyRevocationTransactionV1.TRANSACTION_VERSION): MosaicSupplyRevocationTransactionV1,
+		(MultisigAccountModificationTransactionV1.TRANSACTION_TYPE.value, MultisigAccountModificationTransactionV1.TRANSACTION_VERSION): MultisigAccountModificationTransactionV1,
+		(AddressAliasTransactionV1.TRANSACTION_TYPE.value, AddressAliasTransactionV1.TRANSACTION_VERSION): AddressAliasTransactionV1,
+		(MosaicAliasTransactionV1.TRANSACTION_TYPE.value, MosaicAliasTransactionV1.TRANSACTION_VERSION): MosaicAliasTransactionV1,
+		(NamespaceRegistrationTransactionV1.TRANSACTION_TYPE.value, NamespaceRegistrationTransactionV1.TRANSACTION_VERSION): NamespaceRegistrationTransactionV1,
+		(AccountAddressRestrictionTransactionV1.TRANSACTION_TYPE.value, AccountAddressRestrictionTransactionV1.TRANSACTION_VERSION): AccountAddressRestrictionTransactionV1,
+		(AccountMosaicRestrictionTransactionV1.TRANSACTION_TYPE.value, AccountMosaicRestrictionTransactionV1.TRANSACTION_VERSION): AccountMosaicRestrictionTransactionV1,
+		(AccountOperationRestrictionTransactionV1.TRANSACTION_TYPE.value, AccountOperationRestrictionTransactionV1.TRANSACTION_VERSION): AccountOperationRestrictionTransactionV1,
+		(MosaicAddressRestrictionTransactionV1.TRANSACTION_TYPE.value, MosaicAddressRestrictionTransactionV1.TRANSACTION_VERSION): MosaicAddressRestrictionTransactionV1,
+		(MosaicGlobalRestrictionTransactionV1.TRANSACTION_TYPE.value, MosaicGlobalRestrictionTransactionV1.TRANSACTION_VERSION): MosaicGlobalRestrictionTransactionV1,
+		(TransferTransactionV1.TRANSACTION_TYPE.value, TransferTransactionV1.TRANSACTION_VERSION): TransferTransactionV1
+	}
+
 	@classmethod
-	def deserialize(cls, payload: bytes) -> Transaction:
-		parent = Transaction()
-		buffer = bytes(payload)
-		Transaction._deserialize(buffer, parent)  # pylint: disable=protected-access
+	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Transaction:
+		buffer = memoryview(payload)
+		if len(buffer) < 128:
+			raise ValueError(f'payload size {len(buffer)} is smaller than Transaction header size 128')
+
+		discriminator = (int.from_bytes(buffer[110:112], byteorder='little', signed=False), int.from_bytes(buffer[108:109], byteorder='little', signed=False))
+		factory_class = cls.MAPPING.get(discriminator)
+		if factory_class is None:
+			raise ValueError(f'unknown discriminator {discriminator} for Transaction')
 
-		mapping = {
-			(AccountKeyLinkTransactionV1.TRANSACTION_TYPE, AccountKeyLinkTransactionV1.TRANSACTION_VERSION): AccountKeyLinkTransactionV1,
-			(NodeKeyLinkTransactionV1.TRANSACTION_TYPE, NodeKeyLinkTransactionV1.TRANSACTION_VERSION): NodeKeyLinkTransactionV1,
-			(AggregateCompleteTransactionV1.TRANSACTION_TYPE, AggregateCompleteTransactionV1.TRANSACTION_VERSION): AggregateCompleteTransactionV1,
-			(AggregateCompleteTransactionV2.TRANSACTION_TYPE, AggregateCompleteTransactionV2.TRANSACTION_VERSION): AggregateCompleteTransactionV2,
-			(AggregateBondedTransactionV1.TRANSACTION_TYPE, AggregateBondedTransactionV1.TRANSACTION_VERSION): AggregateBondedTransactionV1,
-			(AggregateBondedTransactionV2.TRANSACTION_TYPE, AggregateBondedTransactionV2.TRANSACTION_VERSION): AggregateBondedTransactionV2,
-			(VotingKeyLinkTransactionV1.TRANSACTION_TYPE, VotingKeyLinkTransactionV1.TRANSACTION_VERSION): VotingKeyLinkTransactionV1,
-			(VrfKeyLinkTransactionV1.TRANSACTION_TYPE, VrfKeyLinkTransactionV1.TRANSACTION_VERSION): VrfKeyLinkTransactionV1,
-			(HashLockTransactionV1.TRANSACTION_TYPE, HashLockTransactionV1.TRANSACTION_VERSION): HashLockTransactionV1,
-			(SecretLockTransactionV1.TRANSACTION_TYPE, SecretLockTransactionV1.TRANSACTION_VERSION): SecretLockTransactionV1,
-			(SecretProofTransactionV1.TRANSACTION_TYPE, SecretProofTransactionV1.TRANSACTION_VERSION): SecretProofTransactionV1,
-			(AccountMetadataTransactionV1.TRANSACTION_TYPE, AccountMetadataTransactionV1.TRANSACTION_VERSION): AccountMetadataTransactionV1,
-			(MosaicMetadataTransactionV1.TRANSACTION_TYPE, MosaicMetadataTransactionV1.TRANSACTION_VERSION): MosaicMetadataTransactionV1,
-			(NamespaceMetadataTransactionV1.TRANSACTION_TYPE, NamespaceMetadataTransactionV1.TRANSACTION_VERSION): NamespaceMetadataTransactionV1,
-			(MosaicDefinitionTransactionV1.TRANSACTION_TYPE, MosaicDefinitionTransactionV1.TRANSACTION_VERSION): MosaicDefinitionTransactionV1,
-			(MosaicSupplyChangeTransactionV1.TRANSACTION_TYPE, MosaicSupplyChangeTransactionV1.TRANSACTION_VERSION): MosaicSupplyChangeTransactionV1,
-			(MosaicSupplyRevocationTransactionV1.TRANSACTION_TYPE, MosaicSupplyRevocationTransactionV1.TRANSACTION_VERSION): MosaicSupplyRevocationTransactionV1,
-			(MultisigAccountModificationTransactionV1.TRANSACTION_TYPE, MultisigAccountModificationTransactionV1.TRANSACTION_VERSION): MultisigAccountModificationTransactionV1,
-			(AddressAliasTransactionV1.TRANSACTION_TYPE, AddressAliasTransactionV1.TRANSACTION_VERSION): AddressAliasTransactionV1,
-			(MosaicAliasTransactionV1.TRANSACTION_TYPE, MosaicAliasTransactionV1.TRANSACTION_VERSION): MosaicAliasTransactionV1,
-			(NamespaceRegistrationTransactionV1.TRANSACTION_TYPE, NamespaceRegistrationTransactionV1.TRANSACTION_VERSION): NamespaceRegistrationTransactionV1,
-			(AccountAddressRestrictionTransactionV1.TRANSACTION_TYPE, AccountAddressRestrictionTransactionV1.TRANSACTION_VERSION): AccountAddressRestrictionTransactionV1,
-			(AccountMosaicRestrictionTransactionV1.TRANSACTION_TYPE, AccountMosaicRestrictionTransactionV1.TRANSACTION_VERSION): AccountMosaicRestrictionTransactionV1,
-			(AccountOperationRestrictionTransactionV1.TRANSACTION_TYPE, AccountOperationRestrictionTransactionV1.TRANSACTION_VERSION): AccountOperationRestrictionTransactionV1,
-			(MosaicAddressRestrictionTransactionV1.TRANSACTION_TYPE, MosaicAddressRestrictionTransactionV1.TRANSACTION_VERSION): MosaicAddressRestrictionTransactionV1,
-			(MosaicGlobalRestrictionTransactionV1.TRANSACTION_TYPE, MosaicGlobalRestrictionTransactionV1.TRANSACTION_VERSION): MosaicGlobalRestrictionTransactionV1,
-			(TransferTransactionV1.TRANSACTION_TYPE, TransferTransactionV1.TRANSACTION_VERSION): TransferTransactionV1
-		}
-		discriminator = (parent.type_, parent.version)
-		factory_class = mapping[discriminator]
 		return factory_class.deserialize(buffer)
 
 	@classmethod
@@ -8964,39 +14872,43 @@ class TransactionFactory:
 
 
 class EmbeddedTransactionFactory:
+	MAPPING = {
+		(EmbeddedAccountKeyLinkTransactionV1.TRANSACTION_TYPE.value, EmbeddedAccountKeyLinkTransactionV1.TRANSACTION_VERSION): EmbeddedAccountKeyLinkTransactionV1,
+		(EmbeddedNodeKeyLinkTransactionV1.TRANSACTION_TYPE.value, EmbeddedNodeKeyLinkTransactionV1.TRANSACTION_VERSION): EmbeddedNodeKeyLinkTransactionV1,
+		(EmbeddedVotingKeyLinkTransactionV1.TRANSACTION_TYPE.value, EmbeddedVotingKeyLinkTransactionV1.TRANSACTION_VERSION): EmbeddedVotingKeyLinkTransactionV1,
+		(EmbeddedVrfKeyLinkTransactionV1.TRANSACTION_TYPE.value, EmbeddedVrfKeyLinkTransactionV1.TRANSACTION_VERSION): EmbeddedVrfKeyLinkTransactionV1,
+		(EmbeddedHashLockTransactionV1.TRANSACTION_TYPE.value, EmbeddedHashLockTransactionV1.TRANSACTION_VERSION): EmbeddedHashLockTransactionV1,
+		(EmbeddedSecretLockTransactionV1.TRANSACTION_TYPE.value, EmbeddedSecretLockTransactionV1.TRANSACTION_VERSION): EmbeddedSecretLockTransactionV1,
+		(EmbeddedSecretProofTransactionV1.TRANSACTION_TYPE.value, EmbeddedSecretProofTransactionV1.TRANSACTION_VERSION): EmbeddedSecretProofTransactionV1,
+		(EmbeddedAccountMetadataTransactionV1.TRANSACTION_TYPE.value, EmbeddedAccountMetadataTransactionV1.TRANSACTION_VERSION): EmbeddedAccountMetadataTransactionV1,
+		(EmbeddedMosaicMetadataTransactionV1.TRANSACTION_TYPE.value, EmbeddedMosaicMetadataTransactionV1.TRANSACTION_VERSION): EmbeddedMosaicMetadataTransactionV1,
+		(EmbeddedNamespaceMetadataTransactionV1.TRANSACTION_TYPE.value, EmbeddedNamespaceMetadataTransactionV1.TRANSACTION_VERSION): EmbeddedNamespaceMetadataTransactionV1,
+		(EmbeddedMosaicDefinitionTransactionV1.TRANSACTION_TYPE.value, EmbeddedMosaicDefinitionTransactionV1.TRANSACTION_VERSION): EmbeddedMosaicDefinitionTransactionV1,
+		(EmbeddedMosaicSupplyChangeTransactionV1.TRANSACTION_TYPE.value, EmbeddedMosaicSupplyChangeTransactionV1.TRANSACTION_VERSION): EmbeddedMosaicSupplyChangeTransactionV1,
+		(EmbeddedMosaicSupplyRevocationTransactionV1.TRANSACTION_TYPE.value, EmbeddedMosaicSupplyRevocationTransactionV1.TRANSACTION_VERSION): EmbeddedMosaicSupplyRevocationTransactionV1,
+		(EmbeddedMultisigAccountModificationTransactionV1.TRANSACTION_TYPE.value, EmbeddedMultisigAccountModificationTransactionV1.TRANSACTION_VERSION): EmbeddedMultisigAccountModificationTransactionV1,
+		(EmbeddedAddressAliasTransactionV1.TRANSACTION_TYPE.value, EmbeddedAddressAliasTransactionV1.TRANSACTION_VERSION): EmbeddedAddressAliasTransactionV1,
+		(EmbeddedMosaicAliasTransactionV1.TRANSACTION_TYPE.value, EmbeddedMosaicAliasTransactionV1.TRANSACTION_VERSION): EmbeddedMosaicAliasTransactionV1,
+		(EmbeddedNamespaceRegistrationTransactionV1.TRANSACTION_TYPE.value, EmbeddedNamespaceRegistrationTransactionV1.TRANSACTION_VERSION): EmbeddedNamespaceRegistrationTransactionV1,
+		(EmbeddedAccountAddressRestrictionTransactionV1.TRANSACTION_TYPE.value, EmbeddedAccountAddressRestrictionTransactionV1.TRANSACTION_VERSION): EmbeddedAccountAddressRestrictionTransactionV1,
+		(EmbeddedAccountMosaicRestrictionTransactionV1.TRANSACTION_TYPE.value, EmbeddedAccountMosaicRestrictionTransactionV1.TRANSACTION_VERSION): EmbeddedAccountMosaicRestrictionTransactionV1,
+		(EmbeddedAccountOperationRestrictionTransactionV1.TRANSACTION_TYPE.value, EmbeddedAccountOperationRestrictionTransactionV1.TRANSACTION_VERSION): EmbeddedAccountOperationRestrictionTransactionV1,
+		(EmbeddedMosaicAddressRestrictionTransactionV1.TRANSACTION_TYPE.value, EmbeddedMosaicAddressRestrictionTransactionV1.TRANSACTION_VERSION): EmbeddedMosaicAddressRestrictionTransactionV1,
+		(EmbeddedMosaicGlobalRestrictionTransactionV1.TRANSACTION_TYPE.value, EmbeddedMosaicGlobalRestrictionTransactionV1.TRANSACTION_VERSION): EmbeddedMosaicGlobalRestrictionTransactionV1,
+		(EmbeddedTransferTransactionV1.TRANSACTION_TYPE.value, EmbeddedTransferTransactionV1.TRANSACTION_VERSION): EmbeddedTransferTransactionV1
+	}
+
 	@classmethod
-	def deserialize(cls, payload: bytes) -> EmbeddedTransaction:
-		parent = EmbeddedTransaction()
-		buffer = bytes(payload)
-		EmbeddedTransaction._deserialize(buffer, parent)  # pylint: disable=protected-access
+	def deserialize(cls, payload: bytes | bytearray | memoryview) -> EmbeddedTransaction:
+		buffer = memoryview(payload)
+		if len(buffer) < 48:
+			raise ValueError(f'payload size {len(buffer)} is smaller than EmbeddedTransaction header size 48')
+
+		discriminator = (int.from_bytes(buffer[46:48], byteorder='little', signed=False), int.from_bytes(buffer[44:45], byteorder='little', signed=False))
+		factory_class = cls.MAPPING.get(discriminator)
+		if factory_class is None:
+			raise ValueError(f'unknown discriminator {discriminator} for EmbeddedTransaction')
 
-		mapping = {
-			(EmbeddedAccountKeyLinkTransactionV1.TRANSACTION_TYPE, EmbeddedAccountKeyLinkTransactionV1.TRANSACTION_VERSION): EmbeddedAccountKeyLinkTransactionV1,
-			(EmbeddedNodeKeyLinkTransactionV1.TRANSACTION_TYPE, EmbeddedNodeKeyLinkTransactionV1.TRANSACTION_VERSION): EmbeddedNodeKeyLinkTransactionV1,
-			(EmbeddedVotingKeyLinkTransactionV1.TRANSACTION_TYPE, EmbeddedVotingKeyLinkTransactionV1.TRANSACTION_VERSION): EmbeddedVotingKeyLinkTransactionV1,
-			(EmbeddedVrfKeyLinkTransactionV1.TRANSACTION_TYPE, EmbeddedVrfKeyLinkTransactionV1.TRANSACTION_VERSION): EmbeddedVrfKeyLinkTransactionV1,
-			(EmbeddedHashLockTransactionV1.TRANSACTION_TYPE, EmbeddedHashLockTransactionV1.TRANSACTION_VERSION): EmbeddedHashLockTransactionV1,
-			(EmbeddedSecretLockTransactionV1.TRANSACTION_TYPE, EmbeddedSecretLockTransactionV1.TRANSACTION_VERSION): EmbeddedSecretLockTransactionV1,
-			(EmbeddedSecretProofTransactionV1.TRANSACTION_TYPE, EmbeddedSecretProofTransactionV1.TRANSACTION_VERSION): EmbeddedSecretProofTransactionV1,
-			(EmbeddedAccountMetadataTransactionV1.TRANSACTION_TYPE, EmbeddedAccountMetadataTransactionV1.TRANSACTION_VERSION): EmbeddedAccountMetadataTransactionV1,
-			(EmbeddedMosaicMetadataTransactionV1.TRANSACTION_TYPE, EmbeddedMosaicMetadataTransactionV1.TRANSACTION_VERSION): EmbeddedMosaicMetadataTransactionV1,
-			(EmbeddedNamespaceMetadataTransactionV1.TRANSACTION_TYPE, EmbeddedNamespaceMetadataTransactionV1.TRANSACTION_VERSION): EmbeddedNamespaceMetadataTransactionV1,
-			(EmbeddedMosaicDefinitionTransactionV1.TRANSACTION_TYPE, EmbeddedMosaicDefinitionTransactionV1.TRANSACTION_VERSION): EmbeddedMosaicDefinitionTransactionV1,
-			(EmbeddedMosaicSupplyChangeTransactionV1.TRANSACTION_TYPE, EmbeddedMosaicSupplyChangeTransactionV1.TRANSACTION_VERSION): EmbeddedMosaicSupplyChangeTransactionV1,
-			(EmbeddedMosaicSupplyRevocationTransactionV1.TRANSACTION_TYPE, EmbeddedMosaicSupplyRevocationTransactionV1.TRANSACTION_VERSION): EmbeddedMosaicSupplyRevocationTransactionV1,
-			(EmbeddedMultisigAccountModificationTransactionV1.TRANSACTION_TYPE, EmbeddedMultisigAccountModificationTransactionV1.TRANSACTION_VERSION): EmbeddedMultisigAccountModificationTransactionV1,
-			(EmbeddedAddressAliasTransactionV1.TRANSACTION_TYPE, EmbeddedAddressAliasTransactionV1.TRANSACTION_VERSION): EmbeddedAddressAliasTransactionV1,
-			(EmbeddedMosaicAliasTransactionV1.TRANSACTION_TYPE, EmbeddedMosaicAliasTransactionV1.TRANSACTION_VERSION): EmbeddedMosaicAliasTransactionV1,
-			(EmbeddedNamespaceRegistrationTransactionV1.TRANSACTION_TYPE, EmbeddedNamespaceRegistrationTransactionV1.TRANSACTION_VERSION): EmbeddedNamespaceRegistrationTransactionV1,
-			(EmbeddedAccountAddressRestrictionTransactionV1.TRANSACTION_TYPE, EmbeddedAccountAddressRestrictionTransactionV1.TRANSACTION_VERSION): EmbeddedAccountAddressRestrictionTransactionV1,
-			(EmbeddedAccountMosaicRestrictionTransactionV1.TRANSACTION_TYPE, EmbeddedAccountMosaicRestrictionTransactionV1.TRANSACTION_VERSION): EmbeddedAccountMosaicRestrictionTransactionV1,
-			(EmbeddedAccountOperationRestrictionTransactionV1.TRANSACTION_TYPE, EmbeddedAccountOperationRestrictionTransactionV1.TRANSACTION_VERSION): EmbeddedAccountOperationRestrictionTransactionV1,
-			(EmbeddedMosaicAddressRestrictionTransactionV1.TRANSACTION_TYPE, EmbeddedMosaicAddressRestrictionTransactionV1.TRANSACTION_VERSION): EmbeddedMosaicAddressRestrictionTransactionV1,
-			(EmbeddedMosaicGlobalRestrictionTransactionV1.TRANSACTION_TYPE, EmbeddedMosaicGlobalRestrictionTransactionV1.TRANSACTION_VERSION): EmbeddedMosaicGlobalRestrictionTransactionV1,
-			(EmbeddedTransferTransactionV1.TRANSACTION_TYPE, EmbeddedTransferTransactionV1.TRANSACTION_VERSION): EmbeddedTransferTransactionV1
-		}
-		discriminator = (parent.type_, parent.version)
-		factory_class = mapping[discriminator]
 		return factory_class.deserialize(buffer)
 
 	@classmethod
@@ -9034,19 +14946,23 @@ class EmbeddedTransactionFactory:
 
 
 class BlockFactory:
+	MAPPING = {
+		(NemesisBlockV1.BLOCK_TYPE.value): NemesisBlockV1,
+		(NormalBlockV1.BLOCK_TYPE.value): NormalBlockV1,
+		(ImportanceBlockV1.BLOCK_TYPE.value): ImportanceBlockV1
+	}
+
 	@classmethod
-	def deserialize(cls, payload: bytes) -> Block:
-		parent = Block()
-		buffer = bytes(payload)
-		Block._deserialize(buffer, parent)  # pylint: disable=protected-access
+	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Block:
+		buffer = memoryview(payload)
+		if len(buffer) < 136:
+			raise ValueError(f'payload size {len(buffer)} is smaller than Block header size 136')
+
+		discriminator = (int.from_bytes(buffer[110:112], byteorder='little', signed=False))
+		factory_class = cls.MAPPING.get(discriminator)
+		if factory_class is None:
+			raise ValueError(f'unknown discriminator {discriminator} for Block')
 
-		mapping = {
-			(NemesisBlockV1.BLOCK_TYPE): NemesisBlockV1,
-			(NormalBlockV1.BLOCK_TYPE): NormalBlockV1,
-			(ImportanceBlockV1.BLOCK_TYPE): ImportanceBlockV1
-		}
-		discriminator = (parent.type_)
-		factory_class = mapping[discriminator]
 		return factory_class.deserialize(buffer)
 
 	@classmethod
@@ -9064,29 +14980,33 @@ class BlockFactory:
 
 
 class ReceiptFactory:
+	MAPPING = {
+		(HarvestFeeReceipt.RECEIPT_TYPE.value): HarvestFeeReceipt,
+		(InflationReceipt.RECEIPT_TYPE.value): InflationReceipt,
+		(LockHashCreatedFeeReceipt.RECEIPT_TYPE.value): LockHashCreatedFeeReceipt,
+		(LockHashCompletedFeeReceipt.RECEIPT_TYPE.value): LockHashCompletedFeeReceipt,
+		(LockHashExpiredFeeReceipt.RECEIPT_TYPE.value): LockHashExpiredFeeReceipt,
+		(LockSecretCreatedFeeReceipt.RECEIPT_TYPE.value): LockSecretCreatedFeeReceipt,
+		(LockSecretCompletedFeeReceipt.RECEIPT_TYPE.value): LockSecretCompletedFeeReceipt,
+		(LockSecretExpiredFeeReceipt.RECEIPT_TYPE.value): LockSecretExpiredFeeReceipt,
+		(MosaicExpiredReceipt.RECEIPT_TYPE.value): MosaicExpiredReceipt,
+		(MosaicRentalFeeReceipt.RECEIPT_TYPE.value): MosaicRentalFeeReceipt,
+		(NamespaceExpiredReceipt.RECEIPT_TYPE.value): NamespaceExpiredReceipt,
+		(NamespaceDeletedReceipt.RECEIPT_TYPE.value): NamespaceDeletedReceipt,
+		(NamespaceRentalFeeReceipt.RECEIPT_TYPE.value): NamespaceRentalFeeReceipt
+	}
+
 	@classmethod
-	def deserialize(cls, payload: bytes) -> Receipt:
-		parent = Receipt()
-		buffer = bytes(payload)
-		Receipt._deserialize(buffer, parent)  # pylint: disable=protected-access
+	def deserialize(cls, payload: bytes | bytearray | memoryview) -> Receipt:
+		buffer = memoryview(payload)
+		if len(buffer) < 8:
+			raise ValueError(f'payload size {len(buffer)} is smaller than Receipt header size 8')
+
+		discriminator = (int.from_bytes(buffer[6:8], byteorder='little', signed=False))
+		factory_class = cls.MAPPING.get(discriminator)
+		if factory_class is None:
+			raise ValueError(f'unknown discriminator {discriminator} for Receipt')
 
-		mapping = {
-			(HarvestFeeReceipt.RECEIPT_TYPE): HarvestFeeReceipt,
-			(InflationReceipt.RECEIPT_TYPE): InflationReceipt,
-			(LockHashCreatedFeeReceipt.RECEIPT_TYPE): LockHashCreatedFeeReceipt,
-			(LockHashCompletedFeeReceipt.RECEIPT_TYPE): LockHashCompletedFeeReceipt,
-			(LockHashExpiredFeeReceipt.RECEIPT_TYPE): LockHashExpiredFeeReceipt,
-			(LockSecretCreatedFeeReceipt.RECEIPT_TYPE): LockSecretCreatedFeeReceipt,
-			(LockSecretCompletedFeeReceipt.RECEIPT_TYPE): LockSecretCompletedFeeReceipt,
-			(LockSecretExpiredFeeReceipt.RECEIPT_TYPE): LockSecretExpiredFeeReceipt,
-			(MosaicExpiredReceipt.RECEIPT_TYPE): MosaicExpiredReceipt,
-			(MosaicRentalFeeReceipt.RECEIPT_TYPE): MosaicRentalFeeReceipt,
-			(NamespaceExpiredReceipt.RECEIPT_TYPE): NamespaceExpiredReceipt,
-			(NamespaceDeletedReceipt.RECEIPT_TYPE): NamespaceDeletedReceipt,
-			(NamespaceRentalFeeReceipt.RECEIPT_TYPE): NamespaceRentalFeeReceipt
-		}
-		discriminator = (parent.type_)
-		factory_class = mapping[discriminator]
 		return factory_class.deserialize(buffer)
 
 	@classmethod
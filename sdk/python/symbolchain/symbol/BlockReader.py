@@ -0,0 +1,112 @@
+from ..ArrayHelpers import ArrayHelpers
+from ..sc import AggregateCompleteTransactionV2, BlockFactory, EmbeddedTransactionFactory, TransactionFactory, TransactionType
+from ..StreamReader import StreamReader
+
+# type follows size, reserved, signature, signer public key, reserved, version and network (same for blocks and transactions)
+ENTITY_TYPE_OFFSET = 110
+TRANSACTION_ALIGNMENT = 8
+
+# size of (empty) block or aggregate is the size of its header preceding transactions
+BLOCK_HEADER_SIZES = {block_type: block_class().size for (block_type, block_class) in BlockFactory.MAPPING.items()}
+AGGREGATE_HEADER_SIZE = AggregateCompleteTransactionV2().size
+AGGREGATE_TRANSACTION_TYPES = (TransactionType.AGGREGATE_COMPLETE.value, TransactionType.AGGREGATE_BONDED.value)
+
+
+def _read_entity_type(view):
+	return int.from_bytes(view[ENTITY_TYPE_OFFSET:ENTITY_TYPE_OFFSET + 2], byteorder='little', signed=False)
+
+
+class StreamedBlock:
+	"""Block read from a stream, which reads its transactions on demand."""
+
+	def __init__(self, header, size, reader, transactions_size):
+		"""Creates a streamed block around a deserialized block header (block without transactions)."""
+		self.header = header
+		self.size = size
+		self._reader = reader
+		self._remaining_size = transactions_size
+
+	def transaction_payloads(self):
+		"""Reads serialized transactions one at a time."""
+		while self._remaining_size:
+			payload = self._reader.read_size_prefixed()
+			if payload is None or len(payload) > self._remaining_size:
+				raise ValueError('transaction exceeds block')
+
+			self._remaining_size -= len(payload)
+
+			# last transaction in block is not padded
+			padding_size = min(ArrayHelpers.align_up(len(payload), TRANSACTION_ALIGNMENT) - len(payload), self._remaining_size)
+			self._reader.skip(padding_size)
+			self._remaining_size -= padding_size
+
+			yield payload
+
+	def transactions(self):
+		"""Reads and deserializes transactions one at a time."""
+		for payload in self.transaction_payloads():
+			yield TransactionFactory.deserialize(payload)
+
+	def skip_transactions(self):
+		"""Skips all transactions that have not been read yet."""
+		self._reader.skip(self._remaining_size)
+		self._remaining_size = 0
+
+
+class BlockReader:
+	"""Reads concatenated serialized blocks one at a time from a buffer (bytes, mmap) or a readinto-capable stream."""
+
+	def __init__(self, source):
+		"""Creates a reader around source."""
+		self._reader = StreamReader(source)
+
+	def __iter__(self):
+		block = None
+		while True:
+			# transactions not consumed by caller need to be skipped before next block can be read
+			if block:
+				block.skip_transactions()
+
+			block = self._read_block()
+			if not block:
+				return
+
+			yield block
+
+	def _read_block(self):
+		prefix = self._reader.read_or_none(ENTITY_TYPE_OFFSET + 2)
+		if prefix is None:
+			return None
+
+		block_size = int.from_bytes(prefix[:4], byteorder='little', signed=False)
+		block_type = _read_entity_type(prefix)
+		if block_type not in BLOCK_HEADER_SIZES:
+			raise ValueError(f'unknown block type {block_type}')
+
+		header_size = BLOCK_HEADER_SIZES[block_type]
+		if block_size < header_size:
+			raise ValueError(f'block size {block_size} is smaller than its header size {header_size}')
+
+		# deserialize header as standalone block without transactions
+		header_buffer = bytearray(header_size)
+		header_buffer[:len(prefix)] = prefix
+		header_buffer[len(prefix):] = self._reader.read(header_size - len(prefix))
+		header_buffer[:4] = header_size.to_bytes(4, byteorder='little', signed=False)
+
+		header = BlockFactory.deserialize(header_buffer)
+		return StreamedBlock(header, block_size, self._reader, block_size - header_size)
+
+
+def read_embedded_transactions(aggregate_payload):
+	"""Reads and deserializes embedded transactions of a serialized aggregate transaction one at a time."""
+	view = memoryview(aggregate_payload)
+	if _read_entity_type(view) not in AGGREGATE_TRANSACTION_TYPES:
+		raise ValueError('payload is not an aggregate transaction')
+
+	# payload size is followed by reserved field, which immediately precedes embedded transactions
+	payload_size = int.from_bytes(view[AGGREGATE_HEADER_SIZE - 8:AGGREGATE_HEADER_SIZE - 4], byteorder='little', signed=False)
+	transactions_view = view[AGGREGATE_HEADER_SIZE:AGGREGATE_HEADER_SIZE + payload_size]
+	if payload_size != len(transactions_view):
+		raise ValueError('embedded transactions exceed aggregate transaction')
+
+	yield from ArrayHelpers.iter_variable_size_elements(transactions_view, EmbeddedTransactionFactory, TRANSACTION_ALIGNMENT)
@@ -1,8 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ed25519
 
 from ..CryptoTypes import PrivateKey, PublicKey, Signature
+from ..impl.ChunkHelpers import map_chunks
 
 
 class KeyPair:
@@ -47,3 +50,44 @@ class Verifier:
 			return True
 		except InvalidSignature:
 			return False
+
+
+class BatchVerifier:
+	"""Verifies signatures signed by (potentially) many key pairs in parallel."""
+
+	def __init__(self, max_workers=None, chunk_size=64):
+		"""Creates a batch verifier using up to max_workers threads, each verifying chunk_size signatures at a time."""
+		self.max_workers = max_workers
+		self.chunk_size = chunk_size
+
+	def verify(self, items):
+		"""Verifies (public key, message, signature) items and returns whether each item was verified."""
+		items = list(items)
+		if len(items) <= self.chunk_size:
+			return self._verify_chunk(items)
+
+		# cryptography releases GIL while verifying, so threads verify signatures concurrently
+		with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+			return map_chunks(self._verify_chunk, (), items, self.chunk_size, executor)
+
+	def failed_indexes(self, items):
+		"""Verifies (public key, message, signature) items and returns indexes of items that failed verification."""
+		return [index for (index, is_verified) in enumerate(self.verify(items)) if not is_verified]
+
+	@staticmethod
+	def _verify_chunk(items):
+		# signers often sign multiple items (e.g. cosignatures), so reuse verifiers within chunk
+		# items with invalid (e.g. zero) public key are reported as failed instead of aborting whole batch
+		verifiers = {}
+		results = []
+		for (public_key, message, signature) in items:
+			if public_key.bytes not in verifiers:
+				try:
+					verifiers[public_key.bytes] = Verifier(public_key)
+				except ValueError:
+					verifiers[public_key.bytes] = None
+
+			verifier = verifiers[public_key.bytes]
+			results.append(bool(verifier) and verifier.verify(message, signature))
+
+		return results
@@ -2,78 +2,184 @@ import hashlib
 from binascii import hexlify
 from collections import namedtuple
 from enum import Enum
-from functools import reduce
 
 from ..BufferReader import BufferReader
 from ..CryptoTypes import Hash256
 
 MerklePart = namedtuple('MerklePart', ['hash', 'is_left'])
 PatriciaTreePath = namedtuple('PatriciaTreePath', ['path', 'size'])
+_PatriciaNodeInfo = namedtuple('_PatriciaNodeInfo', ['hash', 'hex_path', 'link_indexes'])
 
 # region MerkleHashBuilder
 
 
+def _hash_pair(left_hash_bytes, right_hash_bytes):
+	return hashlib.sha3_256(left_hash_bytes + right_hash_bytes).digest()
+
+
+def _build_levels(leaf_hashes):
+	levels = [leaf_hashes]
+	while len(levels[-1]) > 1:
+		level = levels[-1]
+
+		# if there is an odd number of hashes, duplicate the last one
+		levels.append([
+			_hash_pair(level[i], level[i + 1] if i + 1 < len(level) else level[i])
+			for i in range(0, len(level), 2)
+		])
+
+	return levels
+
+
 class MerkleHashBuilder:
 	"""Builder for creating a merkle hash."""
 
 	def __init__(self):
 		"""Creates a merkle hash builder."""
 		self.hashes = []
+		self._levels = None
 
 	def update(self, component_hash):
 		"""Adds a hash to the merkle hash."""
 		self.hashes.append(component_hash.bytes)
+		self._levels = None
 
 	def final(self):
 		"""Calculates the merkle hash."""
 		if not self.hashes:
 			return Hash256.zero()
 
-		num_remaining_hashes = len(self.hashes)
-		while num_remaining_hashes > 1:
-			i = 0
-			while i < num_remaining_hashes:
-				hasher = hashlib.sha3_256()
-				hasher.update(self.hashes[i])
+		return Hash256(self._get_levels()[-1][0])
+
+	def merkle_path(self, index):
+		"""
+		Calculates the merkle *hash chain* path proving the hash at index.
+		Path is ordered from leaf to root, where each element is MerklePart.
+		"""
+		if not 0 <= index < len(self.hashes):
+			raise ValueError(f'index {index} is out of range of {len(self.hashes)} hashes')
+
+		merkle_path = []
+		for level in self._get_levels()[:-1]:
+			# left nodes are paired with their right sibling or, if there is none, with themselves
+			if 1 == index % 2:
+				merkle_path.append(MerklePart(Hash256(level[index - 1]), True))
+			else:
+				merkle_path.append(MerklePart(Hash256(level[index + 1] if index + 1 < len(level) else level[index]), False))
 
-				if i + 1 < num_remaining_hashes:
-					hasher.update(self.hashes[i + 1])
-				else:
-					# if there is an odd number of hashes, duplicate the last one
-					hasher.update(self.hashes[i])
-					num_remaining_hashes += 1
+			index //= 2
 
-				self.hashes[i // 2] = hasher.digest()
-				i += 2
+		return merkle_path
 
-			num_remaining_hashes //= 2
+	def _get_levels(self):
+		# intermediate levels are kept (from leaves to root), so paths of all leaves can be calculated without rehashing
+		if self._levels is None:
+			self._levels = _build_levels(list(self.hashes))
 
-		return Hash256(self.hashes[0])
+		return self._levels
+
+# endregion
+
+
+# region MerkleHashAccumulator
+
+class MerkleHashAccumulator(MerkleHashBuilder):
+	"""Merkle hash builder that rehashes only the nodes on the path of an appended or replaced hash."""
+
+	def __init__(self, component_hashes=()):
+		"""Creates a merkle hash accumulator around (optional) initial hashes."""
+		super().__init__()
+		self.hashes = [component_hash.bytes for component_hash in component_hashes]
+		self._levels = _build_levels(self.hashes)
+
+	def update(self, component_hash):
+		"""Adds a hash to the merkle hash."""
+		self.append(component_hash)
+
+	def append(self, component_hash):
+		"""Appends a hash to the merkle hash."""
+		self.hashes.append(component_hash.bytes)
+		self._update_path(len(self.hashes) - 1)
+
+	def replace(self, index, component_hash):
+		"""Replaces the hash at index."""
+		if not 0 <= index < len(self.hashes):
+			raise ValueError(f'index {index} is out of range of {len(self.hashes)} hashes')
+
+		self.hashes[index] = component_hash.bytes
+		self._update_path(index)
+
+	def root(self):
+		"""Gets the (current) merkle hash."""
+		return self.final()
+
+	def _update_path(self, index):
+		# levels only grow, so parent of an appended node is either an existing node or the new last node of its level
+		level_index = 0
+		while len(self._levels[level_index]) > 1:
+			level = self._levels[level_index]
+			parent_index = index // 2
+			left_index = 2 * parent_index
+			parent_hash_bytes = _hash_pair(level[left_index], level[left_index + 1] if left_index + 1 < len(level) else level[left_index])
+
+			if level_index + 1 == len(self._levels):
+				self._levels.append([])
+
+			parent_level = self._levels[level_index + 1]
+			if parent_index == len(parent_level):
+				parent_level.append(parent_hash_bytes)
+			else:
+				parent_level[parent_index] = parent_hash_bytes
+
+			level_index += 1
+			index = parent_index
 
 # endregion
 
 
 # region prove_merkle
 
+def _calculate_merkle_root_bytes(leaf_hash_bytes, merkle_path, calculate_next_hash_bytes):
+	working_hash_bytes = leaf_hash_bytes
+	for merkle_part in merkle_path:
+		if merkle_part.is_left:
+			working_hash_bytes = calculate_next_hash_bytes(merkle_part.hash.bytes, working_hash_bytes)
+		else:
+			working_hash_bytes = calculate_next_hash_bytes(working_hash_bytes, merkle_part.hash.bytes)
+
+	return working_hash_bytes
+
+
 def prove_merkle(leaf_hash, merkle_path, root_hash):
 	"""
 	Proves a merkle hash.
 	Merkle *hash chain* path is ordered from leaf to root, where each element is MerklePart.
 	"""
 
-	def calculate_next_hash(working_hash, merkle_part):
-		hasher = hashlib.sha3_256()
-		if merkle_part.is_left:
-			hasher.update(merkle_part.hash.bytes)
-			hasher.update(working_hash.bytes)
-		else:
-			hasher.update(working_hash.bytes)
-			hasher.update(merkle_part.hash.bytes)
+	return root_hash.bytes == _calculate_merkle_root_bytes(leaf_hash.bytes, merkle_path, _hash_pair)
 
-		return Hash256(hasher.digest())
 
-	computed_root_hash = reduce(calculate_next_hash, merkle_path, leaf_hash)
-	return root_hash == computed_root_hash
+def prove_merkle_many(leaf_hashes_and_paths, root_hash):
+	"""
+	Proves many merkle hashes against the same root hash, returns list of proof results in input order.
+	Each element is a (leaf hash, merkle *hash chain* path) tuple and internal nodes shared by multiple paths are only hashed once.
+	"""
+
+	parent_hashes = {}
+
+	def calculate_next_hash_bytes(left_hash_bytes, right_hash_bytes):
+		child_hashes = (left_hash_bytes, right_hash_bytes)
+		parent_hash_bytes = parent_hashes.get(child_hashes)
+		if parent_hash_bytes is None:
+			parent_hash_bytes = _hash_pair(left_hash_bytes, right_hash_bytes)
+			parent_hashes[child_hashes] = parent_hash_bytes
+
+		return parent_hash_bytes
+
+	return [
+		root_hash.bytes == _calculate_merkle_root_bytes(leaf_hash.bytes, merkle_path, calculate_next_hash_bytes)
+		for (leaf_hash, merkle_path) in leaf_hashes_and_paths
+	]
 
 # endregion
 
@@ -148,7 +254,7 @@ class BranchNode(TreeNode):
 # endregion
 
 
-# region deserialize_patricia_tree_nodes
+# region deserialize_patricia_tree_nodes / serialize_patricia_tree_nodes
 
 def _deserialize_path(reader):
 	num_nibbles = reader.read_int(1)
@@ -174,20 +280,42 @@ def _deserialize_branch(reader):
 	return BranchNode(path, links)
 
 
+def _deserialize_node(reader):
+	node_marker = reader.read_int(1)
+
+	if 0xFF == node_marker:
+		return _deserialize_leaf(reader)
+
+	if 0x00 == node_marker:
+		return _deserialize_branch(reader)
+
+	raise ValueError(f'invalid marker of a serialized node ({node_marker})')
+
+
 def deserialize_patricia_tree_nodes(buffer):
 	reader = BufferReader(buffer)
 	nodes = []
 	while not reader.eof:
-		node_marker = reader.read_int(1)
+		nodes.append(_deserialize_node(reader))
 
-		if 0xFF == node_marker:
-			nodes.append(_deserialize_leaf(reader))
-		elif 0x00 == node_marker:
-			nodes.append(_deserialize_branch(reader))
+	return nodes
+
+
+def _serialize_path(path):
+	return bytes([path.size]) + path.path[:(path.size + 1) // 2]
+
+
+def serialize_patricia_tree_nodes(nodes):
+	buffer = bytearray()
+	for node in nodes:
+		if hasattr(node, 'value'):
+			buffer += bytes([0xFF]) + _serialize_path(node.path) + node.value.bytes
 		else:
-			raise ValueError(f'invalid marker of a serialized node ({node_marker})')
+			links_mask = sum(1 << index for (index, link) in enumerate(node.links) if link is not None)
+			buffer += bytes([0x00]) + _serialize_path(node.path) + links_mask.to_bytes(2, 'little')
+			buffer += b''.join(link.bytes for link in node.links if link is not None)
 
-	return nodes
+	return bytes(buffer)
 
 # endregion
 
@@ -217,50 +345,108 @@ def _check_state_hash(state_hash, subcache_merkle_roots):
 	return state_hash == Hash256(hasher.digest())
 
 
-def prove_patricia_merkle(encoded_key, value_to_test, merkle_path, state_hash, subcache_merkle_roots):
+class PatriciaProofVerifier:
 	"""
-	Proves a patricia merkle hash.
-	Merkle *node* path is ordered from root to leaf, where each element is either BranchNode or LeafNode.
+	Proves many patricia merkle hashes against the same state hash and subcache merkle roots.
+	Node hashes and link lookups are cached, so nodes must not be modified after they have been used in a proof.
 	"""
 
-	# pylint: disable=too-many-return-statements
+	def __init__(self, state_hash, subcache_merkle_roots):
+		"""Creates a verifier around a state hash and the subcache merkle roots it is derived from."""
+		self.state_hash = state_hash
+		self.subcache_merkle_roots = subcache_merkle_roots
 
-	if not _check_state_hash(state_hash, subcache_merkle_roots):
-		return PatriciaMerkleProofResult.STATE_HASH_DOES_NOT_MATCH_ROOTS
+		self._is_state_hash_valid = _check_state_hash(state_hash, subcache_merkle_roots)
+		self._subcache_merkle_root_bytes = {root.bytes for root in subcache_merkle_roots}
 
-	if merkle_path[0].calculate_hash() not in subcache_merkle_roots:
-		return PatriciaMerkleProofResult.UNANCHORED_PATH_TREE
+		# nodes are kept alive by cache, so their ids are not reused
+		self._node_infos = {}
+		self._serialized_nodes = {}
 
-	# positive proof must end with a leaf
-	is_positive_proof = hasattr(merkle_path[-1], 'value')
-	if is_positive_proof:
-		if value_to_test != merkle_path[-1].value:
-			return PatriciaMerkleProofResult.LEAF_VALUE_MISMATCH
+	def deserialize_patricia_tree_nodes(self, buffer):
+		"""Deserializes nodes, reusing previously deserialized nodes with the same serialized bytes."""
+		reader = BufferReader(buffer)
+		nodes = []
+		while not reader.eof:
+			start_offset = reader.offset
+			node = _deserialize_node(reader)
+			nodes.append(self._serialized_nodes.setdefault(bytes(buffer[start_offset:reader.offset]), node))
 
-	child_hash = None
-	actual_path = ''
-	for node in reversed(merkle_path):
-		node_hash = node.calculate_hash()
-		formatted_link_index = ''
-		if child_hash:
-			if child_hash not in node.links:
-				return PatriciaMerkleProofResult.UNLINKED_NODE
+		return nodes
 
-			formatted_link_index = f'{node.links.index(child_hash):01X}'
+	def prove(self, encoded_key, value_to_test, merkle_path):
+		"""
+		Proves a patricia merkle hash.
+		Merkle *node* path is ordered from root to leaf, where each element is either BranchNode or LeafNode.
+		"""
 
-		child_hash = node_hash
-		actual_path = f'{formatted_link_index}{node.hex_path}{actual_path}'
+		# pylint: disable=too-many-return-statements
 
-	if is_positive_proof:
-		# for positive proof, expected and calculated paths must match exactly
-		return PatriciaMerkleProofResult.PATH_MISMATCH if actual_path != str(encoded_key) else PatriciaMerkleProofResult.VALID_POSITIVE
+		if not self._is_state_hash_valid:
+			return PatriciaMerkleProofResult.STATE_HASH_DOES_NOT_MATCH_ROOTS
 
-	# for negative proof, expected path must start with calculated path and next nibble must be a dead end
-	if not str(encoded_key).startswith(actual_path):
-		return PatriciaMerkleProofResult.PATH_MISMATCH
+		if self._get_node_info(merkle_path[0]).hash not in self._subcache_merkle_root_bytes:
+			return PatriciaMerkleProofResult.UNANCHORED_PATH_TREE
+
+		# positive proof must end with a leaf
+		is_positive_proof = hasattr(merkle_path[-1], 'value')
+		if is_positive_proof:
+			if value_to_test != merkle_path[-1].value:
+				return PatriciaMerkleProofResult.LEAF_VALUE_MISMATCH
+
+		child_hash = None
+		reversed_path_parts = []
+		for node in reversed(merkle_path):
+			node_info = self._get_node_info(node)
+			if child_hash:
+				link_index = node_info.link_indexes.get(child_hash)
+				if link_index is None:
+					return PatriciaMerkleProofResult.UNLINKED_NODE
+
+				reversed_path_parts.append(f'{link_index:01X}')
+
+			child_hash = node_info.hash
+			reversed_path_parts.append(node_info.hex_path)
+
+		actual_path = ''.join(reversed(reversed_path_parts))
+		if is_positive_proof:
+			# for positive proof, expected and calculated paths must match exactly
+			return PatriciaMerkleProofResult.PATH_MISMATCH if actual_path != str(encoded_key) else PatriciaMerkleProofResult.VALID_POSITIVE
+
+		# for negative proof, expected path must start with calculated path and next nibble must be a dead end
+		if not str(encoded_key).startswith(actual_path):
+			return PatriciaMerkleProofResult.PATH_MISMATCH
+
+		next_nibble = _get_nibble_at(PatriciaTreePath(encoded_key.bytes, 2 * len(encoded_key.bytes)), len(actual_path))
+		next_node = merkle_path[-1].links[next_nibble]
+		return PatriciaMerkleProofResult.INCONCLUSIVE if next_node is not None else PatriciaMerkleProofResult.VALID_NEGATIVE
+
+	def prove_many(self, proofs):
+		"""Proves many (encoded key, value to test, merkle path) tuples and returns list of proof results in input order."""
+		return [self.prove(encoded_key, value_to_test, merkle_path) for (encoded_key, value_to_test, merkle_path) in proofs]
+
+	def _get_node_info(self, node):
+		node_info_pair = self._node_infos.get(id(node))
+		if node_info_pair is not None:
+			return node_info_pair[1]
+
+		# first link is used when multiple links have the same hash (same as list index)
+		link_indexes = {}
+		for (index, link) in enumerate(getattr(node, 'links', [])):
+			if link is not None:
+				link_indexes.setdefault(link.bytes, index)
+
+		node_info = _PatriciaNodeInfo(node.calculate_hash().bytes, node.hex_path, link_indexes)
+		self._node_infos[id(node)] = (node, node_info)
+		return node_info
+
+
+def prove_patricia_merkle(encoded_key, value_to_test, merkle_path, state_hash, subcache_merkle_roots):
+	"""
+	Proves a patricia merkle hash.
+	Merkle *node* path is ordered from root to leaf, where each element is either BranchNode or LeafNode.
+	"""
 
-	next_nibble = _get_nibble_at(PatriciaTreePath(encoded_key.bytes, 2 * len(encoded_key.bytes)), len(actual_path))
-	next_node = merkle_path[-1].links[next_nibble]
-	return PatriciaMerkleProofResult.INCONCLUSIVE if next_node is not None else PatriciaMerkleProofResult.VALID_NEGATIVE
+	return PatriciaProofVerifier(state_hash, subcache_merkle_roots).prove(encoded_key, value_to_test, merkle_path)
 
 # endregion
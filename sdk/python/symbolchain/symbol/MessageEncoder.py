@@ -5,7 +5,8 @@ from binascii import hexlify, unhexlify
 import cryptography
 
 from symbolchain.CryptoTypes import PrivateKey, PublicKey
-from symbolchain.impl.CipherHelpers import decode_aes_gcm, encode_aes_gcm
+from symbolchain.impl.CipherHelpers import decode_aes_gcm, encode_aes_gcm, try_decode_many
+from symbolchain.SharedKeyCache import SharedKeyCache
 from symbolchain.symbol.KeyPair import KeyPair
 from symbolchain.symbol.SharedKey import SharedKey
 
@@ -15,10 +16,11 @@ DELEGATION_MARKER = unhexlify('FE2A8061577301E2')
 class MessageEncoder:
 	"""Encrypts and encodes messages between two parties."""
 
-	def __init__(self, key_pair: KeyPair):
-		"""Creates message encoder around key pair."""
+	def __init__(self, key_pair: KeyPair, shared_key_cache: SharedKeyCache = None):
+		"""Creates message encoder around key pair and (optional) cache of shared keys."""
 
 		self.key_pair = key_pair
+		self.shared_key_cache = shared_key_cache
 
 	def try_decode(self, recipient_public_key, encoded_message):
 		"""Tries to decode encoded message, returns tuple:
@@ -28,7 +30,7 @@ class MessageEncoder:
 
 		if 1 == encoded_message[0]:
 			try:
-				message = decode_aes_gcm(SharedKey, self.key_pair, recipient_public_key, encoded_message[1:])
+				message = decode_aes_gcm(SharedKey, self.key_pair, recipient_public_key, encoded_message[1:], self.shared_key_cache)
 				return True, message
 			except cryptography.exceptions.InvalidTag:
 				pass
@@ -46,10 +48,15 @@ class MessageEncoder:
 
 		return False, encoded_message
 
+	def try_decode_many(self, pairs, executor=None):
+		"""Tries to decode many (recipient public key, encoded message) pairs in parallel, returns try_decode tuples in input order."""
+
+		return try_decode_many(self, SharedKey, pairs, executor)
+
 	def encode(self, recipient_public_key: PublicKey, message: bytes):
 		"""Encodes message to recipient using recommended format."""
 
-		tag, initialization_vector, cipher_text = encode_aes_gcm(SharedKey, self.key_pair, recipient_public_key, message)
+		tag, initialization_vector, cipher_text = encode_aes_gcm(SharedKey, self.key_pair, recipient_public_key, message, self.shared_key_cache)
 		return b'\1' + tag + initialization_vector + cipher_text
 
 	@staticmethod
@@ -23,6 +23,8 @@ class NetworkTimestamp(BasicNetworkTimestamp):
 class Address(ByteArray):
 	"""Represents a Symbol address."""
 
+	__slots__ = ()
+
 	SIZE = 24
 	ENCODED_SIZE = 39
 
@@ -0,0 +1,207 @@
+import hashlib
+
+from ..CryptoTypes import Hash256
+from .Merkle import BranchNode, LeafNode, PatriciaTreePath
+
+EMPTY_LINK_HASH = bytes(Hash256.SIZE)
+
+# region nodes
+
+
+def _encode_path(hex_path, is_leaf):
+	# hex paths with odd number of nibbles store first nibble in header byte
+	if 1 == len(hex_path) % 2:
+		return bytes([(0x30 if is_leaf else 0x10) | int(hex_path[0], 16)]) + bytes.fromhex(hex_path[1:])
+
+	return bytes([0x20 if is_leaf else 0]) + bytes.fromhex(hex_path)
+
+
+def _to_tree_path(hex_path):
+	return PatriciaTreePath(bytes.fromhex(hex_path + '0' if 1 == len(hex_path) % 2 else hex_path), len(hex_path))
+
+
+class _Leaf:
+	# nodes are compact (hex string path, raw bytes values and hashes), so that trees with millions of keys fit in memory
+	__slots__ = ('hex_path', 'value', 'hash')
+
+	def __init__(self, hex_path, value):
+		self.hex_path = hex_path
+		self.value = value
+		self.hash = None
+
+	def calculate_hash(self):
+		if self.hash is None:
+			self.hash = hashlib.sha3_256(_encode_path(self.hex_path, True) + self.value).digest()
+
+		return self.hash
+
+	def to_tree_node(self):
+		return LeafNode(_to_tree_path(self.hex_path), Hash256(self.value))
+
+
+class _Branch:
+	__slots__ = ('hex_path', 'links', 'hash')
+
+	def __init__(self, hex_path):
+		self.hex_path = hex_path
+		self.links = [None] * 16
+		self.hash = None
+
+	def calculate_hash(self):
+		if self.hash is None:
+			hasher = hashlib.sha3_256(_encode_path(self.hex_path, False))
+			for link in self.links:
+				hasher.update(EMPTY_LINK_HASH if link is None else link.calculate_hash())
+
+			self.hash = hasher.digest()
+
+		return self.hash
+
+	def to_tree_node(self):
+		return BranchNode(_to_tree_path(self.hex_path), [None if link is None else Hash256(link.calculate_hash()) for link in self.links])
+
+
+def _to_hex_path(key):
+	return key.bytes.hex().upper()
+
+
+def _find_first_difference_index(lhs, rhs):
+	index = 0
+	max_index = min(len(lhs), len(rhs))
+	while index < max_index and lhs[index] == rhs[index]:
+		index += 1
+
+	return index
+
+# endregion
+
+
+# region PatriciaTree
+
+class PatriciaTree:
+	"""In memory compact patricia merkle tree of (key, value hash) pairs that calculates root hashes like catapult."""
+
+	def __init__(self):
+		"""Creates an empty tree."""
+		self._root_node = None
+		self._size = 0
+		self._hex_key_size = None
+
+	def __len__(self):
+		return self._size
+
+	def root(self):
+		"""Calculates the root hash, only rehashing nodes that changed since the root hash was last calculated."""
+		if self._root_node is None:
+			return Hash256.zero()
+
+		return Hash256(self._root_node.calculate_hash())
+
+	def get(self, key):
+		"""Gets the value associated with key or None if key is not in the tree."""
+		hex_path = _to_hex_path(key)
+		node = self._root_node
+		while isinstance(node, _Branch):
+			if not hex_path.startswith(node.hex_path):
+				return None
+
+			node_path_size = len(node.hex_path)
+			node = node.links[int(hex_path[node_path_size], 16)]
+			hex_path = hex_path[node_path_size + 1:]
+
+		return Hash256(node.value) if node is not None and node.hex_path == hex_path else None
+
+	def set(self, key, value):
+		"""Associates value with key, inserting key when it is not in the tree."""
+		hex_path = _to_hex_path(key)
+		if self._root_node is not None and len(hex_path) != self._hex_key_size:
+			raise ValueError(f'all keys in tree must have the same size ({self._hex_key_size // 2} bytes)')
+
+		self._hex_key_size = len(hex_path)
+		self._root_node = self._set(self._root_node, hex_path, value.bytes)
+
+	def unset(self, key):
+		"""Removes key from the tree and returns True if it was removed."""
+		is_removed, self._root_node = self._unset(self._root_node, _to_hex_path(key))
+		if is_removed:
+			self._size -= 1
+
+		return is_removed
+
+	def prove(self, key):
+		"""
+		Creates the merkle *node* path of key, which is ordered from root to leaf, where each element is either BranchNode or LeafNode.
+		Path ends with the leaf of key if key is in the tree (positive proof) or with the last node visited when looking up key (negative proof).
+		"""
+		hex_path = _to_hex_path(key)
+		merkle_path = []
+		node = self._root_node
+		while node is not None:
+			merkle_path.append(node.to_tree_node())
+			if not isinstance(node, _Branch) or not hex_path.startswith(node.hex_path):
+				break
+
+			node_path_size = len(node.hex_path)
+			node = node.links[int(hex_path[node_path_size], 16)]
+			hex_path = hex_path[node_path_size + 1:]
+
+		return merkle_path
+
+	def _set(self, node, hex_path, value):
+		if node is None:
+			self._size += 1
+			return _Leaf(hex_path, value)
+
+		if isinstance(node, _Branch) and hex_path.startswith(node.hex_path):
+			# branch path is completely shared with key, so attach key to (existing or new) linked node
+			node_path_size = len(node.hex_path)
+			link_index = int(hex_path[node_path_size], 16)
+			node.links[link_index] = self._set(node.links[link_index], hex_path[node_path_size + 1:], value)
+			node.hash = None
+			return node
+
+		if isinstance(node, _Leaf) and node.hex_path == hex_path:
+			node.value = value
+			node.hash = None
+			return node
+
+		difference_index = _find_first_difference_index(node.hex_path, hex_path)
+
+		# split node at first difference, so that both node (with truncated path) and new leaf are linked to new branch
+		branch_node = _Branch(hex_path[:difference_index])
+		branch_node.links[int(node.hex_path[difference_index], 16)] = node
+		branch_node.links[int(hex_path[difference_index], 16)] = self._set(None, hex_path[difference_index + 1:], value)
+
+		node.hex_path = node.hex_path[difference_index + 1:]
+		node.hash = None
+		return branch_node
+
+	def _unset(self, node, hex_path):
+		if node is None:
+			return False, node
+
+		if isinstance(node, _Leaf):
+			return (True, None) if node.hex_path == hex_path else (False, node)
+
+		if not hex_path.startswith(node.hex_path):
+			return False, node
+
+		node_path_size = len(node.hex_path)
+		link_index = int(hex_path[node_path_size], 16)
+		is_removed, node.links[link_index] = self._unset(node.links[link_index], hex_path[node_path_size + 1:])
+		if not is_removed:
+			return False, node
+
+		node.hash = None
+		remaining_link_indexes = [index for (index, link) in enumerate(node.links) if link is not None]
+		if 1 != len(remaining_link_indexes):
+			return True, node
+
+		# merge branch with a single remaining link into linked node
+		remaining_link_index = remaining_link_indexes[0]
+		linked_node = node.links[remaining_link_index]
+		linked_node.hex_path = f'{node.hex_path}{remaining_link_index:X}{linked_node.hex_path}'
+		linked_node.hash = None
+		return True, linked_node
+
+# endregion
@@ -1,6 +1,10 @@
+import io
+import json
 import os
 import tempfile
 import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import patch
 
 from symbolchain.AccountDescriptorRepository import AccountDescriptorRepository
 from symbolchain.CryptoTypes import Hash256, PrivateKey, PublicKey, Signature
@@ -9,6 +13,7 @@ from symbolchain.facade.NemFacade import NemFacade
 from symbolchain.nem.Network import Address
 from symbolchain.PrivateKeyStorage import PrivateKeyStorage
 from symbolchain.QrSignatureStorage import QrSignatureStorage
+from symbolchain.SignatureStorage import BinarySignatureStorage, JsonLinesSignatureStorage
 
 from ..test.TestUtils import TestUtils
 
@@ -43,6 +48,14 @@ TRANSACTIONS_YAML_INPUT = f'''
 '''.replace('\t', '  ')
 
 
+class TaggedNemFacade(NemFacade):
+	"""Nem facade with non-default constructor, which cannot be rebuilt from network alone."""
+
+	def __init__(self, network_name, account_descriptor_repository, tag):
+		super().__init__(network_name, account_descriptor_repository)
+		self.tag = tag
+
+
 class BatchOperationsTest(unittest.TestCase):
 	# region load_all
 
@@ -74,6 +87,48 @@ class BatchOperationsTest(unittest.TestCase):
 		self.assertEqual(1000000, transactions[1].amount.value)
 		self.assertEqual(None, transactions[1].message)
 
+	def _assert_can_iter_load_all_transactions(self, load):
+		# Arrange:
+		operations = self._create_operations()
+		expected_transactions = operations.load_all(TRANSACTIONS_YAML_INPUT)
+
+		# Act:
+		transactions = load(operations)
+
+		# Assert:
+		self.assertFalse(isinstance(transactions, list))
+		self.assertEqual(
+			[transaction.serialize() for transaction in expected_transactions],
+			[transaction.serialize() for transaction in transactions])
+
+	def test_can_iter_load_all_transactions_from_multi_document_yaml(self):
+		# Arrange: split list into documents containing single transactions
+		yaml_input = TRANSACTIONS_YAML_INPUT.replace('- type:', '---\ntype:').replace('\n  ', '\n')
+
+		# Act + Assert:
+		self._assert_can_iter_load_all_transactions(lambda operations: operations.iter_load_all(io.StringIO(yaml_input)))
+
+	def test_can_iter_load_all_transactions_from_json_lines(self):
+		# Arrange:
+		json_lines_input = '\n'.join([
+			json.dumps({
+				'type': 'transfer_transaction_v2',
+				'signer_public_key': 'TEST',
+				'recipient_address': 'ALICE',
+				'amount': 3000000,
+				'message': {'message_type': 'plain', 'message': 'Hello world!'}
+			}),
+			json.dumps({
+				'type': 'transfer_transaction_v2',
+				'signer_public_key': 'TEST',
+				'recipient_address': str(BOB_ADDRESS),
+				'amount': 1000000
+			})
+		])
+
+		# Act + Assert:
+		self._assert_can_iter_load_all_transactions(lambda operations: operations.iter_load_all_json_lines(io.StringIO(json_lines_input)))
+
 	# endregion
 
 	# region sign_all
@@ -201,13 +256,127 @@ class BatchOperationsTest(unittest.TestCase):
 
 	# endregion
 
+	# region sign_all + prepare_all (pluggable storage, executor)
+
+	def _assert_can_sign_and_prepare_all(self, signature_storage_factory, executor=None):
+		# Arrange:
+		operations = self._create_operations('test')
+		transactions = operations.load_all(TRANSACTIONS_YAML_INPUT)
+
+		with tempfile.TemporaryDirectory() as temp_directory:
+			(private_key_storage, signature_storage) = self._create_storages(temp_directory, True, signature_storage_factory)
+
+			payload_directory = os.path.join(temp_directory, 'payloads')
+			os.mkdir(payload_directory)
+
+			# Act:
+			operations.sign_all(transactions, private_key_storage, signature_storage, executor)
+			operations.prepare_all(transactions, signature_storage, payload_directory, executor)
+
+			# Assert:
+			self.assertEqual(['payload_test0.json', 'payload_test1.json'], sorted(os.listdir(payload_directory)))
+			for i, transaction in enumerate(transactions):
+				(_, signatures) = signature_storage.load(f'sig_test{i}')
+				self.assertTrue(operations.facade.verify_transaction(transaction, signatures[0]))
+
+	def test_can_sign_and_prepare_all_with_binary_signature_storage(self):
+		self._assert_can_sign_and_prepare_all(BinarySignatureStorage)
+
+	def test_can_sign_and_prepare_all_with_json_lines_signature_storage(self):
+		self._assert_can_sign_and_prepare_all(lambda directory: JsonLinesSignatureStorage(os.path.join(directory, 'signatures.jsonl')))
+
+	def test_can_sign_and_prepare_all_with_thread_pool_executor(self):
+		with ThreadPoolExecutor(2) as executor:
+			self._assert_can_sign_and_prepare_all(BinarySignatureStorage, executor)
+
+	def test_can_sign_and_prepare_all_with_process_pool_executor(self):
+		# Arrange: split transactions into single transaction chunks, so that they are processed by workers
+		with ProcessPoolExecutor(2) as executor, patch('symbolchain.impl.ChunkHelpers.DEFAULT_CHUNK_SIZE', 1):
+			self._assert_can_sign_and_prepare_all(BinarySignatureStorage, executor)
+
+	def _assert_sign_and_prepare_all_use_operations_facade(self, executor=None):
+		# Arrange:
+		facade = TaggedNemFacade('testnet', AccountDescriptorRepository(ACCOUNTS_YAML_INPUT), 'foo')
+		operations = BatchOperations(facade, 'test')
+		transactions = operations.load_all(TRANSACTIONS_YAML_INPUT)
+
+		with tempfile.TemporaryDirectory() as temp_directory:
+			(private_key_storage, signature_storage) = self._create_storages(temp_directory, True, BinarySignatureStorage)
+
+			payload_directory = os.path.join(temp_directory, 'payloads')
+			os.mkdir(payload_directory)
+
+			# Act: facade would fail to be rebuilt, so operations must use it directly
+			operations.sign_all(transactions, private_key_storage, signature_storage, executor)
+			operations.prepare_all(transactions, signature_storage, payload_directory, executor)
+
+			# Assert:
+			self.assertEqual(['payload_test0.json', 'payload_test1.json'], sorted(os.listdir(payload_directory)))
+			self.assertEqual('foo', operations.facade.tag)
+
+	def test_sign_and_prepare_all_use_operations_facade_without_executor(self):
+		self._assert_sign_and_prepare_all_use_operations_facade()
+
+	def test_sign_and_prepare_all_use_operations_facade_with_thread_pool_executor(self):
+		# Arrange: split transactions into single transaction chunks, so that they are processed by executor threads
+		with ThreadPoolExecutor(1) as executor, patch('symbolchain.impl.ChunkHelpers.DEFAULT_CHUNK_SIZE', 1):
+			self._assert_sign_and_prepare_all_use_operations_facade(executor)
+
+	# endregion
+
+	# region prepare_all_json_lines
+
+	def test_cannot_prepare_all_json_lines_when_transaction_signature_does_not_match(self):
+		# Arrange:
+		operations = self._create_operations('test')
+		transactions = operations.load_all(TRANSACTIONS_YAML_INPUT)
+
+		with tempfile.TemporaryDirectory() as temp_directory:
+			(private_key_storage, signature_storage) = self._create_storages(temp_directory, True, BinarySignatureStorage)
+			operations.sign_all(transactions, private_key_storage, signature_storage)
+
+			(transaction_hash, _) = signature_storage.load('sig_test1')
+			signature_storage.save('sig_test1', transaction_hash, [TestUtils.random_byte_array(Signature)])
+
+			output = io.BytesIO()
+
+			# Act + Assert:
+			with self.assertRaises(BatchOperations.PrepareError):
+				operations.prepare_all_json_lines(transactions, signature_storage, output)
+
+			# Sanity: no payloads were written
+			self.assertEqual(b'', output.getvalue())
+
+	def test_can_prepare_all_json_lines_when_all_transactions_match_signatures(self):
+		# Arrange:
+		operations = self._create_operations('test')
+		transactions = operations.load_all(TRANSACTIONS_YAML_INPUT)
+
+		with tempfile.TemporaryDirectory() as temp_directory:
+			(private_key_storage, signature_storage) = self._create_storages(temp_directory, True, BinarySignatureStorage)
+			operations.sign_all(transactions, private_key_storage, signature_storage)
+
+			output = io.BytesIO()
+
+			# Act:
+			operations.prepare_all_json_lines(transactions, signature_storage, output)
+
+			# Assert: every payload is written on its own line
+			expected_lines = [
+				operations.facade.transaction_factory.attach_signature(transaction, signature_storage.load(f'sig_test{i}')[1][0])
+				for i, transaction in enumerate(transactions)
+			]
+			self.assertEqual(expected_lines, output.getvalue().decode('utf8').splitlines())
+
+	# endregion
+
 	@staticmethod
 	def _create_operations(output_file_prefix=''):
 		facade = NemFacade('testnet', AccountDescriptorRepository(ACCOUNTS_YAML_INPUT))
 		return BatchOperations(facade, output_file_prefix)
 
 	@staticmethod
-	def _create_storages(temp_directory, save_test_private_key=True):
+	def _create_storages(temp_directory, save_test_private_key=True, signature_storage_factory=QrSignatureStorage):
 		private_key_directory = os.path.join(temp_directory, 'private_keys')
 		os.mkdir(private_key_directory)
 		private_key_storage = PrivateKeyStorage(private_key_directory, 'password')
@@ -216,6 +385,6 @@ class BatchOperationsTest(unittest.TestCase):
 
 		signature_directory = os.path.join(temp_directory, 'signatures')
 		os.mkdir(signature_directory)
-		signature_storage = QrSignatureStorage(signature_directory)
+		signature_storage = signature_storage_factory(signature_directory)
 
 		return (private_key_storage, signature_storage)
@@ -1,6 +1,9 @@
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from unittest.mock import patch
 
+from symbolchain import nc
 from symbolchain.AccountDescriptorRepository import AccountDescriptorRepository
 from symbolchain.Bip32 import Bip32
 from symbolchain.CryptoTypes import Hash256, PrivateKey, PublicKey, Signature
@@ -18,6 +21,8 @@ YAML_INPUT = '''
 
 
 class NemFacadeTest(unittest.TestCase):
+	# pylint: disable=too-many-public-methods
+
 	# region constants
 
 	def test_bip32_constants_are_correct(self):
@@ -265,6 +270,35 @@ class NemFacadeTest(unittest.TestCase):
 
 	# endregion
 
+	# region hash_transactions
+
+	def _assert_can_hash_transactions(self, executor=None):
+		# Arrange:
+		transactions = [self._create_real_transfer(), self._create_real_multisig_transaction()] * 3
+		for transaction in transactions:
+			transaction.signature = nc.Signature(TestUtils.randbytes(Signature.SIZE))
+
+		# Act:
+		hash_values = NemFacade.hash_transactions(transactions, executor)
+
+		# Assert:
+		self.assertEqual([NemFacade.hash_transaction(transaction) for transaction in transactions], hash_values)
+		self.assertEqual(Hash256('A7064DB890A4E7329AAB2AE7DCFA5EC76D7E374590C61EC85E03C698DF4EA79D'), hash_values[0])
+		self.assertEqual(Hash256('B585BC092CDDDCBA535FD6C0DE38F26EB44E6BA638A0BA6DFAD4BAA7E7AAE1B8'), hash_values[1])
+
+	def test_can_hash_no_transactions(self):
+		self.assertEqual([], NemFacade.hash_transactions([]))
+
+	def test_can_hash_transactions(self):
+		self._assert_can_hash_transactions()
+
+	def test_can_hash_transactions_with_process_pool(self):
+		# Arrange: split transactions into single transaction chunks, so that they are hashed by workers
+		with ProcessPoolExecutor(max_workers=2) as executor, patch('symbolchain.impl.ChunkHelpers.DEFAULT_CHUNK_SIZE', 1):
+			self._assert_can_hash_transactions(executor)
+
+	# endregion
+
 	# region bip32_path
 
 	def test_can_construct_proper_bip32_mainnet_path(self):
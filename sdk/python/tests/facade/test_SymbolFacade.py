@@ -1,13 +1,24 @@
+import hashlib
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 from symbolchain import sc
 from symbolchain.AccountDescriptorRepository import AccountDescriptorRepository
 from symbolchain.Bip32 import Bip32
 from symbolchain.CryptoTypes import Hash256, PrivateKey, PublicKey, Signature
 from symbolchain.facade.SymbolFacade import SymbolFacade
+from symbolchain.symbol.Merkle import MerkleHashBuilder
 from symbolchain.symbol.Network import Network
 
+from ..test.NemesisBlock import (
+	NEMESIS_BLOCK_HASH,
+	NEMESIS_BLOCK_PAYLOAD,
+	NEMESIS_GENERATION_HASH_SEED,
+	NEMESIS_SIGNATURE,
+	NEMESIS_TRANSACTIONS_HASH
+)
 from ..test.TestUtils import TestUtils
 
 YAML_INPUT = '''
@@ -352,6 +363,204 @@ class SymbolFacadeTest(unittest.TestCase):
 
 	# endregion
 
+	# region hash_transactions
+
+	def _create_signed_transactions(self, facade):
+		transactions = [self._create_real_transfer(facade), self._create_real_aggregate(facade), self._create_real_aggregate_swap(facade)]
+		for transaction in transactions:
+			transaction.signature = sc.Signature(TestUtils.randbytes(Signature.SIZE))
+
+		return transactions
+
+	def _assert_can_hash_transactions(self, transactions_to_input, executor=None):
+		# Arrange:
+		facade = SymbolFacade('testnet', AccountDescriptorRepository(YAML_INPUT))
+		transactions = self._create_signed_transactions(facade) * 3
+
+		# Act:
+		hash_values = facade.hash_transactions(transactions_to_input(transactions), executor)
+
+		# Assert:
+		self.assertEqual([facade.hash_transaction(transaction) for transaction in transactions], hash_values)
+		self.assertTrue(all(Hash256 == type(hash_value) for hash_value in hash_values))
+
+	def test_can_hash_no_transactions(self):
+		self.assertEqual([], SymbolFacade('testnet').hash_transactions([]))
+
+	def test_can_hash_transactions(self):
+		self._assert_can_hash_transactions(lambda transactions: transactions)
+
+	def test_can_hash_transactions_from_generator(self):
+		self._assert_can_hash_transactions(lambda transactions: (transaction for transaction in transactions))
+
+	def test_can_hash_serialized_transactions(self):
+		self._assert_can_hash_transactions(lambda transactions: [transaction.serialize() for transaction in transactions])
+
+	def test_can_hash_serialized_transaction_views(self):
+		self._assert_can_hash_transactions(lambda transactions: [memoryview(bytes(transaction.serialize())) for transaction in transactions])
+
+	def test_can_hash_transactions_with_process_pool(self):
+		# Arrange: split transactions into single transaction chunks, so that they are hashed by workers
+		with ProcessPoolExecutor(max_workers=2) as executor, patch('symbolchain.impl.ChunkHelpers.DEFAULT_CHUNK_SIZE', 1):
+			self._assert_can_hash_transactions(
+				lambda transactions: [memoryview(bytes(transaction.serialize())) for transaction in transactions],
+				executor)
+
+	# endregion
+
+	# region create_signing_context
+
+	def test_signing_context_sign_hash_and_verify_match_facade(self):
+		# Arrange:
+		private_key = PrivateKey('EDB671EB741BD676969D8A035271D1EE5E75DF33278083D877F23615EB839FEC')
+		facade = SymbolFacade('testnet', AccountDescriptorRepository(YAML_INPUT))
+		transaction = self._create_real_aggregate(facade)
+
+		# Act:
+		context = facade.create_signing_context(transaction)
+		signature = context.sign(SymbolFacade.KeyPair(private_key))
+		facade.transaction_factory.attach_signature(transaction, signature)
+		hash_value = context.hash()
+
+		# Assert:
+		self.assertEqual(Signature(''.join([
+			'40C5C9F0BAF74E64877982C411D0D16665E18D463B66204081D846564FC6CAE1',
+			'3F1F75C688CBD2D34263DA166537A90B4F371C1B38DDF00414AB0F5D78C3CD0F'
+		])), signature)
+		self.assertEqual(Hash256('D074716D62F4CDF1CE219D7E0580DC2C030102E216ECE2037FA28A3BC5726BD0'), hash_value)
+		self.assertTrue(context.verify())
+		self.assertTrue(context.verify(signature))
+		self.assertFalse(context.verify(TestUtils.random_byte_array(Signature)))
+
+	def test_signing_context_serializes_transaction_once(self):
+		# Arrange:
+		private_key = PrivateKey('F4BC233E183E8CEA08D0A604A3DC67FF3261D1E6EBF84D233488BC53D89C50B7')
+		facade = SymbolFacade('testnet', AccountDescriptorRepository(YAML_INPUT))
+		transaction = self._create_real_aggregate_swap(facade)
+		transaction_class = type(transaction)
+
+		with patch.object(transaction_class, 'serialize', autospec=True, side_effect=transaction_class.serialize) as serialize:
+			# Act:
+			context = facade.create_signing_context(transaction)
+			transaction.signature = sc.Signature(context.sign(SymbolFacade.KeyPair(private_key)).bytes)
+			context.hash()
+			context.verify()
+			for _ in range(3):
+				context.cosign(SymbolFacade.KeyPair(PrivateKey.random()))
+
+			# Assert:
+			self.assertEqual(1, serialize.call_count)
+
+	def test_signing_context_hash_changes_when_signature_changes(self):
+		# Arrange:
+		facade = SymbolFacade('testnet', AccountDescriptorRepository(YAML_INPUT))
+		transaction = self._create_real_transfer(facade)
+		context = facade.create_signing_context(transaction)
+
+		# Act:
+		unsigned_hash = context.hash()
+		transaction.signature = sc.Signature(TestUtils.randbytes(Signature.SIZE))
+		signed_hash = context.hash()
+
+		# Assert:
+		self.assertNotEqual(unsigned_hash, signed_hash)
+		self.assertEqual(facade.hash_transaction(transaction), signed_hash)
+		self.assertEqual(signed_hash, context.hash())
+
+	def _assert_can_cosign_transaction_with_signing_context(self, detached):
+		# Arrange:
+		signer_private_key = PrivateKey('F4BC233E183E8CEA08D0A604A3DC67FF3261D1E6EBF84D233488BC53D89C50B7')
+		cosigner_key_pair = SymbolFacade.KeyPair(PrivateKey('BE7B98F835A896136ADDAF04220F28CB4925D24F0675A21421BF213C180BEF86'))
+		facade = SymbolFacade('testnet', AccountDescriptorRepository(YAML_INPUT))
+
+		transaction = self._create_real_aggregate_swap(facade)
+		context = facade.create_signing_context(transaction)
+		facade.transaction_factory.attach_signature(transaction, context.sign(SymbolFacade.KeyPair(signer_private_key)))
+
+		# Act:
+		cosignature = context.cosign(cosigner_key_pair, detached)
+
+		# Assert:
+		self.assertEqual(facade.cosign_transaction(cosigner_key_pair, transaction, detached).serialize(), cosignature.serialize())
+
+	def test_can_cosign_transaction_with_signing_context(self):
+		self._assert_can_cosign_transaction_with_signing_context(False)
+
+	def test_can_cosign_transaction_detached_with_signing_context(self):
+		self._assert_can_cosign_transaction_with_signing_context(True)
+
+	# endregion
+
+	# region verify_transactions / verify_cosignatures
+
+	@staticmethod
+	def _create_signed_transfer(facade, key_pair, amount):
+		transaction = facade.transaction_factory.create({
+			'type': 'transfer_transaction_v1',
+			'signer_public_key': key_pair.public_key,
+			'fee': 1000000,
+			'deadline': 41998024783,
+			'recipient_address': 'TD4PJKW5JP3CNHA47VDFIM25RCWTWRGT45HMPSA',
+			'mosaics': [
+				{'mosaic_id': 0x2CF403E85507F39E, 'amount': amount}
+			]
+		})
+		facade.transaction_factory.attach_signature(transaction, facade.sign_transaction(key_pair, transaction))
+		return transaction
+
+	def test_can_verify_transactions(self):
+		# Arrange:
+		facade = SymbolFacade('testnet')
+		key_pairs = [SymbolFacade.KeyPair(PrivateKey.random()) for _ in range(2)]
+		transactions = [self._create_signed_transfer(facade, key_pairs[index % 2], index + 1) for index in range(5)]
+
+		# - modify transactions after signing
+		transactions[1].fee = sc.Amount(2000000)
+		transactions[4].deadline = sc.Timestamp(41998024784)
+
+		# Act:
+		results = facade.verify_transactions(transactions, SymbolFacade.BatchVerifier(chunk_size=2))
+
+		# Assert:
+		self.assertEqual([True, False, True, True, False], results)
+
+	def test_can_verify_aggregate_transactions(self):
+		# Arrange:
+		facade = SymbolFacade('testnet', AccountDescriptorRepository(YAML_INPUT))
+		key_pair = SymbolFacade.KeyPair(PrivateKey.random())
+		transaction = self._create_real_aggregate(facade)
+		transaction.signer_public_key = sc.PublicKey(key_pair.public_key.bytes)
+		facade.transaction_factory.attach_signature(transaction, facade.sign_transaction(key_pair, transaction))
+
+		# Act:
+		results = facade.verify_transactions([transaction])
+
+		# Assert:
+		self.assertEqual([True], results)
+
+	def test_can_verify_cosignatures(self):
+		# Arrange:
+		facade = SymbolFacade('testnet', AccountDescriptorRepository(YAML_INPUT))
+		transaction = self._create_real_aggregate_swap(facade)
+		facade.transaction_factory.attach_signature(transaction, TestUtils.random_byte_array(Signature))
+
+		for _ in range(5):
+			transaction.cosignatures.append(facade.cosign_transaction(SymbolFacade.KeyPair(PrivateKey.random()), transaction))
+
+		# - corrupt one cosignature and attach cosignature of different transaction
+		transaction.cosignatures[1].signature = sc.Signature(bytes(Signature.SIZE))
+		transaction.cosignatures[3] = facade.cosign_transaction(
+			SymbolFacade.KeyPair(PrivateKey.random()),
+			self._create_signed_transfer(facade, SymbolFacade.KeyPair(PrivateKey.random()), 1))
+
+		# Act:
+		results = facade.verify_cosignatures(transaction, SymbolFacade.BatchVerifier(chunk_size=2))
+
+		# Assert:
+		self.assertEqual([True, False, True, False, True], results)
+
+	# endregion
+
 	# region hash_embedded_transactions
 
 	def test_can_hash_embedded_transactions(self):
@@ -376,6 +585,220 @@ class SymbolFacadeTest(unittest.TestCase):
 		# Assert:
 		self.assertEqual(Hash256('5C78999F21EA75B880100E1B4C76166B9C320869F67C00D28F9F8F754D7831C9'), hash_value)
 
+	def test_can_hash_embedded_transaction(self):
+		# Arrange:
+		facade = SymbolFacade('testnet', AccountDescriptorRepository(YAML_INPUT))
+		transaction = self._create_real_embedded_transactions(facade)[0]
+
+		# Act:
+		hash_value = facade.hash_embedded_transaction(transaction)
+
+		# Assert:
+		self.assertEqual(facade.hash_embedded_transactions([transaction]), hash_value)
+
+	def test_can_create_transactions_hash_accumulator(self):
+		# Arrange:
+		facade = SymbolFacade('testnet', AccountDescriptorRepository(YAML_INPUT))
+		transactions = self._create_real_embedded_transactions(facade)
+
+		# Act:
+		accumulator = facade.create_transactions_hash_accumulator(transactions)
+
+		# Assert:
+		self.assertEqual(Hash256('5C78999F21EA75B880100E1B4C76166B9C320869F67C00D28F9F8F754D7831C9'), accumulator.root())
+
+	def test_can_keep_aggregate_transactions_hash_current_with_accumulator(self):
+		# Arrange:
+		facade = SymbolFacade('testnet', AccountDescriptorRepository(YAML_INPUT))
+		transaction = self._create_real_aggregate(facade)
+		embedded_transactions = list(transaction.transactions)
+		transaction.transactions = []
+		accumulator = facade.create_transactions_hash_accumulator()
+
+		# Act:
+		for embedded_transaction in embedded_transactions:
+			transaction.transactions.append(embedded_transaction)
+			accumulator.append(facade.hash_embedded_transaction(embedded_transaction))
+
+		# Assert:
+		self.assertEqual(transaction.transactions_hash.bytes, accumulator.root().bytes)
+
+	# endregion
+
+	# region hash_block / sign_block / verify_block
+
+	@staticmethod
+	def _create_block(block_class, transactions=None):
+		block = block_class()
+		block.network = sc.NetworkType.TESTNET
+		block.height = sc.Height(1234)
+		block.timestamp = sc.Timestamp(0x12345678)
+		block.difficulty = sc.Difficulty(100_000_000_000_000)
+		block.previous_block_hash = sc.Hash256(TestUtils.randbytes(Hash256.SIZE))
+		block.beneficiary_address = sc.Address(TestUtils.randbytes(sc.Address.SIZE))
+		block.fee_multiplier = sc.BlockFeeMultiplier(100)
+		block.transactions = transactions or []
+		return block
+
+	def _create_signed_block(self, facade, block_class, transactions=None):
+		key_pair = SymbolFacade.KeyPair(PrivateKey('EDB671EB741BD676969D8A035271D1EE5E75DF33278083D877F23615EB839FEC'))
+		block = self._create_block(block_class, transactions)
+		block.signer_public_key = sc.PublicKey(key_pair.public_key.bytes)
+		block.transactions_hash = sc.Hash256(facade.compute_block_transactions_hash(block).bytes)
+		block.signature = sc.Signature(SymbolFacade.sign_block(key_pair, block).bytes)
+		return block
+
+	def _assert_can_hash_block(self, block_class, block_footer_size):
+		# Arrange:
+		facade = SymbolFacade('testnet', AccountDescriptorRepository(YAML_INPUT))
+		block = self._create_signed_block(facade, block_class, self._create_signed_transactions(facade))
+		block_header_size = self._create_block(block_class).size
+
+		# Act:
+		hash_value = SymbolFacade.hash_block(block)
+
+		# Assert: signature, signer public key and header (except normal block footer padding) are hashed
+		block_buffer = block.serialize()
+		expected_hash = Hash256(hashlib.sha3_256(
+			block_buffer[8:104] + block_buffer[108:block_header_size - block_footer_size]).digest())
+		self.assertEqual(expected_hash, hash_value)
+		self.assertEqual(3, len(block.transactions))
+
+	def test_can_hash_normal_block(self):
+		self._assert_can_hash_block(sc.NormalBlockV1, 4)
+
+	def test_can_hash_importance_block(self):
+		self._assert_can_hash_block(sc.ImportanceBlockV1, 0)
+
+	@staticmethod
+	def _create_nemesis_facade():
+		return SymbolFacade(Network('testnet', 0x98, Network.TESTNET.datetime_converter.epoch, Hash256(NEMESIS_GENERATION_HASH_SEED)))
+
+	def test_can_hash_real_block(self):
+		# Arrange:
+		block = sc.BlockFactory.deserialize(bytes.fromhex(NEMESIS_BLOCK_PAYLOAD))
+
+		# Act:
+		hash_value = SymbolFacade.hash_block(block)
+
+		# Assert:
+		self.assertEqual(Hash256(NEMESIS_BLOCK_HASH), hash_value)
+
+	def test_block_hash_does_not_depend_on_transactions(self):
+		# Arrange:
+		facade = SymbolFacade('testnet', AccountDescriptorRepository(YAML_INPUT))
+		block = self._create_signed_block(facade, sc.NormalBlockV1, self._create_signed_transactions(facade))
+		hash_value = SymbolFacade.hash_block(block)
+
+		# Act:
+		block.transactions = block.transactions[:1]
+
+		# Assert: transactions only contribute to block hash via transactions hash in header
+		self.assertEqual(hash_value, SymbolFacade.hash_block(block))
+
+	def _assert_can_sign_and_verify_block(self, block_class):
+		# Arrange:
+		facade = SymbolFacade('testnet', AccountDescriptorRepository(YAML_INPUT))
+
+		# Act:
+		block = self._create_signed_block(facade, block_class, self._create_signed_transactions(facade))
+
+		# Assert:
+		self.assertTrue(SymbolFacade.verify_block(block))
+		self.assertTrue(SymbolFacade.verify_block(block, Signature(block.signature.bytes)))
+		self.assertFalse(SymbolFacade.verify_block(block, TestUtils.random_byte_array(Signature)))
+
+	def test_can_sign_and_verify_normal_block(self):
+		self._assert_can_sign_and_verify_block(sc.NormalBlockV1)
+
+	def test_can_sign_and_verify_importance_block(self):
+		self._assert_can_sign_and_verify_block(sc.ImportanceBlockV1)
+
+	def test_can_verify_real_block(self):
+		# Arrange:
+		block = sc.BlockFactory.deserialize(bytes.fromhex(NEMESIS_BLOCK_PAYLOAD))
+
+		# Act + Assert:
+		self.assertEqual(Signature(NEMESIS_SIGNATURE), Signature(block.signature.bytes))
+		self.assertTrue(SymbolFacade.verify_block(block))
+		self.assertTrue(SymbolFacade.verify_block(block, Signature(NEMESIS_SIGNATURE)))
+
+	def test_cannot_verify_modified_block(self):
+		# Arrange:
+		facade = SymbolFacade('testnet', AccountDescriptorRepository(YAML_INPUT))
+		block = self._create_signed_block(facade, sc.NormalBlockV1, self._create_signed_transactions(facade))
+
+		# Act:
+		block.height = sc.Height(1235)
+
+		# Assert:
+		self.assertFalse(SymbolFacade.verify_block(block))
+
+	# endregion
+
+	# region compute_block_transactions_hash
+
+	def test_can_compute_transactions_hash_of_empty_block(self):
+		# Arrange:
+		facade = SymbolFacade('testnet')
+
+		# Act:
+		transactions_hash = facade.compute_block_transactions_hash(self._create_block(sc.NormalBlockV1))
+
+		# Assert:
+		self.assertEqual(Hash256.zero(), transactions_hash)
+
+	def _assert_can_compute_real_block_transactions_hash(self, executor=None):
+		# Arrange:
+		facade = self._create_nemesis_facade()
+		block = sc.BlockFactory.deserialize(bytes.fromhex(NEMESIS_BLOCK_PAYLOAD))
+
+		# Act:
+		transactions_hash = facade.compute_block_transactions_hash(block, executor)
+
+		# Assert:
+		self.assertEqual(Hash256(NEMESIS_TRANSACTIONS_HASH), transactions_hash)
+		self.assertEqual(42, len(block.transactions))
+
+	def test_can_compute_real_block_transactions_hash(self):
+		self._assert_can_compute_real_block_transactions_hash()
+
+	def test_can_compute_real_block_transactions_hash_with_process_pool(self):
+		# Arrange: split transactions into multiple chunks, so that they are hashed by workers
+		with ProcessPoolExecutor(max_workers=2) as executor, patch('symbolchain.impl.ChunkHelpers.DEFAULT_CHUNK_SIZE', 10):
+			self._assert_can_compute_real_block_transactions_hash(executor)
+
+	def _assert_can_compute_block_transactions_hash(self, executor=None):
+		# Arrange: cosign aggregate swap
+		facade = SymbolFacade('testnet', AccountDescriptorRepository(YAML_INPUT))
+		transactions = self._create_signed_transactions(facade)
+		cosigner_key_pairs = [SymbolFacade.KeyPair(PrivateKey.random()) for _ in range(2)]
+		transactions[2].cosignatures = [facade.cosign_transaction(key_pair, transactions[2]) for key_pair in cosigner_key_pairs]
+
+		block = self._create_block(sc.NormalBlockV1, transactions)
+
+		# Act:
+		transactions_hash = facade.compute_block_transactions_hash(block, executor)
+
+		# Assert: cosigners public keys are appended to hash of cosigned aggregate
+		transaction_hashes = [facade.hash_transaction(transaction) for transaction in transactions]
+		merkle_component_hashes = transaction_hashes[:2] + [Hash256(hashlib.sha3_256(
+			transaction_hashes[2].bytes + b''.join(key_pair.public_key.bytes for key_pair in cosigner_key_pairs)).digest())]
+
+		hash_builder = MerkleHashBuilder()
+		for merkle_component_hash in merkle_component_hashes:
+			hash_builder.update(merkle_component_hash)
+
+		self.assertEqual(hash_builder.final(), transactions_hash)
+
+	def test_can_compute_block_transactions_hash(self):
+		self._assert_can_compute_block_transactions_hash()
+
+	def test_can_compute_block_transactions_hash_with_process_pool(self):
+		# Arrange: split transactions into single transaction chunks, so that they are hashed by workers
+		with ProcessPoolExecutor(max_workers=2) as executor, patch('symbolchain.impl.ChunkHelpers.DEFAULT_CHUNK_SIZE', 1):
+			self._assert_can_compute_block_transactions_hash(executor)
+
 	# endregion
 
 	# region bip32_path
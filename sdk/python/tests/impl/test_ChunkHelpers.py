@@ -0,0 +1,51 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from symbolchain.impl.ChunkHelpers import map_chunks
+
+
+def _scale_chunk(multiplier, offset, chunk):
+	return [multiplier * value + offset for value in chunk]
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+	"""Thread pool executor that records all mapped chunks."""
+
+	def __init__(self):
+		super().__init__(max_workers=2)
+		self.chunks = []
+
+	def map(self, fn, *iterables, timeout=None, chunksize=1):
+		# fixed arguments are infinitely repeated, so arguments are zipped with (finite) chunks
+		arguments = list(zip(*iterables))
+		self.chunks.extend(chunk_arguments[-1] for chunk_arguments in arguments)
+		return super().map(fn, *zip(*arguments), timeout=timeout, chunksize=chunksize)
+
+
+class ChunkHelpersTest(unittest.TestCase):
+	def _assert_can_map_chunks(self, count, chunk_size, executor, expected_chunks):
+		# Act:
+		results = map_chunks(_scale_chunk, (3, 1), list(range(count)), chunk_size, executor)
+
+		# Assert:
+		self.assertEqual([3 * value + 1 for value in range(count)], results)
+		if isinstance(executor, RecordingExecutor):
+			self.assertEqual(expected_chunks, executor.chunks)
+
+	def test_can_map_no_items(self):
+		self._assert_can_map_chunks(0, 4, None, [])
+
+	def test_can_map_items_without_executor(self):
+		self._assert_can_map_chunks(10, 4, None, [])
+
+	def test_can_map_items_fitting_single_chunk_without_using_executor(self):
+		with RecordingExecutor() as executor:
+			self._assert_can_map_chunks(4, 4, executor, [])
+
+	def test_can_map_items_split_across_chunks_with_executor(self):
+		with RecordingExecutor() as executor:
+			self._assert_can_map_chunks(10, 4, executor, [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]])
+
+	def test_can_map_items_split_across_chunks_with_process_pool(self):
+		with ProcessPoolExecutor(max_workers=2) as executor:
+			self._assert_can_map_chunks(10, 4, executor, None)
@@ -11,3 +11,86 @@ class NetworkTest(BasicKeyPairTest, unittest.TestCase):
 		deterministic_private_key = PrivateKey('ED4C70D78104EB11BCD73EBDC512FEBC8FBCEB36A370C957FF7E266230BB5D57')  # reversed
 		expected_public_key = PublicKey('D6C3845431236C5A5A907A9E45BD60DA0E12EFD350B970E7F58E3499E2E7A2F0')
 		return KeyPairTestDescriptor(KeyPair, Verifier, deterministic_private_key, expected_public_key)
+
+
+class KeyPairTest(unittest.TestCase):
+	@staticmethod
+	def _create_deterministic_key_pair():
+		return KeyPair(PrivateKey('ED4C70D78104EB11BCD73EBDC512FEBC8FBCEB36A370C957FF7E266230BB5D57'))
+
+	# region sign_many
+
+	def test_can_sign_zero_messages(self):
+		# Arrange:
+		key_pair = self._create_deterministic_key_pair()
+
+		# Act:
+		signatures = key_pair.sign_many([])
+
+		# Assert:
+		self.assertEqual([], signatures)
+
+	def test_sign_many_produces_same_signatures_as_sign(self):
+		# Arrange:
+		key_pair = self._create_deterministic_key_pair()
+		messages = [bytes([index] * (index * 10)) for index in range(5)]
+
+		# Act:
+		signatures = key_pair.sign_many(messages)
+
+		# Assert:
+		self.assertEqual([key_pair.sign(message) for message in messages], signatures)
+		for (message, signature) in zip(messages, signatures):
+			self.assertTrue(Verifier(key_pair.public_key).verify(message, signature))
+
+	# endregion
+
+	# region wipe
+
+	def test_wipe_zeroes_secrets(self):
+		# Arrange:
+		key_pair = self._create_deterministic_key_pair()
+		secrets = [key_pair._sk, key_pair._a, key_pair._nonce_prefix]  # pylint: disable=protected-access
+
+		# Act:
+		key_pair.wipe()
+
+		# Assert:
+		self.assertEqual([bytearray(32)] * 3, secrets)
+
+	def test_wipe_preserves_public_key(self):
+		# Arrange:
+		key_pair = self._create_deterministic_key_pair()
+
+		# Act:
+		key_pair.wipe()
+
+		# Assert:
+		self.assertEqual(PublicKey('D6C3845431236C5A5A907A9E45BD60DA0E12EFD350B970E7F58E3499E2E7A2F0'), key_pair.public_key)
+
+	def test_can_wipe_multiple_times(self):
+		# Arrange:
+		key_pair = self._create_deterministic_key_pair()
+		key_pair.wipe()
+
+		# Act + Assert: no exception
+		key_pair.wipe()
+
+	def test_cannot_access_private_key_or_sign_after_wipe(self):
+		# Arrange:
+		key_pair = self._create_deterministic_key_pair()
+
+		# Act:
+		key_pair.wipe()
+
+		# Assert:
+		with self.assertRaises(ValueError):
+			key_pair.private_key  # pylint: disable=pointless-statement
+
+		with self.assertRaises(ValueError):
+			key_pair.sign(b'hello')
+
+		with self.assertRaises(ValueError):
+			key_pair.sign_many([b'hello'])
+
+	# endregion
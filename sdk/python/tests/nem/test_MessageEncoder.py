@@ -6,7 +6,7 @@ from symbolchain.nc import Message, MessageType
 from symbolchain.nem.KeyPair import KeyPair
 from symbolchain.nem.MessageEncoder import MessageEncoder
 
-from ..test.BasicMessageEncoderTest import BasicMessageEncoderTest, MessageEncoderTestInterface
+from ..test.BasicMessageEncoderTest import BasicMessageEncoderTest, MessageEncoderDecodeManyTest, MessageEncoderTestInterface
 
 
 def malform_message(encoded):
@@ -15,7 +15,7 @@ def malform_message(encoded):
 	return encoded
 
 
-class MessageEncoderTests(BasicMessageEncoderTest, unittest.TestCase):
+class MessageEncoderTests(BasicMessageEncoderTest, MessageEncoderDecodeManyTest, unittest.TestCase):
 	def get_basic_test_interface(self):
 		return MessageEncoderTestInterface(KeyPair, MessageEncoder, None, None, malform_message)
 
@@ -46,7 +46,7 @@ class MessageEncoderTests(BasicMessageEncoderTest, unittest.TestCase):
 			encoder.try_decode(PublicKey(bytes(PublicKey.SIZE)), encoded_message)
 
 
-class MessageEncoderDeprecatedTests(BasicMessageEncoderTest, unittest.TestCase):
+class MessageEncoderDeprecatedTests(BasicMessageEncoderTest, MessageEncoderDecodeManyTest, unittest.TestCase):
 	def get_basic_test_interface(self):
 		def encode_deprecated(encoder):
 			def encode(recipient_public_key, message):
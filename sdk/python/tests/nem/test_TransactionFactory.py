@@ -3,7 +3,7 @@ from binascii import hexlify
 from random import randint
 
 from symbolchain import nc
-from symbolchain.CryptoTypes import PublicKey, Signature
+from symbolchain.CryptoTypes import Hash256, PublicKey, Signature
 from symbolchain.nem.Network import Address, Network
 from symbolchain.nem.TransactionFactory import TransactionFactory
 
@@ -14,6 +14,8 @@ TEST_SIGNER_PUBLIC_KEY = TestUtils.random_byte_array(PublicKey)
 
 
 class TransactionFactoryTest(BasicTransactionFactoryTest, unittest.TestCase):
+	# pylint: disable=too-many-public-methods
+
 	def assert_transaction(self, transaction):
 		self.assertEqual(nc.TransactionType.TRANSFER, transaction.type_)
 		self.assertEqual(2, transaction.version)
@@ -260,4 +262,113 @@ class TransactionFactoryTest(BasicTransactionFactoryTest, unittest.TestCase):
 		# Assert:
 		self.assertEqual(non_verifiable_transaction1.serialize(), non_verifiable_transaction2.serialize())
 
+	def test_can_serialize_non_verifiable_portion_of_verifiable_transaction(self):
+		# Arrange:
+		factory = self.create_factory()
+		transaction = self.create_transaction(factory)(self._create_transfer_descriptor_with_signature(
+			TestUtils.random_byte_array(Signature)))
+
+		# Act:
+		non_verifiable_buffer = TransactionFactory.serialize_non_verifiable_transaction(transaction)
+
+		# Assert: size and signature are cut out from the buffer
+		verifiable_buffer = transaction.serialize()
+		offset = nc.TransactionType.TRANSFER.size + 1 + 2 + nc.NetworkType.TESTNET.size + nc.Timestamp.SIZE + 4 + nc.PublicKey.SIZE
+		self.assertEqual(verifiable_buffer[:offset] + verifiable_buffer[offset + 4 + nc.Signature.SIZE:], non_verifiable_buffer)
+		self.assertEqual(TransactionFactory.to_non_verifiable_transaction(transaction).serialize(), non_verifiable_buffer)
+
+	def test_can_serialize_non_verifiable_portion_of_non_verifiable_transaction(self):
+		# Arrange:
+		factory = self.create_factory()
+		transaction = self.create_transaction(factory)(self._create_transfer_descriptor_with_signature(
+			TestUtils.random_byte_array(Signature)))
+		non_verifiable_transaction = TransactionFactory.to_non_verifiable_transaction(transaction)
+
+		# Act:
+		non_verifiable_buffer = TransactionFactory.serialize_non_verifiable_transaction(non_verifiable_transaction)
+
+		# Assert:
+		self.assertEqual(non_verifiable_transaction.serialize(), non_verifiable_buffer)
+
+	def test_can_serialize_non_verifiable_portion_of_multisig_transaction(self):
+		# Arrange: attach signature and cosignature, which are both excluded from non-verifiable portion
+		factory = self.create_factory()
+		inner_transaction = TransactionFactory.to_non_verifiable_transaction(self.create_transaction(factory)(
+			self._create_transfer_descriptor_with_signature(TestUtils.random_byte_array(Signature))))
+		transaction = self.create_transaction(factory)({
+			'type': 'multisig_transaction_v1',
+			'signer_public_key': TEST_SIGNER_PUBLIC_KEY,
+			'signature': TestUtils.random_byte_array(Signature),
+			'fee': 0x123456,
+			'timestamp': 191205516,
+			'deadline': 191291916,
+			'inner_transaction': inner_transaction,
+			'cosignatures': [{
+				'cosignature': {
+					'signer_public_key': TestUtils.random_byte_array(PublicKey),
+					'signature': TestUtils.random_byte_array(Signature),
+					'multisig_transaction_hash': TestUtils.random_byte_array(Hash256),
+					'multisig_account_address': TestUtils.random_byte_array(Address)
+				}
+			}]
+		})
+
+		expected_transaction = nc.NonVerifiableMultisigTransactionV1()
+		expected_transaction.network = transaction.network
+		expected_transaction.timestamp = transaction.timestamp
+		expected_transaction.signer_public_key = transaction.signer_public_key
+		expected_transaction.fee = transaction.fee
+		expected_transaction.deadline = transaction.deadline
+		expected_transaction.inner_transaction = inner_transaction
+
+		# Act:
+		non_verifiable_buffer = TransactionFactory.serialize_non_verifiable_transaction(transaction)
+
+		# Assert:
+		self.assertEqual(1, len(transaction.cosignatures))
+		self.assertEqual(expected_transaction.serialize(), non_verifiable_buffer)
+
+	def test_serialize_non_verifiable_matches_attribute_copy_for_all_verifiable_transactions(self):
+		# Arrange:
+		transaction_classes = [
+			transaction_class for transaction_class in vars(nc).values()
+			if isinstance(transaction_class, type) and issubclass(transaction_class, nc.Transaction) and nc.Transaction != transaction_class
+		]
+
+		for transaction_class in transaction_classes:
+			if nc.CosignatureV1 == transaction_class:
+				continue
+
+			transaction = transaction_class()
+
+			# Act:
+			non_verifiable_buffer = TransactionFactory.serialize_non_verifiable_transaction(transaction)
+
+			# Assert:
+			expected_transaction = TransactionFactory._copy_to_non_verifiable_transaction(transaction)  # pylint: disable=protected-access
+			self.assertEqual(expected_transaction.serialize(), non_verifiable_buffer, transaction_class.__name__)
+
+	# endregion
+
+	# region generated deserialize
+
+	def _assert_cannot_deserialize(self, factory_class, payload, message):
+		with self.assertRaisesRegex(ValueError, message):
+			factory_class.deserialize(payload)
+
+	def test_generated_factories_cannot_deserialize_truncated_payload(self):
+		for (factory_class, header_size) in [(nc.TransactionFactory, 128), (nc.NonVerifiableTransactionFactory, 60)]:
+			for size in (0, header_size // 2, header_size - 1):
+				self._assert_cannot_deserialize(factory_class, bytes(size), f'smaller than .* header size {header_size}')
+
+	def test_generated_factories_cannot_deserialize_payload_with_unknown_discriminator(self):
+		for factory_class in (nc.TransactionFactory, nc.NonVerifiableTransactionFactory):
+			self._assert_cannot_deserialize(factory_class, bytes(200), 'unknown discriminator')
+
+	def test_generated_fixed_layout_models_cannot_deserialize_short_payload(self):
+		for (model_class, size) in [(nc.Amount, 8), (nc.Timestamp, 4), (nc.MultisigAccountModification, 40)]:
+			for payload_size in (0, size // 2, size - 1):
+				with self.assertRaisesRegex(ValueError, f'smaller than {model_class.__name__} size {size}'):
+					model_class.deserialize(bytes(payload_size))
+
 	# endregion
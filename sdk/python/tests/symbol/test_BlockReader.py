@@ -0,0 +1,185 @@
+import io
+import mmap
+import tempfile
+import unittest
+
+from symbolchain.CryptoTypes import PublicKey
+from symbolchain.facade.SymbolFacade import SymbolFacade
+from symbolchain.sc import Cosignature, Height, ImportanceBlockV1, NormalBlockV1
+from symbolchain.symbol.BlockReader import BlockReader, read_embedded_transactions
+
+from ..test.TestUtils import TestUtils
+
+FACADE = SymbolFacade('testnet')
+
+
+def create_transfer(message, is_embedded=False):
+	signer_public_key = TestUtils.random_byte_array(PublicKey)
+	descriptor = {
+		'type': 'transfer_transaction_v1',
+		'signer_public_key': signer_public_key,
+		'recipient_address': FACADE.network.public_key_to_address(signer_public_key),
+		'message': message
+	}
+
+	if is_embedded:
+		return FACADE.transaction_factory.create_embedded(descriptor)
+
+	descriptor['deadline'] = 1
+	return FACADE.transaction_factory.create(descriptor)
+
+
+def create_aggregate(embedded_transactions):
+	aggregate = FACADE.transaction_factory.create({
+		'type': 'aggregate_complete_transaction_v2',
+		'signer_public_key': TestUtils.random_byte_array(PublicKey),
+		'transactions_hash': FACADE.hash_embedded_transactions(embedded_transactions),
+		'transactions': embedded_transactions
+	})
+
+	cosignature = Cosignature()
+	cosignature.signer_public_key = TestUtils.random_byte_array(PublicKey)
+	aggregate.cosignatures.append(cosignature)
+	return aggregate
+
+
+def create_block(block_class, height, transactions):
+	block = block_class()
+	block.height = Height(height)
+	block.transactions = transactions
+	return block
+
+
+def create_blocks():
+	# transfers with odd messages are not aligned, so transactions are padded in blocks
+	return [
+		create_block(NormalBlockV1, 1, [
+			create_transfer('a'),
+			create_aggregate([create_transfer('bc', True), create_transfer('d', True)]),
+			create_transfer('efg')
+		]),
+		create_block(ImportanceBlockV1, 2, []),
+		create_block(NormalBlockV1, 3, [create_transfer('hi')])
+	]
+
+
+def serialize_blocks(blocks):
+	return b''.join(block.serialize() for block in blocks)
+
+
+def header_of(block):
+	header = block.__class__.deserialize(block.serialize())
+	header.transactions = []
+	return header
+
+
+class BlockReaderTest(unittest.TestCase):
+	def _assert_can_read_blocks_and_transactions(self, source, blocks):
+		# Act:
+		streamed_blocks = [
+			(streamed_block.header.serialize(), streamed_block.size, [transaction.serialize() for transaction in streamed_block.transactions()])
+			for streamed_block in source
+		]
+
+		# Assert:
+		self.assertEqual(
+			[(header_of(block).serialize(), block.size, [transaction.serialize() for transaction in block.transactions]) for block in blocks],
+			streamed_blocks)
+
+	def test_can_read_blocks_and_transactions_from_buffer(self):
+		# Arrange:
+		blocks = create_blocks()
+
+		# Act + Assert:
+		self._assert_can_read_blocks_and_transactions(BlockReader(serialize_blocks(blocks)), blocks)
+
+	def test_can_read_blocks_and_transactions_from_stream(self):
+		# Arrange:
+		blocks = create_blocks()
+
+		# Act + Assert:
+		self._assert_can_read_blocks_and_transactions(BlockReader(io.BytesIO(serialize_blocks(blocks))), blocks)
+
+	def test_can_read_blocks_and_transactions_from_memory_mapped_file(self):
+		# Arrange:
+		blocks = create_blocks()
+		with tempfile.TemporaryFile() as output_file:
+			output_file.write(serialize_blocks(blocks))
+			output_file.flush()
+
+			with mmap.mmap(output_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+				# Act + Assert:
+				self._assert_can_read_blocks_and_transactions(BlockReader(mapped_file), blocks)
+
+	def test_can_read_blocks_without_reading_transactions(self):
+		# Arrange:
+		blocks = create_blocks()
+
+		for source in [serialize_blocks(blocks), io.BytesIO(serialize_blocks(blocks))]:
+			# Act: unread transactions are skipped
+			heights = [streamed_block.header.height for streamed_block in BlockReader(source)]
+
+			# Assert:
+			self.assertEqual([Height(1), Height(2), Height(3)], heights)
+
+	def test_can_read_blocks_after_partially_reading_transactions(self):
+		# Arrange:
+		blocks = create_blocks()
+
+		# Act:
+		first_transactions = []
+		for streamed_block in BlockReader(io.BytesIO(serialize_blocks(blocks))):
+			first_transactions.append(next(streamed_block.transaction_payloads(), None))
+
+		# Assert:
+		self.assertEqual([bytes(blocks[0].transactions[0].serialize()), None, bytes(blocks[2].transactions[0].serialize())], [
+			None if payload is None else payload.tobytes() for payload in first_transactions
+		])
+
+	def test_cannot_read_truncated_block(self):
+		# Arrange:
+		buffer = serialize_blocks(create_blocks())
+
+		for size in [200, len(buffer) - 1]:
+			# Act + Assert:
+			with self.assertRaises(ValueError):
+				for streamed_block in BlockReader(buffer[:size]):
+					list(streamed_block.transactions())
+
+	def test_cannot_read_block_with_unknown_type(self):
+		# Arrange:
+		buffer = bytearray(serialize_blocks(create_blocks()))
+		buffer[110:112] = bytes(2)
+
+		# Act + Assert:
+		with self.assertRaises(ValueError):
+			list(BlockReader(buffer))
+
+	# region read_embedded_transactions
+
+	def test_can_read_embedded_transactions(self):
+		# Arrange:
+		embedded_transactions = [create_transfer('bc', True), create_transfer('d', True), create_transfer('', True)]
+		aggregate = create_aggregate(embedded_transactions)
+
+		# Act:
+		read_transactions = list(read_embedded_transactions(aggregate.serialize()))
+
+		# Assert:
+		self.assertEqual(
+			[transaction.serialize() for transaction in embedded_transactions],
+			[transaction.serialize() for transaction in read_transactions])
+
+	def test_cannot_read_embedded_transactions_from_non_aggregate(self):
+		with self.assertRaises(ValueError):
+			list(read_embedded_transactions(create_transfer('a').serialize()))
+
+	def test_cannot_read_embedded_transactions_from_truncated_aggregate(self):
+		# Arrange:
+		payload = create_aggregate([create_transfer('bc', True)]).serialize()
+
+		# Act + Assert:
+		with self.assertRaises(ValueError):
+			list(read_embedded_transactions(payload[:200]))
+
+	# endregion
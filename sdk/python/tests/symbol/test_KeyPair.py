@@ -1,9 +1,10 @@
 import unittest
 
-from symbolchain.CryptoTypes import PrivateKey, PublicKey
-from symbolchain.symbol.KeyPair import KeyPair, Verifier
+from symbolchain.CryptoTypes import PrivateKey, PublicKey, Signature
+from symbolchain.symbol.KeyPair import BatchVerifier, KeyPair, Verifier
 
 from ..test.BasicKeyPairTest import BasicKeyPairTest, KeyPairTestDescriptor
+from ..test.TestUtils import TestUtils
 
 
 class NetworkTest(BasicKeyPairTest, unittest.TestCase):
@@ -11,3 +12,78 @@ class NetworkTest(BasicKeyPairTest, unittest.TestCase):
 		deterministic_private_key = PrivateKey('E88283CE35FE74C89FFCB2D8BFA0A2CF6108BDC0D07606DEE34D161C30AC2F1E')
 		expected_public_key = PublicKey('E29C5934F44482E7A9F50725C8681DE6CA63F49E5562DB7E5BC9EABA31356BAD')
 		return KeyPairTestDescriptor(KeyPair, Verifier, deterministic_private_key, expected_public_key)
+
+
+class BatchVerifierTest(unittest.TestCase):
+	@staticmethod
+	def _create_items(count, key_pairs):
+		items = []
+		for index in range(count):
+			key_pair = key_pairs[index % len(key_pairs)]
+			message = TestUtils.randbytes(21 + index)
+			items.append((key_pair.public_key, message, key_pair.sign(message)))
+
+		return items
+
+	def _assert_can_verify_all_items(self, count, **kwargs):
+		# Arrange:
+		items = self._create_items(count, [KeyPair(PrivateKey.random()) for _ in range(3)])
+
+		# Act:
+		results = BatchVerifier(**kwargs).verify(items)
+
+		# Assert:
+		self.assertEqual([True] * count, results)
+
+	def test_can_verify_zero_items(self):
+		self._assert_can_verify_all_items(0)
+
+	def test_can_verify_single_chunk(self):
+		self._assert_can_verify_all_items(10)
+
+	def test_can_verify_multiple_chunks(self):
+		self._assert_can_verify_all_items(25, max_workers=3, chunk_size=4)
+
+	def test_can_verify_items_from_generator(self):
+		# Arrange:
+		items = self._create_items(10, [KeyPair(PrivateKey.random())])
+
+		# Act:
+		results = BatchVerifier(chunk_size=3).verify(item for item in items)
+
+		# Assert:
+		self.assertEqual([True] * 10, results)
+
+	def _create_items_with_failures(self):
+		items = self._create_items(10, [KeyPair(PrivateKey.random()) for _ in range(2)])
+
+		(public_key, message, signature) = items[2]
+		items[2] = (public_key, message + b'x', signature)
+
+		(public_key, message, signature) = items[5]
+		items[5] = (public_key, message, Signature(signature.bytes[:-1] + bytes([signature.bytes[-1] ^ 0xFF])))
+
+		(_, message, signature) = items[9]
+		items[9] = (PublicKey(bytes(PublicKey.SIZE)), message, signature)
+		return items
+
+	def test_reports_failed_items(self):
+		# Arrange:
+		items = self._create_items_with_failures()
+
+		for chunk_size in [3, 64]:
+			# Act:
+			results = BatchVerifier(chunk_size=chunk_size).verify(items)
+
+			# Assert:
+			self.assertEqual([index not in (2, 5, 9) for index in range(10)], results)
+
+	def test_can_find_failed_indexes(self):
+		# Arrange:
+		items = self._create_items_with_failures()
+
+		# Act:
+		failed_indexes = BatchVerifier(chunk_size=3).failed_indexes(items)
+
+		# Assert:
+		self.assertEqual([2, 5, 9], failed_indexes)
@@ -3,12 +3,16 @@ from binascii import unhexlify
 
 from symbolchain.CryptoTypes import Hash256
 from symbolchain.symbol.Merkle import (
+	MerkleHashAccumulator,
 	MerkleHashBuilder,
 	MerklePart,
 	PatriciaMerkleProofResult,
+	PatriciaProofVerifier,
 	deserialize_patricia_tree_nodes,
 	prove_merkle,
-	prove_patricia_merkle
+	prove_merkle_many,
+	prove_patricia_merkle,
+	serialize_patricia_tree_nodes
 )
 
 from ..test.TestUtils import TestUtils
@@ -93,6 +97,95 @@ class MerkleHashBuilderTest(unittest.TestCase):
 		# Assert:
 		self.assertNotEqual(merkle_hash1, merkle_hash2)
 
+	def test_can_calculate_merkle_hash_multiple_times(self):
+		# Arrange:
+		seed_hashes = [TestUtils.random_byte_array(Hash256) for _ in range(0, 5)]
+		builder = MerkleHashBuilder()
+		for seed_hash in seed_hashes:
+			builder.update(seed_hash)
+
+		# Act:
+		merkle_hash1 = builder.final()
+		merkle_hash2 = builder.final()
+
+		# Assert:
+		self.assertEqual(self._calculate_merkle_hash(seed_hashes), merkle_hash1)
+		self.assertEqual(merkle_hash1, merkle_hash2)
+
+	def test_can_add_hashes_after_calculating_merkle_hash(self):
+		# Arrange:
+		seed_hashes = [TestUtils.random_byte_array(Hash256) for _ in range(0, 5)]
+		builder = MerkleHashBuilder()
+		for seed_hash in seed_hashes[:3]:
+			builder.update(seed_hash)
+
+		builder.final()
+
+		# Act:
+		for seed_hash in seed_hashes[3:]:
+			builder.update(seed_hash)
+
+		merkle_hash = builder.final()
+
+		# Assert:
+		self.assertEqual(self._calculate_merkle_hash(seed_hashes), merkle_hash)
+
+	def test_can_calculate_merkle_path_of_every_hash(self):
+		for count in range(1, 10):
+			# Arrange:
+			seed_hashes = [TestUtils.random_byte_array(Hash256) for _ in range(0, count)]
+			builder = MerkleHashBuilder()
+			for seed_hash in seed_hashes:
+				builder.update(seed_hash)
+
+			for (index, seed_hash) in enumerate(seed_hashes):
+				# Act:
+				merkle_path = builder.merkle_path(index)
+
+				# Assert:
+				self.assertTrue(prove_merkle(seed_hash, merkle_path, builder.final()), f'count {count}, index {index}')
+
+	def test_can_calculate_merkle_path_of_unbalanced_tree(self):
+		# Arrange:
+		seed_hashes = [
+			Hash256('36C8213162CDBC78767CF43D4E06DDBE0D3367B6CEAEAEB577A50E2052441BC8'),
+			Hash256('8A316E48F35CDADD3F827663F7535E840289A16A43E7134B053A86773E474C28'),
+			Hash256('6D80E71F00DFB73B358B772AD453AEB652AE347D3E098AE269005A88DA0B84A7'),
+			Hash256('2AE2CA59B5BB29721BFB79FE113929B6E52891CAA29CBF562EBEDC46903FF681'),
+			Hash256('421D6B68A6DF8BB1D5C9ACF7ED44515E77945D42A491BECE68DA009B551EE6CE')
+		]
+		builder = MerkleHashBuilder()
+		for seed_hash in seed_hashes:
+			builder.update(seed_hash)
+
+		# Act:
+		merkle_path1 = builder.merkle_path(1)
+		merkle_path4 = builder.merkle_path(4)
+
+		# Assert:
+		self.assertEqual(3, len(merkle_path1))
+		self.assertEqual(MerklePart(seed_hashes[0], True), merkle_path1[0])
+		self.assertEqual([False, False], [merkle_part.is_left for merkle_part in merkle_path1[1:]])
+
+		self.assertEqual(3, len(merkle_path4))
+		self.assertEqual(MerklePart(seed_hashes[4], False), merkle_path4[0])
+		self.assertEqual([False, True], [merkle_part.is_left for merkle_part in merkle_path4[1:]])
+
+		root_hash = Hash256('DEFB4BF7ACF2145500087A02C88F8D1FCF27B8DEF4E0FDABE09413D87A3F0D09')
+		for (index, merkle_path) in [(1, merkle_path1), (4, merkle_path4)]:
+			self.assertTrue(prove_merkle(seed_hashes[index], merkle_path, root_hash))
+
+	def test_cannot_calculate_merkle_path_of_hash_out_of_range(self):
+		# Arrange:
+		builder = MerkleHashBuilder()
+		for _ in range(0, 3):
+			builder.update(TestUtils.random_byte_array(Hash256))
+
+		for index in [-1, 3, 4]:
+			# Act + Assert:
+			with self.assertRaises(ValueError):
+				builder.merkle_path(index)
+
 	@staticmethod
 	def _calculate_merkle_hash(seed_hashes):
 		builder = MerkleHashBuilder()
@@ -105,6 +198,102 @@ class MerkleHashBuilderTest(unittest.TestCase):
 # endregion
 
 
+# region MerkleHashAccumulator
+
+class MerkleHashAccumulatorTest(unittest.TestCase):
+	@staticmethod
+	def _calculate_merkle_hash(seed_hashes):
+		builder = MerkleHashBuilder()
+		for seed_hash in seed_hashes:
+			builder.update(seed_hash)
+
+		return builder.final()
+
+	def test_can_create_empty(self):
+		# Act:
+		accumulator = MerkleHashAccumulator()
+
+		# Assert:
+		self.assertEqual(Hash256.zero(), accumulator.root())
+
+	def test_can_create_with_initial_hashes(self):
+		for count in range(1, 10):
+			# Arrange:
+			seed_hashes = [TestUtils.random_byte_array(Hash256) for _ in range(0, count)]
+
+			# Act:
+			accumulator = MerkleHashAccumulator(seed_hashes)
+
+			# Assert:
+			self.assertEqual(self._calculate_merkle_hash(seed_hashes), accumulator.root(), f'count {count}')
+
+	def test_root_matches_builder_after_every_append(self):
+		# Arrange:
+		seed_hashes = [TestUtils.random_byte_array(Hash256) for _ in range(0, 17)]
+		accumulator = MerkleHashAccumulator()
+
+		for count in range(1, len(seed_hashes) + 1):
+			# Act:
+			accumulator.append(seed_hashes[count - 1])
+
+			# Assert:
+			self.assertEqual(self._calculate_merkle_hash(seed_hashes[:count]), accumulator.root(), f'count {count}')
+
+	def test_update_appends_hash(self):
+		# Arrange:
+		seed_hashes = [TestUtils.random_byte_array(Hash256) for _ in range(0, 5)]
+		accumulator = MerkleHashAccumulator()
+
+		# Act:
+		for seed_hash in seed_hashes:
+			accumulator.update(seed_hash)
+
+		# Assert:
+		self.assertEqual(self._calculate_merkle_hash(seed_hashes), accumulator.final())
+
+	def test_root_matches_builder_after_every_replace(self):
+		for count in [1, 2, 5, 8, 9]:
+			# Arrange:
+			seed_hashes = [TestUtils.random_byte_array(Hash256) for _ in range(0, count)]
+			accumulator = MerkleHashAccumulator(seed_hashes)
+
+			for index in range(0, count):
+				# Act:
+				seed_hashes[index] = TestUtils.random_byte_array(Hash256)
+				accumulator.replace(index, seed_hashes[index])
+
+				# Assert:
+				self.assertEqual(self._calculate_merkle_hash(seed_hashes), accumulator.root(), f'count {count}, index {index}')
+
+	def test_can_calculate_merkle_path_after_append_and_replace(self):
+		# Arrange:
+		seed_hashes = [TestUtils.random_byte_array(Hash256) for _ in range(0, 7)]
+		accumulator = MerkleHashAccumulator(seed_hashes[:4])
+		for seed_hash in seed_hashes[4:]:
+			accumulator.append(seed_hash)
+
+		seed_hashes[2] = TestUtils.random_byte_array(Hash256)
+		accumulator.replace(2, seed_hashes[2])
+
+		for (index, seed_hash) in enumerate(seed_hashes):
+			# Act:
+			merkle_path = accumulator.merkle_path(index)
+
+			# Assert:
+			self.assertTrue(prove_merkle(seed_hash, merkle_path, accumulator.root()), f'index {index}')
+
+	def test_cannot_replace_hash_out_of_range(self):
+		# Arrange:
+		accumulator = MerkleHashAccumulator([TestUtils.random_byte_array(Hash256) for _ in range(0, 3)])
+
+		for index in [-1, 3, 4]:
+			# Act + Assert:
+			with self.assertRaises(ValueError):
+				accumulator.replace(index, TestUtils.random_byte_array(Hash256))
+
+# endregion
+
+
 # region prove_merkle
 
 class ProveMerkleTest(unittest.TestCase):
@@ -183,6 +372,74 @@ class ProveMerkleTest(unittest.TestCase):
 # endregion
 
 
+# region prove_merkle_many
+
+class ProveMerkleManyTest(unittest.TestCase):
+	@staticmethod
+	def _create_leaf_hashes_and_paths(count):
+		seed_hashes = [TestUtils.random_byte_array(Hash256) for _ in range(0, count)]
+		builder = MerkleHashBuilder()
+		for seed_hash in seed_hashes:
+			builder.update(seed_hash)
+
+		return [(seed_hash, builder.merkle_path(index)) for (index, seed_hash) in enumerate(seed_hashes)], builder.final()
+
+	def test_succeeds_when_there_are_no_proofs(self):
+		# Act:
+		results = prove_merkle_many([], TestUtils.random_byte_array(Hash256))
+
+		# Assert:
+		self.assertEqual([], results)
+
+	def test_succeeds_when_all_proofs_are_valid(self):
+		# Arrange:
+		leaf_hashes_and_paths, root_hash = self._create_leaf_hashes_and_paths(11)
+
+		# Act:
+		results = prove_merkle_many(leaf_hashes_and_paths, root_hash)
+
+		# Assert:
+		self.assertEqual([True] * 11, results)
+
+	def test_succeeds_when_proof_is_default_test_vector(self):
+		# Arrange:
+		test_vector = ProveMerkleTest._create_default_test_vector()  # pylint: disable=protected-access
+
+		# Act:
+		results = prove_merkle_many([(test_vector['leaf_hash'], test_vector['merkle_path'])], test_vector['root_hash'])
+
+		# Assert:
+		self.assertEqual([True], results)
+
+	def test_fails_only_invalid_proofs(self):
+		# Arrange: corrupt leaf 2, swap branch position of leaf 5 and truncate path of leaf 9
+		leaf_hashes_and_paths, root_hash = self._create_leaf_hashes_and_paths(11)
+		leaf_hashes_and_paths[2] = (TestUtils.random_byte_array(Hash256), leaf_hashes_and_paths[2][1])
+
+		merkle_path = leaf_hashes_and_paths[5][1]
+		merkle_path[1] = MerklePart(merkle_path[1].hash, not merkle_path[1].is_left)
+
+		leaf_hashes_and_paths[9] = (leaf_hashes_and_paths[9][0], leaf_hashes_and_paths[9][1][:-1])
+
+		# Act:
+		results = prove_merkle_many(leaf_hashes_and_paths, root_hash)
+
+		# Assert:
+		self.assertEqual([index not in (2, 5, 9) for index in range(0, 11)], results)
+
+	def test_fails_when_root_does_not_match(self):
+		# Arrange:
+		leaf_hashes_and_paths, _ = self._create_leaf_hashes_and_paths(11)
+
+		# Act:
+		results = prove_merkle_many(leaf_hashes_and_paths, TestUtils.random_byte_array(Hash256))
+
+		# Assert:
+		self.assertEqual([False] * 11, results)
+
+# endregion
+
+
 # region deserialize_patricia_tree_nodes
 
 ENCODED_EVEN_PATH = '3C' + 'FD50029F6E1DEFD128D221EEACC5E1796E1AAA9C247204019CEFE3CA050E'
@@ -408,6 +665,22 @@ class DeserializePatriciaTreeNodesTest(unittest.TestCase):
 		self.assertEqual(Hash256('61F7C1393209E53D38189D28CD3A9C6D4325647F7D1D810994EE9CF1DB90718F'), nodes[2].calculate_hash())
 		self.assertEqual(Hash256('DABE94628AFAC26C029C544A78FDC4649E26E2E2C6B61972B28DCE1974379B23'), nodes[3].calculate_hash())
 
+
+class SerializePatriciaTreeNodesTest(unittest.TestCase):
+	def test_can_serialize_no_nodes(self):
+		self.assertEqual(bytes(), serialize_patricia_tree_nodes([]))
+
+	def test_can_round_trip_nodes(self):
+		for serialized_path in [POSITIVE_PROOF_SERIALIZED_PATH, POSITIVE_PROOF_SERIALIZED_PATH_ODD, NEGATIVE_PROOF_SERIALIZED_PATH]:
+			# Arrange:
+			nodes = deserialize_patricia_tree_nodes(unhexlify(serialized_path))
+
+			# Act:
+			buffer = serialize_patricia_tree_nodes(nodes)
+
+			# Assert:
+			self.assertEqual(unhexlify(serialized_path), buffer)
+
 # endregion
 
 
@@ -553,3 +826,106 @@ class ProvePatriciaMerkleTest(unittest.TestCase):
 		self.assertEqual(PatriciaMerkleProofResult.VALID_NEGATIVE, result)
 
 # endregion
+
+
+# region PatriciaProofVerifier
+
+class PatriciaProofVerifierTest(unittest.TestCase):
+	POSITIVE_PARAMS = ProvePatriciaMerkleTest.POSITIVE_PARAMS
+	NEGATIVE_PARAMS = ProvePatriciaMerkleTest.NEGATIVE_PARAMS
+
+	def _create_verifier(self):
+		return PatriciaProofVerifier(*self.POSITIVE_PARAMS[3:])
+
+	def test_can_prove_many(self):
+		# Arrange: mix valid proofs with proofs that have mismatched value or dropped connecting node
+		verifier = self._create_verifier()
+		proofs = [
+			self.POSITIVE_PARAMS[:3],
+			self.NEGATIVE_PARAMS[:3],
+			[self.POSITIVE_PARAMS[0], Hash256('AAAABBBBCCCCDDDDEEEEFFFF0000111122223333444455556666777788889999'), self.POSITIVE_PARAMS[2]],
+			[self.POSITIVE_PARAMS[0], self.POSITIVE_PARAMS[1], self.POSITIVE_PARAMS[2][:1] + self.POSITIVE_PARAMS[2][2:]],
+			self.POSITIVE_PARAMS[:3]
+		]
+
+		# Act:
+		results = verifier.prove_many(proofs)
+
+		# Assert:
+		self.assertEqual([
+			PatriciaMerkleProofResult.VALID_POSITIVE,
+			PatriciaMerkleProofResult.VALID_NEGATIVE,
+			PatriciaMerkleProofResult.LEAF_VALUE_MISMATCH,
+			PatriciaMerkleProofResult.UNLINKED_NODE,
+			PatriciaMerkleProofResult.VALID_POSITIVE
+		], results)
+
+	def test_cannot_prove_many_when_state_hash_does_not_match_roots(self):
+		# Arrange:
+		verifier = PatriciaProofVerifier(
+			Hash256('AAAABBBBCCCCDDDDEEEEFFFF0000111122223333444455556666777788889999'),
+			self.POSITIVE_PARAMS[4])
+
+		# Act:
+		results = verifier.prove_many([self.POSITIVE_PARAMS[:3], self.NEGATIVE_PARAMS[:3]])
+
+		# Assert:
+		self.assertEqual([PatriciaMerkleProofResult.STATE_HASH_DOES_NOT_MATCH_ROOTS] * 2, results)
+
+	def test_can_prove_same_results_as_prove_patricia_merkle(self):
+		# Arrange:
+		verifier = self._create_verifier()
+
+		for params in [self.POSITIVE_PARAMS, self.NEGATIVE_PARAMS]:
+			# Act:
+			result = verifier.prove(*params[:3])
+
+			# Assert:
+			self.assertEqual(prove_patricia_merkle(*params), result)
+
+	def test_calculates_node_hashes_once(self):
+		# Arrange:
+		verifier = self._create_verifier()
+		nodes = verifier.deserialize_patricia_tree_nodes(unhexlify(POSITIVE_PROOF_SERIALIZED_PATH))
+
+		calculate_hash_counts = [0] * len(nodes)
+		for (index, node) in enumerate(nodes):
+			def calculate_hash(index=index, calculate_hash=node.calculate_hash):
+				calculate_hash_counts[index] += 1
+				return calculate_hash()
+
+			node.calculate_hash = calculate_hash
+
+		# Act:
+		results = verifier.prove_many([(self.POSITIVE_PARAMS[0], self.POSITIVE_PARAMS[1], nodes)] * 3)
+
+		# Assert:
+		self.assertEqual([PatriciaMerkleProofResult.VALID_POSITIVE] * 3, results)
+		self.assertEqual([1] * len(nodes), calculate_hash_counts)
+
+	def test_deserialize_reuses_nodes_with_same_serialized_bytes(self):
+		# Arrange:
+		verifier = self._create_verifier()
+
+		# Act:
+		nodes1 = verifier.deserialize_patricia_tree_nodes(unhexlify(POSITIVE_PROOF_SERIALIZED_PATH))
+		nodes2 = verifier.deserialize_patricia_tree_nodes(unhexlify(NEGATIVE_PROOF_SERIALIZED_PATH))
+		nodes3 = verifier.deserialize_patricia_tree_nodes(unhexlify(POSITIVE_PROOF_SERIALIZED_PATH))
+
+		# Assert:
+		self.assertEqual(
+			[node.calculate_hash() for node in deserialize_patricia_tree_nodes(unhexlify(POSITIVE_PROOF_SERIALIZED_PATH))],
+			[node.calculate_hash() for node in nodes1])
+		self.assertIs(nodes1[0], nodes2[0])
+		for (node1, node3) in zip(nodes1, nodes3):
+			self.assertIs(node1, node3)
+
+	def test_cannot_deserialize_unknown(self):
+		# Arrange:
+		verifier = self._create_verifier()
+
+		# Act + Assert:
+		with self.assertRaises(ValueError):
+			verifier.deserialize_patricia_tree_nodes(unhexlify('FE'))
+
+# endregion
@@ -5,14 +5,19 @@ from symbolchain.CryptoTypes import PrivateKey, PublicKey
 from symbolchain.symbol.KeyPair import KeyPair
 from symbolchain.symbol.MessageEncoder import MessageEncoder
 
-from ..test.BasicMessageEncoderTest import BasicMessageEncoderTest, MessageEncoderDecodeFailureTest, MessageEncoderTestInterface
+from ..test.BasicMessageEncoderTest import (
+	BasicMessageEncoderTest,
+	MessageEncoderDecodeFailureTest,
+	MessageEncoderDecodeManyTest,
+	MessageEncoderTestInterface
+)
 
 
 def malform_message(encoded_bytes):
 	return encoded_bytes[:-1] + bytes(encoded_bytes[-1] ^ 0xFF)
 
 
-class MessageEncoderTests(BasicMessageEncoderTest, unittest.TestCase):
+class MessageEncoderTests(BasicMessageEncoderTest, MessageEncoderDecodeManyTest, unittest.TestCase):
 	def get_basic_test_interface(self):
 		return MessageEncoderTestInterface(KeyPair, MessageEncoder, None, None, malform_message)
 
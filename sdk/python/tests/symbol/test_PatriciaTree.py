@@ -0,0 +1,260 @@
+import hashlib
+import unittest
+
+from symbolchain.CryptoTypes import Hash256
+from symbolchain.symbol.Merkle import (
+	BranchNode,
+	LeafNode,
+	PatriciaMerkleProofResult,
+	PatriciaTreePath,
+	deserialize_patricia_tree_nodes,
+	prove_patricia_merkle,
+	serialize_patricia_tree_nodes
+)
+from symbolchain.symbol.Network import Address
+from symbolchain.symbol.PatriciaTree import PatriciaTree
+
+from ..test.TestUtils import TestUtils
+
+
+def make_key(hex_prefix):
+	return Hash256(hex_prefix + '0' * (2 * Hash256.SIZE - len(hex_prefix)))
+
+
+def create_tree(pairs):
+	tree = PatriciaTree()
+	for (key, value) in pairs:
+		tree.set(key, value)
+
+	return tree
+
+
+def create_random_pairs(count):
+	# use some keys with shared prefixes, so that tree contains branches with non-empty paths
+	return [
+		(make_key(f'{index:04X}') if 0 == index % 2 else TestUtils.random_byte_array(Hash256), TestUtils.random_byte_array(Hash256))
+		for index in range(count)
+	]
+
+
+class PatriciaTreeTest(unittest.TestCase):
+	# region root
+
+	def test_root_of_empty_tree_is_zero_hash(self):
+		# Act:
+		tree = PatriciaTree()
+
+		# Assert:
+		self.assertEqual(0, len(tree))
+		self.assertEqual(Hash256.zero(), tree.root())
+
+	def test_root_of_tree_with_single_key_is_leaf_hash(self):
+		# Arrange:
+		key = TestUtils.random_byte_array(Hash256)
+		value = TestUtils.random_byte_array(Hash256)
+
+		# Act:
+		tree = create_tree([(key, value)])
+
+		# Assert:
+		self.assertEqual(1, len(tree))
+		self.assertEqual(LeafNode(PatriciaTreePath(key.bytes, 64), value).calculate_hash(), tree.root())
+
+	def test_root_of_tree_with_multiple_keys_is_branch_hash(self):
+		# Arrange:
+		keys = [make_key('ABC1'), make_key('ABC2'), make_key('AB4')]
+		values = [TestUtils.random_byte_array(Hash256) for _ in range(3)]
+
+		# Act:
+		tree = create_tree(zip(keys, values))
+
+		# Assert: ABC1 and ABC2 are linked to branch with empty path, which is linked (at C) with AB4 to root branch with path AB
+		leaf_hashes = [LeafNode(PatriciaTreePath(bytes(30), 60), value).calculate_hash() for value in values[:2]]
+		leaf_hashes.append(LeafNode(PatriciaTreePath(bytes(31), 61), values[2]).calculate_hash())
+
+		child_branch_hash = BranchNode(PatriciaTreePath(bytes(), 0), [None, leaf_hashes[0], leaf_hashes[1]] + [None] * 13).calculate_hash()
+		root_links = [None] * 16
+		root_links[4] = leaf_hashes[2]
+		root_links[0xC] = child_branch_hash
+
+		self.assertEqual(3, len(tree))
+		self.assertEqual(BranchNode(PatriciaTreePath(bytes([0xAB]), 2), root_links).calculate_hash(), tree.root())
+
+	def test_root_is_independent_of_insertion_order(self):
+		# Arrange:
+		pairs = create_random_pairs(100)
+
+		# Act:
+		tree1 = create_tree(pairs)
+		tree2 = create_tree(reversed(pairs))
+
+		# Assert:
+		self.assertEqual(100, len(tree1))
+		self.assertEqual(tree1.root(), tree2.root())
+
+	# endregion
+
+	# region set / get
+
+	def test_can_get_values(self):
+		# Arrange:
+		pairs = create_random_pairs(50)
+		tree = create_tree(pairs)
+
+		# Act + Assert:
+		for (key, value) in pairs:
+			self.assertEqual(value, tree.get(key))
+
+		self.assertIsNone(tree.get(make_key('FFFF')))
+		self.assertIsNone(tree.get(make_key('0000000001')))
+
+	def test_can_update_value(self):
+		# Arrange:
+		pairs = create_random_pairs(50)
+		tree = create_tree(pairs)
+		root_hash = tree.root()
+
+		# Act:
+		new_value = TestUtils.random_byte_array(Hash256)
+		tree.set(pairs[10][0], new_value)
+		updated_root_hash = tree.root()
+
+		# Assert:
+		self.assertEqual(50, len(tree))
+		self.assertEqual(new_value, tree.get(pairs[10][0]))
+		self.assertNotEqual(root_hash, updated_root_hash)
+		self.assertEqual(create_tree(pairs[:10] + [(pairs[10][0], new_value)] + pairs[11:]).root(), updated_root_hash)
+
+	def test_updating_value_back_restores_root(self):
+		# Arrange:
+		pairs = create_random_pairs(50)
+		tree = create_tree(pairs)
+		root_hash = tree.root()
+
+		# Act:
+		tree.set(pairs[10][0], TestUtils.random_byte_array(Hash256))
+		tree.root()
+		tree.set(pairs[10][0], pairs[10][1])
+
+		# Assert:
+		self.assertEqual(root_hash, tree.root())
+
+	def test_cannot_set_keys_with_different_sizes(self):
+		# Arrange:
+		tree = create_tree([(make_key('AB'), TestUtils.random_byte_array(Hash256))])
+
+		# Act + Assert:
+		with self.assertRaises(ValueError):
+			tree.set(TestUtils.random_byte_array(Address), TestUtils.random_byte_array(Hash256))
+
+	# endregion
+
+	# region unset
+
+	def test_can_unset_keys(self):
+		# Arrange:
+		pairs = create_random_pairs(50)
+		tree = create_tree(pairs)
+
+		for index in range(0, 50, 3):
+			# Act:
+			is_removed = tree.unset(pairs[index][0])
+
+			# Assert: branches left with single link are merged, so root matches tree created without removed keys
+			self.assertTrue(is_removed)
+			self.assertIsNone(tree.get(pairs[index][0]))
+
+		remaining_pairs = [pair for (index, pair) in enumerate(pairs) if 0 != index % 3]
+		self.assertEqual(len(remaining_pairs), len(tree))
+		self.assertEqual(create_tree(remaining_pairs).root(), tree.root())
+
+	def test_cannot_unset_unknown_keys(self):
+		# Arrange:
+		pairs = [(make_key('ABC1'), TestUtils.random_byte_array(Hash256)), (make_key('ABC2'), TestUtils.random_byte_array(Hash256))]
+		tree = create_tree(pairs)
+		root_hash = tree.root()
+
+		for key in [make_key('ABC3'), make_key('AB'), make_key('F')]:
+			# Act:
+			is_removed = tree.unset(key)
+
+			# Assert:
+			self.assertFalse(is_removed)
+			self.assertEqual(2, len(tree))
+			self.assertEqual(root_hash, tree.root())
+
+	def test_unsetting_all_keys_results_in_empty_tree(self):
+		# Arrange:
+		pairs = create_random_pairs(20)
+		tree = create_tree(pairs)
+
+		# Act:
+		for (key, _) in pairs:
+			tree.unset(key)
+
+		# Assert:
+		self.assertEqual(0, len(tree))
+		self.assertEqual(Hash256.zero(), tree.root())
+
+	# endregion
+
+	# region prove
+
+	@staticmethod
+	def _prove(tree, key):
+		subcache_merkle_roots = [TestUtils.random_byte_array(Hash256), tree.root()]
+		state_hash = Hash256(hashlib.sha3_256(b''.join(root.bytes for root in subcache_merkle_roots)).digest())
+
+		# round trip proof through serialization, so that proof is in format received from nodes
+		merkle_path = deserialize_patricia_tree_nodes(serialize_patricia_tree_nodes(tree.prove(key)))
+		return prove_patricia_merkle(key, tree.get(key), merkle_path, state_hash, subcache_merkle_roots)
+
+	def test_can_prove_keys_in_tree(self):
+		# Arrange:
+		pairs = create_random_pairs(50)
+		tree = create_tree(pairs)
+
+		# Act:
+		results = [self._prove(tree, key) for (key, _) in pairs]
+
+		# Assert:
+		self.assertEqual([PatriciaMerkleProofResult.VALID_POSITIVE] * 50, results)
+
+	def test_can_prove_key_not_in_tree(self):
+		# Arrange:
+		tree = create_tree([
+			(make_key('A1'), TestUtils.random_byte_array(Hash256)),
+			(make_key('A2'), TestUtils.random_byte_array(Hash256)),
+			(make_key('B'), TestUtils.random_byte_array(Hash256))
+		])
+
+		# Act:
+		results = [self._prove(tree, make_key('A3')), self._prove(tree, make_key('C'))]
+
+		# Assert:
+		self.assertEqual([PatriciaMerkleProofResult.VALID_NEGATIVE] * 2, results)
+
+	def test_proof_of_key_in_tree_ends_with_leaf(self):
+		# Arrange:
+		tree = create_tree([
+			(make_key('A1'), TestUtils.random_byte_array(Hash256)),
+			(make_key('A2'), TestUtils.random_byte_array(Hash256)),
+			(make_key('B'), TestUtils.random_byte_array(Hash256))
+		])
+
+		# Act:
+		merkle_path = tree.prove(make_key('A2'))
+
+		# Assert:
+		self.assertEqual(['', '', '0' * 62], [node.hex_path for node in merkle_path])
+		self.assertEqual(tree.root(), merkle_path[0].calculate_hash())
+		self.assertEqual(tree.get(make_key('A2')), merkle_path[-1].value)
+
+	def test_proof_of_empty_tree_is_empty(self):
+		# Act:
+		merkle_path = PatriciaTree().prove(make_key('A'))
+
+		# Assert:
+		self.assertEqual([], merkle_path)
+
+	# endregion
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from binascii import hexlify
 
@@ -52,6 +53,54 @@ class SymbolTransactionFactoryTest(AbstractBasicTransactionFactoryExSignatureTes
 
 	# endregion
 
+	# region slots
+
+	def _create_hash_lock_transaction(self):
+		return self.create_transaction(self.create_factory())({
+			'type': 'hash_lock_transaction_v1',
+			'signer_public_key': TEST_SIGNER_PUBLIC_KEY,
+			'hash': TestUtils.random_byte_array(Hash256),
+			'duration': 654321,
+			'mosaic': {'mosaic_id': 0x12345678ABCDEF, 'amount': 12345}
+		})
+
+	def test_created_transaction_does_not_have_instance_dictionary(self):
+		# Arrange:
+		transaction = self._create_hash_lock_transaction()
+
+		# Act + Assert:
+		for model in (transaction, transaction.mosaic, transaction.mosaic.amount, transaction.hash):
+			self.assertFalse(hasattr(model, '__dict__'))
+
+		with self.assertRaises(AttributeError):
+			transaction.other = 123
+
+	def test_deserialized_transaction_is_equal_to_created_transaction(self):
+		# Arrange:
+		transaction = self._create_hash_lock_transaction()
+
+		# Act:
+		deserialized_transaction = type(transaction).deserialize(transaction.serialize())
+
+		# Assert:
+		self.assertEqual(transaction.serialize(), deserialized_transaction.serialize())
+		self.assertEqual(sc.Amount(12345), deserialized_transaction.mosaic.amount)
+		self.assertEqual(sc.UnresolvedMosaicId(0x12345678ABCDEF), deserialized_transaction.mosaic.mosaic_id)
+		self.assertEqual(transaction.hash, deserialized_transaction.hash)
+
+	def test_created_transaction_can_be_pickled(self):
+		# Arrange:
+		transaction = self._create_hash_lock_transaction()
+
+		# Act:
+		unpickled_transaction = pickle.loads(pickle.dumps(transaction))
+
+		# Assert:
+		self.assertEqual(transaction.serialize(), unpickled_transaction.serialize())
+		self.assertEqual(transaction.mosaic.amount, unpickled_transaction.mosaic.amount)
+
+	# endregion
+
 	# region address type conversion
 
 	def test_can_create_transaction_with_address(self):
@@ -265,3 +314,73 @@ class TransactionFactoryTest(BasicTransactionFactoryTest, SymbolTransactionFacto
 			TransactionFactory.lookup_transaction_name(sc.TransactionType(123), 1)
 
 	# endregion
+
+	# region generated deserialize
+
+	def _assert_cannot_deserialize(self, factory_class, payload, message):
+		with self.assertRaisesRegex(ValueError, message):
+			factory_class.deserialize(payload)
+
+	def test_generated_factories_cannot_deserialize_truncated_payload(self):
+		for (factory_class, header_size) in [
+			(sc.TransactionFactory, 128), (sc.EmbeddedTransactionFactory, 48), (sc.BlockFactory, 136), (sc.ReceiptFactory, 8)
+		]:
+			for size in (0, header_size // 2, header_size - 1):
+				self._assert_cannot_deserialize(factory_class, bytes(size), f'smaller than .* header size {header_size}')
+
+	def test_generated_factories_cannot_deserialize_payload_with_unknown_discriminator(self):
+		for factory_class in (sc.TransactionFactory, sc.EmbeddedTransactionFactory, sc.BlockFactory, sc.ReceiptFactory):
+			self._assert_cannot_deserialize(factory_class, bytes(200), 'unknown discriminator')
+
+	def test_generated_fixed_layout_models_cannot_deserialize_short_payload(self):
+		for (model_class, size) in [(sc.Amount, 8), (sc.Mosaic, 16), (sc.Cosignature, 104)]:
+			for payload_size in (0, size // 2, size - 1):
+				with self.assertRaisesRegex(ValueError, f'smaller than {model_class.__name__} size {size}'):
+					model_class.deserialize(bytes(payload_size))
+
+	def test_generated_fixed_layout_models_can_deserialize_payload_with_trailing_data(self):
+		# Act:
+		amount = sc.Amount.deserialize(bytes([1, 0, 0, 0, 0, 0, 0, 0, 0xFF]))
+		mosaic = sc.Mosaic.deserialize(bytes([2] + [0] * 7 + [3] + [0] * 7 + [0xFF]))
+
+		# Assert:
+		self.assertEqual(1, amount.value)
+		self.assertEqual(2, mosaic.mosaic_id.value)
+		self.assertEqual(3, mosaic.amount.value)
+
+	def test_generated_views_cannot_be_created_around_empty_or_truncated_payload(self):
+		# Arrange:
+		transaction = self.create_factory().create({
+			'type': 'transfer_transaction_v1',
+			'signer_public_key': TEST_SIGNER_PUBLIC_KEY,
+			'mosaics': [{'mosaic_id': 1, 'amount': 2}]
+		})
+		payload = transaction.serialize()
+
+		for (view_class, truncated_payload) in [
+			(sc.MosaicView, b''),
+			(sc.MosaicView, bytes(15)),
+			(sc.TransferTransactionV1View, b''),
+			(sc.TransferTransactionV1View, bytes(10)),
+			(sc.TransferTransactionV1View, payload[:-1]),
+			(sc.TransferTransactionV1View, payload[:transaction.size - 16])
+		]:
+			# Act + Assert:
+			with self.assertRaises(ValueError):
+				view_class(truncated_payload)
+
+	def test_generated_factory_can_deserialize_known_payload(self):
+		# Arrange:
+		transaction = self.create_factory().create({
+			'type': 'transfer_transaction_v1',
+			'signer_public_key': TEST_SIGNER_PUBLIC_KEY
+		})
+
+		# Act:
+		deserialized_transaction = sc.TransactionFactory.deserialize(transaction.serialize())
+
+		# Assert:
+		self.assertEqual(sc.TransferTransactionV1, type(deserialized_transaction))
+		self.assertEqual(transaction.serialize(), deserialized_transaction.serialize())
+
+	# endregion
@@ -1,7 +1,9 @@
 from abc import abstractmethod
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 from symbolchain.CryptoTypes import PrivateKey
+from symbolchain.SharedKeyCache import SharedKeyCache
 
 MessageEncoderTestInterface = namedtuple('MessageEncoderTestInterface', [
 	'key_pair_class', 'encoder_class', 'encode', 'try_decode', 'malform'
@@ -80,6 +82,143 @@ class BasicMessageEncoderTest(MessageEncoderDecodeFailureTest):
 		self.assertTrue(result)
 		self.assertEqual(decoded, b'hello world')
 
+	def test_encoder_with_shared_key_cache_derives_shared_key_once_per_counterparty(self):
+		# Arrange:
+		interface = self.get_basic_test_interface()
+		key_pair = interface.key_pair_class(PrivateKey.random())
+		recipient_key_pairs = [interface.key_pair_class(PrivateKey.random()) for _ in range(2)]
+		shared_key_cache = SharedKeyCache()
+		encoder = interface.encoder_class(key_pair, shared_key_cache)
+
+		# Act:
+		encoded_messages = []
+		for index in range(6):
+			recipient_public_key = recipient_key_pairs[index % 2].public_key
+			encoded_messages.append(_encode(interface, encoder)(recipient_public_key, f'hello world {index}'.encode('utf8')))
+
+		results = [
+			_try_decode(interface, encoder)(recipient_key_pairs[index % 2].public_key, encoded)
+			for (index, encoded) in enumerate(encoded_messages)
+		]
+
+		# Assert:
+		self.assertEqual([(True, f'hello world {index}'.encode('utf8')) for index in range(6)], results)
+		self.assertEqual(2, len(shared_key_cache))
+		self.assertEqual(2, shared_key_cache.misses)
+
+		# - deprecated encodings use random salts, so only (recommended) shared key used when decoding is cached
+		self.assertLessEqual(4, shared_key_cache.hits)
+
+	def test_encoder_with_shared_key_cache_can_exchange_messages_with_encoder_without_cache(self):
+		# Arrange:
+		interface = self.get_basic_test_interface()
+		key_pair = interface.key_pair_class(PrivateKey.random())
+		recipient_key_pair = interface.key_pair_class(PrivateKey.random())
+		encoder = interface.encoder_class(key_pair, SharedKeyCache())
+		encoded = _encode(interface, encoder)(recipient_key_pair.public_key, b'hello world')
+
+		# Act:
+		decoder = interface.encoder_class(recipient_key_pair)
+		result, decoded = _try_decode(interface, decoder)(key_pair.public_key, encoded)
+
+		# Assert:
+		self.assertTrue(result)
+		self.assertEqual(decoded, b'hello world')
+
+	@abstractmethod
+	def get_basic_test_interface(self):
+		pass
+
+
+def _prepare_encoded_messages(interface, encoder, num_messages, num_recipients):
+	recipient_public_keys = [interface.key_pair_class(PrivateKey.random()).public_key for _ in range(num_recipients)]
+
+	pairs = []
+	expected_results = []
+	for index in range(num_messages):
+		recipient_public_key = recipient_public_keys[index % num_recipients]
+		message = f'hello world {index}'.encode('utf8')
+		encoded = _encode(interface, encoder)(recipient_public_key, message)
+
+		# every fifth message is malformed, so it cannot be decoded
+		# (malformed CBC messages occasionally still have valid padding, so they are reencoded until they cannot be decoded)
+		if 0 == index % 5:
+			encoded = interface.malform(encoded)
+			while _try_decode(interface, encoder)(recipient_public_key, encoded)[0]:
+				encoded = interface.malform(_encode(interface, encoder)(recipient_public_key, message))
+
+			expected_results.append((False, encoded))
+		else:
+			expected_results.append((True, message))
+
+		pairs.append((recipient_public_key, encoded))
+
+	return pairs, expected_results
+
+
+class MessageEncoderDecodeManyTest:
+	# pylint: disable=no-member
+	def _assert_can_decode_many(self, num_messages, executor=None):
+		# Arrange:
+		interface = self.get_basic_test_interface()
+		encoder = interface.encoder_class(interface.key_pair_class(PrivateKey.random()))
+		pairs, expected_results = _prepare_encoded_messages(interface, encoder, num_messages, 3)
+
+		# Act:
+		results = encoder.try_decode_many(pairs, executor)
+
+		# Assert:
+		self.assertEqual(expected_results, results)
+
+	def test_can_decode_many_with_no_messages(self):
+		self._assert_can_decode_many(0)
+
+	def test_can_decode_many_with_single_chunk_of_messages(self):
+		self._assert_can_decode_many(10)
+
+	def test_can_decode_many_with_multiple_chunks_of_messages(self):
+		self._assert_can_decode_many(150)
+
+	def test_can_decode_many_with_multiple_chunks_of_messages_using_custom_executor(self):
+		with ThreadPoolExecutor(max_workers=2) as executor:
+			self._assert_can_decode_many(150, executor)
+
+			# Assert: executor is not shut down
+			self.assertEqual(3, executor.submit(lambda: 3).result())
+
+	def test_decode_many_derives_shared_key_once_per_counterparty(self):
+		# Arrange:
+		interface = self.get_basic_test_interface()
+		key_pair = interface.key_pair_class(PrivateKey.random())
+		pairs, expected_results = _prepare_encoded_messages(interface, interface.encoder_class(key_pair), 150, 3)
+
+		shared_key_cache = SharedKeyCache()
+		encoder = interface.encoder_class(key_pair, shared_key_cache)
+
+		# Act:
+		results = encoder.try_decode_many(pairs)
+
+		# Assert:
+		self.assertEqual(expected_results, results)
+		self.assertEqual(3, len(shared_key_cache))
+		self.assertEqual(3, shared_key_cache.misses)
+
+	def test_decode_many_does_not_evict_shared_keys_from_too_small_cache(self):
+		# Arrange:
+		interface = self.get_basic_test_interface()
+		key_pair = interface.key_pair_class(PrivateKey.random())
+		pairs, expected_results = _prepare_encoded_messages(interface, interface.encoder_class(key_pair), 150, 3)
+
+		shared_key_cache = SharedKeyCache(2)
+		encoder = interface.encoder_class(key_pair, shared_key_cache)
+
+		# Act:
+		results = encoder.try_decode_many(pairs)
+
+		# Assert: batch cache was used instead
+		self.assertEqual(expected_results, results)
+		self.assertEqual(0, len(shared_key_cache))
+
 	@abstractmethod
 	def get_basic_test_interface(self):
 		pass
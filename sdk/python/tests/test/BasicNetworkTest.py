@@ -1,9 +1,23 @@
 import datetime
 from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
 
 from symbolchain.NetworkTimestamp import NetworkTimestamp
 
 
+class RecordingProcessPoolExecutor(ProcessPoolExecutor):
+	"""Process pool executor that counts submitted work items."""
+
+	def __init__(self, max_workers):
+		super().__init__(max_workers=max_workers)
+		self.num_submitted = 0
+
+	def submit(self, fn, /, *args, **kwargs):
+		self.num_submitted += 1
+		return super().submit(fn, *args, **kwargs)
+
+
 class NetworkTestDescriptor:
 	def __init__(
 		self,
@@ -67,6 +81,49 @@ class BasicNetworkTest:
 
 	# endregion
 
+	# region public_keys_to_addresses
+
+	def _assert_can_convert_public_keys_to_addresses(self, executor=None):
+		# Arrange:
+		test_descriptor = self.get_test_descriptor()
+		public_key_class = test_descriptor.deterministic_public_key.__class__
+		public_keys = [public_key_class(bytes([index]) * public_key_class.SIZE) for index in range(20)]
+		public_keys.append(test_descriptor.deterministic_public_key)
+
+		for network in [test_descriptor.mainnet_network, test_descriptor.testnet_network]:
+			# Act:
+			addresses = network.public_keys_to_addresses(public_keys, executor)
+
+			# Assert:
+			self.assertEqual([network.public_key_to_address(public_key) for public_key in public_keys], addresses)
+			self.assertTrue(all(network.is_valid_address(address) for address in addresses))
+
+		self.assertEqual(test_descriptor.expected_testnet_address, addresses[-1])
+
+	def test_can_convert_no_public_keys_to_addresses(self):
+		# Arrange:
+		test_descriptor = self.get_test_descriptor()
+
+		# Act:
+		addresses = test_descriptor.mainnet_network.public_keys_to_addresses([])
+
+		# Assert:
+		self.assertEqual([], addresses)
+
+	def test_can_convert_public_keys_to_addresses(self):
+		self._assert_can_convert_public_keys_to_addresses()
+
+	def test_can_convert_public_keys_to_addresses_with_process_pool(self):
+		# Arrange: split 21 public keys into chunks of (at most) 5 keys, so that they are converted by workers
+		with RecordingProcessPoolExecutor(2) as executor, patch('symbolchain.impl.ChunkHelpers.DEFAULT_CHUNK_SIZE', 5):
+			# Act + Assert:
+			self._assert_can_convert_public_keys_to_addresses(executor)
+
+			# Assert: 5 chunks were submitted for both mainnet and testnet
+			self.assertEqual(2 * 5, executor.num_submitted)
+
+	# endregion
+
 	# region is_valid_address[_string]
 
 	def test_can_validate_valid_mainnet_address(self):
@@ -0,0 +1,139 @@
+# testnet nemesis block from the catapult client seed (client/catapult/seed/testnet/00000/00001.dat)
+# * block hash is taken from the seed hashes.dat
+# * transactions hash is taken from the seed summary.txt
+# * generation hash seed is taken from the catapult client resources (client/catapult/resources/config-network.properties)
+
+NEMESIS_GENERATION_HASH_SEED = '57F7DA205008026C776CB6AED843393F04CD458E0AA2D9F1D5F31A402072B2D6'
+
+NEMESIS_BLOCK_HASH = '3A71AFC15705D718FFDE7E2BD4134EF1E9E5417CD39100EA4DC15FBEEA4BFB6F'
+
+NEMESIS_TRANSACTIONS_HASH = '5507AC9077A460E55E7AE6486EAD07A46B86A956AA5CC585A272B31F99F4D16B'
+
+NEMESIS_SIGNATURE = (
+	'C1A78852D91A4BF94C9A4D654B6F0568913F1DC437FCB224B807429E105B78B9'
+	'CD2B3F6BF54E50176AC9405C399237A3CC4AA150E4E4D9A093A8835EB30DFA04'
+)
+
+NEMESIS_BLOCK_PAYLOAD = (
+	'111E000000000000C1A78852D91A4BF94C9A4D654B6F0568913F1DC437FCB224B807429E105B78B9CD2B3F6BF54E50176AC9405C399237A3CC4AA150E4E4D9A0'
+	'93A8835EB30DFA04C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E000000000198438001000000000000000000000000000000'
+	'00407A10F35A00008D49594A96C31EC6C64305FB2CCB47AA7A4AC0A4F614442BB3684D2BF41F274E82FB583BFE3EE78805784D078F2547AE480175C83739B22C'
+	'53EAECAA7E7F3B245F1DFAFA6B3AE5C1D0129502FCBAAD0C00000000000000000000000000000000000000000000000000000000000000005507AC9077A460E5'
+	'5E7AE6486EAD07A46B86A956AA5CC585A272B31F99F4D16B00000000000000000000000000000000000000000000000000000000000000000000000000000000'
+	'0000000000000000000000000000000000000000000000009822D031CAFB3993B57FEE5ADC0BD4033A431FBFA138812A00000000000000000B00000000000000'
+	'000000000000000000000000000000000000000000000000000000000000000000000000000000009500000000000000C98BB35E0F0DEEE214D2EF721C995CD0'
+	'E6D3571722CFF463AE9ED86EB575EF9981F956E168EB0CFBBCA4C9F6138FDE7AF06F53E817E0BF17326459491D4CB50BC67F465087EF681824805B7E9FF3B272'
+	'8A4EE847DE044DE5D9FA415F7660B08E0000000001984E410000000000000000010000000000000000000000000000004F1B65BA5F7F49B10003636174000000'
+	'9900000000000000AB9A5E9D22911D4B53CE42B7739C8417412569E88B8BAFD947CF8545099D06AD3E95615EF71E4CFC97181073DC0784FB2450A2533A5BDCA7'
+	'02A32BA93D9D510EC67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001984E4100000000000000000100000000000000'
+	'4F1B65BA5F7F49B11C29E1B7B2991294010768617276657374000000000000009A00000000000000143535009E16F8EF2D86A7C2780FDF36074735A9819A8BA4'
+	'DF6906DFBD7732B5BBD09898F6033AEF2219F1A3A09033C73D58330D329396188D604BAAE52A2508C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5'
+	'D9FA415F7660B08E0000000001984E41000000000000000001000000000000004F1B65BA5F7F49B144B262C46CEABB85010863757272656E6379000000000000'
+	'96000000000000002AF257828565770FDDAD41775693FD400A71F463387BD0881A62FEE5FB77F54781885AB8D36C0F93D31BB7AE2153DC98FA15C8F06ECCB3ED'
+	'BC833DDC49D3D30BC67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001984D4100000000000000000100000000000000'
+	'F56638316AD34E660000000000000000000000000206000091000000000000004E89024BBAB3CFFCE3EE00571A7D109E83CCE038A10A7539222620AE2F76426C'
+	'C9C798740B7F31B08C75220AECFC0C74FCEF97FDB1382143A9D27587377B0C04C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E'
+	'0000000001984E430000000000000000010000000000000044B262C46CEABB85F56638316AD34E6601000000000000009100000000000000B32AECECEC2BEE3E'
+	'DB56FAF6842FD870AEF4E96B11CD8A7D9BE2EF12B4822BC6345649E4D8A10EFF046374D084E5975B68BA608B5DB6A94BA1CD7341AE962D00C67F465087EF6818'
+	'24805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001984D420000000000000000010000000000000044B262C46CEABB8580FBDBCA73F91F00'
+	'0100000000000000960000000000000014C6D5300F9DC9E521239CB5AE9D6D27EF649BBC23B224829BEDEE5E2875103D9A95085C73DCC449F67EC70C5C2475BC'
+	'626097E411049CCD2110855A033DA306C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001984D410000000000000000'
+	'0100000000000000C4D1F839A48B094C00000000000000000100000003030000910000000000000087F8DBE346361C771167E2F431317F703EE19AF5E176F911'
+	'5C467AB08A0CD6CF6ABADD44BDB1056C466E0DE7E1D761098B26389191EC86D240B7B49D21AE4A06C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5'
+	'D9FA415F7660B08E0000000001984E43000000000000000001000000000000001C29E1B7B2991294C4D1F839A48B094C01000000000000009100000000000000'
+	'7391EEEBE5C160CF09ABC6021F85C9E09B71870C8B4D7EB25D41F6DAF1D204FB39D7A7268F578042DFDD15CC119A24D9B71FD0985E72EE98E3C5C163915F9E07'
+	'C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001984D42000000000000000001000000000000001C29E1B7B2991294'
+	'40660301000000000100000000000000C00000000000000062835AE7AC0CEF282D319DD4D082F1AEA301E2D661896C3E4759E9E86A4C3AED928AEE7CABC88F93'
+	'A401EE2519406F372DF24A038A3BF9B1262AF97154222105C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001985441'
+	'0000000000000000010000000000000098000D7B3D85F071A2AED1312217E1A305F2E20F0C6904AB000002000000000044B262C46CEABB8540D14FE610740100'
+	'1C29E1B7B299129440420F0000000000C0000000000000000A1100A4E0EAC76DD9D9753CCE0223BA9773DACAE2A422AB735937179E10C525CC86B5968B2F39E2'
+	'61E2F30508A4DA374E37802A38BDB8AAB412CD70C1BE2601C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001985441'
+	'0000000000000000010000000000000098000DE49DF8951CE3FED40DC71B7163344201BE92F3FBF3000002000000000044B262C46CEABB8540D14FE610740100'
+	'1C29E1B7B299129440420F0000000000C000000000000000A96D9E97273CF93746B1E4E47B3C3233C35D407654F3002004E2BB02CA4260C532BACD6879ADBD31'
+	'9ABF3FCCB784648985E319D948903B450C2F2F0612C85B00C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001985441'
+	'0000000000000000010000000000000098000E468E4EA2122AD8764F2666D3198EC14474139821EB000002000000000044B262C46CEABB8540D14FE610740100'
+	'1C29E1B7B299129440420F0000000000C0000000000000002B42A8F44F6AF3C0B926AE23399F6121776B8B15EE43E95ABAC2AC5ED6F0C31BAA39ADAE08248B66'
+	'3B54C443D36D4200DB1F6443A88CD20C06778673F064710FC67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001985441'
+	'0000000000000000010000000000000098000F351FD053C2909AE25B59CA11C9EE6C8B224F564C2E000002000000000044B262C46CEABB8540D14FE610740100'
+	'1C29E1B7B299129440420F0000000000C000000000000000177BED4D8BB10EFEA875CC2907A672E6D74186677CEED9021D58F1BC8E93FE89489D7FAB4A256BEB'
+	'018E17DDEE4B47E7CBB9BB9EF582D8FAE7A587D495AAF005C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001985441'
+	'0000000000000000010000000000000098000FBBBBB428BBB5CAD1A6FFC291BFE2A7C46D2F26FE35000002000000000044B262C46CEABB8540D14FE610740100'
+	'1C29E1B7B299129400093D0000000000C000000000000000D1BA21D5319EB3DB51367FCE825A3883D77150BBD5F599F45FD87A7B823501217B5173B4F79D8604'
+	'9510704D1CD8D4B6D950D0C521F815BD311C2B79B1003B0BC67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001985441'
+	'000000000000000001000000000000009800017EEBD13D7169A295D1C17986F9ED93139FB15776BD000002000000000044B262C46CEABB8540D14FE610740100'
+	'1C29E1B7B299129440420F0000000000C0000000000000002F44A3C5A283E0179D69FF88D035AB2C11D84CD7413DD3255E37850918B00C366B9D28E1AC7B67D9'
+	'C1B6F41E13B9EADA5277AB39E0809BA0BAA2BD1AE0B8DC0AC67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001985441'
+	'00000000000000000100000000000000980001BEC9D7DD9ABE4F65857EC216B0B9F417CAA1597811000002000000000044B262C46CEABB8540D14FE610740100'
+	'1C29E1B7B299129440420F0000000000C00000000000000067452BDAF1C01114F53F040EEA0D6DDFC08FFBC003A687918D278769A56C0436804D8F1C7A01684E'
+	'6D680B9218BD07BC70926DA9B19866142A4BCFAFCEF09300C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001985441'
+	'0000000000000000010000000000000098000206DD84D20C2ECEC53234BBE14A3224162FD9401316000002000000000044B262C46CEABB8540D14FE610740100'
+	'1C29E1B7B299129440420F0000000000C000000000000000E0338B78CAB7A5E78EA0A7717CE930E82497CEE9866531B1CA19F5199CD51984B28759898E68DC2A'
+	'448EAC2F73531113748BAA855F4B28FD3419E768ECEB4C0BC67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001985441'
+	'0000000000000000010000000000000098000282F3D10E6581D7747C8DA6F1D7C83FC36B212281BA000002000000000044B262C46CEABB8540D14FE610740100'
+	'1C29E1B7B299129440420F0000000000C00000000000000097AF3013AF47C923FBA45149B856DCE2F6BD2A1F7B6EC15E275E9C3E1F61F86DC3AD5B1B955B2AF9'
+	'C022373145110DAA5DED1479311C8BC89D19BE403A01A40EC67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001985441'
+	'000000000000000001000000000000009800037AC9F20F1221C96F29D3F8D5E9C105DA9F93AEA31F000002000000000044B262C46CEABB8540D14FE610740100'
+	'1C29E1B7B299129440420F0000000000C00000000000000062E8183E73AD17E9CE318A9B3BB176A0A31B47B7AADDC67D61F8A1736B5457829D5FC3B8D0249669'
+	'CCAC931F5C4C17661CB284C87208C5C743CACC28D98C3007C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001985441'
+	'00000000000000000100000000000000980003CD5305B8D59977A7E9ACD9FD5DA1CC7C66C5358A1D000002000000000044B262C46CEABB8540D14FE610740100'
+	'1C29E1B7B299129400093D0000000000B000000000000000A4504DA8D696B6B7032F3CF59451642A28E544D1F8EC4908E90571C1E53F0C2F0B81E82CE77AA58A'
+	'A7168D8F36D5F13EA280DFFE9B07ECC44F1B907C47882807C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001985441'
+	'0000000000000000010000000000000098389FBC22B48AABFAEAA54E3A75E035704829F6A05DF36B000001000000000044B262C46CEABB8540D14FE610740100'
+	'B0000000000000001B2D7EB0360B8A389CA94B1C9142D75F64D28A152DDFD58B7DB7958850BBA7E24D9CE3555F9FF90A2BD1A17AB288EF3408F76AD001B6C5CF'
+	'F8B0017ECDF7B200C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E000000000198544100000000000000000100000000000000'
+	'980F8BFA16AF8299D74AA3FF05D7598B1AC845A53738750A000001000000000044B262C46CEABB8540D14FE610740100B000000000000000E52B05A1316C1D62'
+	'081F9045609F8E6D0E1FF6C984871C3599B52F771989366D64269A12D92352ED0E7C4EFB4DB9ED377E4C6DD08D9AF6928FF7DCF2858B0803C67F465087EF6818'
+	'24805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E00000000019854410000000000000000010000000000000098128BE6D413BD25EEBDDB3ABFF4C422'
+	'1919B05FD366156E000001000000000044B262C46CEABB8540D14FE610740100B00000000000000083FF58343EEB23B3B73028F6D90C6278E1BE1C991200A780'
+	'51E4EAE609E2AE537DC03ED228D0937293C18BDFE4C8DEC5AA3F3B6AF9C2D639EB80F15999F23A03C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5'
+	'D9FA415F7660B08E0000000001985441000000000000000001000000000000009827B2D1948108BABFD9C6E1BBDA5A80DC713453D44516050000010000000000'
+	'44B262C46CEABB8540D14FE610740100B000000000000000CD3002E9769EB03E56A4C0C946C088CE8210AFA11E431BE541B2361A2A4843D09BEF4C4B32A2ED59'
+	'A3BAE66DBEC1A7645C8FA0CF5AB5B1B4810AD301C77F1307C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001985441'
+	'0000000000000000010000000000000098302BDAC8528232B437B271E312B0C2605BA06289EA698C000001000000000044B262C46CEABB8540D14FE610740100'
+	'B000000000000000244481D85471F7F39D662DBB9369F10048264272765E1A14A1FF96C339192D12AD68A77E5B65CA8FF16C764B2722E9476E24074699CFD00F'
+	'96F58855D0DE260EC67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E000000000198544100000000000000000100000000000000'
+	'984274D3AD43346AD3CD9F6218B5DA99C72B95C5ACA3C664000001000000000044B262C46CEABB8540D14FE610740100B000000000000000C9DEA1D45F695C38'
+	'AEB9805B8BECBD41727D28E9BD0F04EE079B9409B7AC5B0E7FFDDCD46464AD3D65D795530264C39FB4D6F6B701D8E0CE254F5EB89B3F8705C67F465087EF6818'
+	'24805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E000000000198544100000000000000000100000000000000984C974EDDD28EF5113FA06001F2B6A6'
+	'110DD281BCEE3BE1000001000000000044B262C46CEABB8540D14FE610740100B00000000000000044CA6B64816DC1A4A1E05D9EC0A29E19E4D5FA21CFC4126E'
+	'0EB5812EB5E625A606CAA934C559E337C6A5BACDF1AD2F8B19CCDBD6CE9B6E1D36FF73BE40FA360BC67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5'
+	'D9FA415F7660B08E00000000019854410000000000000000010000000000000098838092C9E8CB3626FE783E84478826ECDA6607234549A40000010000000000'
+	'44B262C46CEABB8540D14FE610740100B00000000000000081025F7D662C56F5E44BEB8F7F34BAE789AE65A3CDB58AD5D7E65E6127C9D6C59692BDA501904ABE'
+	'DB63540393F635B534CFCE5A6471C94323041F73FFA18D07C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E0000000001985441'
+	'0000000000000000010000000000000098C2E81463D439A22A780C1A98456E5B3B2935A3537E7F74000001000000000044B262C46CEABB8540D14FE610740100'
+	'B0000000000000006A566E8511F7972C46719C132859B9BD790289758FD4A04E7A65A999E965931B354E645865C6416DC3E344E630B9105D1CCCB4C0D2A9CF4A'
+	'5B5AC38FA4497605C67F465087EF681824805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E000000000198544100000000000000000100000000000000'
+	'98C4AA1673391BCBD21D20FD4933DF4500111A099A95D207000001000000000044B262C46CEABB8540D14FE610740100B0000000000000001CC9C08514F5792A'
+	'7FE792D7C08124C722266EF424356918CD4608068839BEBF6CE976D8C0B8BB36E7779EAC48F9166948B62373F15AD31ACB72F9C1BC9E9C0DC67F465087EF6818'
+	'24805B7E9FF3B2728A4EE847DE044DE5D9FA415F7660B08E00000000019854410000000000000000010000000000000098C6C8E40CD19C7A1C1765BAA83C19BE'
+	'9423B1F15F274AF7000001000000000044B262C46CEABB8540D14FE610740100A10000000000000025A28D51D7EE559C4851EDCC357AF9DFABD2C5432880BFD0'
+	'A4B846E326F29F034D5F53667D3B76917AD3B6C0CD4F9FC4E652B7FD5CBEEF14CAE9844E55C40909D6C41E2D597A43B9D815BC2D8B0C4381E6920BFBDC1B1D85'
+	'AAE390FFF11D8A8C0000000001984342000000000000000001000000000000006979A295EEE7DFD28BDB8CF8FE4E69B9ABF8DF1F48E64ABA38C64904404FA43C'
+	'0100000000000000A100000000000000EED1591A70206E3C78DBEC70F509692DD60BD628860EF3092405FFC5F236DDC8525F17117348AE3760BA1ECACC7584A6'
+	'384B0A7686762EA13A008E174E5DEB043D3333E1DBFD7A912B87D5A21C746F522F938BF3930969C235682676AD5EFCF500000000019843420000000000000000'
+	'0100000000000000F3293999A083C9DDACE82FB74E2C53AD399D80A3C6190F3E27DC1247C2C64CB90100000000000000A100000000000000E7765E2920CC954B'
+	'81B153D77BD4AD2F227AE51DBE7E178F04614960C758514B7AA29BC8D66FF67737883FD3262BC3902478E4A32B26551DA3FE63084CB10803CAE46E384324E7D3'
+	'922E8BA11955F90A1C355C2E0F04FEA29C53B54C212D64210000000001984342000000000000000001000000000000007E851742FAEAF7CA6986077AC4DDE78E'
+	'225649C5AF7F4FC6A63778B4767BB0420100000000000000A100000000000000F7E8494323EA9CBECE7C224F5F28CBC50A8181FB337046802581258C21E30195'
+	'A605DBCEA03B133B1AC41C84BD7061BD4D86D5A220C879723B12D66BF4F0DC0358D7765F78BEE73C8A670D665BF829898D6A1F58770664ECEE1BBE7D36CE970C'
+	'0000000001984342000000000000000001000000000000009C5261B1FF9312027454C17F8C73179D84B6133F7AC4C8427C3BCE5988A614A80100000000000000'
+	'A100000000000000A2A2E2F3C043D522E7AEE85AAB12A079A8005604CFCE03ED8B325148CA3F63E1D728C7C318878BBBCAC59D2AF2B1FD48E432BAFAE04D30A0'
+	'ACE90F951D80E00ABF0396D07432B9D0C11C30B3C3DD670B02A9C63496DD5AB8B44B818550FDC42C000000000198434200000000000000000100000000000000'
+	'5675B71AC631975643309562D3C0DB8FA8B39C5EBFAA30EEA175CCBFCEA467FC0100000000000000A100000000000000F70DA7D05CCD0E1EB3149085F577003B'
+	'74B332D1910035EB6DF24553C804B2966D11CE29EBCCACE10140A5800CB62410CA363CBF6D8A15F06CBD08E7C2E1230774C5E5CA81CF3E106253D7DD6F9545A0'
+	'17F5921ABD729EF561D20FA040ABEE9E000000000198434200000000000000000100000000000000135F3C38E2E5CECAF045B8121A2ECC5A6AA859D00B53BAE9'
+	'E8B8D0D4D82C7C1B0100000000000000A100000000000000594DDB8D87B7AB58E27FEF2E00CB715FC46D603A9A6C5B018470B8EE5962600917701600A0B28F37'
+	'BA01745DF8B7A96678C53114EE7D71EDE9725F818DF7690C8DAC41F80C86D48B795F11BFFDEA883158D0104D564CA71ABC15712706E2341D0000000001984342'
+	'00000000000000000100000000000000E7E29932C0CE240480565161C447627177E76AC4BFE8DCFBBCBF2BACBB66881E0100000000000000A100000000000000'
+	'8BE80C63307DACC9AB68684FCD10A3F2E8D5CCFBB40826255CCA368DA3589CBB9503A7560C585EC42F290BC639EB73E729E11B4C50BFC38919F98621D6AEDA0B'
+	'714B03F05BA3A21421BF64544F11EF49E5749EB327AB7F0CD60275CBC094E9810000000001984342000000000000000001000000000000005BF050D642E64888'
+	'C87B3B3BCBA0EABAD6E677F5B3413ECF2D58580F6D843A4B0100000000000000A1000000000000007C99AA9FAFC8ECC061932AD12BADF3F50DB37C05BEC62577'
+	'2C19A854771FA998205565D9CF58C2FE47B994FAD4EBF187949EAB55A0E30EFEF0B910899FB21F0A2CCE3512862018D088D101FA1B6C83C3B90449C6D234C3D0'
+	'57E489154042CACA000000000198434200000000000000000100000000000000981A88DEB091FA7F27BD320D89996A21E6922F308273BBCA7DCB9216FB403364'
+	'0100000000000000A10000000000000044761BD17B4E7023251015FC2EFFB3405CE0AFCD594D00FD8C00C1D9537C6AD2DBF73A11DEE426D68940B8F60F5A4B39'
+	'A89B2059785AE0C01A6BFA30AF347C0A4CE3880D7ABC5DF9AFD918D172C4B646CA03877BF0FF6060240E6D497F2DEBDC00000000019843420000000000000000'
+	'0100000000000000B4BE952D81679F93F67493B4935CCD6B9A0EC36F22EFB08155BB7A1D0416E06C0100000000000000A1000000000000009BBF5972E6617540'
+	'16BF2EAFE2E118066D2EE598DAF77205699314D1D2B70BBF188ADF9DDFD4A38BB3D25B84BBBFEC8686F0650F51AC140EE0F598020D2568002A41EEEDC2118292'
+	'E48B8B788568C4BC2A510E6D1E1DB798616587F3BB9ED9550000000001984342000000000000000001000000000000008499BA45D53117B39BAED431A44E5D97'
+	'FB77F88A5DF22D9E46278F477ED8BDD801'
+)
@@ -3,7 +3,7 @@ import unittest
 
 import yaml
 
-from symbolchain.AccountDescriptorRepository import AccountDescriptorRepository
+from symbolchain.AccountDescriptorRepository import AccountDescriptor, AccountDescriptorRepository
 from symbolchain.ByteArray import ByteArray
 from symbolchain.CryptoTypes import PublicKey
 
@@ -238,3 +238,100 @@ class AccountDescriptorRepositoryTest(unittest.TestCase):
 		self._assert_can_parse_public_key(str(PUBLIC_KEY_2), PUBLIC_KEY_2)
 
 	# endregion
+
+
+class AccountDescriptorRepositoryIndexTest(unittest.TestCase):
+	# region find (duplicates)
+
+	def test_find_all_by_role_returns_descriptor_with_duplicate_role_once(self):
+		# Arrange:
+		repository = AccountDescriptorRepository([{'name': 'dave', 'roles': ['main', 'main']}])
+
+		# Act:
+		descriptors = repository.find_all_by_role('main')
+
+		# Assert:
+		self.assertEqual(['dave'], [descriptor.name for descriptor in descriptors])
+
+	def test_find_returns_first_matching_descriptor_when_multiple_descriptors_match(self):
+		# Arrange:
+		descriptors_yaml = yaml.load(YAML_INPUT, Loader=yaml.SafeLoader)
+		descriptors_yaml.append({'public_key': str(PUBLIC_KEY_1), 'address': ENCODED_ADDRESS_1, 'name': 'alice'})
+		repository = AccountDescriptorRepository(descriptors_yaml)
+
+		# Act:
+		descriptor1 = repository.try_find_by_name('alice')
+		descriptor2 = repository.find_by_public_key(PUBLIC_KEY_1)
+		descriptor3 = repository.find_by_address(ENCODED_ADDRESS_1)
+
+		# Assert:
+		self.assertEqual([repository.descriptors[0], repository.descriptors[1], repository.descriptors[0]], [
+			descriptor1, descriptor2, descriptor3
+		])
+
+	# endregion
+
+	# region add / remove
+
+	def test_can_add_descriptor(self):
+		# Arrange:
+		repository = AccountDescriptorRepository(YAML_INPUT)
+		public_key = TestUtils.random_byte_array(PublicKey)
+		descriptor = AccountDescriptor({'public_key': str(public_key), 'name': 'dave', 'roles': ['main']})
+
+		# Act:
+		repository.add(descriptor)
+
+		# Assert:
+		self.assertEqual(5, len(repository.descriptors))
+		self.assertEqual(descriptor, repository.try_find_by_name('dave'))
+		self.assertEqual(descriptor, repository.find_by_public_key(public_key))
+		self.assertEqual(['alice', 'BOB', 'dave'], [descriptor.name for descriptor in repository.find_all_by_role('main')])
+
+	def test_can_remove_descriptor(self):
+		# Arrange:
+		repository = AccountDescriptorRepository(YAML_INPUT)
+		alice = repository.try_find_by_name('alice')
+		bob = repository.try_find_by_name('BOB')
+
+		# Act:
+		repository.remove(alice)
+		repository.remove(bob)
+
+		# Assert:
+		self.assertEqual(['TEST1', 'charlie'], [descriptor.name for descriptor in repository.descriptors])
+		self.assertIsNone(repository.try_find_by_name('alice'))
+		self.assertIsNone(repository.try_find_by_name('BOB'))
+		self.assertEqual([], repository.find_all_by_role('main'))
+		self.assertEqual(['TEST1'], [descriptor.name for descriptor in repository.find_all_by_role('test')])
+
+		with self.assertRaises(StopIteration):
+			repository.find_by_address(ENCODED_ADDRESS_1)
+
+		with self.assertRaises(StopIteration):
+			repository.find_by_public_key(PUBLIC_KEY_2)
+
+	def test_removing_descriptor_exposes_next_matching_descriptor(self):
+		# Arrange:
+		repository = AccountDescriptorRepository(YAML_INPUT)
+		descriptor = AccountDescriptor({'address': ENCODED_ADDRESS_1, 'name': 'alice'})
+		repository.add(descriptor)
+
+		# Act:
+		repository.remove(repository.descriptors[0])
+
+		# Assert:
+		self.assertEqual(descriptor, repository.try_find_by_name('alice'))
+		self.assertEqual(descriptor, repository.find_by_address(ENCODED_ADDRESS_1))
+
+	def test_cannot_remove_unknown_descriptor(self):
+		# Arrange:
+		repository = AccountDescriptorRepository(YAML_INPUT)
+
+		# Act + Assert:
+		with self.assertRaises(ValueError):
+			repository.remove(AccountDescriptor({'name': 'alice'}))
+
+		self.assertEqual(4, len(repository.descriptors))
+
+	# endregion
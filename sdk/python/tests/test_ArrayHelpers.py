@@ -1,5 +1,6 @@
 import unittest
 from collections import namedtuple
+from struct import Struct
 
 from symbolchain.ArrayHelpers import ArrayHelpers
 
@@ -8,6 +9,13 @@ from .test.TestUtils import TestUtils
 DeserializedTuple = namedtuple('DeserializedTuple', ['size', 'tag'])
 
 
+def write_into(write, elements, *args):
+	# write into the middle of buffer filled with nonzero bytes to ensure nothing outside of written area is touched
+	buffer = bytearray([0xFF] * 30)
+	offset = write(buffer, 3, elements, *args)
+	return (offset, buffer[:offset + 2])
+
+
 class ArrayHelpersTest(unittest.TestCase):
 	# pylint: disable=too-many-public-methods
 
@@ -21,6 +29,10 @@ class ArrayHelpersTest(unittest.TestCase):
 			def serialize(self):
 				return bytes([100 + self.size])
 
+			def serialize_into(self, buffer, offset):
+				buffer[offset] = 100 + self.size
+				return offset + 1
+
 		def __init__(self, sizes=None):
 			element_sizes = sizes if sizes is not None else [i * 3 + 1 for i in range(0, 5)]
 			self.elements = list(map(self.MockElement, element_sizes))
@@ -240,6 +252,77 @@ class ArrayHelpersTest(unittest.TestCase):
 
 	# endregion
 
+	# region readers - read_fixed_size_array
+
+	class FixedSizeElement:
+		@staticmethod
+		def from_unpacked(values):
+			return DeserializedTuple(*values)
+
+	FIXED_SIZE_CODEC = Struct('<BH')
+
+	def test_read_fixed_size_array_reads_all_available_elements(self):
+		# Act:
+		elements = ArrayHelpers.read_fixed_size_array(
+			bytes([3, 0x11, 0x22, 4, 0x33, 0x44, 5, 0x55, 0x66]),
+			self.FixedSizeElement,
+			self.FIXED_SIZE_CODEC)
+
+		# Assert:
+		self.assertEqual([DeserializedTuple(3, 0x2211), DeserializedTuple(4, 0x4433), DeserializedTuple(5, 0x6655)], elements)
+
+	def test_read_fixed_size_array_reads_no_elements_from_empty_buffer(self):
+		# Act:
+		elements = ArrayHelpers.read_fixed_size_array(bytes(), self.FixedSizeElement, self.FIXED_SIZE_CODEC)
+
+		# Assert:
+		self.assertEqual([], elements)
+
+	def test_read_fixed_size_array_throws_when_last_element_is_partial(self):
+		# Act + Assert:
+		with self.assertRaises(ValueError):
+			ArrayHelpers.read_fixed_size_array(bytes([3, 0x11, 0x22, 4, 0x33]), self.FixedSizeElement, self.FIXED_SIZE_CODEC)
+
+	def test_read_fixed_size_array_with_count_reads_only_requested_elements(self):
+		# Act:
+		elements = ArrayHelpers.read_fixed_size_array(
+			memoryview(bytes([3, 0x11, 0x22, 4, 0x33, 0x44, 5, 0x55])),
+			self.FixedSizeElement,
+			self.FIXED_SIZE_CODEC,
+			2)
+
+		# Assert:
+		self.assertEqual([DeserializedTuple(3, 0x2211), DeserializedTuple(4, 0x4433)], elements)
+
+	def test_read_fixed_size_array_with_count_throws_when_buffer_is_too_small(self):
+		# Act + Assert:
+		with self.assertRaises(ValueError):
+			ArrayHelpers.read_fixed_size_array(bytes([3, 0x11, 0x22, 4, 0x33]), self.FixedSizeElement, self.FIXED_SIZE_CODEC, 2)
+
+	def test_read_fixed_size_array_can_read_when_using_accessor_and_elements_are_ordered(self):
+		# Act:
+		elements = ArrayHelpers.read_fixed_size_array(
+			bytes([3, 0x11, 0x22, 4, 0x33, 0x44]),
+			self.FixedSizeElement,
+			self.FIXED_SIZE_CODEC,
+			2,
+			lambda element: element.size)
+
+		# Assert:
+		self.assertEqual([DeserializedTuple(3, 0x2211), DeserializedTuple(4, 0x4433)], elements)
+
+	def test_read_fixed_size_array_cannot_read_when_using_accessor_and_elements_are_not_ordered(self):
+		# Act + Assert:
+		with self.assertRaises(ValueError):
+			ArrayHelpers.read_fixed_size_array(
+				bytes([3, 0x11, 0x22, 4, 0x33, 0x44]),
+				self.FixedSizeElement,
+				self.FIXED_SIZE_CODEC,
+				2,
+				lambda element: -element.size)
+
+	# endregion
+
 	# region readers - read_variable_size_elements
 
 	def test_read_variable_size_elements_throws_when_any_element_has_zero_size(self):
@@ -407,3 +490,75 @@ class ArrayHelpersTest(unittest.TestCase):
 		self.assertEqual(bytes([101, 0, 0, 0, 104, 107, 0, 110, 0, 0, 113]), output)
 
 	# endregion
+
+	# region writers (into) - write_array_into
+
+	class WriteArrayIntoTraits:
+		def __init__(self):
+			self.expected_output = (8, bytes([0xFF, 0xFF, 0xFF, 101, 104, 107, 110, 113, 0xFF, 0xFF]))
+
+		@staticmethod
+		def writer(elements, accessor=None):
+			return write_into(ArrayHelpers.write_array_into, elements, accessor)
+
+	def test_write_array_into_writes_all_elements(self):
+		traits = self.WriteArrayIntoTraits()
+		self._assert_writer_writes_all_elements(traits.writer, traits.expected_output)
+
+	def test_write_array_into_can_write_when_using_accessor_and_elements_are_ordered(self):
+		traits = self.WriteArrayIntoTraits()
+		self._assert_writer_can_write_when_using_accessor_and_elements_are_ordered(traits.writer, traits.expected_output)
+
+	def test_write_array_into_cannot_write_when_using_accessor_and_elements_are_not_ordered(self):
+		traits = self.WriteArrayIntoTraits()
+		self._assert_writer_cannot_write_when_using_accessor_and_elements_are_not_ordered(traits.writer)
+
+	# endregion
+
+	# region writers (into) - write_array_count_into
+
+	class WriteArrayCountIntoTraits:
+		def __init__(self):
+			self.expected_output = (6, bytes([0xFF, 0xFF, 0xFF, 101, 104, 107, 0xFF, 0xFF]))
+
+		@staticmethod
+		def writer(elements, accessor=None):
+			return write_into(ArrayHelpers.write_array_count_into, elements, 3, accessor)
+
+	def test_write_array_count_into_writes_all_elements(self):
+		traits = self.WriteArrayCountIntoTraits()
+		self._assert_writer_writes_all_elements(traits.writer, traits.expected_output)
+
+	def test_write_array_count_into_can_write_when_using_accessor_and_elements_are_ordered(self):
+		traits = self.WriteArrayCountIntoTraits()
+		self._assert_writer_can_write_when_using_accessor_and_elements_are_ordered(traits.writer, traits.expected_output)
+
+	def test_write_array_count_into_cannot_write_when_using_accessor_and_elements_are_not_ordered(self):
+		traits = self.WriteArrayCountIntoTraits()
+		self._assert_writer_cannot_write_when_using_accessor_and_elements_are_not_ordered(traits.writer)
+
+	# endregion
+
+	# region writers (into) - write_variable_size_elements_into
+
+	def test_write_variable_size_elements_into_writes_all_elements_and_aligns(self):
+		# Arrange:
+		context = self.ElementsTestContext([1, 4, 7])
+
+		# Act:
+		output = write_into(ArrayHelpers.write_variable_size_elements_into, context.elements, 4)
+
+		# Assert: notice that alignment is calculated from serialized size, not reported size
+		self.assertEqual((15, bytes([0xFF, 0xFF, 0xFF, 101, 0, 0, 0, 104, 0, 0, 0, 107, 0, 0, 0, 0xFF, 0xFF])), output)
+
+	def test_write_variable_size_elements_into_ex_last_writes_all_elements_and_aligns_all_ex_last(self):
+		# Arrange:
+		context = self.ElementsTestContext([1, 4, 7])
+
+		# Act:
+		output = write_into(ArrayHelpers.write_variable_size_elements_into, context.elements, 4, True)
+
+		# Assert: notice that alignment is calculated from serialized size, not reported size
+		self.assertEqual((12, bytes([0xFF, 0xFF, 0xFF, 101, 0, 0, 0, 104, 0, 0, 0, 107, 0xFF, 0xFF])), output)
+
+	# endregion
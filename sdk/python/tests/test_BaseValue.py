@@ -22,6 +22,25 @@ class FakeValue:
 		self.value = value
 
 
+class FakeWord(BaseValue):
+	SIZE = WORD_WIDTH
+
+	def __init__(self, value=0):
+		super().__init__(self.SIZE, value, FakeWord)
+
+
+class FakeSignedWord(BaseValue):
+	SIZE = WORD_WIDTH
+
+	def __init__(self, value=0):
+		super().__init__(self.SIZE, value, FakeSignedWord, True)
+
+
+class FakeUntaggedWord(BaseValue):
+	def __init__(self, value=0):
+		super().__init__(2, value)
+
+
 class BaseValueTest(ComparisonTestUtils, unittest.TestCase):
 	# pylint: disable=too-many-public-methods
 
@@ -109,6 +128,51 @@ class BaseValueTest(ComparisonTestUtils, unittest.TestCase):
 			self.assertEqual(size, value.size)
 			self.assertEqual(raw_value, value.value)
 
+	def test_can_create_base_value_from_trusted(self):
+		# Act:
+		value = FakeWord.from_trusted(DEFAULT_VALUE)
+
+		# Assert:
+		self.assertIsInstance(value, FakeWord)
+		self.assertEqual(WORD_WIDTH, value.size)
+		self.assertEqual(DEFAULT_VALUE, value.value)
+		self.assertEqual(FakeWord(DEFAULT_VALUE), value)
+		self.assertEqual(hash(FakeWord(DEFAULT_VALUE)), hash(value))
+		self.assertNotEqual(BaseValue(WORD_WIDTH, DEFAULT_VALUE), value)
+
+	def test_can_create_signed_base_value_from_trusted(self):
+		# Act:
+		value = FakeSignedWord.from_trusted(-DEFAULT_VALUE)
+
+		# Assert:
+		self.assertIsInstance(value, FakeSignedWord)
+		self.assertEqual(WORD_WIDTH, value.size)
+		self.assertEqual(-DEFAULT_VALUE, value.value)
+		self.assertEqual(FakeSignedWord(-DEFAULT_VALUE), value)
+		self.assertEqual(hash(FakeSignedWord(-DEFAULT_VALUE)), hash(value))
+		self.assertEqual(str(FakeSignedWord(-DEFAULT_VALUE)), str(value))
+		self.assertNotEqual(FakeWord.from_trusted(DEFAULT_VALUE), FakeSignedWord.from_trusted(DEFAULT_VALUE))
+
+	def test_can_create_base_value_from_trusted_with_size_and_tag_from_constructor(self):
+		# Act:
+		value = FakeUntaggedWord.from_trusted(0x1234)
+
+		# Assert:
+		self.assertIsInstance(value, FakeUntaggedWord)
+		self.assertEqual(2, value.size)
+		self.assertEqual(FakeUntaggedWord(0x1234), value)
+		self.assertEqual(hash(FakeUntaggedWord(0x1234)), hash(value))
+		self.assertEqual('0x1234', str(value))
+
+	def test_base_value_does_not_have_instance_dictionary(self):
+		# Arrange:
+		value = BaseValue(WORD_WIDTH, DEFAULT_VALUE)
+
+		# Act + Assert:
+		self.assertFalse(hasattr(value, '__dict__'))
+		with self.assertRaises(AttributeError):
+			value.other = 123  # pylint: disable=assigning-non-slot
+
 	# endregion
 
 	# region equality
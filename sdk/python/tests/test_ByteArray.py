@@ -27,6 +27,13 @@ class FakeByteArray:
 		self.bytes = value
 
 
+class FakeByteArray24(ByteArray):
+	SIZE = FIXED_SIZE
+
+	def __init__(self, array_input=bytes(FIXED_SIZE)):
+		super().__init__(self.SIZE, array_input, FakeByteArray24)
+
+
 def random_hex_string(size):
 	return hexlify(TestUtils.randbytes(size)).decode('utf8')
 
@@ -62,6 +69,26 @@ class ByteArrayTest(ComparisonTestUtils, unittest.TestCase):
 			with self.assertRaises(ValueError):
 				ByteArray(FIXED_SIZE, random_hex_string(size))
 
+	def test_can_create_byte_array_from_trusted(self):
+		# Act:
+		byte_array = FakeByteArray24.from_trusted(TEST_BYTES)
+
+		# Assert:
+		self.assertIsInstance(byte_array, FakeByteArray24)
+		self.assertEqual(TEST_BYTES, byte_array.bytes)
+		self.assertEqual(FakeByteArray24(TEST_BYTES), byte_array)
+		self.assertEqual(hash(FakeByteArray24(TEST_BYTES)), hash(byte_array))
+		self.assertNotEqual(ByteArray(FIXED_SIZE, TEST_BYTES), byte_array)
+
+	def test_byte_array_does_not_have_instance_dictionary(self):
+		# Arrange:
+		byte_array = ByteArray(FIXED_SIZE, TEST_BYTES)
+
+		# Act + Assert:
+		self.assertFalse(hasattr(byte_array, '__dict__'))
+		with self.assertRaises(AttributeError):
+			byte_array.other = 123  # pylint: disable=assigning-non-slot
+
 	def test_equality_and_inequality_are_supported(self):
 		# Arrange:
 		descriptor = EqualityTestDescriptor(
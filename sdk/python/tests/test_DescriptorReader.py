@@ -0,0 +1,112 @@
+import io
+import unittest
+
+from symbolchain.DescriptorReader import load_yaml, read_json_lines_descriptors, read_yaml_descriptors
+
+MULTI_DOCUMENT_YAML_INPUT = '''
+type: transfer
+amount: 1
+---
+- type: transfer
+	amount: 2
+- type: transfer
+	amount: 3
+---
+---
+type: transfer
+amount: 4
+'''.replace('\t', '  ')
+
+JSON_LINES_INPUT = '''{"type": "transfer", "amount": 1}
+{"type": "transfer", "amount": 2}
+
+{"type": "transfer", "amount": 3, "message": {"message_type": "plain", "message": "hello"}}
+'''
+
+
+class DescriptorReaderTest(unittest.TestCase):
+	# region load_yaml
+
+	def test_can_load_yaml(self):
+		# Act:
+		descriptors = load_yaml('- type: transfer\n  amount: 1\n- type: transfer\n  amount: 2\n')
+
+		# Assert:
+		self.assertEqual([{'type': 'transfer', 'amount': 1}, {'type': 'transfer', 'amount': 2}], descriptors)
+
+	def test_cannot_load_unsafe_yaml(self):
+		with self.assertRaises(Exception):
+			load_yaml('!!python/object/apply:os.system ["true"]')
+
+	# endregion
+
+	# region read_yaml_descriptors
+
+	def test_can_read_yaml_descriptors_from_string(self):
+		# Act:
+		descriptors = list(read_yaml_descriptors(MULTI_DOCUMENT_YAML_INPUT))
+
+		# Assert: empty documents are skipped and lists are flattened
+		self.assertEqual([1, 2, 3, 4], [descriptor['amount'] for descriptor in descriptors])
+
+	def test_can_read_yaml_descriptors_from_stream(self):
+		# Act:
+		descriptors = list(read_yaml_descriptors(io.StringIO(MULTI_DOCUMENT_YAML_INPUT)))
+
+		# Assert:
+		self.assertEqual([1, 2, 3, 4], [descriptor['amount'] for descriptor in descriptors])
+
+	def test_can_read_yaml_descriptors_from_single_document(self):
+		# Act:
+		descriptors = list(read_yaml_descriptors('- amount: 1\n- amount: 2\n'))
+
+		# Assert:
+		self.assertEqual([{'amount': 1}, {'amount': 2}], descriptors)
+
+	def test_reads_yaml_descriptors_lazily(self):
+		# Arrange: second document is malformed
+		descriptors = read_yaml_descriptors(io.StringIO('amount: 1\n---\namount: [\n'))
+
+		# Act:
+		descriptor = next(descriptors)
+
+		# Assert: first document is read before second is parsed
+		self.assertEqual({'amount': 1}, descriptor)
+		with self.assertRaises(Exception):
+			next(descriptors)
+
+	# endregion
+
+	# region read_json_lines_descriptors
+
+	def test_can_read_json_lines_descriptors_from_string(self):
+		# Act:
+		descriptors = list(read_json_lines_descriptors(JSON_LINES_INPUT))
+
+		# Assert: empty lines are skipped
+		self.assertEqual([
+			{'type': 'transfer', 'amount': 1},
+			{'type': 'transfer', 'amount': 2},
+			{'type': 'transfer', 'amount': 3, 'message': {'message_type': 'plain', 'message': 'hello'}}
+		], descriptors)
+
+	def test_can_read_json_lines_descriptors_from_stream(self):
+		# Act:
+		descriptors = list(read_json_lines_descriptors(io.StringIO(JSON_LINES_INPUT)))
+
+		# Assert:
+		self.assertEqual([1, 2, 3], [descriptor['amount'] for descriptor in descriptors])
+
+	def test_reads_json_lines_descriptors_lazily(self):
+		# Arrange: second line is malformed
+		descriptors = read_json_lines_descriptors(io.StringIO('{"amount": 1}\n{"amount": \n'))
+
+		# Act:
+		descriptor = next(descriptors)
+
+		# Assert:
+		self.assertEqual({'amount': 1}, descriptor)
+		with self.assertRaises(ValueError):
+			next(descriptors)
+
+	# endregion
@@ -1,5 +1,6 @@
 import unittest
 from enum import Enum, Flag
+from unittest.mock import patch
 
 from symbolchain.BaseValue import BaseValue
 from symbolchain.ByteArray import ByteArray
@@ -493,3 +494,114 @@ class RuleBasedTransactionFactoryTest(unittest.TestCase):
 			})
 
 	# endregion
+
+	# region create_from_factory (copy plans)
+
+	@staticmethod
+	def _create_plain_struct_factory():
+		factory = RuleBasedTransactionFactory(Module)
+		factory.add_struct_parser('StructPlain')
+
+		def entity_factory(entity_type):
+			return None if 123 != entity_type else Module.StructPlain()
+
+		return (factory, entity_factory)
+
+	def test_can_create_multiple_structs_from_factory_with_same_descriptor_keys(self):
+		# Arrange:
+		(factory, entity_factory) = self._create_plain_struct_factory()
+
+		# Act:
+		parsed_structs = [
+			factory.create_from_factory(entity_factory, {'type': 123, 'mosaic_id': mosaic_id, 'amount': mosaic_id * 2})
+			for mosaic_id in [1, 2, 3]
+		]
+
+		# Assert:
+		self.assertEqual([(1, 2), (2, 4), (3, 6)], [(parsed.mosaic_id, parsed.amount) for parsed in parsed_structs])
+
+	def test_can_create_multiple_structs_from_factory_with_different_descriptor_keys(self):
+		# Arrange:
+		(factory, entity_factory) = self._create_plain_struct_factory()
+
+		# Act:
+		parsed_structs = [
+			factory.create_from_factory(entity_factory, {'type': 123, 'mosaic_id': 1}),
+			factory.create_from_factory(entity_factory, {'type': 123, 'amount': 2}),
+			factory.create_from_factory(entity_factory, {'amount': 4, 'type': 123, 'mosaic_id': 3})
+		]
+
+		# Assert:
+		self.assertEqual([(1, 0), (0, 2), (3, 4)], [(parsed.mosaic_id, parsed.amount) for parsed in parsed_structs])
+
+	def test_create_from_factory_shares_plan_across_descriptor_key_orders(self):
+		# Arrange:
+		(factory, entity_factory) = self._create_plain_struct_factory()
+
+		# Act:
+		parsed_structs = [
+			factory.create_from_factory(entity_factory, {'type': 123, 'mosaic_id': 1, 'amount': 2}),
+			factory.create_from_factory(entity_factory, {'amount': 4, 'mosaic_id': 3, 'type': 123}),
+			factory.create_from_factory(entity_factory, {'mosaic_id': 5, 'type': 123, 'amount': 6})
+		]
+
+		# Assert:
+		self.assertEqual([(1, 2), (3, 4), (5, 6)], [(parsed.mosaic_id, parsed.amount) for parsed in parsed_structs])
+		self.assertEqual(1, len(factory._copy_plans))  # pylint: disable=protected-access
+
+	def test_create_from_factory_evicts_least_recently_used_plan_when_cache_is_full(self):
+		# Arrange:
+		(factory, entity_factory) = self._create_plain_struct_factory()
+
+		with patch.object(RuleBasedTransactionFactory, 'MAX_COPY_PLANS', 2):
+			factory.create_from_factory(entity_factory, {'type': 123, 'mosaic_id': 1})
+			factory.create_from_factory(entity_factory, {'type': 123, 'amount': 2})
+			factory.create_from_factory(entity_factory, {'type': 123, 'mosaic_id': 3})
+
+			# Act:
+			parsed = factory.create_from_factory(entity_factory, {'type': 123, 'mosaic_id': 5, 'amount': 6})
+
+		# Assert:
+		self.assertEqual((5, 6), (parsed.mosaic_id, parsed.amount))
+		self.assertEqual(
+			[frozenset(['type', 'mosaic_id']), frozenset(['type', 'mosaic_id', 'amount'])],
+			[plan_key[1] for plan_key in factory._copy_plans])  # pylint: disable=protected-access
+
+	def test_create_from_factory_uses_rules_added_after_previous_creation(self):
+		# Arrange:
+		factory = RuleBasedTransactionFactory(Module)
+
+		def entity_factory(_):
+			return Module.UnresolvedMosaic()
+
+		descriptor = {'type': 123, 'mosaic_id': 0x01234567_89ABCDEF, 'amount': 123}
+		parsed_without_rules = factory.create_from_factory(entity_factory, descriptor)
+
+		factory.add_pod_parser('Amount', Module.Amount)
+
+		# Act:
+		parsed = factory.create_from_factory(entity_factory, descriptor)
+
+		# Assert:
+		self.assertEqual(123, parsed_without_rules.amount)
+		self.assertEqual(Module.Amount(123), parsed.amount)
+		self.assertEqual(0x01234567_89ABCDEF, parsed.mosaic_id)
+
+	def test_cannot_create_struct_from_factory_when_descriptor_has_unknown_attribute(self):
+		# Arrange:
+		(factory, entity_factory) = self._create_plain_struct_factory()
+
+		for _ in range(2):
+			# Act + Assert: failure is raised every time (failed plans are not cached)
+			with self.assertRaises(ValueError):
+				factory.create_from_factory(entity_factory, {'type': 123, 'mosaic_id': 1, 'foo': 2})
+
+	def test_cannot_create_struct_from_factory_when_descriptor_has_computed_attribute(self):
+		# Arrange:
+		(factory, entity_factory) = self._create_plain_struct_factory()
+
+		# Act + Assert:
+		with self.assertRaises(ValueError):
+			factory.create_from_factory(entity_factory, {'type': 123, 'amount_computed': 1})
+
+	# endregion
@@ -0,0 +1,49 @@
+import hashlib
+import unittest
+
+import sha3
+
+from symbolchain.CryptoTypes import PrivateKey
+from symbolchain.external import ed25519
+from symbolchain.SharedKey import derive_shared_secret
+from symbolchain.symbol.KeyPair import KeyPair
+
+
+class DeriveSharedSecretTest(unittest.TestCase):
+	def _assert_derived_shared_secret_matches_reference(self, hashing_algorithm):
+		for _ in range(10):
+			# Arrange:
+			private_key_bytes = PrivateKey.random().bytes
+			other_public_key_bytes = KeyPair(PrivateKey.random()).public_key.bytes
+
+			# Act:
+			shared_secret = derive_shared_secret(other_public_key_bytes, private_key_bytes, hashing_algorithm)
+
+			# Assert:
+			expected_shared_secret = ed25519.derive_shared_secret_unsafe(other_public_key_bytes, private_key_bytes, hashing_algorithm)
+			self.assertEqual(expected_shared_secret, shared_secret)
+
+	def test_derived_shared_secret_matches_reference_sha512(self):
+		self._assert_derived_shared_secret_matches_reference(hashlib.sha512)
+
+	def test_derived_shared_secret_matches_reference_keccak_512(self):
+		self._assert_derived_shared_secret_matches_reference(sha3.keccak_512)
+
+	def test_derived_shared_secret_matches_reference_for_identity_point(self):
+		# Arrange: identity is rejected by libsodium, so reference implementation is used
+		private_key_bytes = PrivateKey.random().bytes
+		identity_bytes = bytes([1] + [0] * 31)
+
+		# Act:
+		shared_secret = derive_shared_secret(identity_bytes, private_key_bytes)
+
+		# Assert:
+		self.assertEqual(ed25519.derive_shared_secret_unsafe(identity_bytes, private_key_bytes), shared_secret)
+
+	def test_cannot_derive_shared_secret_from_non_canonical_point(self):
+		# Arrange:
+		non_canonical_bytes = bytes([0xFF] * 31 + [0x7F])
+
+		# Act + Assert:
+		with self.assertRaisesRegex(ValueError, 'point is not canonical'):
+			derive_shared_secret(non_canonical_bytes, PrivateKey.random().bytes)
@@ -0,0 +1,133 @@
+import unittest
+
+from symbolchain.CryptoTypes import PrivateKey, SharedKey256
+from symbolchain.SharedKeyCache import SharedKeyCache
+from symbolchain.symbol.KeyPair import KeyPair
+
+from .test.TestUtils import TestUtils
+
+
+class MockSharedKey:
+	"""Shared key class (substitute) that returns random shared keys and records derivations."""
+
+	def __init__(self):
+		self.derivations = []
+
+	def derive_shared_key(self, key_pair, other_public_key):
+		self.derivations.append((key_pair.public_key, other_public_key))
+		return TestUtils.random_byte_array(SharedKey256)
+
+
+class SharedKeyCacheTest(unittest.TestCase):
+	def setUp(self):
+		self.shared_key_class = MockSharedKey()
+		self.key_pairs = [KeyPair(PrivateKey.random()) for _ in range(2)]
+		self.public_keys = [KeyPair(PrivateKey.random()).public_key for _ in range(4)]
+
+	# region constructor
+
+	def test_can_create_empty_cache(self):
+		# Act:
+		cache = SharedKeyCache(10)
+
+		# Assert:
+		self.assertEqual(10, cache.max_size)
+		self.assertEqual(0, len(cache))
+		self.assertEqual((0, 0), (cache.hits, cache.misses))
+
+	def test_cannot_create_cache_with_non_positive_size(self):
+		for max_size in [0, -1]:
+			with self.assertRaises(ValueError):
+				SharedKeyCache(max_size)
+
+	# endregion
+
+	# region derive_shared_key
+
+	def test_derives_shared_key_on_miss(self):
+		# Arrange:
+		cache = SharedKeyCache()
+
+		# Act:
+		shared_key = cache.derive_shared_key(self.shared_key_class, self.key_pairs[0], self.public_keys[0])
+
+		# Assert:
+		self.assertEqual(SharedKey256.SIZE, len(shared_key.bytes))
+		self.assertEqual([(self.key_pairs[0].public_key, self.public_keys[0])], self.shared_key_class.derivations)
+		self.assertEqual(1, len(cache))
+		self.assertEqual((0, 1), (cache.hits, cache.misses))
+
+	def test_returns_cached_shared_key_on_hit(self):
+		# Arrange:
+		cache = SharedKeyCache()
+		shared_key = cache.derive_shared_key(self.shared_key_class, self.key_pairs[0], self.public_keys[0])
+
+		# Act:
+		shared_key_2 = cache.derive_shared_key(self.shared_key_class, self.key_pairs[0], self.public_keys[0])
+		shared_key_3 = cache.derive_shared_key(self.shared_key_class, self.key_pairs[0], self.public_keys[0])
+
+		# Assert:
+		self.assertEqual([shared_key, shared_key], [shared_key_2, shared_key_3])
+		self.assertEqual(1, len(self.shared_key_class.derivations))
+		self.assertEqual(1, len(cache))
+		self.assertEqual((2, 1), (cache.hits, cache.misses))
+
+	def test_shared_keys_are_cached_per_key_pair_counterparty_and_shared_key_class(self):
+		# Arrange:
+		cache = SharedKeyCache()
+
+		# Act:
+		shared_keys = [
+			cache.derive_shared_key(self.shared_key_class, self.key_pairs[0], self.public_keys[0]),
+			cache.derive_shared_key(self.shared_key_class, self.key_pairs[0], self.public_keys[1]),
+			cache.derive_shared_key(self.shared_key_class, self.key_pairs[1], self.public_keys[0]),
+			cache.derive_shared_key(MockSharedKey(), self.key_pairs[0], self.public_keys[0])
+		]
+
+		# Assert:
+		self.assertEqual(4, len(set(shared_key.bytes for shared_key in shared_keys)))
+		self.assertEqual(4, len(cache))
+		self.assertEqual((0, 4), (cache.hits, cache.misses))
+
+	def test_evicts_least_recently_used_shared_key_when_full(self):
+		# Arrange:
+		cache = SharedKeyCache(3)
+		for public_key in self.public_keys[:3]:
+			cache.derive_shared_key(self.shared_key_class, self.key_pairs[0], public_key)
+
+		# - touch first shared key, so second one is least recently used
+		cache.derive_shared_key(self.shared_key_class, self.key_pairs[0], self.public_keys[0])
+
+		# Act:
+		cache.derive_shared_key(self.shared_key_class, self.key_pairs[0], self.public_keys[3])
+		self.shared_key_class.derivations = []
+		for public_key in [self.public_keys[0], self.public_keys[2], self.public_keys[3], self.public_keys[1]]:
+			cache.derive_shared_key(self.shared_key_class, self.key_pairs[0], public_key)
+
+		# Assert: only evicted shared key is derived again
+		self.assertEqual([(self.key_pairs[0].public_key, self.public_keys[1])], self.shared_key_class.derivations)
+		self.assertEqual(3, len(cache))
+
+	# endregion
+
+	# region clear
+
+	def test_clear_wipes_shared_keys_and_counters(self):
+		# Arrange:
+		cache = SharedKeyCache()
+		for public_key in self.public_keys:
+			cache.derive_shared_key(self.shared_key_class, self.key_pairs[0], public_key)
+
+		cache.derive_shared_key(self.shared_key_class, self.key_pairs[0], self.public_keys[0])
+
+		# Act:
+		cache.clear()
+		self.shared_key_class.derivations = []
+		cache.derive_shared_key(self.shared_key_class, self.key_pairs[0], self.public_keys[0])
+
+		# Assert:
+		self.assertEqual(1, len(self.shared_key_class.derivations))
+		self.assertEqual(1, len(cache))
+		self.assertEqual((0, 1), (cache.hits, cache.misses))
+
+	# endregion
@@ -0,0 +1,150 @@
+import os
+import tempfile
+import unittest
+
+from symbolchain.CryptoTypes import Hash256, Signature
+from symbolchain.SignatureStorage import BinarySignatureStorage, JsonLinesSignatureStorage
+
+from .test.TestUtils import TestUtils
+
+
+def create_random_signature_group(num_signatures):
+	return (TestUtils.random_byte_array(Hash256), [TestUtils.random_byte_array(Signature) for _ in range(0, num_signatures)])
+
+
+class BasicSignatureStorageTest:
+	# pylint: disable=no-member
+
+	def _assert_can_roundtrip_signatures(self, num_signatures):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			storage = self.create_storage(temp_directory)
+
+			(transaction_hash, signatures) = create_random_signature_group(num_signatures)
+			storage.save('foo', transaction_hash, signatures)
+
+			# Act:
+			(loaded_transaction_hash, loaded_signatures) = storage.load('foo')
+
+			# Assert:
+			self.assertEqual(transaction_hash, loaded_transaction_hash)
+			self.assertEqual(signatures, loaded_signatures)
+
+	def test_can_roundtrip_zero_signatures(self):
+		self._assert_can_roundtrip_signatures(0)
+
+	def test_can_roundtrip_single_signature(self):
+		self._assert_can_roundtrip_signatures(1)
+
+	def test_can_roundtrip_multiple_signatures(self):
+		self._assert_can_roundtrip_signatures(5)
+
+	def test_can_roundtrip_multiple_signature_groups(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			storage = self.create_storage(temp_directory)
+
+			signature_groups = [create_random_signature_group(num_signatures) for num_signatures in [1, 3, 2]]
+			storage.save_all((f'foo{i}', transaction_hash, signatures) for (i, (transaction_hash, signatures)) in enumerate(signature_groups))
+
+			# Act:
+			loaded_signature_groups = storage.load_all(['foo2', 'foo0', 'foo1'])
+
+			# Assert:
+			self.assertEqual([signature_groups[2], signature_groups[0], signature_groups[1]], loaded_signature_groups)
+
+	def test_can_overwrite_signatures(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			storage = self.create_storage(temp_directory)
+
+			storage.save('foo', *create_random_signature_group(2))
+			(transaction_hash, signatures) = create_random_signature_group(1)
+			storage.save('foo', transaction_hash, signatures)
+
+			# Act:
+			(loaded_transaction_hash, loaded_signatures) = storage.load('foo')
+
+			# Assert:
+			self.assertEqual(transaction_hash, loaded_transaction_hash)
+			self.assertEqual(signatures, loaded_signatures)
+
+
+class BinarySignatureStorageTest(BasicSignatureStorageTest, unittest.TestCase):
+	@staticmethod
+	def create_storage(temp_directory):
+		return BinarySignatureStorage(temp_directory)
+
+	def test_cannot_load_unknown_signatures(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			storage = BinarySignatureStorage(temp_directory)
+
+			# Act + Assert:
+			with self.assertRaises(FileNotFoundError):
+				storage.load('foo')
+
+	def _assert_cannot_load_file(self, data_size):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			with open(os.path.join(temp_directory, 'foo.bin'), 'wb') as outfile:
+				outfile.write(TestUtils.randbytes(data_size))
+
+			storage = BinarySignatureStorage(temp_directory)
+
+			# Act + Assert:
+			with self.assertRaises(ValueError):
+				storage.load('foo')
+
+	def test_cannot_load_file_containing_insufficient_data(self):
+		self._assert_cannot_load_file(Hash256.SIZE - 1)  # less than transaction_hash
+
+	def test_cannot_load_file_containing_partial_signature(self):
+		self._assert_cannot_load_file(Hash256.SIZE + Signature.SIZE * 2 + Signature.SIZE // 2)  # 2.5 signatures
+
+
+class JsonLinesSignatureStorageTest(BasicSignatureStorageTest, unittest.TestCase):
+	@staticmethod
+	def create_storage(temp_directory):
+		return JsonLinesSignatureStorage(os.path.join(temp_directory, 'signatures.jsonl'))
+
+	def test_saves_signatures_as_json_lines(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			storage = self.create_storage(temp_directory)
+			signature_groups = [create_random_signature_group(num_signatures) for num_signatures in [1, 2]]
+
+			# Act:
+			storage.save('foo', *signature_groups[0])
+			storage.save('bar', *signature_groups[1])
+
+			# Assert:
+			with open(storage.file_path, 'rt', encoding='utf8') as infile:
+				lines = infile.read().splitlines()
+
+			self.assertEqual([
+				f'{{"name": "foo", "transaction_hash": "{signature_groups[0][0]}", "signatures": ["{signature_groups[0][1][0]}"]}}',
+				''.join([
+					f'{{"name": "bar", "transaction_hash": "{signature_groups[1][0]}", ',
+					f'"signatures": ["{signature_groups[1][1][0]}", "{signature_groups[1][1][1]}"]}}'
+				])
+			], lines)
+
+	def test_cannot_load_unknown_signatures(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			storage = self.create_storage(temp_directory)
+			storage.save('bar', *create_random_signature_group(1))
+
+			# Act + Assert:
+			with self.assertRaises(KeyError):
+				storage.load('foo')
+
+	def test_cannot_load_from_missing_file(self):
+		# Arrange:
+		with tempfile.TemporaryDirectory() as temp_directory:
+			storage = self.create_storage(temp_directory)
+
+			# Act + Assert:
+			with self.assertRaises(FileNotFoundError):
+				storage.load('foo')
@@ -0,0 +1,191 @@
+import io
+import unittest
+
+from symbolchain.StreamReader import StreamReader
+
+
+class ChunkedStream:
+	"""Stream that returns at most chunk_size bytes from every readinto call."""
+
+	def __init__(self, buffer, chunk_size=3):
+		self.stream = io.BytesIO(buffer)
+		self.chunk_size = chunk_size
+
+	def readinto(self, view):
+		return self.stream.readinto(view[:self.chunk_size])
+
+
+SOURCE_FACTORIES = {
+	'bytes': bytes,
+	'bytearray': bytearray,
+	'stream': io.BytesIO,
+	'chunked stream': ChunkedStream
+}
+
+
+class StreamReaderTest(unittest.TestCase):
+	# region constructor
+
+	def test_cannot_create_around_unsupported_source(self):
+		with self.assertRaises(TypeError):
+			StreamReader('0102')
+
+	def test_buffer_source_is_read_without_copying(self):
+		# Arrange:
+		buffer = bytearray([1, 2, 3, 4])
+		reader = StreamReader(buffer)
+
+		# Act:
+		view = reader.read(4)
+		buffer[1] = 0xFF
+
+		# Assert:
+		self.assertEqual(bytes([1, 0xFF, 3, 4]), view)
+
+	# endregion
+
+	# region read
+
+	def test_can_read_bytes(self):
+		for (name, source_factory) in SOURCE_FACTORIES.items():
+			with self.subTest(source=name):
+				# Arrange:
+				reader = StreamReader(source_factory(bytes([1, 2, 3, 4, 5, 6, 7])))
+
+				# Act:
+				views = [reader.read(4), reader.read(2)]
+
+				# Assert:
+				self.assertEqual([bytes([1, 2, 3, 4]), bytes([5, 6])], views)
+				self.assertEqual(6, reader.offset)
+
+	def test_cannot_read_more_bytes_than_available(self):
+		for (name, source_factory) in SOURCE_FACTORIES.items():
+			with self.subTest(source=name):
+				# Arrange:
+				reader = StreamReader(source_factory(bytes([1, 2, 3, 4, 5])))
+
+				# Act + Assert:
+				with self.assertRaises(ValueError):
+					reader.read(6)
+
+	def test_read_or_none_returns_none_when_no_data_is_left(self):
+		for (name, source_factory) in SOURCE_FACTORIES.items():
+			with self.subTest(source=name):
+				# Arrange:
+				reader = StreamReader(source_factory(bytes([1, 2, 3, 4])))
+
+				# Act:
+				views = [reader.read_or_none(4), reader.read_or_none(4)]
+
+				# Assert:
+				self.assertEqual([bytes([1, 2, 3, 4]), None], views)
+
+	def test_read_or_none_cannot_read_partial_data(self):
+		for (name, source_factory) in SOURCE_FACTORIES.items():
+			with self.subTest(source=name):
+				# Arrange:
+				reader = StreamReader(source_factory(bytes([1, 2, 3, 4, 5])))
+				reader.read(4)
+
+				# Act + Assert:
+				with self.assertRaises(ValueError):
+					reader.read_or_none(4)
+
+	# endregion
+
+	# region read_size_prefixed
+
+	def test_can_read_size_prefixed_entities(self):
+		for (name, source_factory) in SOURCE_FACTORIES.items():
+			with self.subTest(source=name):
+				# Arrange:
+				reader = StreamReader(source_factory(bytes([6, 0, 0, 0, 0xAA, 0xBB, 4, 0, 0, 0])))
+
+				# Act:
+				views = [reader.read_size_prefixed(), reader.read_size_prefixed(), reader.read_size_prefixed()]
+
+				# Assert:
+				self.assertEqual([bytes([6, 0, 0, 0, 0xAA, 0xBB]), bytes([4, 0, 0, 0]), None], views)
+				self.assertEqual(10, reader.offset)
+
+	def test_can_read_size_prefixed_entity_with_custom_size_prefix_size(self):
+		# Arrange:
+		reader = StreamReader(bytes([3, 0, 0xAA, 0xBB]))
+
+		# Act:
+		view = reader.read_size_prefixed(2)
+
+		# Assert:
+		self.assertEqual(bytes([3, 0, 0xAA]), view)
+
+	def test_cannot_read_size_prefixed_entity_with_incomplete_size_prefix(self):
+		for (name, source_factory) in SOURCE_FACTORIES.items():
+			with self.subTest(source=name):
+				# Arrange:
+				reader = StreamReader(source_factory(bytes([6, 0, 0])))
+
+				# Act + Assert:
+				with self.assertRaises(ValueError):
+					reader.read_size_prefixed()
+
+	def test_cannot_read_size_prefixed_entity_with_size_smaller_than_size_prefix(self):
+		for (name, source_factory) in SOURCE_FACTORIES.items():
+			with self.subTest(source=name):
+				# Arrange:
+				reader = StreamReader(source_factory(bytes([3, 0, 0, 0, 0xAA])))
+
+				# Act + Assert:
+				with self.assertRaises(ValueError):
+					reader.read_size_prefixed()
+
+	def test_cannot_read_truncated_size_prefixed_entity(self):
+		for (name, source_factory) in SOURCE_FACTORIES.items():
+			with self.subTest(source=name):
+				# Arrange:
+				reader = StreamReader(source_factory(bytes([7, 0, 0, 0, 0xAA, 0xBB])))
+
+				# Act + Assert:
+				with self.assertRaises(ValueError):
+					reader.read_size_prefixed()
+
+	# endregion
+
+	# region skip
+
+	def test_can_skip_bytes(self):
+		for (name, source_factory) in SOURCE_FACTORIES.items():
+			with self.subTest(source=name):
+				# Arrange:
+				reader = StreamReader(source_factory(bytes([1, 2, 3, 4, 5, 6, 7])))
+
+				# Act:
+				reader.skip(5)
+				view = reader.read(2)
+
+				# Assert:
+				self.assertEqual(bytes([6, 7]), view)
+				self.assertEqual(7, reader.offset)
+
+	def test_can_skip_more_bytes_than_skip_chunk_size(self):
+		# Arrange:
+		reader = StreamReader(io.BytesIO(bytes(0x10000 * 2 + 5) + bytes([0xAA])))
+
+		# Act:
+		reader.skip(0x10000 * 2 + 5)
+		view = reader.read(1)
+
+		# Assert:
+		self.assertEqual(bytes([0xAA]), view)
+
+	def test_cannot_skip_more_bytes_than_available(self):
+		for (name, source_factory) in SOURCE_FACTORIES.items():
+			with self.subTest(source=name):
+				# Arrange:
+				reader = StreamReader(source_factory(bytes([1, 2, 3])))
+
+				# Act + Assert:
+				with self.assertRaises(ValueError):
+					reader.skip(4)
+
+	# endregion
@@ -260,6 +260,11 @@ def assert_roundtrip(item, module):
 	assert payload_hex == to_hex_string(transaction_buffer)
 	assert len(transaction_buffer) == transaction.size
 
+	# - additionally serialize into (dirty) buffer at nonzero offset
+	output_buffer = bytearray([0xFF] * (transaction.size + 7))
+	assert transaction.size + 5 == transaction.serialize_into(output_buffer, 5)
+	assert payload_hex == to_hex_string(output_buffer[5:-2])
+
 	# - additionally pass all transactions through TransactionFactory builder ([:-2] to ignore "v1", "v2" suffix)
 	if schema_name[:-2].endswith('Transaction'):
 		assert_roundtrip({'schema_name': 'TransactionFactory', 'payload': payload_hex}, module)
@@ -275,3 +280,63 @@ def test_roundtrip_symbol(item):
 	assert_roundtrip(item, importlib.import_module('symbolchain.sc'))
 
 # endregion
+
+
+# region view
+
+def to_comparable_string(value):
+	return list(map(str, value)) if isinstance(value, list) else str(value)
+
+
+def assert_view(item, module):
+	# Arrange:
+	schema_name = item['schema_name']
+	payload = unhexlify(item['payload'])
+
+	view_class = getattr(module, f'{schema_name}View')
+	property_names = [name for name in dir(view_class) if isinstance(getattr(view_class, name), property)]
+
+	transaction = getattr(module, schema_name).deserialize(payload)
+
+	# Act:
+	view = view_class(payload)
+
+	# Assert:
+	assert transaction.size == view.size
+	for name in property_names:
+		assert to_comparable_string(getattr(transaction, name)) == to_comparable_string(getattr(view, name)), name
+
+
+def assert_view_rejects_truncation(item, module):
+	# Arrange:
+	schema_name = item['schema_name']
+	payload = unhexlify(item['payload'])
+
+	view_class = getattr(module, f'{schema_name}View')
+
+	for truncated_payload in [payload[:-1], b'']:
+		# Act + Assert:
+		with pytest.raises(ValueError):
+			view_class(truncated_payload)
+
+
+@pytest.mark.parametrize('item', prepare_test_cases('nem'), ids=generate_pretty_id)
+def test_view_nem(item):
+	assert_view(item, importlib.import_module('symbolchain.nc'))
+
+
+@pytest.mark.parametrize('item', prepare_test_cases('symbol'), ids=generate_pretty_id)
+def test_view_symbol(item):
+	assert_view(item, importlib.import_module('symbolchain.sc'))
+
+
+@pytest.mark.parametrize('item', prepare_test_cases('nem'), ids=generate_pretty_id)
+def test_view_truncated_nem(item):
+	assert_view_rejects_truncation(item, importlib.import_module('symbolchain.nc'))
+
+
+@pytest.mark.parametrize('item', prepare_test_cases('symbol'), ids=generate_pretty_id)
+def test_view_truncated_symbol(item):
+	assert_view_rejects_truncation(item, importlib.import_module('symbolchain.sc'))
+
+# endregion
@@ -262,7 +262,7 @@ class NemHelper:
 	def create_cosignature(self, test_name, index):
 		name = f'{test_name}_cosig_{index + 1}'
 		descriptor = {
-			# note: `type: cosignature`` is not present, it's handled by TransactionDescriptorProcessor
+			# note: `type: cosignature`` is not present, it's handled by RuleBasedTransactionFactory
 			'multisig_transaction_hash': hashlib.sha3_256(test_name.encode('utf8')).hexdigest(),
 			'multisig_account_address': 'TBT7GACQQLYXUFBSQCUHXXWQMSRDAJPACTNJ724W'
 		}